@@ -418,11 +418,13 @@ def transition_events(
     return events
 
 
-def publish(home_eventctl: str, event: dict[str, Any]) -> None:
+def publish(home_eventctl: str, events: list[dict[str, Any]]) -> None:
     try:
         result = subprocess.run(
-            [home_eventctl, "enqueue", "--source", "august"],
-            input=json.dumps(event, separators=(",", ":")),
+            [home_eventctl, "enqueue", "--source", "august", "--ndjson"],
+            input="".join(
+                json.dumps(event, separators=(",", ":")) + "\n" for event in events
+            ),
             text=True,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -452,10 +454,10 @@ def publish_pending(
     if not isinstance(state_after, dict):
         raise AdapterError("invalid_pending_state")
     state_after = validate_state(state_after)
-    for event in pending["events"]:
-        if not isinstance(event, dict):
-            raise AdapterError("invalid_pending_state")
-        publish(home_eventctl, event)
+    if not all(isinstance(event, dict) for event in pending["events"]):
+        raise AdapterError("invalid_pending_state")
+    if pending["events"]:
+        publish(home_eventctl, pending["events"])
     atomic_json(state_path, state_after)
     pending_path.unlink()
     fsync_directory(pending_path.parent)
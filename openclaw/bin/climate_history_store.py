@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Indexed store over the day-partitioned climate history.
+
+``nest-history-append`` and the attended Airthings importer write
+``~/.openclaw/nest-history/YYYY-MM-DD.jsonl``; the Nest dashboard reads those
+files.  Deduplicating a sample used to mean parsing the whole day file and
+scanning every room record.  This module keeps a SQLite index beside the
+files (``nest-history/.climate-history.sqlite3``) with:
+
+* ``history_records`` -- every record line keyed by day and line number,
+  with its UTC epoch indexed for range scans across days;
+* ``history_room_keys`` -- one row per (source, timestamp, structure, room,
+  day), so a dedupe check is a primary-key lookup.
+
+The JSONL files stay the source of truth and the format the dashboards read.
+``sync_day`` records how far into each day file it has indexed (inode, size,
+mtime, offset), indexes only appended complete lines, and re-indexes a day
+whose file shrank or was replaced.  ``export_day`` is the compatibility
+exporter: it returns a day's records merged with new ones in the timestamp
+order the importer writes back as JSONL.  The database is a disposable cache
+and can be deleted at any time; ``climate_history_store.py sync`` rebuilds it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import re
+import sqlite3
+import stat
+import sys
+from typing import Any, Iterable, Iterator, Optional
+
+
+DATABASE_NAME = ".climate-history.sqlite3"
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_SECONDS = 5
+# Same bound nest-history-append applies before reading a day file.
+MAX_HISTORY_BYTES = 64 * 1_048_576
+DAY_FILE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.jsonl$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history_sources (
+    day TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed_offset INTEGER NOT NULL,
+    next_line INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history_records (
+    day TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    epoch REAL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (day, line)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_records_epoch_idx ON history_records (epoch);
+CREATE TABLE IF NOT EXISTS history_room_keys (
+    source TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    structure TEXT NOT NULL,
+    room TEXT NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (source, timestamp, structure, room, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_room_keys_day_idx ON history_room_keys (day);
+"""
+
+
+class HistoryStoreError(Exception):
+    """Store failure whose code is safe to print."""
+
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def default_history_dir(home: Optional[Path] = None) -> Path:
+    return (home or Path.home()) / ".openclaw" / "nest-history"
+
+
+def _epoch(timestamp: str) -> Optional[float]:
+    try:
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _key_text(value: Any) -> str:
+    # Non-string structure/room values never match a requested name.
+    return value if isinstance(value, str) else ""
+
+
+class ClimateHistoryStore:
+    """SQLite index of one climate-history directory."""
+
+    def __init__(self, history_dir: str | os.PathLike[str]) -> None:
+        self.history_dir = Path(history_dir)
+        self.database = self.history_dir / DATABASE_NAME
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        created = not self.database.exists()
+        connection = sqlite3.connect(
+            self.database, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        try:
+            if created:
+                os.chmod(self.database, 0o600)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            row = connection.execute(
+                "SELECT value FROM history_meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                connection.execute(
+                    "INSERT OR IGNORE INTO history_meta (key, value) VALUES ('schema_version', ?)",
+                    (SCHEMA_VERSION,),
+                )
+            elif row[0] != SCHEMA_VERSION:
+                raise HistoryStoreError("history_schema_unsupported")
+            yield connection
+        finally:
+            connection.close()
+
+    # -- indexing ---------------------------------------------------------
+
+    def sync(self, days: Optional[Iterable[str]] = None) -> int:
+        """Index new complete lines of ``days`` (default: every day file)."""
+        if days is None:
+            try:
+                days = sorted(
+                    name[: -len(".jsonl")]
+                    for name in os.listdir(self.history_dir)
+                    if DAY_FILE_RE.match(name)
+                )
+            except OSError:
+                return 0
+        indexed = 0
+        with self.connect() as connection:
+            for day in days:
+                indexed += self._sync_day(connection, day)
+        return indexed
+
+    def sync_day(self, day: str) -> int:
+        return self.sync([day])
+
+    def _sync_day(self, connection: sqlite3.Connection, day: str) -> int:
+        path = self.history_dir / f"{day}.jsonl"
+        try:
+            descriptor = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except FileNotFoundError:
+            self._forget_day(connection, day)
+            return 0
+        except OSError as exc:
+            raise HistoryStoreError("unsafe_history_file") from exc
+        with os.fdopen(descriptor, "rb") as handle:
+            status = os.fstat(handle.fileno())
+            if (
+                not stat.S_ISREG(status.st_mode)
+                or status.st_uid != os.getuid()
+                or status.st_nlink != 1
+                or status.st_size > MAX_HISTORY_BYTES
+            ):
+                raise HistoryStoreError("unsafe_history_file")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                indexed = self._index_day(connection, day, handle, status)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return indexed
+
+    def _forget_day(self, connection: sqlite3.Connection, day: str) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ("history_sources", "history_records", "history_room_keys"):
+                connection.execute(f"DELETE FROM {table} WHERE day = ?", (day,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _index_day(self, connection, day: str, handle, status: os.stat_result) -> int:
+        source = connection.execute(
+            "SELECT * FROM history_sources WHERE day = ?", (day,)
+        ).fetchone()
+        if source is not None and (
+            source["inode"] == status.st_ino
+            and source["size"] == status.st_size
+            and source["mtime_ns"] == status.st_mtime_ns
+        ):
+            return 0
+        start, line_number = 0, 0
+        if (
+            source is not None
+            and source["inode"] == status.st_ino
+            and source["size"] < status.st_size
+        ):
+            start, line_number = source["indexed_offset"], source["next_line"]
+        else:
+            connection.execute("DELETE FROM history_records WHERE day = ?", (day,))
+            connection.execute("DELETE FROM history_room_keys WHERE day = ?", (day,))
+        handle.seek(start)
+        data = handle.read(max(0, status.st_size - start))
+        complete = data.rfind(b"\n") + 1
+        indexed = 0
+        for raw in data[:complete].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except (ValueError, UnicodeDecodeError) as exc:
+                raise HistoryStoreError("invalid_history_file") from exc
+            if not isinstance(record, dict) or not isinstance(record.get("timestamp"), str):
+                raise HistoryStoreError("invalid_history_file")
+            timestamp = record["timestamp"]
+            connection.execute(
+                "INSERT INTO history_records (day, line, timestamp, epoch, record) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (day, line_number, timestamp, _epoch(timestamp), raw.decode("utf-8")),
+            )
+            rooms = record.get("rooms")
+            for room in rooms if isinstance(rooms, list) else ():
+                if not isinstance(room, dict) or not isinstance(room.get("source"), str):
+                    continue
+                connection.execute(
+                    "INSERT OR IGNORE INTO history_room_keys "
+                    "(source, timestamp, structure, room, day) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        room["source"],
+                        timestamp,
+                        _key_text(room.get("structure")),
+                        _key_text(room.get("room")),
+                        day,
+                    ),
+                )
+            line_number += 1
+            indexed += 1
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO history_sources
+                (day, inode, size, mtime_ns, indexed_offset, next_line)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                day,
+                status.st_ino,
+                status.st_size,
+                status.st_mtime_ns,
+                start + complete,
+                line_number,
+            ),
+        )
+        return indexed
+
+    # -- queries ----------------------------------------------------------
+
+    def contains(
+        self,
+        day: str,
+        source: str,
+        timestamp: str,
+        *,
+        structure: Optional[str] = None,
+        room: Optional[str] = None,
+    ) -> bool:
+        """Whether ``day`` has a ``source`` room at exactly ``timestamp``.
+
+        ``structure`` and ``room`` narrow the match when given.  Call
+        ``sync_day`` first; the answer reflects the last sync.
+        """
+        query = (
+            "SELECT 1 FROM history_room_keys "
+            "WHERE source = ? AND timestamp = ? AND day = ?"
+        )
+        params: list[Any] = [source, timestamp, day]
+        if structure is not None:
+            query += " AND structure = ?"
+            params.append(structure)
+        if room is not None:
+            query += " AND room = ?"
+            params.append(room)
+        with self.connect() as connection:
+            return connection.execute(query + " LIMIT 1", params).fetchone() is not None
+
+    def existing_timestamps(
+        self, day: str, source: str, timestamps: Iterable[str], *, structure: str, room: str
+    ) -> set[str]:
+        """Subset of ``timestamps`` already recorded for one source room on ``day``."""
+        found: set[str] = set()
+        with self.connect() as connection:
+            for timestamp in timestamps:
+                row = connection.execute(
+                    "SELECT 1 FROM history_room_keys WHERE source = ? AND timestamp = ? "
+                    "AND structure = ? AND room = ? AND day = ?",
+                    (source, timestamp, structure, room, day),
+                ).fetchone()
+                if row is not None:
+                    found.add(timestamp)
+        return found
+
+    def day_records(self, day: str) -> list[dict[str, Any]]:
+        """A day's indexed records in file order."""
+        with self.connect() as connection:
+            return [
+                json.loads(row["record"])
+                for row in connection.execute(
+                    "SELECT record FROM history_records WHERE day = ? ORDER BY line", (day,)
+                )
+            ]
+
+    def records_between(self, start: float, end: float) -> list[dict[str, Any]]:
+        """Records with ``start <= epoch < end`` across days, oldest first."""
+        with self.connect() as connection:
+            return [
+                json.loads(row["record"])
+                for row in connection.execute(
+                    "SELECT record FROM history_records WHERE epoch >= ? AND epoch < ? "
+                    "ORDER BY epoch, day, line",
+                    (start, end),
+                )
+            ]
+
+    def export_day(
+        self, day: str, additions: Iterable[dict[str, Any]] = ()
+    ) -> list[dict[str, Any]]:
+        """Compatibility export: a day's records plus ``additions`` in JSONL order.
+
+        Records are sorted by timestamp; existing records keep their file
+        order ahead of additions with the same timestamp.
+        """
+        return sorted(
+            self.day_records(day) + list(additions), key=lambda item: item["timestamp"]
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    sync = subcommands.add_parser("sync", help="index new climate-history lines")
+    sync.add_argument("--history-dir", type=Path, default=default_history_dir())
+    export = subcommands.add_parser("export", help="print one day as JSONL")
+    export.add_argument("day")
+    export.add_argument("--history-dir", type=Path, default=default_history_dir())
+    args = parser.parse_args(argv)
+    store = ClimateHistoryStore(args.history_dir)
+    try:
+        if args.command == "sync":
+            indexed = store.sync()
+        else:
+            store.sync_day(args.day)
+            for record in store.export_day(args.day):
+                print(json.dumps(record, separators=(",", ":"), sort_keys=True))
+            return 0
+    except (OSError, sqlite3.Error):
+        print(json.dumps({"ok": False, "error": "history_store_unavailable"}))
+        return 1
+    except HistoryStoreError as exc:
+        print(json.dumps({"ok": False, "error": exc.code}))
+        return 1
+    print(json.dumps({"ok": True, "indexed": indexed}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
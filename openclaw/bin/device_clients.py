@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""In-process device clients for the home dashboard.
+
+Each client imports one skill API module once and calls its dispatch
+function directly, returning the same JSON payload and exit code the CLI's
+``--json`` mode prints. A client whose module or runtime cannot be loaded
+in this interpreter raises ``ClientUnavailable`` and the caller keeps using
+the CLI. A call given a ``timeout`` runs on a bounded worker pool and raises
+``ClientTimeout`` when it outlives that deadline, mirroring the CLI's
+subprocess timeout; the worker thread itself cannot be interrupted.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+import importlib.util
+from pathlib import Path
+import sys
+import threading
+from typing import Any
+
+
+# Worker threads shared by every timed call; a hung call holds one until its
+# socket or event loop gives up.
+MAX_CONCURRENT_CALLS = 8
+
+
+class ClientUnavailable(Exception):
+    """The skill module behind a client cannot be loaded here."""
+
+
+class ClientTimeout(Exception):
+    """An in-process call did not finish before its deadline."""
+
+
+class DeviceClient(abc.ABC):
+    """Lazily loaded skill module exposed through ``call(argv)``."""
+
+    cli = ""
+    module_path = ""
+    # Third-party packages the module imports at call time; the skills that
+    # need them run from dedicated venvs the dashboard interpreter lacks.
+    requires: tuple[str, ...] = ()
+
+    def __init__(self, skills_dir: Path) -> None:
+        self.path = Path(skills_dir) / self.module_path
+        self._lock = threading.Lock()
+        self._module = None
+        self._load_error: str | None = None
+
+    @property
+    def available(self) -> bool:
+        try:
+            self.module()
+        except ClientUnavailable:
+            return False
+        return True
+
+    def module(self) -> Any:
+        with self._lock:
+            if self._module is None and self._load_error is None:
+                try:
+                    self._module = self._load()
+                except (Exception, SystemExit) as exc:
+                    # Import failures are permanent for this process.
+                    self._load_error = type(exc).__name__
+            if self._module is None:
+                raise ClientUnavailable(f"{self.cli}: {self._load_error}")
+            return self._module
+
+    def _load(self) -> Any:
+        for requirement in self.requires:
+            if importlib.util.find_spec(requirement) is None:
+                raise ImportError(requirement)
+        name = f"_openclaw_{self.cli.replace('-', '_')}_client"
+        spec = importlib.util.spec_from_file_location(name, self.path)
+        if spec is None or spec.loader is None:
+            raise ImportError(str(self.path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        return module
+
+    def call(self, argv: list[str]) -> tuple[int, Any]:
+        """Run one CLI command in process; returns ``(returncode, payload)``."""
+        return self._dispatch(self.module(), [arg for arg in argv if arg != "--json"])
+
+    @abc.abstractmethod
+    def _dispatch(self, module: Any, argv: list[str]) -> tuple[int, Any]:
+        """Run ``argv`` against the loaded module; subclasses map the CLI."""
+
+
+class PetlibroClient(DeviceClient):
+    cli = "petlibro"
+    module_path = "petlibro/petlibro-api.py"
+
+    def _dispatch(self, module: Any, argv: list[str]) -> tuple[int, Any]:
+        try:
+            return 0, module.dispatch(argv)
+        except module.PetlibroError as error:
+            return 1, error.payload()
+        except Exception:
+            return 1, {
+                "success": False,
+                "error": "internal_error",
+                "message": "Petlibro command failed safely",
+            }
+
+
+class LitterRobotClient(DeviceClient):
+    cli = "litter-robot"
+    module_path = "litter-robot/litter-robot-api.py"
+    requires = ("pylitterbot",)
+
+    def _dispatch(self, module: Any, argv: list[str]) -> tuple[int, Any]:
+        try:
+            return 0, asyncio.run(module.dispatch(argv))
+        except module.LitterRobotError as exc:
+            return 1, exc.as_dict()
+        except Exception:
+            return 1, {
+                "ok": False,
+                "error": "unexpected_error",
+                "message": "Litter-Robot command failed unexpectedly.",
+            }
+
+
+class MideaClient(DeviceClient):
+    cli = "midea-ac"
+    module_path = "midea-ac/scripts/midea_ac.py"
+    requires = ("midealocal",)
+    # Dashboard reads and controls only; discovery and enrollment stay on
+    # the operator CLI.
+    commands = frozenset({"status", "on", "off", "temperature", "mode", "fan", "eco"})
+
+    def _load(self) -> Any:
+        module = super()._load()
+        # The dashboard outlives each call, so keep authenticated LAN
+        # sessions open between polls instead of reconnecting every time.
+        module.SESSIONS.enable()
+        return module
+
+    def _dispatch(self, module: Any, argv: list[str]) -> tuple[int, Any]:
+        if not argv or argv[0] not in self.commands:
+            return 2, {"ok": False, "error": "command_invalid"}
+        try:
+            args = module.parser().parse_args(argv)
+        except SystemExit:
+            return 2, {"ok": False, "error": "command_invalid"}
+        try:
+            if args.command == "status":
+                return 0, {"ok": True, "devices": module.collect_status(args.alias)}
+            if args.command == "temperature" and not 60 <= args.value <= 86:
+                raise module.MideaACError("temperature_out_of_range")
+            result, code = module.send_control(
+                args.command, args.alias, getattr(args, "value", None)
+            )
+            return code, result
+        except module.MideaACError as exc:
+            return exc.exit_code, {"ok": False, "error": exc.code}
+        except Exception:
+            return 1, {"ok": False, "error": "internal_error"}
+
+
+CLIENT_TYPES = (PetlibroClient, LitterRobotClient, MideaClient)
+
+
+class DeviceClientRegistry:
+    """CLI name → in-process client, shared by dashboard collectors and commands."""
+
+    def __init__(
+        self, skills_dir, client_types=CLIENT_TYPES, *, max_workers=MAX_CONCURRENT_CALLS
+    ) -> None:
+        self._clients = {
+            client_type.cli: client_type(Path(skills_dir)) for client_type in client_types
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="device-client"
+        )
+
+    def get(self, cli: str) -> DeviceClient | None:
+        return self._clients.get(cli)
+
+    def call(self, argv: list[str], timeout: float | None = None) -> tuple[int, Any]:
+        """Run ``argv`` (a CLI invocation) in process or raise ``ClientUnavailable``.
+
+        With ``timeout``, raises ``ClientTimeout`` if the call has not
+        finished after that many seconds.
+        """
+        client = self._clients.get(argv[0]) if argv else None
+        if client is None:
+            raise ClientUnavailable(argv[0] if argv else "")
+        if timeout is None:
+            return client.call(list(argv[1:]))
+        future = self._executor.submit(client.call, list(argv[1:]))
+        done, _pending = wait([future], timeout=timeout)
+        if not done:
+            # Drops the call if it is still queued behind hung workers.
+            future.cancel()
+            raise ClientTimeout(argv[0])
+        return future.result()
+
+    def availability(self) -> dict[str, bool]:
+        return {cli: client.available for cli, client in self._clients.items()}
@@ -11,6 +11,7 @@ Tailscale-tailnet access; not public internet.
 import json
 import os
 import signal
+import sqlite3
 import subprocess
 import sys
 import threading
@@ -20,6 +21,10 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 from urllib.parse import urlparse, parse_qs
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import history_index  # noqa: E402
+import route_index  # noqa: E402
+
 HISTORY_DIR = os.path.expanduser("~/.openclaw/dog-walk/history")
 STATE_FILE = os.path.expanduser("~/.openclaw/dog-walk/state.json")
 ROUTES_DIR = os.path.expanduser("~/.openclaw/dog-walk/routes")
@@ -154,32 +159,11 @@ def _load_route_file(path):
         return None
 
 
-def _route_summary(route):
-    return {
-        "walk_id": route.get("walk_id"),
-        "origin_location": route.get("origin_location"),
-        "started_at": route.get("started_at"),
-        "ended_at": route.get("ended_at"),
-        "end_location": route.get("end_location"),
-        "return_signal": route.get("return_signal"),
-        "distance_m": route.get("distance_m", 0),
-        "fi_distance_m": route.get("fi_distance_m"),
-        "fi_walk_start": route.get("fi_walk_start"),
-        "fi_walk_end": route.get("fi_walk_end"),
-        "fi_walker": route.get("fi_walker"),
-        "fi_walk_count": route.get("fi_walk_count"),
-        "detection_latency_s": route.get("detection_latency_s"),
-        "is_car_trip": route.get("is_car_trip", False),
-        "point_count": route.get("point_count", len(route.get("points") or [])),
-        "active": route.get("ended_at") is None,
-    }
-
-
 def _route_matches(route, cutoff=None, allowed_locations=None):
     origin_location = route.get("origin_location")
     if allowed_locations is not None and origin_location not in allowed_locations:
         return False
-    if route.get("is_interhome_transit") or route.get("is_car_trip"):
+    if route_index.route_excluded(route):
         return False
     started_dt = _parse_iso8601(route.get("started_at"))
     if started_dt is None:
@@ -194,35 +178,11 @@ def load_events(days):
     days = min(max(1, days), MAX_DAYS)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=days)
-    records = []
-
-    for i in range(days + 1):
-        day = (now - timedelta(days=i)).strftime("%Y-%m-%d")
-        path = os.path.join(HISTORY_DIR, f"{day}.jsonl")
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    ts_str = rec.get("timestamp", "")
-                    try:
-                        ts = _parse_iso8601(ts_str)
-                    except (ValueError, TypeError):
-                        ts = None
-                    if ts is None:
-                        continue
-                    if ts >= cutoff:
-                        records.append(rec)
-        except OSError:
-            continue
 
+    day_names = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days + 1)]
+    records = history_index.for_directory(HISTORY_DIR).records(
+        day_names, since=cutoff.timestamp()
+    )
     records.sort(key=lambda r: r.get("timestamp", ""))
     return records, days
 
@@ -236,20 +196,35 @@ def load_current_state():
         return None
 
 
+def _query_route_index(query):
+    """Run ``query`` on the synced route index; None to fall back to a file scan."""
+    index = route_index.RouteIndex(ROUTES_DIR)
+    try:
+        index.sync()
+        return query(index)
+    except (OSError, sqlite3.Error, route_index.RouteIndexError):
+        return None
+
+
 def load_route_summaries(days, location="all"):
-    """Load per-walk route summaries from route files."""
+    """Load per-walk route summaries from the route index."""
     days = min(max(1, days), MAX_DAYS)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=days)
     location = _normalize_location(location, allow_all=True)
     allowed_locations = None if location == "all" else {location}
+    summaries = _query_route_index(lambda index: index.summaries(
+        since=cutoff.timestamp(), location=None if location == "all" else location
+    ))
+    if summaries is not None:
+        return summaries, days, location
     summaries = []
 
     for path in _iter_route_files() or []:
         route = _load_route_file(path)
         if route is None or not _route_matches(route, cutoff=cutoff, allowed_locations=allowed_locations):
             continue
-        summaries.append(_route_summary(route))
+        summaries.append(route_index.route_summary(route))
 
     summaries.sort(key=lambda r: r.get("started_at") or "", reverse=True)
     return summaries, days, location
@@ -258,11 +233,18 @@ def load_route_summaries(days, location="all"):
 def load_route_detail(walk_id):
     if not walk_id:
         return None
+    indexed = _query_route_index(lambda index: [index.route_path(walk_id)])
+    if indexed is not None:
+        path = indexed[0]
+        route = _load_route_file(path) if path is not None else None
+        if route is None or route_index.route_excluded(route):
+            return None
+        return route
     for path in _iter_route_files() or []:
         if os.path.basename(path) != f"{walk_id}.json":
             continue
         route = _load_route_file(path)
-        if route is None or route.get("is_interhome_transit") or route.get("is_car_trip"):
+        if route is None or route_index.route_excluded(route):
             return None
         return route
     return None
@@ -276,6 +258,17 @@ def load_heatmap_points(days, location):
     if location is None:
         return [], days, None
 
+    # Indexed points are pre-binned per ~11 m cell, weighted by point count.
+    heatmap = _query_route_index(
+        lambda index: index.heatmap(since=cutoff.timestamp(), location=location)
+    )
+    if heatmap is not None:
+        return heatmap["points"], days, {
+            "location": location,
+            "walk_count": heatmap["walk_count"],
+            "point_count": heatmap["point_count"],
+        }
+
     points = []
     walk_count = 0
     for path in _iter_route_files() or []:
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""Shared time-partitioned index over ``YYYY-MM-DD.jsonl`` history files.
+
+The Nest, usage, dog-walk, and Roomba dashboards each read day-partitioned
+JSONL history written append-only by their collectors.  Every request used to
+re-read and re-parse every line of every day in range.  This module keeps one
+small sidecar per day file under ``<history>/.index/YYYY-MM-DD.json`` with:
+
+* the byte offset and length of every complete JSON-object line, its epoch
+  timestamp (timezone-aware ``timestamp`` only), and its ``event_type``;
+* the file's minimum and maximum timestamp, so a whole day can be skipped;
+* one rollup per ``%Y-%m-%d-%H`` hour: the representative line closest to the
+  top of the hour, the first/last epoch, and optional per-hour sums of numeric
+  fields and references to list fields that downsampling merges.
+
+A sidecar is keyed by the file's inode, size, and mtime.  When the same file
+has only grown, and the bytes that ended the indexed prefix are unchanged,
+only the appended lines are parsed; a shrunk, replaced, or rewritten file is
+re-indexed from the start.  A trailing partial line is never indexed until
+its newline arrives.  Sidecars are a cache: they are written atomically and
+best effort, and an unwritable directory still works from memory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any, Iterable, Mapping, Optional, Sequence
+import zlib
+
+
+INDEX_VERSION = 1
+INDEX_DIRNAME = ".index"
+HOUR_KEY_FORMAT = "%Y-%m-%d-%H"
+TAIL_CHECK_BYTES = 64
+
+# Line entry fields.
+_OFFSET, _LENGTH, _EPOCH, _EVENT_TYPE, _HOUR = range(5)
+
+_INDEXES: dict[tuple[str, str], "HistoryIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Return a timezone-aware datetime for an ISO-8601 value, else None."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return parsed
+
+
+def for_directory(
+    directory: str | os.PathLike[str],
+    *,
+    hourly_sums: Optional[Mapping[str, Sequence[str]]] = None,
+    hourly_lists: Sequence[str] = (),
+) -> "HistoryIndex":
+    """Return the process-wide index for one history directory and rollup shape."""
+    index = HistoryIndex(directory, hourly_sums=hourly_sums, hourly_lists=hourly_lists)
+    key = (str(index.directory), index.config)
+    with _INDEXES_LOCK:
+        return _INDEXES.setdefault(key, index)
+
+
+class HistoryIndex:
+    """Incrementally maintained offsets and hourly rollups for one directory."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        hourly_sums: Optional[Mapping[str, Sequence[str]]] = None,
+        hourly_lists: Sequence[str] = (),
+    ) -> None:
+        self.directory = Path(os.path.abspath(os.fspath(directory)))
+        self.hourly_sums = {
+            group: tuple(fields) for group, fields in (hourly_sums or {}).items()
+        }
+        self.hourly_lists = tuple(hourly_lists)
+        self.config = json.dumps(
+            {"sums": self.hourly_sums, "lists": self.hourly_lists}, sort_keys=True
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # -- read API ---------------------------------------------------------
+
+    def records(
+        self,
+        days: Iterable[str],
+        *,
+        since: Optional[float] = None,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Return JSON-object lines from the given days in file order.
+
+        With ``since``, only lines whose timezone-aware timestamp is at or
+        after that epoch are returned and days that end earlier are skipped
+        without reading.  Without it, untimestamped objects are included.
+        """
+        wanted = None if event_types is None else frozenset(event_types)
+        records: list[dict[str, Any]] = []
+        for day in days:
+            opened = self._open_day(day)
+            if opened is None:
+                continue
+            handle, entry = opened
+            with handle:
+                if not _may_overlap(entry, since):
+                    continue
+                refs = [
+                    line
+                    for line in entry["lines"]
+                    if (since is None or (line[_EPOCH] is not None and line[_EPOCH] >= since))
+                    and (wanted is None or line[_EVENT_TYPE] in wanted)
+                ]
+                records.extend(record for _line, record in _read_lines(handle, refs))
+        return records
+
+    def hourly_records(
+        self, days: Iterable[str], *, since: Optional[float] = None
+    ) -> list[dict[str, Any]]:
+        """Return one record per hour, closest to the top of the hour.
+
+        Ties keep the earliest timestamp.  Configured sum fields of every
+        dropped line in the hour are added to the kept record's group, and
+        configured list fields of dropped lines are appended to the kept
+        record's list in timestamp order.  Hours entirely at or after
+        ``since`` come straight from the rollups; only the hour straddling
+        ``since`` is recomputed from its lines.
+        """
+        buckets: dict[str, dict[str, Any]] = {}
+        with contextlib.ExitStack() as stack:
+            handles = {}
+            for day in days:
+                opened = self._open_day(day)
+                if opened is None:
+                    continue
+                handle, entry = opened
+                stack.enter_context(handle)
+                if not _may_overlap(entry, since):
+                    continue
+                handles[day] = handle
+                for slot, hour in enumerate(entry["hours"]):
+                    if since is not None and hour["last"] < since:
+                        continue
+                    if since is None or hour["first"] >= since:
+                        partial = hour
+                    else:
+                        partial = self._boundary_hour(handle, entry, slot, since)
+                    self._merge(buckets, day, partial)
+            records = [
+                self._materialize(handles, buckets[key]) for key in sorted(buckets)
+            ]
+        return [record for record in records if record is not None]
+
+    # -- hourly rollups ---------------------------------------------------
+
+    def _new_hour(self, key: str) -> dict[str, Any]:
+        return {
+            "key": key,
+            "first": None,
+            "last": None,
+            "rank": None,
+            "rep": None,
+            "count": 0,
+            "sums": {},
+            "groups": {},
+            "lists": {},
+        }
+
+    def _fold(
+        self,
+        hour: dict[str, Any],
+        record: Mapping[str, Any],
+        line: Sequence[Any],
+        timestamp: datetime,
+    ) -> None:
+        epoch = line[_EPOCH]
+        ref = [line[_OFFSET], line[_LENGTH]]
+        rank = [timestamp.minute, record["timestamp"]]
+        hour["count"] += 1
+        hour["first"] = epoch if hour["first"] is None else min(hour["first"], epoch)
+        hour["last"] = epoch if hour["last"] is None else max(hour["last"], epoch)
+        if hour["rank"] is None or rank < hour["rank"]:
+            hour["rank"] = rank
+            hour["rep"] = ref
+        for group, fields in self.hourly_sums.items():
+            values = record.get(group)
+            if not isinstance(values, dict) or not values:
+                continue
+            hour["groups"][group] = hour["groups"].get(group, 0) + 1
+            sums = hour["sums"].setdefault(group, {})
+            for field in fields:
+                value = values.get(field, 0)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    sums[field] = sums.get(field, 0) + value
+        for field in self.hourly_lists:
+            value = record.get(field)
+            if isinstance(value, list) and value:
+                hour["lists"].setdefault(field, []).append(ref)
+
+    def _boundary_hour(
+        self, handle, entry: Mapping[str, Any], slot: int, since: float
+    ) -> dict[str, Any]:
+        hour = self._new_hour(entry["hours"][slot]["key"])
+        refs = [
+            line
+            for line in entry["lines"]
+            if line[_HOUR] == slot and line[_EPOCH] >= since
+        ]
+        for line, record in _read_lines(handle, refs):
+            timestamp = parse_timestamp(record.get("timestamp"))
+            if timestamp is not None:
+                self._fold(hour, record, line, timestamp)
+        return hour
+
+    def _merge(
+        self, buckets: dict[str, dict[str, Any]], day: str, hour: Mapping[str, Any]
+    ) -> None:
+        if hour["rep"] is None:
+            return
+        bucket = buckets.get(hour["key"])
+        if bucket is None:
+            bucket = buckets[hour["key"]] = {
+                "rank": None,
+                "rep": None,
+                "sums": {},
+                "groups": {},
+                "lists": {},
+            }
+        if bucket["rank"] is None or hour["rank"] < bucket["rank"]:
+            bucket["rank"] = hour["rank"]
+            bucket["rep"] = (day, *hour["rep"])
+        for group, sums in hour["sums"].items():
+            target = bucket["sums"].setdefault(group, {})
+            for field, value in sums.items():
+                target[field] = target.get(field, 0) + value
+        for group, count in hour["groups"].items():
+            bucket["groups"][group] = bucket["groups"].get(group, 0) + count
+        for field, refs in hour["lists"].items():
+            bucket["lists"].setdefault(field, []).extend(
+                (day, *ref) for ref in refs
+            )
+
+    def _materialize(
+        self, handles: Mapping[str, Any], bucket: Mapping[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        kept = _read_ref(handles, bucket["rep"])
+        if kept is None:
+            return None
+        for group, fields in self.hourly_sums.items():
+            own = kept.get(group)
+            dropped = bucket["groups"].get(group, 0) - (
+                1 if isinstance(own, dict) and own else 0
+            )
+            if dropped <= 0:
+                continue
+            target = kept.setdefault(group, {})
+            sums = bucket["sums"].get(group, {})
+            for field in fields:
+                target[field] = sums.get(field, 0)
+        for field in self.hourly_lists:
+            others = [
+                record
+                for ref in bucket["lists"].get(field, [])
+                if ref != bucket["rep"]
+                for record in (_read_ref(handles, ref),)
+                if record is not None
+            ]
+            others.sort(key=lambda record: record.get("timestamp", ""))
+            for record in others:
+                kept.setdefault(field, []).extend(record[field])
+        return kept
+
+    # -- index maintenance ------------------------------------------------
+
+    def _path(self, day: str) -> Path:
+        return self.directory / f"{day}.jsonl"
+
+    def _sidecar(self, day: str) -> Path:
+        return self.directory / INDEX_DIRNAME / f"{day}.json"
+
+    def _open_day(self, day: str):
+        try:
+            handle = open(self._path(day), "rb")
+        except OSError:
+            return None
+        try:
+            entry = self._refresh(day, handle, os.fstat(handle.fileno()))
+        except OSError:
+            handle.close()
+            return None
+        return handle, entry
+
+    def _refresh(self, day: str, handle, status: os.stat_result) -> dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(day)
+            if entry is None:
+                entry = self._load_sidecar(day)
+            if entry is not None and _is_current(entry, status):
+                self._entries[day] = entry
+                return entry
+            if entry is not None and _is_append(entry, status, handle):
+                entry = self._extend(copy.deepcopy(entry), handle, status)
+            else:
+                entry = self._build(handle, status)
+            self._entries[day] = entry
+            self._store_sidecar(day, entry)
+            return entry
+
+    def _build(self, handle, status: os.stat_result) -> dict[str, Any]:
+        entry = {
+            "version": INDEX_VERSION,
+            "config": self.config,
+            "size": 0,
+            "tail": 0,
+            "min_ts": None,
+            "max_ts": None,
+            "lines": [],
+            "hours": [],
+        }
+        return self._extend(entry, handle, status)
+
+    def _extend(
+        self, entry: dict[str, Any], handle, status: os.stat_result
+    ) -> dict[str, Any]:
+        start = entry["size"]
+        handle.seek(start)
+        data = handle.read(max(0, status.st_size - start))
+        complete = data.rfind(b"\n") + 1
+        slots = {hour["key"]: slot for slot, hour in enumerate(entry["hours"])}
+        position = 0
+        for raw in data[:complete].splitlines(keepends=True):
+            offset = start + position
+            position += len(raw)
+            record = _decode(raw)
+            if record is None:
+                continue
+            line: list[Any] = [offset, len(raw), None, None, None]
+            event_type = record.get("event_type")
+            if isinstance(event_type, str):
+                line[_EVENT_TYPE] = event_type
+            timestamp = parse_timestamp(record.get("timestamp"))
+            if timestamp is not None:
+                epoch = timestamp.timestamp()
+                line[_EPOCH] = epoch
+                entry["min_ts"] = epoch if entry["min_ts"] is None else min(entry["min_ts"], epoch)
+                entry["max_ts"] = epoch if entry["max_ts"] is None else max(entry["max_ts"], epoch)
+                key = timestamp.strftime(HOUR_KEY_FORMAT)
+                slot = slots.get(key)
+                if slot is None:
+                    slot = slots[key] = len(entry["hours"])
+                    entry["hours"].append(self._new_hour(key))
+                line[_HOUR] = slot
+                self._fold(entry["hours"][slot], record, line, timestamp)
+            entry["lines"].append(line)
+        entry["size"] = start + complete
+        entry["tail"] = _tail_checksum(handle, entry["size"])
+        entry["inode"] = status.st_ino
+        entry["file_size"] = status.st_size
+        entry["mtime_ns"] = status.st_mtime_ns
+        return entry
+
+    def _load_sidecar(self, day: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self._sidecar(day), encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != INDEX_VERSION
+            or entry.get("config") != self.config
+        ):
+            return None
+        return entry
+
+    def _store_sidecar(self, day: str, entry: Mapping[str, Any]) -> None:
+        target = self._sidecar(day)
+        temporary = None
+        try:
+            target.parent.mkdir(mode=0o700, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(
+                prefix=f".{day}.", suffix=".tmp", dir=target.parent
+            )
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, separators=(",", ":"))
+            os.replace(temporary, target)
+            temporary = None
+        except OSError:
+            pass
+        finally:
+            if temporary is not None:
+                try:
+                    os.unlink(temporary)
+                except OSError:
+                    pass
+
+
+def _may_overlap(entry: Mapping[str, Any], since: Optional[float]) -> bool:
+    if since is None:
+        return True
+    return entry["max_ts"] is not None and entry["max_ts"] >= since
+
+
+def _is_current(entry: Mapping[str, Any], status: os.stat_result) -> bool:
+    return (
+        entry.get("inode") == status.st_ino
+        and entry.get("file_size") == status.st_size
+        and entry.get("mtime_ns") == status.st_mtime_ns
+    )
+
+
+def _is_append(entry: Mapping[str, Any], status: os.stat_result, handle) -> bool:
+    return (
+        entry.get("inode") == status.st_ino
+        and status.st_size > entry.get("file_size", 0)
+        and entry["size"] <= status.st_size
+        and _tail_checksum(handle, entry["size"]) == entry.get("tail")
+    )
+
+
+def _tail_checksum(handle, end: int) -> int:
+    start = max(0, end - TAIL_CHECK_BYTES)
+    return zlib.crc32(_read_at(handle, start, end - start))
+
+
+def _read_at(handle, offset: int, length: int) -> bytes:
+    handle.seek(offset)
+    return handle.read(length)
+
+
+def _read_ref(handles: Mapping[str, Any], ref: Sequence[Any]) -> Optional[dict[str, Any]]:
+    day, offset, length = ref
+    return _decode(_read_at(handles[day], offset, length))
+
+
+def _read_lines(handle, lines: Sequence[Sequence[Any]]):
+    """Yield ``(line, record)`` for indexed lines using one contiguous read."""
+    if not lines:
+        return
+    start = lines[0][_OFFSET]
+    end = lines[-1][_OFFSET] + lines[-1][_LENGTH]
+    data = _read_at(handle, start, end - start)
+    for line in lines:
+        offset = line[_OFFSET] - start
+        record = _decode(data[offset:offset + line[_LENGTH]])
+        if record is not None:
+            yield line, record
+
+
+def _decode(raw: bytes) -> Optional[dict[str, Any]]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        record = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
@@ -5,24 +5,31 @@ import hmac
 import json
 import math
 import os
+import random
 import secrets
 import signal
 import subprocess
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
 from urllib.parse import parse_qs, urlparse
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import device_clients  # noqa: E402
+
 
 PORT = 8558
 BIND_HOST = "0.0.0.0"
 CACHE_TTL_SECONDS = 60
 COMMAND_TIMEOUT_SECONDS = 30
 MAX_COMMAND_BODY_BYTES = 16 * 1024
+EVENT_HEARTBEAT_SECONDS = 15
+EVENT_STREAM_MAX_SECONDS = 30 * 60
+MAX_EVENT_STREAMS = 16
 MUTATION_TOKEN = secrets.token_urlsafe(32)
 MUTATION_TOKEN_PLACEHOLDER = "__HOME_DASHBOARD_MUTATION_TOKEN__"
 PRESENCE_STATE_PATH = os.path.expanduser("~/.openclaw/presence/state.json")
@@ -31,6 +38,7 @@ DOG_WALK_STATE_PATH = os.path.expanduser("~/.openclaw/dog-walk/state.json")
 SECRETS_CACHE_PATH = os.path.expanduser("~/.openclaw/.secrets-cache")
 CATT_BIN = os.path.expanduser("~/.local/bin/catt")
 CAMERA_SNAP_DIR = os.path.expanduser("~/.openclaw/camera-snaps")
+SKILLS_DIR = os.path.expanduser("~/.openclaw/skills")
 _SPEAKER_IPS = {"bedroom": "192.168.165.146", "living room": "192.168.165.113"}
 _CABIN_SPEAKER_IPS = {"kitchen": "192.168.1.66", "bedroom": "192.168.1.163"}
 
@@ -50,8 +58,18 @@ def _load_secrets():
 
 
 _load_secrets()
+DEVICE_CLIENTS = device_clients.DeviceClientRegistry(SKILLS_DIR)
 STATUS_CACHE = {}
 STATUS_CACHE_LOCK = threading.Lock()
+# Bumped under STATUS_CACHE_LOCK whenever cached status data changes;
+# STATUS_VERSIONS records the version at which each collector last changed.
+# Together they back the bundle ETag and the /api/events push channel.
+STATUS_CHANGED = threading.Condition(STATUS_CACHE_LOCK)
+STATUS_VERSION = {"value": 0}
+STATUS_VERSIONS = {}
+STATUS_BOOT_ID = secrets.token_hex(4)
+EVENT_STREAMS = {"open": 0}
+EVENT_STREAMS_LOCK = threading.Lock()
 
 
 def _iso_timestamp(timestamp=None):
@@ -159,6 +177,21 @@ def _run_cli(args, parse_json=False):
     return {"raw": stdout or stderr or "(no output)"}
 
 
+def _run_device(args):
+    """Run a JSON status CLI through its in-process client, else as a subprocess."""
+    try:
+        returncode, data = DEVICE_CLIENTS.call(args, timeout=COMMAND_TIMEOUT_SECONDS)
+    except device_clients.ClientUnavailable:
+        return _run_cli(args, parse_json=True)
+    except device_clients.ClientTimeout:
+        return {"error": f"command timed out after {COMMAND_TIMEOUT_SECONDS}s"}
+    if not isinstance(data, dict):
+        data = {"data": data}
+    if returncode != 0:
+        data.setdefault("returncode", returncode)
+    return data
+
+
 def collect_presence():
     return _read_json_file(PRESENCE_STATE_PATH)
 
@@ -199,7 +232,7 @@ def collect_mysa():
 
 
 def collect_midea():
-    return _run_cli(["midea-ac", "status", "--json"], parse_json=True)
+    return _run_device(["midea-ac", "status", "--json"])
 
 
 def collect_lock():
@@ -242,11 +275,11 @@ def collect_cabin_speakers():
 
 
 def collect_litter_robot():
-    return _run_cli(["litter-robot", "--json", "status"], parse_json=True)
+    return _run_device(["litter-robot", "--json", "status"])
 
 
 def collect_petlibro():
-    return _run_cli(["petlibro", "status"])
+    return _run_device(["petlibro", "--json", "status"])
 
 
 def collect_8sleep():
@@ -287,88 +320,294 @@ COLLECTORS = {
 # on Google Home devices when the device is idle.
 _NO_BG_REFRESH = {"speakers", "cabin_speakers"}
 
+# Per-collector freshness (TTL) and background cadence, in seconds. Entries
+# older than their TTL are still served, flagged stale, while one coalesced
+# revalidation runs. Local file readers are cheap; LAN and cloud CLIs are
+# refreshed on the previous five-minute cadence. Each TTL matches its
+# collector's cadence, so a status poll only revalidates an entry whose
+# background run is overdue.
+COLLECTOR_TTL_SECONDS = {
+    "presence": 60,
+    "nest": 60,
+    "dog_walk": 60,
+    "hue_crosstown": 300,
+    "hue_cabin": 300,
+    "cielo": 300,
+    "mysa": 300,
+    "midea": 300,
+    "lock": 300,
+    "roombas_crosstown": 300,
+    "roombas_cabin": 300,
+    "tv": 300,
+    "speakers": 300,
+    "cabin_speakers": 300,
+    "litter_robot": 300,
+    "petlibro": 300,
+    "8sleep": 300,
+    "ring": 300,
+}
+DEFAULT_REFRESH_SECONDS = 300
+COLLECTOR_REFRESH_SECONDS = {
+    "presence": 60,
+    "nest": 60,
+    "dog_walk": 60,
+}
+REFRESH_JITTER_FRACTION = 0.1
 
-def _collect_with_cache(name, collector, refresh=False):
-    now = time.time()
-    if not refresh:
-        with STATUS_CACHE_LOCK:
-            cached = STATUS_CACHE.get(name)
-        if cached and (now - cached["timestamp"]) < CACHE_TTL_SECONDS:
-            return cached["data"], True, cached["timestamp"]
 
-    data = collector()
-    timestamp = time.time()
-    with STATUS_CACHE_LOCK:
-        STATUS_CACHE[name] = {"data": data, "timestamp": timestamp}
-    return data, False, timestamp
+def _collector_ttl(name):
+    return COLLECTOR_TTL_SECONDS.get(name, CACHE_TTL_SECONDS)
 
 
-def collect_status_bundle(refresh=False):
-    results = {}
-    cache = {}
+def _bump_status_version_locked():
+    """Advance the status version and wake event streams (lock held)."""
+    STATUS_VERSION["value"] += 1
+    STATUS_CHANGED.notify_all()
+    return STATUS_VERSION["value"]
+
+
+def _store_status_locked(name, data, timestamp):
+    """Cache one collector result; only a change in data is published."""
+    previous = STATUS_CACHE.get(name)
+    entry = STATUS_CACHE[name] = {"data": data, "timestamp": timestamp}
+    if previous is None or previous["data"] != data:
+        STATUS_VERSIONS[name] = _bump_status_version_locked()
+    return entry
+
 
-    with ThreadPoolExecutor(max_workers=len(COLLECTORS)) as executor:
-        futures = {
-            executor.submit(_collect_with_cache, name, collector, refresh): name
-            for name, collector in COLLECTORS.items()
+def _status_token(version):
+    return f"{STATUS_BOOT_ID}-{version}"
+
+
+def _parse_status_token(token):
+    """Return the version a client last saw, or 0 for another server boot."""
+    boot_id, _, version = (token or "").strip().partition("-")
+    if boot_id != STATUS_BOOT_ID or not version.isdigit():
+        return 0
+    return int(version)
+
+
+def wait_for_status_changes(since, timeout):
+    """Block until the status version passes ``since`` or ``timeout`` elapses.
+
+    Returns ``(version, changes)`` where ``changes`` maps each collector that
+    changed after ``since`` to its current cache entry.
+    """
+    with STATUS_CHANGED:
+        if STATUS_VERSION["value"] <= since:
+            STATUS_CHANGED.wait(timeout)
+        version = STATUS_VERSION["value"]
+        changes = {
+            name: STATUS_CACHE[name]
+            for name in COLLECTORS
+            if STATUS_VERSIONS.get(name, 0) > since and name in STATUS_CACHE
         }
-        for future in as_completed(futures):
-            name = futures[future]
+    return version, changes
+
+
+class CollectorScheduler:
+    """Persistent stale-while-revalidate refresher for ``COLLECTORS``.
+
+    Each collector has at most one run in flight; concurrent refresh requests
+    share its future. Background collectors are re-run on their own jittered
+    cadence, counted from the end of their last run, whether that run was
+    scheduled or request-driven. Collectors in ``_NO_BG_REFRESH`` only run
+    on request.
+    """
+
+    def __init__(self, collectors, *, clock=time.time, jitter=random.uniform):
+        self._collectors = collectors
+        self._clock = clock
+        self._jitter = jitter
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(collectors), thread_name_prefix="collector"
+        )
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._next_due = {}
+        self._invalidated_at = 0.0
+        self._wake = threading.Event()
+
+    def refresh(self, name):
+        """Start (or join) one run of ``name``; the future yields (data, timestamp)."""
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is None:
+                future = self._executor.submit(self._run, name, self._clock())
+                self._inflight[name] = future
+            return future
+
+    def invalidate(self):
+        """Discard results of runs that started before a device command."""
+        with self._lock:
+            self._invalidated_at = self._clock()
+
+    def revalidate_if_stale(self, name, entry, now):
+        if entry is None:
+            self.refresh(name)
+        # A stale _NO_BG_REFRESH entry waits for an explicit refresh; status
+        # polls from an open page must not open Cast connections.
+        elif name not in _NO_BG_REFRESH and now - entry["timestamp"] >= _collector_ttl(name):
+            self.refresh(name)
+
+    def start(self):
+        """Precache every collector, then keep background collectors fresh."""
+        for name in self._collectors:
+            self.refresh(name)
+        threading.Thread(target=self._loop, name="collector-scheduler", daemon=True).start()
+
+    def _run(self, name, started):
+        try:
             try:
-                data, cached, timestamp = future.result()
+                data = self._collectors[name]()
             except Exception as exc:
                 data = {"error": str(exc)}
-                cached = False
-                timestamp = time.time()
-            results[name] = data
-            cache[name] = {"cached": cached, "timestamp": _iso_timestamp(timestamp)}
-
-    payload = {
-        "meta": {
-            "timestamp": _iso_timestamp(),
-            "ttl_seconds": CACHE_TTL_SECONDS,
-            "refresh": refresh,
-        }
+            finished = self._clock()
+            with self._lock:
+                superseded = started < self._invalidated_at
+            # A device command since this run started makes its result
+            # pre-command state; do not cache it.
+            if superseded:
+                return data, finished
+            with STATUS_CACHE_LOCK:
+                current = STATUS_CACHE.get(name)
+                # A command readback written after this run started is newer.
+                if current is None or current["timestamp"] <= started:
+                    current = _store_status_locked(name, data, finished)
+            return current["data"], current["timestamp"]
+        finally:
+            with self._lock:
+                self._inflight.pop(name, None)
+                if name not in _NO_BG_REFRESH:
+                    cadence = COLLECTOR_REFRESH_SECONDS.get(name, DEFAULT_REFRESH_SECONDS)
+                    spread = cadence * REFRESH_JITTER_FRACTION
+                    self._next_due[name] = self._clock() + cadence + self._jitter(-spread, spread)
+            self._wake.set()
+
+    def _loop(self):
+        while True:
+            now = self._clock()
+            with self._lock:
+                due = [
+                    name
+                    for name, at in self._next_due.items()
+                    if at <= now and name not in self._inflight
+                ]
+                for name in due:
+                    self._next_due.pop(name)
+                upcoming = min(self._next_due.values(), default=now + DEFAULT_REFRESH_SECONDS)
+            for name in due:
+                self.refresh(name)
+            self._wake.wait(max(1.0, upcoming - now))
+            self._wake.clear()
+
+
+SCHEDULER = CollectorScheduler(COLLECTORS)
+
+
+def _cache_info(name, entry, cached, now):
+    age = max(0.0, now - entry["timestamp"])
+    return {
+        "cached": cached,
+        "timestamp": _iso_timestamp(entry["timestamp"]),
+        "age_seconds": int(age),
+        "ttl_seconds": _collector_ttl(name),
+        "stale": age >= _collector_ttl(name),
     }
+
+
+def _status_payload(entries, *, refresh, version, pending=None):
+    now = time.time()
+    cache_info = {}
+    ages = []
+    for name, (entry, cached) in entries.items():
+        ages.append(max(0.0, now - entry["timestamp"]))
+        cache_info[name] = _cache_info(name, entry, cached, now)
+
+    meta = {
+        "timestamp": _iso_timestamp(),
+        "ttl_seconds": CACHE_TTL_SECONDS,
+        "refresh": refresh,
+        "age_seconds": int(max(ages, default=0)),
+        "version": _status_token(version),
+    }
+    if pending is not None:
+        meta["pending"] = pending
+    payload = {"meta": meta}
     for name in COLLECTORS:
-        payload[name] = results.get(name, {"error": "collector missing"})
-    payload["cache"] = cache
+        if name in entries:
+            payload[name] = entries[name][0]["data"]
+        elif pending is not None and name in pending:
+            payload[name] = {"_pending": True}
+        else:
+            payload[name] = {"error": "collector missing"}
+    payload["cache"] = cache_info
     return payload
 
 
+def collect_status_bundle(refresh=False):
+    """Return every collector, serving stale entries while they revalidate.
+
+    Only collectors with no cached entry are waited on. ``refresh=True``
+    waits for a fresh, coalesced run of every collector.
+    """
+    now = time.time()
+    entries = {}
+    futures = {}
+    with STATUS_CACHE_LOCK:
+        version = STATUS_VERSION["value"]
+    for name in COLLECTORS:
+        with STATUS_CACHE_LOCK:
+            entry = STATUS_CACHE.get(name)
+        if refresh or entry is None:
+            futures[name] = SCHEDULER.refresh(name)
+        else:
+            entries[name] = (entry, True)
+            SCHEDULER.revalidate_if_stale(name, entry, now)
+
+    for name, future in futures.items():
+        try:
+            data, timestamp = future.result()
+        except Exception as exc:
+            data, timestamp = {"error": str(exc)}, time.time()
+        entries[name] = ({"data": data, "timestamp": timestamp}, False)
+
+    return _status_payload(entries, refresh=refresh, version=version)
+
+
 def collect_status_cached_fast():
     """Return whatever is in cache immediately — no blocking on collectors.
 
-    Returns partial data if some collectors haven't finished yet.
+    Returns partial data if some collectors haven't finished yet, and starts
+    one coalesced revalidation for every missing or stale collector.
     The 'pending' list tells the frontend which devices to poll individually.
     """
     now = time.time()
-    results = {}
-    cache_info = {}
+    entries = {}
     pending = []
-
+    # Read before the entries so the version never claims newer data than
+    # the payload holds.
     with STATUS_CACHE_LOCK:
-        for name in COLLECTORS:
-            cached = STATUS_CACHE.get(name)
-            if cached:
-                results[name] = cached["data"]
-                cache_info[name] = {"cached": True, "timestamp": _iso_timestamp(cached["timestamp"])}
-            else:
-                results[name] = {"_pending": True}
-                pending.append(name)
-
-    payload = {
-        "meta": {
-            "timestamp": _iso_timestamp(),
-            "ttl_seconds": CACHE_TTL_SECONDS,
-            "refresh": False,
-            "pending": pending,
-        }
-    }
+        version = STATUS_VERSION["value"]
+
     for name in COLLECTORS:
-        payload[name] = results.get(name, {"error": "collector missing"})
-    payload["cache"] = cache_info
-    return payload
+        with STATUS_CACHE_LOCK:
+            entry = STATUS_CACHE.get(name)
+        if entry:
+            entries[name] = (entry, True)
+        else:
+            pending.append(name)
+        SCHEDULER.revalidate_if_stale(name, entry, now)
+
+    return _status_payload(entries, refresh=False, version=version, pending=pending)
+
+
+def _status_age_header(payload):
+    return (("Age", str(payload["meta"]["age_seconds"])),)
+
+
+def _status_etag(payload):
+    return f'W/"{payload["meta"]["version"]}"'
 
 
 def _build_hue_command(bridge_flag, action, args):
@@ -626,39 +865,56 @@ def execute_command(payload):
         return 400, {"success": False, "error": "invalid command arguments"}
 
     try:
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            timeout=COMMAND_TIMEOUT_SECONDS,
-            text=True,
+        returncode, structured_output = DEVICE_CLIENTS.call(
+            command, timeout=COMMAND_TIMEOUT_SECONDS
         )
-    except FileNotFoundError:
-        return 502, {"success": False, "error": "command unavailable"}
-    except subprocess.TimeoutExpired:
+    except device_clients.ClientTimeout:
         return 504, {
             "success": False,
             "error": f"command timed out after {COMMAND_TIMEOUT_SECONDS}s",
         }
-    except OSError:
-        return 502, {"success": False, "error": "command could not be started"}
-
-    stdout = (result.stdout or "").strip()
-    stderr = (result.stderr or "").strip()
+    except device_clients.ClientUnavailable:
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                timeout=COMMAND_TIMEOUT_SECONDS,
+                text=True,
+            )
+        except FileNotFoundError:
+            return 502, {"success": False, "error": "command unavailable"}
+        except subprocess.TimeoutExpired:
+            return 504, {
+                "success": False,
+                "error": f"command timed out after {COMMAND_TIMEOUT_SECONDS}s",
+            }
+        except OSError:
+            return 502, {"success": False, "error": "command could not be started"}
+        returncode = result.returncode
+        stdout = (result.stdout or "").strip()
+        stderr = (result.stderr or "").strip()
+        structured_output = _parse_cli_json(stdout)
+    else:
+        stdout = json.dumps(structured_output, separators=(",", ":"), default=str)
+        stderr = ""
+        if returncode != 0 and isinstance(structured_output, dict):
+            stderr = str(structured_output.get("message") or structured_output.get("error") or "")
 
     response = {
-        "success": result.returncode == 0,
+        "success": returncode == 0,
         "output": stdout,
         "error": stderr,
-        "returncode": result.returncode,
+        "returncode": returncode,
     }
-    structured_output = _parse_cli_json(stdout)
     if structured_output is not None:
         response["result"] = structured_output
 
-    if result.returncode == 0:
+    if returncode == 0:
+        SCHEDULER.invalidate()
         with STATUS_CACHE_LOCK:
             previous_midea = STATUS_CACHE.get("midea", {}).get("data", {})
             STATUS_CACHE.clear()
+            _bump_status_version_locked()
             if device == "midea" and isinstance(structured_output, dict):
                 verified_status = structured_output.get("status")
                 if isinstance(verified_status, dict):
@@ -670,10 +926,9 @@ def execute_command(payload):
                         and item.get("alias") != verified_status.get("alias")
                     ]
                     devices.append(verified_status)
-                    STATUS_CACHE["midea"] = {
-                        "data": {"ok": True, "devices": devices},
-                        "timestamp": time.time(),
-                    }
+                    _store_status_locked(
+                        "midea", {"ok": True, "devices": devices}, time.time()
+                    )
         return 200, response
 
     return 502, response
@@ -699,16 +954,24 @@ class DashboardHandler(BaseHTTPRequestHandler):
         elif path == "/api/status":
             refresh = qs.get("refresh", ["false"])[0].lower() in {"1", "true", "yes"}
             if refresh:
-                self._respond(200, collect_status_bundle(refresh=True))
+                payload = collect_status_bundle(refresh=True)
             else:
-                self._respond(200, collect_status_cached_fast())
+                payload = collect_status_cached_fast()
+            etag = _status_etag(payload)
+            headers = _status_age_header(payload) + (("ETag", etag),)
+            if not refresh and self.headers.get("If-None-Match") == etag:
+                self._respond_not_modified(headers)
+            else:
+                self._respond(200, payload, extra_headers=headers)
+        elif path == "/api/events":
+            since = self.headers.get("Last-Event-ID") or qs.get("since", [""])[0]
+            self._serve_events(_parse_status_token(since))
         elif path.startswith("/api/status/"):
             device_name = path.split("/api/status/", 1)[1]
             if device_name in COLLECTORS:
-                data = COLLECTORS[device_name]()
-                with STATUS_CACHE_LOCK:
-                    STATUS_CACHE[device_name] = {"data": data, "timestamp": time.time()}
-                self._respond(200, data)
+                data, timestamp = SCHEDULER.refresh(device_name).result()
+                age = max(0, int(time.time() - timestamp))
+                self._respond(200, data, extra_headers=(("Age", str(age)),))
             else:
                 self._respond(404, {"error": f"unknown device: {device_name}"})
         elif path == "/api/presence":
@@ -798,6 +1061,62 @@ class DashboardHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(body)
 
+    def _respond_not_modified(self, extra_headers):
+        self.send_response(304)
+        self.send_header("Cache-Control", "no-store")
+        for name, value in extra_headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _serve_events(self, since):
+        """Stream collector changes after version ``since`` as server-sent events.
+
+        Each ``status`` event carries one collector's data and cache info, with
+        the status version as its id so a reconnecting EventSource resumes
+        from Last-Event-ID. Streams close after EVENT_STREAM_MAX_SECONDS and
+        the browser reconnects.
+        """
+        with EVENT_STREAMS_LOCK:
+            if EVENT_STREAMS["open"] >= MAX_EVENT_STREAMS:
+                self._respond(503, {"error": "too many event streams"})
+                return
+            EVENT_STREAMS["open"] += 1
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(b"retry: 5000\n\n")
+            self.wfile.flush()
+            deadline = time.time() + EVENT_STREAM_MAX_SECONDS
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                version, changes = wait_for_status_changes(
+                    since, min(EVENT_HEARTBEAT_SECONDS, remaining)
+                )
+                if version == since:
+                    self.wfile.write(b": keepalive\n\n")
+                now = time.time()
+                for name, entry in changes.items():
+                    event = {
+                        "name": name,
+                        "data": entry["data"],
+                        "cache": _cache_info(name, entry, True, now),
+                    }
+                    self.wfile.write(
+                        f"event: status\nid: {_status_token(version)}\n"
+                        f"data: {json.dumps(event)}\n\n".encode()
+                    )
+                self.wfile.flush()
+                since = version
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with EVENT_STREAMS_LOCK:
+                EVENT_STREAMS["open"] -= 1
+
     def _serve_html(self):
         token_literal = json.dumps(MUTATION_TOKEN)
         body = DASHBOARD_HTML.replace(MUTATION_TOKEN_PLACEHOLDER, token_literal).encode()
@@ -1487,6 +1806,8 @@ const state = {
   location: 'both',
   data: null,
   loading: false,
+  etag: null,
+  events: null,
 };
 
 function escapeHtml(value) {
@@ -1808,35 +2129,29 @@ function renderCabinSpeakers(result) {
 function renderPetlibro(result) {
   if (!result) return '<div class="muted">No Petlibro data</div>';
   if (isPending(result)) return renderPending();
-  if (result.error) return renderError(result);
-  const raw = result.raw || '';
-  if (!raw) return '<div class="muted">No data</div>';
-  const blocks = raw.split(/\n(?=\S)/).filter(b => b.trim());
-  const cards = blocks.map(block => {
-    const lines = block.split('\n');
-    const headerMatch = lines[0].match(/^(.+?)\s+\((\w+)\)\s*—\s*(\w+)/);
-    if (!headerMatch) return null;
-    const [, name, , status] = headerMatch;
-    const isOnline = status.toLowerCase() === 'online';
+  if (result.error) return renderError({ error: result.message || result.error });
+  const devices = Array.isArray(result.data) ? result.data : [];
+  if (!devices.length) return '<div class="muted">No data</div>';
+  const cards = devices.filter((device) => device && typeof device === 'object').map((device) => {
+    const isOnline = Boolean(device.online);
+    const status = isOnline ? 'Online' : 'Offline';
     const dot = isOnline ? '<span style="color:#4ade80">●</span>' : '<span style="color:var(--text-muted)">○</span>';
-    const props = {};
-    lines.slice(1).forEach(l => {
-      const kv = l.match(/^\s+(.+?):\s+(.+)$/);
-      if (kv) props[kv[1].trim().toLowerCase()] = kv[2].trim();
-    });
     const meta = [];
-    if (props['water level']) meta.push('💧 ' + props['water level']);
-    if (props['battery']) meta.push('🔋 ' + props['battery']);
-    if (props['food level']) meta.push('🍽️ ' + props['food level']);
-    if (props['next feed']) meta.push('⏰ ' + props['next feed']);
-    if (props['today drunk']) meta.push(props['today drunk'] + ' today');
-    if (props['filter'] && props['filter'].includes('OVERDUE')) meta.push('⚠️ Filter overdue');
+    if (device.type === 'fountain') {
+      meta.push(`💧 ${device.waterPercent}% (${device.waterWeight}g)`);
+      meta.push(`🔋 ${device.battery}% (${device.batteryState})`);
+      meta.push(`${device.todayDrinkMl} mL today`);
+      if (typeof device.filterDaysRemaining === 'number' && device.filterDaysRemaining < 0) meta.push('⚠️ Filter overdue');
+    } else if (device.type === 'feeder') {
+      meta.push(`🍽️ ${device.foodLevel}`);
+      meta.push(`⏰ ${device.nextFeedTime} (${device.nextFeedPortions} portions)`);
+    }
     return `<div class="room-chip">
-      <div class="room-name">${escapeHtml(name.trim())}</div>
-      <div class="room-temp">${dot} ${escapeHtml(status)}</div>
-      ${meta.length ? '<div class="room-meta">' + meta.join(' · ') + '</div>' : ''}
+      <div class="room-name">${escapeHtml(device.name || '?')}</div>
+      <div class="room-temp">${dot} ${status}</div>
+      ${meta.length ? '<div class="room-meta">' + meta.map(escapeHtml).join(' · ') + '</div>' : ''}
     </div>`;
-  }).filter(Boolean).join('');
+  }).join('');
   return `<div class="room-grid">${cards}</div>`;
 }
 
@@ -2139,13 +2454,17 @@ async function fetchStatus(refresh=false) {
   if (state.loading) return;
   state.loading = true;
   try {
-    const response = await fetch(`/api/status${refresh ? '?refresh=true' : ''}`);
+    const headers = !refresh && state.etag ? { 'If-None-Match': state.etag } : {};
+    const response = await fetch(`/api/status${refresh ? '?refresh=true' : ''}`, { headers });
+    if (response.status === 304) return;
     const data = await response.json();
     if (!response.ok) {
       throw new Error(data.error || 'Failed to load status');
     }
     state.data = data;
+    state.etag = response.headers.get('ETag');
     renderDashboard();
+    connectEvents(data.meta && data.meta.version);
     if (!refresh) {
       showFeedback('');
     }
@@ -2164,6 +2483,21 @@ async function fetchStatus(refresh=false) {
   }
 }
 
+// Collector changes are pushed as they land; the poll below is a fallback.
+function connectEvents(version) {
+  if (state.events || typeof EventSource === 'undefined') return;
+  const source = new EventSource(`/api/events?since=${encodeURIComponent(version || '')}`);
+  source.addEventListener('status', (event) => {
+    const update = JSON.parse(event.data);
+    if (!state.data) return;
+    state.data[update.name] = update.data;
+    state.data.cache = Object.assign({}, state.data.cache, { [update.name]: update.cache });
+    state.etag = null;
+    renderDashboard();
+  });
+  state.events = source;
+}
+
 const DEVICE_TO_COLLECTOR = {
   hue_crosstown: 'hue_crosstown',
   hue_cabin: 'hue_cabin',
@@ -2358,34 +2692,15 @@ setInterval(() => fetchStatus(), 5 * 60 * 1000);
 def run():
     server = ThreadedHTTPServer((BIND_HOST, PORT), DashboardHandler)
 
-    # Precache all collectors on startup
-    threading.Thread(target=collect_status_bundle, daemon=True).start()
-
-    # Periodic background refresh every 5 minutes
-    # Collectors in _NO_BG_REFRESH are skipped — they are polled only on page
-    # load or explicit request to avoid unwanted side effects (e.g. Cast
-    # connections cause chimes on idle Google Home devices).
-    def _periodic_refresh():
-        bg_collectors = {k: v for k, v in COLLECTORS.items() if k not in _NO_BG_REFRESH}
-        while True:
-            time.sleep(300)
-            try:
-                with ThreadPoolExecutor(max_workers=len(bg_collectors)) as executor:
-                    futures = {
-                        executor.submit(_collect_with_cache, name, collector, True): name
-                        for name, collector in bg_collectors.items()
-                    }
-                    for future in as_completed(futures):
-                        try:
-                            future.result()
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-
-    threading.Thread(target=_periodic_refresh, daemon=True).start()
+    # Precache all collectors, then refresh each on its own jittered cadence.
+    # Collectors in _NO_BG_REFRESH are only re-run on page load or explicit
+    # request to avoid unwanted side effects (e.g. Cast connections cause
+    # chimes on idle Google Home devices).
+    SCHEDULER.start()
 
     print(f"Home Control Plane running on http://{BIND_HOST}:{PORT}", flush=True)
+    for cli, available in DEVICE_CLIENTS.availability().items():
+        print(f"  {cli}: {'in-process client' if available else 'CLI fallback'}", flush=True)
     print("  Access via Tailscale IP or localhost", flush=True)
 
     def shutdown(signum, frame):
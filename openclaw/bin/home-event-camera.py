@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 import dataclasses
 from datetime import datetime, timedelta, timezone
@@ -17,13 +18,14 @@ import stat
 import subprocess
 import sys
 import time
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Sequence
 
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from home_event_bus import (  # noqa: E402
     EventStore,
     HomeEventError,
+    camera_timing_counters,
     load_delivery_policy,
     utc_now,
     validate_runtime,
@@ -37,6 +39,9 @@ MODEL = "codex/gpt-5.6-sol"
 MODEL_PROVIDER = "codex"
 MODEL_NAME = "gpt-5.6-sol"
 SNAPSHOT_OFFSETS = (30, 60)
+# Targets of one slot are captured and analyzed concurrently; a binding has at
+# most two Ring aliases plus Nest, so this never queues in practice.
+MAX_TARGET_WORKERS = 4
 CONFIDENCES = frozenset({"low", "medium", "high"})
 SAFE_CODE_RE = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
 IMAGE_NAME_RE = re.compile(
@@ -77,6 +82,10 @@ class VisionDecision:
     confidence: str
 
 
+def _elapsed_ms(started: float) -> int:
+    return max(0, int((time.monotonic() - started) * 1000))
+
+
 def parse_time(value: Any) -> datetime:
     if not isinstance(value, str) or len(value) > 64:
         raise CameraError("invalid_timestamp")
@@ -272,7 +281,7 @@ class CameraWorker:
         commands: CameraCommands | Any | None = None,
     ) -> None:
         self.paths = validate_runtime(root)
-        self.store = EventStore(self.paths, clock=clock)
+        self.store = EventStore(self.paths, clock=clock, persistent=True)
         self.presence_state = presence_state or Path(
             os.environ.get(
                 "HOME_EVENTS_PRESENCE_STATE",
@@ -555,11 +564,27 @@ class CameraWorker:
         if not header.startswith(b"\xff\xd8\xff") or trailer != b"\xff\xd9":
             raise CameraError("captured_image_invalid")
 
+    @staticmethod
+    def _record_timings(
+        connection: sqlite3.Connection,
+        timings: Sequence[tuple[str, int]],
+    ) -> None:
+        for stage, elapsed_ms in timings:
+            for name, amount in camera_timing_counters(stage, elapsed_ms):
+                connection.execute(
+                    """
+                    INSERT INTO service_counters(name, value) VALUES (?, ?)
+                    ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+                    """,
+                    (name, amount),
+                )
+
     def _record_slot(
         self,
         claim: Mapping[str, Any],
         result: str,
         error_code: str | None,
+        timings: Sequence[tuple[str, int]] = (),
     ) -> str:
         now = format_time(self.now())
         with closing(self.store.connect()) as connection:
@@ -583,6 +608,7 @@ class CameraWorker:
             ).fetchone()
             assert row is not None
             combined = self._finalize_ready(connection, row)
+            self._record_timings(connection, timings)
             self._runtime_update(
                 connection,
                 now=now,
@@ -593,7 +619,11 @@ class CameraWorker:
             connection.commit()
         return combined or result
 
-    def _cancel_claim_for_presence(self, claim: Mapping[str, Any]) -> str:
+    def _cancel_claim_for_presence(
+        self,
+        claim: Mapping[str, Any],
+        timings: Sequence[tuple[str, int]] = (),
+    ) -> str:
         """Fail closed when presence changes after a snapshot slot is claimed."""
 
         now = format_time(self.now())
@@ -628,6 +658,7 @@ class CameraWorker:
                 ON CONFLICT(name) DO UPDATE SET value = value + 1
                 """
             )
+            self._record_timings(connection, timings)
             self._runtime_update(connection, now=now, health="ok")
             connection.commit()
         return "cancelled"
@@ -642,22 +673,40 @@ class CameraWorker:
         provider: str,
         alias: str,
         target: int,
-    ) -> tuple[str, str | None]:
+    ) -> tuple[str, str | None, list[tuple[str, int]]]:
+        """Capture then analyze one target; runs on a slot worker thread.
+
+        Returns ``cancelled`` without analysis when the site is no longer
+        vacant once the frame exists.  Only the calling thread touches SQLite.
+        """
+
         path = self._image_path(
             int(claim["id"]), int(claim["offset"]), target
         )
         started = time.time()
         result = "failed"
         error_code: str | None = None
+        timings: list[tuple[str, int]] = []
         try:
-            self.commands.capture(
-                provider,
-                str(claim["site"]),
-                alias,
-                path,
-            )
-            self._validate_image(path, oldest=started)
-            decision = self.commands.analyze(path)
+            stage_started = time.monotonic()
+            try:
+                self.commands.capture(
+                    provider,
+                    str(claim["site"]),
+                    alias,
+                    path,
+                )
+                self._validate_image(path, oldest=started)
+            finally:
+                timings.append(("capture", _elapsed_ms(stage_started)))
+            if not self._claimed_site_is_vacant(claim):
+                result = "cancelled"
+                return result, error_code, timings
+            stage_started = time.monotonic()
+            try:
+                decision = self.commands.analyze(path)
+            finally:
+                timings.append(("analysis", _elapsed_ms(stage_started)))
             if (
                 not isinstance(decision, VisionDecision)
                 or type(decision.person_visible) is not bool
@@ -684,24 +733,28 @@ class CameraWorker:
             except CameraError:
                 error_code = f"{provider}_image_cleanup_failed"
                 result = "failed"
-        return result, error_code
+        return result, error_code, timings
 
     def _process(self, claim: Mapping[str, Any]) -> str:
-        results: list[str] = []
-        errors: list[str] = []
-        for index, value in enumerate(claim["targets"], start=1):
-            if not self._claimed_site_is_vacant(claim):
-                return self._cancel_claim_for_presence(claim)
-            provider, alias = value
-            result, error_code = self._process_target(
-                claim,
-                str(provider),
-                str(alias),
-                index,
-            )
-            results.append(result)
-            if error_code is not None:
-                errors.append(error_code)
+        if not self._claimed_site_is_vacant(claim):
+            return self._cancel_claim_for_presence(claim)
+        slot_started = time.monotonic()
+        targets = [(str(provider), str(alias)) for provider, alias in claim["targets"]]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(targets), MAX_TARGET_WORKERS)),
+            thread_name_prefix="camera-target",
+        ) as pool:
+            futures = [
+                pool.submit(self._process_target, claim, provider, alias, index)
+                for index, (provider, alias) in enumerate(targets, start=1)
+            ]
+            outcomes = [future.result() for future in futures]
+        timings = [sample for _result, _error, samples in outcomes for sample in samples]
+        timings.append(("slot", _elapsed_ms(slot_started)))
+        if any(result == "cancelled" for result, _error, _samples in outcomes):
+            return self._cancel_claim_for_presence(claim, timings)
+        results = [result for result, _error, _samples in outcomes]
+        errors = [error for _result, error, _samples in outcomes if error is not None]
         if "person" in results:
             combined = "person"
         elif results and all(result == "clear" for result in results):
@@ -721,7 +774,7 @@ class CameraWorker:
                     if combined == "failed"
                     else "camera_targets_partial"
                 )
-        return self._record_slot(claim, combined, error_code)
+        return self._record_slot(claim, combined, error_code, timings)
 
     def run_once(self) -> Mapping[str, Any]:
         descriptor = os.open(
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import argparse
-from contextlib import closing
+import bisect
+from contextlib import closing, contextmanager
+import fcntl
 import json
 import os
 from pathlib import Path
@@ -13,8 +15,9 @@ import secrets
 import sqlite3
 import stat
 import sys
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Iterator, Mapping
 
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -41,7 +44,16 @@ CAMERA_COALESCE = timedelta(seconds=120)
 CAMERA_TRIGGER_TYPES = frozenset(
     {"entry.person_detected", "camera.person_detected", "lock.unlocked", "door.opened"}
 )
+ACCESS_EVENT_TYPES = frozenset(
+    {"lock.unlocked", "lock.locked", "door.opened", "door.closed"}
+)
 SAFE_CODE_RE = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
+CLAIM_LIMIT = 20
+DAEMON_MAX_CLAIM_LIMIT = 100
+DAEMON_POLL_SECONDS = 1.0
+# A presence file modified this recently may still change within the same
+# mtime tick, so it is re-read rather than served from the daemon cache.
+PRESENCE_CACHE_SETTLE_NS = 1_000_000_000
 LOCAL_PRESENCE_SHADOW_COUNTERS = {
     "presence.local_departure_inferred": "local_departure_inferred_shadowed",
     "presence.local_arrival_observed": "local_arrival_observed_shadowed",
@@ -72,8 +84,17 @@ def format_time(value: datetime) -> str:
     return value.astimezone(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
-def read_presence(path: Path, now: datetime) -> Mapping[str, str]:
-    """Return fail-closed per-site modes without exposing resident details."""
+def read_presence(
+    path: Path,
+    now: datetime,
+    cache: dict[str, Any] | None = None,
+) -> Mapping[str, str]:
+    """Return fail-closed per-site modes without exposing resident details.
+
+    A daemon passes ``cache`` to reuse the parsed file while its identity,
+    size and timestamps are unchanged; freshness is always re-evaluated
+    against ``now``.
+    """
 
     unknown = {"cabin": "uncertain", "crosstown": "uncertain"}
     try:
@@ -87,7 +108,24 @@ def read_presence(path: Path, now: datetime) -> Mapping[str, str]:
             or metadata.st_size > 1024 * 1024
         ):
             return unknown
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        signature = (
+            metadata.st_ino,
+            metadata.st_size,
+            metadata.st_mtime_ns,
+            metadata.st_ctime_ns,
+        )
+        if cache is not None and cache.get("signature") == signature:
+            payload = cache["payload"]
+        else:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                cache is not None
+                and time.time_ns() - metadata.st_mtime_ns >= PRESENCE_CACHE_SETTLE_NS
+            ):
+                cache.clear()
+                cache.update(signature=signature, payload=payload)
+        if not isinstance(payload, dict):
+            return unknown
         observed = parse_time(payload.get("timestamp"))
         if observed > now + timedelta(minutes=5) or now - observed > PRESENCE_MAX_AGE:
             return unknown
@@ -109,6 +147,97 @@ def read_presence(path: Path, now: datetime) -> Mapping[str, str]:
         return unknown
 
 
+def _load_access_evidence(
+    connection: sqlite3.Connection, incident_id: int
+) -> list[tuple[str, int, str]]:
+    return [
+        (row["observed_at"], int(row["id"]), row["event_type"])
+        for row in connection.execute(
+            """
+            SELECT e.observed_at, e.id, e.event_type
+            FROM incident_events ie
+            JOIN events e ON e.id = ie.event_id
+            WHERE ie.incident_id = ?
+              AND e.event_type IN (
+                'lock.unlocked', 'lock.locked', 'door.opened', 'door.closed'
+              )
+            ORDER BY e.observed_at, e.id
+            """,
+            (incident_id,),
+        )
+    ]
+
+
+class IncidentIndex:
+    """Daemon cache of open incidents and their access evidence.
+
+    Entries are filled from, and updated inside, the correlator's own
+    ``BEGIN IMMEDIATE`` transactions.  Any transaction that does not commit
+    resets the whole index, so it never holds state SQLite rolled back.  It is
+    trusted only while the correlator lock is held: the correlator is the only
+    writer of open incidents, and prune removes closed incidents only.
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[tuple[str, str], int] | None = None
+        self._access: dict[int, list[tuple[str, int, str]]] = {}
+
+    def reset(self) -> None:
+        self._open = None
+        self._access = {}
+
+    def open_id(
+        self, connection: sqlite3.Connection, site: str, category: str
+    ) -> int | None:
+        if self._open is None:
+            rows = connection.execute(
+                """
+                SELECT id, site, category FROM incidents
+                WHERE state = 'open'
+                """
+            ).fetchall()
+            # Ordered here rather than in SQL so the open-incident partial
+            # index serves the read; the newest open incident wins, as in
+            # the unindexed lookup.
+            self._open = {
+                (row["site"], row["category"]): int(row["id"])
+                for row in sorted(rows, key=lambda row: row["id"])
+            }
+        return self._open.get((site, category))
+
+    def opened(self, site: str, category: str, incident_id: int) -> None:
+        if self._open is not None:
+            self._open[(site, category)] = incident_id
+        self._access[incident_id] = []
+
+    def closed(self, incident_id: int) -> None:
+        if self._open is not None:
+            self._open = {
+                key: value for key, value in self._open.items() if value != incident_id
+            }
+        self._access.pop(incident_id, None)
+
+    def access_evidence(
+        self, connection: sqlite3.Connection, incident_id: int
+    ) -> list[tuple[str, int, str]]:
+        if incident_id not in self._access:
+            self._access[incident_id] = _load_access_evidence(connection, incident_id)
+        return self._access[incident_id]
+
+    def attached(
+        self, connection: sqlite3.Connection, incident_id: int, event_id: int
+    ) -> None:
+        evidence = self._access.get(incident_id)
+        if evidence is None:
+            return
+        row = connection.execute(
+            "SELECT observed_at, event_type FROM events WHERE id = ?",
+            (event_id,),
+        ).fetchone()
+        if row is not None and row["event_type"] in ACCESS_EVENT_TYPES:
+            bisect.insort(evidence, (row["observed_at"], event_id, row["event_type"]))
+
+
 class ShadowCorrelator:
     def __init__(
         self,
@@ -118,9 +247,11 @@ class ShadowCorrelator:
         clock: Callable[[], str] = utc_now,
     ) -> None:
         self.paths = validate_runtime(root)
-        self.store = EventStore(self.paths, clock=clock)
+        self.store = EventStore(self.paths, clock=clock, persistent=True)
         self.presence_state = presence_state
         self.clock = clock
+        self.index: IncidentIndex | None = None
+        self._presence_cache: dict[str, Any] | None = None
 
     def now(self) -> datetime:
         return parse_time(self.clock())
@@ -135,18 +266,40 @@ class ShadowCorrelator:
             (name,),
         )
 
-    @staticmethod
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with closing(self.store.connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.commit()
+            except BaseException:
+                if self.index is not None:
+                    self.index.reset()
+                raise
+
     def _open_incident(
-        connection: sqlite3.Connection, site: str, category: str
+        self, connection: sqlite3.Connection, site: str, category: str
     ) -> sqlite3.Row | None:
-        return connection.execute(
-            """
-            SELECT * FROM incidents
-            WHERE site = ? AND category = ? AND state = 'open'
-            ORDER BY id DESC LIMIT 1
-            """,
-            (site, category),
+        if self.index is None:
+            return connection.execute(
+                """
+                SELECT * FROM incidents
+                WHERE site = ? AND category = ? AND state = 'open'
+                ORDER BY id DESC LIMIT 1
+                """,
+                (site, category),
+            ).fetchone()
+        incident_id = self.index.open_id(connection, site, category)
+        if incident_id is None:
+            return None
+        incident = connection.execute(
+            "SELECT * FROM incidents WHERE id = ? AND state = 'open'",
+            (incident_id,),
         ).fetchone()
+        if incident is None:
+            raise CorrelatorError("incident_index_stale")
+        return incident
 
     def _ensure_incident(
         self,
@@ -161,7 +314,7 @@ class ShadowCorrelator:
         now = format_time(self.now())
         if incident is None:
             incident_uid = "inc_" + secrets.token_hex(16)
-            connection.execute(
+            cursor = connection.execute(
                 """
                 INSERT INTO incidents(
                     incident_uid, site, state, category, summary_code,
@@ -171,6 +324,8 @@ class ShadowCorrelator:
                 (incident_uid, site, category, summary_code, event_time, now),
             )
             self._increment(connection, "incidents_opened")
+            if self.index is not None:
+                self.index.opened(site, category, int(cursor.lastrowid))
             incident = self._open_incident(connection, site, category)
             assert incident is not None
         else:
@@ -194,7 +349,7 @@ class ShadowCorrelator:
         event_id: int,
         relation: str,
     ) -> None:
-        connection.execute(
+        cursor = connection.execute(
             """
             INSERT OR IGNORE INTO incident_events(
                 incident_id, event_id, relation, created_at
@@ -202,6 +357,8 @@ class ShadowCorrelator:
             """,
             (incident_id, event_id, relation, format_time(self.now())),
         )
+        if self.index is not None and cursor.rowcount == 1:
+            self.index.attached(connection, incident_id, event_id)
 
     def _record_decision(
         self,
@@ -235,19 +392,9 @@ class ShadowCorrelator:
         if not has_access or (lock_open is not True and door_open is not True):
             return None
         access_event_ids = [
-            int(row["id"])
-            for row in connection.execute(
-                """
-                SELECT e.id
-                FROM incident_events ie
-                JOIN events e ON e.id = ie.event_id
-                WHERE ie.incident_id = ?
-                  AND e.event_type IN (
-                    'lock.unlocked', 'lock.locked', 'door.opened', 'door.closed'
-                  )
-                ORDER BY e.observed_at, e.id
-                """,
-                (incident["id"],),
+            event_id
+            for _observed_at, event_id, _event_type in self._access_evidence(
+                connection, int(incident["id"])
             )
         ]
         self._resolve(connection, incident, "access_carried_into_vacancy")
@@ -375,30 +522,26 @@ class ShadowCorrelator:
             """,
             (state, summary_code, now, now, incident["id"]),
         )
+        if self.index is not None:
+            self.index.closed(int(incident["id"]))
         self._increment(connection, "incidents_resolved")
 
-    @staticmethod
+    def _access_evidence(
+        self, connection: sqlite3.Connection, incident_id: int
+    ) -> list[tuple[str, int, str]]:
+        if self.index is None:
+            return _load_access_evidence(connection, incident_id)
+        return self.index.access_evidence(connection, incident_id)
+
     def _access_state(
-        connection: sqlite3.Connection, incident_id: int
+        self, connection: sqlite3.Connection, incident_id: int
     ) -> tuple[bool, bool | None, bool | None]:
-        rows = connection.execute(
-            """
-            SELECT e.event_type
-            FROM incident_events ie
-            JOIN events e ON e.id = ie.event_id
-            WHERE ie.incident_id = ?
-              AND e.event_type IN (
-                'lock.unlocked', 'lock.locked', 'door.opened', 'door.closed'
-              )
-            ORDER BY e.observed_at, e.id
-            """,
-            (incident_id,),
-        ).fetchall()
         has_open_evidence = False
         lock_open: bool | None = None
         door_open: bool | None = None
-        for row in rows:
-            event_type = row["event_type"]
+        for _observed_at, _event_id, event_type in self._access_evidence(
+            connection, incident_id
+        ):
             if event_type == "lock.unlocked":
                 has_open_evidence = True
                 lock_open = True
@@ -430,8 +573,7 @@ class ShadowCorrelator:
         event_id = int(delivery["event_id"])
         event_time = delivery["observed_at"]
         mode = presence.get(site, "uncertain")
-        with closing(self.store.connect()) as connection:
-            connection.execute("BEGIN IMMEDIATE")
+        with self._transaction() as connection:
             if delivery.get("time_precision") == "backfill":
                 self._increment(connection, "ring_backfill_shadowed")
             elif event_type in LOCAL_PRESENCE_SHADOW_COUNTERS:
@@ -565,13 +707,11 @@ class ShadowCorrelator:
             )
             if acknowledged.rowcount != 1:
                 raise CorrelatorError("delivery_lease_mismatch")
-            connection.commit()
 
     def _expire_incidents(self) -> int:
         now = self.now()
         changed = 0
-        with closing(self.store.connect()) as connection:
-            connection.execute("BEGIN IMMEDIATE")
+        with self._transaction() as connection:
             incidents = connection.execute(
                 "SELECT * FROM incidents WHERE state = 'open'"
             ).fetchall()
@@ -629,7 +769,6 @@ class ShadowCorrelator:
                     elif not access_open and quiet >= ROUTINE_QUIET:
                         self._resolve(connection, incident, "routine_quiet_silent")
                         changed += 1
-            connection.commit()
         return changed
 
     @staticmethod
@@ -702,8 +841,7 @@ class ShadowCorrelator:
                 else int(RATE_LIMIT.total_seconds())
             )
         )
-        with closing(self.store.connect()) as connection:
-            connection.execute("BEGIN IMMEDIATE")
+        with self._transaction() as connection:
             transaction_mode = connection.execute(
                 "SELECT mode FROM runtime_status WHERE singleton = 1"
             ).fetchone()["mode"]
@@ -898,11 +1036,118 @@ class ShadowCorrelator:
                 )
                 self._increment(connection, "shadow_delivery_decisions")
                 shadow_decisions += 1
-            connection.commit()
         return shadow_decisions, reservations
 
-    def run_once(self, *, limit: int = 20) -> Mapping[str, Any]:
-        presence = read_presence(self.presence_state, self.now())
+    @contextmanager
+    def _correlator_lock(self) -> Iterator[bool]:
+        """Yield whether this process now owns the single-correlator lock."""
+
+        try:
+            descriptor = os.open(
+                self.paths.correlator_lock,
+                os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0),
+                0o600,
+            )
+        except OSError as exc:
+            raise CorrelatorError("unsafe_lock_file") from exc
+        try:
+            metadata = os.fstat(descriptor)
+            if (
+                not stat.S_ISREG(metadata.st_mode)
+                or metadata.st_uid != os.geteuid()
+                or stat.S_IMODE(metadata.st_mode) & 0o077
+            ):
+                raise CorrelatorError("unsafe_lock_file")
+            try:
+                fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(descriptor, fcntl.LOCK_UN)
+        finally:
+            os.close(descriptor)
+
+    def run_once(self, *, limit: int = CLAIM_LIMIT) -> Mapping[str, Any]:
+        with self._correlator_lock() as owned:
+            if not owned:
+                return {"ok": True, "outcome": "busy"}
+            return self._run_cycle(limit=limit)
+
+    def run_daemon(
+        self,
+        *,
+        poll_seconds: float = DAEMON_POLL_SECONDS,
+        max_seconds: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Mapping[str, Any]:
+        """Drain the claim queue continuously with an in-memory incident index.
+
+        A full claim doubles the next claim size up to the bus maximum and runs
+        again immediately; a short claim halves it back toward the tick-mode
+        limit and waits ``poll_seconds``.  Every cycle still expires incidents,
+        finalizes decisions and refreshes status exactly like ``run_once``.
+        """
+
+        if not 0 < poll_seconds <= 60:
+            raise CorrelatorError("invalid_poll_interval")
+        if max_seconds is not None and max_seconds <= 0:
+            raise CorrelatorError("invalid_max_seconds")
+        totals = dict.fromkeys(
+            (
+                "claimed",
+                "acknowledged",
+                "dead_lettered",
+                "expired",
+                "shadow_decisions",
+                "reservations",
+            ),
+            0,
+        )
+        with self._correlator_lock() as owned:
+            if not owned:
+                return {"ok": True, "outcome": "busy"}
+            self.index = IncidentIndex()
+            self._presence_cache = {}
+            deadline = None if max_seconds is None else time.monotonic() + max_seconds
+            limit = CLAIM_LIMIT
+            largest = limit
+            cycles = 0
+            try:
+                while True:
+                    result = self._run_cycle(limit=limit)
+                    cycles += 1
+                    for name in totals:
+                        totals[name] += int(result[name])
+                    drained = result["acknowledged"] + result["dead_lettered"]
+                    full = result["claimed"] >= limit and drained == result["claimed"]
+                    if full:
+                        limit = min(limit * 2, DAEMON_MAX_CLAIM_LIMIT)
+                        largest = max(largest, limit)
+                    else:
+                        limit = max(CLAIM_LIMIT, limit // 2)
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    if not full:
+                        sleep(poll_seconds)
+            finally:
+                self.index = None
+                self._presence_cache = None
+        return {
+            "ok": True,
+            "mode": self.store.runtime_mode(),
+            "outcome": "stopped",
+            "cycles": cycles,
+            "max_claim_limit": largest,
+            **totals,
+        }
+
+    def _run_cycle(self, *, limit: int) -> Mapping[str, Any]:
+        presence = read_presence(
+            self.presence_state, self.now(), self._presence_cache
+        )
         claimed = self.store.claim_deliveries(CONSUMER, limit=limit)
         acknowledged = 0
         dead = 0
@@ -956,14 +1201,23 @@ def parser() -> argparse.ArgumentParser:
             )
         ).expanduser(),
     )
-    value.add_argument("--limit", type=int, default=20)
+    value.add_argument("--limit", type=int, default=CLAIM_LIMIT)
+    value.add_argument("--daemon", action="store_true")
+    value.add_argument("--poll-seconds", type=float, default=DAEMON_POLL_SECONDS)
+    value.add_argument("--max-seconds", type=float)
     return value
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parser().parse_args(argv)
     try:
-        result = ShadowCorrelator(args.root, args.presence_state).run_once(limit=args.limit)
+        correlator = ShadowCorrelator(args.root, args.presence_state)
+        if args.daemon:
+            result = correlator.run_daemon(
+                poll_seconds=args.poll_seconds, max_seconds=args.max_seconds
+            )
+        else:
+            result = correlator.run_once(limit=args.limit)
     except (CorrelatorError, HomeEventError, sqlite3.Error, OSError) as exc:
         code = exc.code if hasattr(exc, "code") and SAFE_CODE_RE.fullmatch(exc.code) else "correlator_failed"
         print(json.dumps({"ok": False, "error_code": code}, separators=(",", ":")))
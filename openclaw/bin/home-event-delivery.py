@@ -224,7 +224,7 @@ class DeliveryWorker:
         clock: Callable[[], str] = utc_now,
     ) -> None:
         self.paths = validate_runtime(root)
-        self.store = EventStore(self.paths, clock=clock)
+        self.store = EventStore(self.paths, clock=clock, persistent=True)
         self.presence_state = presence_state
         self.target = target
         self.clock = clock
@@ -10,7 +10,10 @@ files into SQLite.  The agent CLI is deliberately read-only.
 from __future__ import annotations
 
 import argparse
+import collections
 import contextlib
+import ctypes
+import ctypes.util
 import dataclasses
 import datetime as dt
 import fcntl
@@ -21,13 +24,26 @@ import os
 from pathlib import Path
 import re
 import secrets
+import select
 import sqlite3
 import stat
 import sys
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 
-SCHEMA_VERSION = 5
+SCHEMA_VERSION = 7
 STATUS_SCHEMA_VERSION = 5
 EVENT_SCHEMA_VERSION = 1
 DELIVERY_POLICY_SCHEMA_VERSION = 3
@@ -36,14 +52,27 @@ DEFAULT_ROOT = Path("~/.openclaw/home-events").expanduser()
 SOURCES = ("ring", "presence", "august", "nest")
 SITES = ("cabin", "crosstown")
 MAX_STDIN_BYTES = 64 * 1024
+MAX_ENQUEUE_BATCH = 64
+MAX_ENQUEUE_BATCH_BYTES = 1024 * 1024
 MAX_SPOOL_BYTES = 32 * 1024
 MAX_ATTRIBUTES_BYTES = 2 * 1024
 MAX_DELIVERY_POLICY_BYTES = 16 * 1024
 MAX_QUERY_LIMIT = 100
+MAX_INGEST_LIMIT = 1000
+DEFAULT_INGEST_BATCH_SIZE = 100
+READ_POOL_SIZE = 4
+WATCH_RESCAN_SECONDS = 5.0
+INGEST_LATENCY_WINDOW = 512
+TAIL_PAGE_SIZE = 500
+TAIL_POLL_SECONDS = 1.0
 ACCEPTED_RETENTION_DAYS = 30
 DEAD_LETTER_RETENTION_DAYS = 90
 AUTO_PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+PRUNE_BATCH_SIZE = 500
+PRUNE_BUDGET_SECONDS = 2.0
+PRUNE_BATCH_PAUSE_SECONDS = 0.01
 MAINTENANCE_LAST_PRUNE_EPOCH = "maintenance_last_prune_epoch"
+MAINTENANCE_PRUNE_RESUME_STEP = "maintenance_prune_resume_step"
 ACCESS_INCIDENTS_EXPIRED = "access_incidents_expired"
 ACCESS_ATTENTION_REVIEWED = "access_attention_reviewed"
 ACCESS_ATTENTION_LAST_REVIEWED_EPOCH = "access_attention_last_reviewed_epoch"
@@ -98,6 +127,9 @@ CAMERA_SNAPSHOT_OFFSETS_SECONDS = (30, 60)
 CAMERA_RESULTS = frozenset(
     {"person_visible", "no_person_visible", "uncertain", "unavailable"}
 )
+CAMERA_TIMING_STAGES = ("capture", "analysis", "slot")
+CAMERA_TIMING_BUCKETS_MS = (1000, 2500, 5000, 10000, 20000, 30000, 60000, 90000)
+CAMERA_TIMING_PREFIX = "camera_timing_"
 
 LOCAL_PRESENCE_EVENT_TYPES = frozenset(
     {
@@ -371,6 +403,10 @@ class RuntimePaths:
     def delivery_lock(self) -> Path:
         return self.state / "delivery.lock"
 
+    @property
+    def correlator_lock(self) -> Path:
+        return self.state / "correlator.lock"
+
     @property
     def camera_images(self) -> Path:
         return self.state / "camera-images"
@@ -427,6 +463,24 @@ class IngestResult:
             values["cleanup_pending"] += 1
         return IngestResult(**values)
 
+    def merged(self, other: "IngestResult") -> "IngestResult":
+        return IngestResult(
+            **{
+                name: value + getattr(other, name)
+                for name, value in dataclasses.asdict(self).items()
+            }
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class SpoolReceipt:
+    """One validated spool file, or the safe code that dead-letters it."""
+
+    receipt_uid: str
+    source: str
+    event: Optional[NormalizedEvent] = None
+    error_code: Optional[str] = None
+
 
 def utc_now() -> str:
     return _format_timestamp(dt.datetime.now(dt.timezone.utc))
@@ -1410,6 +1464,8 @@ def initialize_runtime(root: Path, *, clock: Callable[[], str] = utc_now) -> "Ev
         _create_private_file(paths.ingest_lock, b"home-events-ingest\n")
     if not paths.delivery_lock.exists():
         _create_private_file(paths.delivery_lock, b"home-events-delivery\n")
+    if not paths.correlator_lock.exists():
+        _create_private_file(paths.correlator_lock, b"home-events-correlator\n")
     store = EventStore(paths, clock=clock)
     store.initialize()
     store.write_status_best_effort()
@@ -1447,6 +1503,50 @@ def validate_runtime(root: Path, *, require_status: bool = False) -> RuntimePath
     return paths
 
 
+def enqueue_many(
+    root: Path,
+    source: str,
+    payloads: Sequence[bytes],
+    *,
+    clock: Callable[[], str] = utc_now,
+) -> list[NormalizedEvent]:
+    """Validate a producer batch as a whole, then spool one file per event.
+
+    Nothing is written unless every payload normalizes.  Each spool file is
+    still written atomically on its own, so a failure part-way through leaves
+    a prefix that ingest deduplicates when the producer retries the batch with
+    the same ``source_event_id`` values.
+    """
+
+    if not payloads:
+        raise PayloadError("empty_batch")
+    if len(payloads) > MAX_ENQUEUE_BATCH:
+        raise PayloadError("batch_too_large")
+    paths = validate_runtime(root)
+    secret = _load_secret(paths)
+    prepared = []
+    for data in payloads:
+        parsed = _decode_json(data, max_bytes=MAX_STDIN_BYTES, code="event_too_large")
+        event = normalize_input(source, parsed, secret, clock=clock)
+        record = event.as_spool_record()
+        record["record_mac"] = _record_mac(secret, record)
+        encoded = json.dumps(
+            record,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8") + b"\n"
+        if len(encoded) > MAX_SPOOL_BYTES:
+            raise PayloadError("normalized_event_too_large")
+        prepared.append((event, encoded))
+    spool = paths.source_spool(source)
+    for event, encoded in prepared:
+        destination = spool / (
+            event.event_uid + "." + secrets.token_hex(16) + ".ready"
+        )
+        _atomic_write(destination, encoded)
+    return [event for event, _encoded in prepared]
+
+
 def enqueue_event(
     root: Path,
     source: str,
@@ -1454,24 +1554,13 @@ def enqueue_event(
     *,
     clock: Callable[[], str] = utc_now,
 ) -> NormalizedEvent:
-    paths = validate_runtime(root)
-    secret = _load_secret(paths)
-    parsed = _decode_json(data, max_bytes=MAX_STDIN_BYTES, code="event_too_large")
-    event = normalize_input(source, parsed, secret, clock=clock)
-    destination = paths.source_spool(source) / (
-        event.event_uid + "." + secrets.token_hex(16) + ".ready"
-    )
-    record = event.as_spool_record()
-    record["record_mac"] = _record_mac(secret, record)
-    encoded = json.dumps(
-        record,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8") + b"\n"
-    if len(encoded) > MAX_SPOOL_BYTES:
-        raise PayloadError("normalized_event_too_large")
-    _atomic_write(destination, encoded)
-    return event
+    return enqueue_many(root, source, [data], clock=clock)[0]
+
+
+def _split_ndjson(data: bytes) -> list[bytes]:
+    if len(data) > MAX_ENQUEUE_BATCH_BYTES:
+        raise PayloadError("batch_too_large")
+    return [line for line in data.split(b"\n") if line.strip()]
 
 
 SCHEMA_SQL = """
@@ -1586,6 +1675,10 @@ CREATE TABLE IF NOT EXISTS service_counters (
     name TEXT PRIMARY KEY,
     value INTEGER NOT NULL
 );
+CREATE TABLE IF NOT EXISTS status_counts (
+    name TEXT PRIMARY KEY NOT NULL,
+    value INTEGER NOT NULL
+);
 CREATE TABLE IF NOT EXISTS runtime_status (
     singleton INTEGER PRIMARY KEY CHECK(singleton = 1),
     mode TEXT NOT NULL CHECK(mode IN ('shadow', 'limited_delivery')),
@@ -1664,6 +1757,7 @@ EXPECTED_TABLES = frozenset(
         "incident_decisions",
         "notification_outbox",
         "service_counters",
+        "status_counts",
         "runtime_status",
         "delivery_runtime",
         "camera_evaluations",
@@ -1823,6 +1917,102 @@ EXPECTED_COLUMNS: Mapping[str, frozenset] = {
             "last_error_code",
         }
     ),
+    "status_counts": frozenset({"name", "value"}),
+}
+
+# Materialized status counts.  Each expression names the counter row that one
+# table row contributes to (NULL for none).  Triggers keep every row exact in
+# the same transaction as the state change, whichever worker performs it.
+STATUS_COUNT_KEYS: Mapping[str, Tuple[str, ...]] = {
+    "events": ("'events'",),
+    "producer_inbox": ("'inbox:' || {row}.outcome",),
+    "consumer_deliveries": (
+        "'deliveries:' || {row}.status",
+        "'deliveries:' || {row}.consumer_name || ':' || {row}.status",
+    ),
+    "incidents": ("'incidents:' || {row}.state",),
+    "notification_outbox": (
+        "'outbox:' || {row}.status",
+        "CASE WHEN {row}.status = 'unknown' AND {row}.reviewed_at IS NULL"
+        " THEN 'outbox:unknown_unreviewed' END",
+    ),
+    "camera_evaluations": ("'camera:' || {row}.state",),
+}
+
+
+def _status_count_triggers() -> Iterator[Tuple[str, str]]:
+    for table, keys in STATUS_COUNT_KEYS.items():
+        for index, key in enumerate(keys):
+            name = "status_counts_{table}_{index}".format(table=table, index=index)
+            new = key.format(row="NEW")
+            old = key.format(row="OLD")
+            add = """
+                INSERT OR IGNORE INTO status_counts(name, value)
+                    SELECT {new}, 0 WHERE {new} IS NOT NULL;
+                UPDATE status_counts SET value = value + 1 WHERE name = {new};
+            """.format(new=new)
+            remove = "UPDATE status_counts SET value = value - 1 WHERE name = {old};".format(
+                old=old
+            )
+            yield name + "_insert", (
+                "CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {table}"
+                " BEGIN {add} END"
+            ).format(name=name, table=table, add=add)
+            yield name + "_update", (
+                "CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE ON {table}"
+                " WHEN ({old}) IS NOT ({new}) BEGIN {remove} {add} END"
+            ).format(name=name, table=table, old=old, new=new, remove=remove, add=add)
+            yield name + "_delete", (
+                "CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {table}"
+                " BEGIN {remove} END"
+            ).format(name=name, table=table, remove=remove)
+
+
+STATUS_COUNT_TRIGGERS: Mapping[str, str] = dict(_status_count_triggers())
+
+# Access-path indexes added in schema v7.  They are created after migrations
+# (not in SCHEMA_SQL) because some index columns do not exist before v4.
+ACCESS_PATH_INDEXES: Mapping[str, str] = {
+    name: "CREATE INDEX IF NOT EXISTS {name} ON {target}".format(
+        name=name, target=target
+    )
+    for name, target in (
+        # claim_deliveries, the correlator backlog probe, and status MIN().
+        (
+            "deliveries_consumer_status_idx",
+            "consumer_deliveries(consumer_name, status, lease_until)",
+        ),
+        ("deliveries_event_idx", "consumer_deliveries(event_id)"),
+        ("deliveries_status_updated_idx", "consumer_deliveries(status, updated_at)"),
+        ("events_occurred_idx", "events(occurred_at)"),
+        ("events_producer_inbox_idx", "events(producer_inbox_id)"),
+        (
+            "producer_inbox_dead_letter_idx",
+            "producer_inbox(received_at) WHERE outcome = 'dead_letter'",
+        ),
+        ("incident_events_event_idx", "incident_events(event_id)"),
+        # _open_incident and the correlator's open-incident sweeps.
+        (
+            "incidents_open_category_site_idx",
+            "incidents(category, site) WHERE state = 'open'",
+        ),
+        ("incidents_updated_idx", "incidents(updated_at)"),
+        ("notification_incident_idx", "notification_outbox(incident_id)"),
+        (
+            "notification_camera_evaluation_idx",
+            "notification_outbox(camera_evaluation_id)"
+            " WHERE camera_evaluation_id IS NOT NULL",
+        ),
+        ("notification_site_created_idx", "notification_outbox(site, created_at)"),
+        (
+            "notification_unreserved_updated_idx",
+            "notification_outbox(updated_at) WHERE status != 'reserved'",
+        ),
+        (
+            "camera_evaluations_finished_updated_idx",
+            "camera_evaluations(updated_at) WHERE state != 'pending'",
+        ),
+    )
 }
 
 
@@ -1945,35 +2135,86 @@ MIGRATION_V3_COPY_SQL = (
 )
 
 
+class _PooledConnection(sqlite3.Connection):
+    """SQLite connection whose ``close`` may hand it back to its store's pool."""
+
+    release: Optional[Callable[["_PooledConnection"], bool]] = None
+    identity: Tuple[int, int] = (0, 0)
+    read_only: bool = False
+
+    def close(self) -> None:
+        release = self.release
+        if release is not None and release(self):
+            return
+        self.release = None
+        super().close()
+
+
 class EventStore:
-    """SQLite store with one explicit writer boundary and safe read queries."""
+    """SQLite store with one explicit writer boundary and safe read queries.
+
+    With ``persistent=True`` the store keeps one writer and a small read-only
+    pool open for the life of the process, so PRAGMA setup and sqlite3's
+    per-connection prepared-statement cache survive across calls.  Callers
+    still ``close`` every connection; closing returns it to the pool after
+    rolling back any unfinished transaction.  Every checkout re-runs the private-file checks
+    and reopens the connection if the database inode changed underneath it.
+    """
 
-    def __init__(self, paths: RuntimePaths, *, clock: Callable[[], str] = utc_now):
+    def __init__(
+        self,
+        paths: RuntimePaths,
+        *,
+        clock: Callable[[], str] = utc_now,
+        persistent: bool = False,
+    ):
         self.paths = paths
         self.clock = clock
+        self.persistent = persistent
+        self._pool_lock = threading.Lock()
+        self._idle: Dict[bool, list[_PooledConnection]] = {False: [], True: []}
 
     def _now(self) -> str:
         value = self.clock()
         _parse_now(value)
         return _format_timestamp(_parse_now(value))
 
-    def _prepare_database(self) -> None:
-        descriptor = _open_private_regular(
-            self.paths.database,
-            os.O_RDWR | os.O_CREAT,
-        )
-        os.close(descriptor)
+    def _prepare_database(self) -> Tuple[int, int]:
+        return self._database_identity(os.O_RDWR | os.O_CREAT)
+
+    def _database_identity(self, flags: int) -> Tuple[int, int]:
+        descriptor = _open_private_regular(self.paths.database, flags)
+        try:
+            metadata = os.fstat(descriptor)
+        finally:
+            os.close(descriptor)
+        return metadata.st_dev, metadata.st_ino
 
     def connect(self, *, read_only: bool = False) -> sqlite3.Connection:
+        if self.persistent:
+            pooled = self._checkout(read_only)
+            if pooled is not None:
+                return pooled
+        factory = _PooledConnection if self.persistent else sqlite3.Connection
         if read_only:
-            descriptor = _open_private_regular(self.paths.database, os.O_RDONLY)
-            os.close(descriptor)
+            identity = self._database_identity(os.O_RDONLY)
             uri = "file:" + str(self.paths.database) + "?mode=ro"
-            connection = sqlite3.connect(uri, uri=True, timeout=15)
+            connection = sqlite3.connect(
+                uri,
+                uri=True,
+                timeout=15,
+                factory=factory,
+                check_same_thread=not self.persistent,
+            )
             connection.execute("PRAGMA query_only = ON")
         else:
-            self._prepare_database()
-            connection = sqlite3.connect(self.paths.database, timeout=15)
+            identity = self._prepare_database()
+            connection = sqlite3.connect(
+                self.paths.database,
+                timeout=15,
+                factory=factory,
+                check_same_thread=not self.persistent,
+            )
             mode = connection.execute("PRAGMA journal_mode = WAL").fetchone()[0]
             if str(mode).lower() != "wal":
                 connection.close()
@@ -1982,8 +2223,60 @@ class EventStore:
         connection.row_factory = sqlite3.Row
         connection.execute("PRAGMA foreign_keys = ON")
         connection.execute("PRAGMA busy_timeout = 15000")
+        if isinstance(connection, _PooledConnection):
+            connection.identity = identity
+            connection.read_only = read_only
+            connection.release = self._release
+        return connection
+
+    def _checkout(self, read_only: bool) -> Optional[_PooledConnection]:
+        with self._pool_lock:
+            idle = self._idle[read_only]
+            connection = idle.pop() if idle else None
+        if connection is None:
+            return None
+        try:
+            identity = (
+                self._database_identity(os.O_RDONLY)
+                if read_only
+                else self._prepare_database()
+            )
+        except HomeEventError:
+            connection.release = None
+            connection.close()
+            raise
+        if identity != connection.identity:
+            connection.release = None
+            connection.close()
+            return None
         return connection
 
+    def _release(self, connection: _PooledConnection) -> bool:
+        if not self.persistent:
+            return False
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            return False
+        limit = READ_POOL_SIZE if connection.read_only else 1
+        with self._pool_lock:
+            idle = self._idle[connection.read_only]
+            if len(idle) >= limit or connection in idle:
+                return False
+            idle.append(connection)
+        return True
+
+    def close(self) -> None:
+        """Close every pooled connection; later calls open fresh ones."""
+
+        with self._pool_lock:
+            idle = self._idle[False] + self._idle[True]
+            self._idle = {False: [], True: []}
+        for connection in idle:
+            connection.release = None
+            connection.close()
+
     def initialize(self) -> None:
         now = self._now()
         with contextlib.closing(self.connect()) as connection:
@@ -2001,17 +2294,34 @@ class EventStore:
                 self._migrate_v2_to_v3(connection, now)
                 self._migrate_v3_to_v4(connection, now)
                 self._migrate_v4_to_v5(connection, now)
+                self._migrate_v5_to_v6(connection, now)
+                self._migrate_v6_to_v7(connection, now)
             elif [row["version"] for row in versions] == [2]:
                 self._migrate_v2_to_v3(connection, now)
                 self._migrate_v3_to_v4(connection, now)
                 self._migrate_v4_to_v5(connection, now)
+                self._migrate_v5_to_v6(connection, now)
+                self._migrate_v6_to_v7(connection, now)
             elif [row["version"] for row in versions] == [3]:
                 self._migrate_v3_to_v4(connection, now)
                 self._migrate_v4_to_v5(connection, now)
+                self._migrate_v5_to_v6(connection, now)
+                self._migrate_v6_to_v7(connection, now)
             elif [row["version"] for row in versions] == [4]:
                 self._migrate_v4_to_v5(connection, now)
+                self._migrate_v5_to_v6(connection, now)
+                self._migrate_v6_to_v7(connection, now)
+            elif [row["version"] for row in versions] == [5]:
+                self._migrate_v5_to_v6(connection, now)
+                self._migrate_v6_to_v7(connection, now)
+            elif [row["version"] for row in versions] == [6]:
+                self._migrate_v6_to_v7(connection, now)
             elif [row["version"] for row in versions] != [SCHEMA_VERSION]:
                 raise ConfigError("database_schema")
+            for statement in STATUS_COUNT_TRIGGERS.values():
+                connection.execute(statement)
+            for statement in ACCESS_PATH_INDEXES.values():
+                connection.execute(statement)
             for source in SOURCES:
                 connection.execute(
                     "INSERT OR IGNORE INTO producer_state(source) VALUES (?)",
@@ -2200,6 +2510,94 @@ class EventStore:
             connection.rollback()
             raise
 
+    @staticmethod
+    def _migrate_v5_to_v6(connection: sqlite3.Connection, now: str) -> None:
+        """Materialize status counts so snapshots stop scanning retained rows."""
+
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            EventStore._rebuild_status_counts(connection)
+            connection.execute(
+                "UPDATE schema_migrations SET version = ?, applied_at = ? WHERE version = 5",
+                (6, now),
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    @staticmethod
+    def _migrate_v6_to_v7(connection: sqlite3.Connection, now: str) -> None:
+        """Add covering and partial indexes for the hot worker queries."""
+
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for statement in ACCESS_PATH_INDEXES.values():
+                connection.execute(statement)
+            connection.execute(
+                "UPDATE schema_migrations SET version = ?, applied_at = ? WHERE version = 6",
+                (7, now),
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    @staticmethod
+    def _actual_status_counts(connection: sqlite3.Connection) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for table, keys in STATUS_COUNT_KEYS.items():
+            for key in keys:
+                expression = key.format(row=table)
+                for name, value in connection.execute(
+                    """
+                    SELECT {key}, COUNT(*) FROM {table}
+                    WHERE ({key}) IS NOT NULL GROUP BY 1
+                    """.format(key=expression, table=table)
+                ):
+                    counts[name] = int(value)
+        return counts
+
+    @staticmethod
+    def _rebuild_status_counts(connection: sqlite3.Connection) -> None:
+        for statement in STATUS_COUNT_TRIGGERS.values():
+            connection.execute(statement)
+        connection.execute("DELETE FROM status_counts")
+        connection.executemany(
+            "INSERT INTO status_counts(name, value) VALUES (?, ?)",
+            sorted(EventStore._actual_status_counts(connection).items()),
+        )
+
+    def verify_counters(self, *, repair: bool = False) -> Mapping[str, Any]:
+        """Reconcile materialized status counts against real table counts."""
+
+        with contextlib.closing(self.connect(read_only=not repair)) as connection:
+            connection.execute("BEGIN IMMEDIATE" if repair else "BEGIN")
+            stored = {
+                row["name"]: int(row["value"])
+                for row in connection.execute("SELECT name, value FROM status_counts")
+            }
+            actual = self._actual_status_counts(connection)
+            drift = {
+                name: {"stored": stored.get(name, 0), "actual": actual.get(name, 0)}
+                for name in sorted(set(stored) | set(actual))
+                if stored.get(name, 0) != actual.get(name, 0)
+            }
+            if repair and drift:
+                self._rebuild_status_counts(connection)
+                self._increment(connection, "status_count_repairs")
+                connection.commit()
+            else:
+                connection.rollback()
+        if repair and drift:
+            self.write_status_best_effort()
+        return {
+            "consistent": not drift,
+            "checked": len(set(stored) | set(actual)),
+            "drift": drift,
+            "repaired": bool(repair and drift),
+        }
+
     def check_schema(self) -> None:
         with contextlib.closing(self.connect(read_only=True)) as connection:
             journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
@@ -2218,6 +2616,22 @@ class EventStore:
             }
             if not EXPECTED_TABLES.issubset(tables):
                 raise ConfigError("database_schema")
+            triggers = {
+                row["name"]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+            if not set(STATUS_COUNT_TRIGGERS).issubset(triggers):
+                raise ConfigError("database_schema")
+            indexes = {
+                row["name"]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            if not set(ACCESS_PATH_INDEXES).issubset(indexes):
+                raise ConfigError("database_schema")
             for table, expected in EXPECTED_COLUMNS.items():
                 actual = {
                     row["name"]
@@ -2356,15 +2770,21 @@ class EventStore:
     def _automatic_prune_state(
         connection: sqlite3.Connection, now_epoch: int
     ) -> Tuple[bool, Any]:
-        row = connection.execute(
-            "SELECT value FROM service_counters WHERE name = ?",
-            (MAINTENANCE_LAST_PRUNE_EPOCH,),
-        ).fetchone()
-        if row is None:
+        markers = {
+            row["name"]: row["value"]
+            for row in connection.execute(
+                "SELECT name, value FROM service_counters WHERE name IN (?, ?)",
+                (MAINTENANCE_LAST_PRUNE_EPOCH, MAINTENANCE_PRUNE_RESUME_STEP),
+            )
+        }
+        if MAINTENANCE_LAST_PRUNE_EPOCH not in markers:
             return True, None
-        last_epoch = row["value"]
+        last_epoch = markers[MAINTENANCE_LAST_PRUNE_EPOCH]
         if type(last_epoch) is not int or last_epoch < 0 or last_epoch > now_epoch:
             return True, last_epoch
+        # A run that exhausted its budget stays due until a later run finishes.
+        if MAINTENANCE_PRUNE_RESUME_STEP in markers:
+            return True, last_epoch
         return now_epoch - last_epoch >= AUTO_PRUNE_INTERVAL_SECONDS, last_epoch
 
     @staticmethod
@@ -2411,37 +2831,54 @@ class EventStore:
     ) -> str:
         with contextlib.closing(self.connect()) as connection:
             connection.execute("BEGIN IMMEDIATE")
-            existing = connection.execute(
-                "SELECT outcome FROM producer_inbox WHERE receipt_uid = ?",
-                (receipt_uid,),
-            ).fetchone()
-            if existing is None:
-                connection.execute(
-                    """
-                    INSERT INTO producer_inbox(
-                        receipt_uid, source, received_at, outcome, error_code
-                    ) VALUES (?, ?, ?, 'dead_letter', ?)
-                    """,
-                    (receipt_uid, source, now, error_code),
-                )
-                connection.execute(
-                    """
-                    UPDATE producer_state SET
-                        error_count = error_count + 1,
-                        last_ingested_at = ?, health = 'degraded',
-                        last_error_code = ?
-                    WHERE source = ?
-                    """,
-                    (now, error_code, source),
-                )
-                self._increment(connection, "dead_letters")
-                self._touch_status(
-                    connection,
-                    now,
-                    health="degraded",
-                    error_code=error_code,
-                )
+            outcome = self._record_dead_letter_locked(
+                connection,
+                receipt_uid,
+                source,
+                error_code,
+                now,
+            )
             connection.commit()
+        return outcome
+
+    def _record_dead_letter_locked(
+        self,
+        connection: sqlite3.Connection,
+        receipt_uid: str,
+        source: str,
+        error_code: str,
+        now: str,
+    ) -> str:
+        existing = connection.execute(
+            "SELECT outcome FROM producer_inbox WHERE receipt_uid = ?",
+            (receipt_uid,),
+        ).fetchone()
+        if existing is None:
+            connection.execute(
+                """
+                INSERT INTO producer_inbox(
+                    receipt_uid, source, received_at, outcome, error_code
+                ) VALUES (?, ?, ?, 'dead_letter', ?)
+                """,
+                (receipt_uid, source, now, error_code),
+            )
+            connection.execute(
+                """
+                UPDATE producer_state SET
+                    error_count = error_count + 1,
+                    last_ingested_at = ?, health = 'degraded',
+                    last_error_code = ?
+                WHERE source = ?
+                """,
+                (now, error_code, source),
+            )
+            self._increment(connection, "dead_letters")
+            self._touch_status(
+                connection,
+                now,
+                health="degraded",
+                error_code=error_code,
+            )
         return "dead_letter"
 
     def ingest_event(
@@ -2451,142 +2888,194 @@ class EventStore:
         event: NormalizedEvent,
     ) -> str:
         now = self._now()
-        if event.source != source_directory:
-            return self._record_dead_letter(
+        with contextlib.closing(self.connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            outcome = self._ingest_event_locked(
+                connection,
                 receipt_uid,
                 source_directory,
-                "source_directory_mismatch",
+                event,
                 now,
             )
+            connection.commit()
+        return outcome
+
+    def ingest_batch(self, receipts: Sequence[SpoolReceipt]) -> list[str]:
+        """Commit several spool receipts in one durable write transaction.
+
+        Each receipt keeps the exact per-file dedupe and dead-letter outcome of
+        ``ingest_event``; only the commit (and its fsync) is shared.  Nothing
+        is visible to readers until every receipt in the batch is durable.
+        """
+
+        if not receipts:
+            return []
+        outcomes = []
         with contextlib.closing(self.connect()) as connection:
             connection.execute("BEGIN IMMEDIATE")
-            existing_receipt = connection.execute(
-                "SELECT outcome FROM producer_inbox WHERE receipt_uid = ?",
-                (receipt_uid,),
-            ).fetchone()
-            if existing_receipt is not None:
-                connection.commit()
-                if existing_receipt["outcome"] == "dead_letter":
-                    return "dead_letter"
-                return "duplicate"
+            for receipt in receipts:
+                now = self._now()
+                if receipt.event is None:
+                    outcome = self._record_dead_letter_locked(
+                        connection,
+                        receipt.receipt_uid,
+                        receipt.source,
+                        receipt.error_code or "invalid_spool_file",
+                        now,
+                    )
+                else:
+                    outcome = self._ingest_event_locked(
+                        connection,
+                        receipt.receipt_uid,
+                        receipt.source,
+                        receipt.event,
+                        now,
+                    )
+                outcomes.append(outcome)
+            connection.commit()
+        return outcomes
 
-            existing_event = connection.execute(
-                "SELECT id FROM events WHERE dedupe_key = ?",
-                (event.dedupe_key,),
-            ).fetchone()
-            outcome = "duplicate" if existing_event is not None else "accepted"
-            cursor = connection.execute(
+    def _ingest_event_locked(
+        self,
+        connection: sqlite3.Connection,
+        receipt_uid: str,
+        source_directory: str,
+        event: NormalizedEvent,
+        now: str,
+    ) -> str:
+        if event.source != source_directory:
+            return self._record_dead_letter_locked(
+                connection,
+                receipt_uid,
+                source_directory,
+                "source_directory_mismatch",
+                now,
+            )
+        existing_receipt = connection.execute(
+            "SELECT outcome FROM producer_inbox WHERE receipt_uid = ?",
+            (receipt_uid,),
+        ).fetchone()
+        if existing_receipt is not None:
+            if existing_receipt["outcome"] == "dead_letter":
+                return "dead_letter"
+            return "duplicate"
+
+        existing_event = connection.execute(
+            "SELECT id FROM events WHERE dedupe_key = ?",
+            (event.dedupe_key,),
+        ).fetchone()
+        outcome = "duplicate" if existing_event is not None else "accepted"
+        cursor = connection.execute(
+            """
+            INSERT INTO producer_inbox(
+                receipt_uid, source, event_uid, received_at, outcome
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+            (receipt_uid, event.source, event.event_uid, now, outcome),
+        )
+        inbox_id = int(cursor.lastrowid)
+        if existing_event is not None:
+            connection.execute(
                 """
-                INSERT INTO producer_inbox(
-                    receipt_uid, source, event_uid, received_at, outcome
-                ) VALUES (?, ?, ?, ?, ?)
+                UPDATE producer_state SET
+                    duplicate_count = duplicate_count + 1,
+                    last_ingested_at = ?
+                WHERE source = ?
+                """,
+                (now, event.source),
+            )
+            self._increment(connection, "duplicate_events")
+            self._touch_status(connection, now)
+        else:
+            event_cursor = connection.execute(
+                """
+                INSERT INTO events(
+                    producer_inbox_id, event_uid, dedupe_key, source, event_type,
+                    site, entity_kind, entity_alias, occurred_at, observed_at,
+                    time_precision, attributes_json, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    inbox_id,
+                    event.event_uid,
+                    event.dedupe_key,
+                    event.source,
+                    event.event_type,
+                    event.site,
+                    event.entity_kind,
+                    event.entity_alias,
+                    event.occurred_at,
+                    event.observed_at,
+                    event.time_precision,
+                    json.dumps(event.attributes, sort_keys=True, separators=(",", ":")),
+                    now,
+                ),
+            )
+            event_id = int(event_cursor.lastrowid)
+            connection.execute(
+                """
+                UPDATE producer_state SET
+                    last_event_id = ?,
+                    last_observed_at = CASE
+                        WHEN last_observed_at IS NULL OR last_observed_at < ?
+                        THEN ? ELSE last_observed_at END,
+                    last_ingested_at = ?,
+                    accepted_count = accepted_count + 1
+                WHERE source = ?
                 """,
-                (receipt_uid, event.source, event.event_uid, now, outcome),
+                (
+                    event_id,
+                    event.observed_at,
+                    event.observed_at,
+                    now,
+                    event.source,
+                ),
             )
-            inbox_id = int(cursor.lastrowid)
-            if existing_event is not None:
+            if event.event_type == "source.unavailable":
                 connection.execute(
                     """
                     UPDATE producer_state SET
-                        duplicate_count = duplicate_count + 1,
-                        last_ingested_at = ?
+                        health = 'degraded',
+                        consecutive_failures = ?,
+                        last_error_code = ?
                     WHERE source = ?
                     """,
-                    (now, event.source),
-                )
-                self._increment(connection, "duplicate_events")
-                self._touch_status(connection, now)
-            else:
-                event_cursor = connection.execute(
-                    """
-                    INSERT INTO events(
-                        producer_inbox_id, event_uid, dedupe_key, source, event_type,
-                        site, entity_kind, entity_alias, occurred_at, observed_at,
-                        time_precision, attributes_json, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
                     (
-                        inbox_id,
-                        event.event_uid,
-                        event.dedupe_key,
+                        int(event.attributes["failure_count"]),
+                        str(event.attributes["reason_code"]),
                         event.source,
-                        event.event_type,
-                        event.site,
-                        event.entity_kind,
-                        event.entity_alias,
-                        event.occurred_at,
-                        event.observed_at,
-                        event.time_precision,
-                        json.dumps(event.attributes, sort_keys=True, separators=(",", ":")),
-                        now,
                     ),
                 )
-                event_id = int(event_cursor.lastrowid)
+            elif event.event_type == "source.recovered":
                 connection.execute(
                     """
                     UPDATE producer_state SET
-                        last_event_id = ?,
-                        last_observed_at = CASE
-                            WHEN last_observed_at IS NULL OR last_observed_at < ?
-                            THEN ? ELSE last_observed_at END,
-                        last_ingested_at = ?,
-                        accepted_count = accepted_count + 1
+                        health = 'ok', consecutive_failures = 0,
+                        last_error_code = NULL
                     WHERE source = ?
                     """,
-                    (
-                        event_id,
-                        event.observed_at,
-                        event.observed_at,
-                        now,
-                        event.source,
-                    ),
+                    (event.source,),
                 )
-                if event.event_type == "source.unavailable":
-                    connection.execute(
-                        """
-                        UPDATE producer_state SET
-                            health = 'degraded',
-                            consecutive_failures = ?,
-                            last_error_code = ?
-                        WHERE source = ?
-                        """,
-                        (
-                            int(event.attributes["failure_count"]),
-                            str(event.attributes["reason_code"]),
-                            event.source,
-                        ),
-                    )
-                elif event.event_type == "source.recovered":
-                    connection.execute(
-                        """
-                        UPDATE producer_state SET
-                            health = 'ok', consecutive_failures = 0,
-                            last_error_code = NULL
-                        WHERE source = ?
-                        """,
-                        (event.source,),
-                    )
-                else:
-                    connection.execute(
-                        """
-                        UPDATE producer_state SET
-                            health = CASE WHEN health = 'unknown' THEN 'ok' ELSE health END
-                        WHERE source = ?
-                        """,
-                        (event.source,),
-                    )
+            else:
                 connection.execute(
                     """
-                    INSERT INTO consumer_deliveries(
-                        consumer_name, event_id, status, created_at, updated_at
-                    )
-                    SELECT name, ?, 'pending', ?, ? FROM consumers WHERE enabled = 1
+                    UPDATE producer_state SET
+                        health = CASE WHEN health = 'unknown' THEN 'ok' ELSE health END
+                    WHERE source = ?
                     """,
-                    (event_id, now, now),
+                    (event.source,),
                 )
-                self._increment(connection, "accepted_events")
-                self._touch_status(connection, now, accepted=True)
-            connection.commit()
+            connection.execute(
+                """
+                INSERT INTO consumer_deliveries(
+                    consumer_name, event_id, status, created_at, updated_at
+                )
+                SELECT name, ?, 'pending', ?, ? FROM consumers WHERE enabled = 1
+                """,
+                (event_id, now, now),
+            )
+            self._increment(connection, "accepted_events")
+            self._touch_status(connection, now, accepted=True)
         return outcome
 
     def claim_deliveries(
@@ -2632,6 +3121,7 @@ class EventStore:
                 SELECT d.id FROM consumer_deliveries d
                 JOIN events e ON e.id = d.event_id
                 WHERE d.consumer_name = ?
+                  AND d.status IN ('pending', 'leased')
                   AND (
                     d.status = 'pending'
                     OR (d.status = 'leased' AND d.lease_until < ?)
@@ -2758,36 +3248,21 @@ class EventStore:
                 )
             connection.commit()
 
-    def _prune(
-        self,
-        *,
-        now: str,
-        checkpoint: bool,
-        only_if_due: bool,
-        write_status: bool,
-        expected_prune_marker: Any = None,
-    ) -> Optional[Mapping[str, int]]:
-        now_epoch = int(_parse_now(now).timestamp())
-        accepted_cutoff = _cutoff(now, ACCEPTED_RETENTION_DAYS)
-        dead_cutoff = _cutoff(now, DEAD_LETTER_RETENTION_DAYS)
-        deleted: Dict[str, int] = {}
-        with contextlib.closing(self.connect()) as connection:
-            connection.execute("BEGIN IMMEDIATE")
-            if only_if_due:
-                prune_due, current_marker = self._automatic_prune_state(
-                    connection,
-                    now_epoch,
-                )
-                marker_unchanged = (
-                    type(current_marker) is type(expected_prune_marker)
-                    and current_marker == expected_prune_marker
-                )
-                if not marker_unchanged or not prune_due:
-                    connection.rollback()
-                    return None
-            cursor = connection.execute(
+    @staticmethod
+    def _prune_steps(
+        accepted_cutoff: str, dead_cutoff: str
+    ) -> Tuple[Tuple[str, str, Tuple[Any, ...], Tuple[Tuple[str, str], ...]], ...]:
+        """Return ordered ``(table, eligible-id query, parameters, children)``.
+
+        Children are deleted with their parent batch; steps run in foreign-key
+        order so a later step only sees rows an earlier step has released.
+        """
+
+        return (
+            (
+                "notification_outbox",
                 """
-                DELETE FROM notification_outbox
+                SELECT id FROM notification_outbox
                 WHERE status != 'reserved'
                   AND (
                     (status IN ('dead_letter', 'unknown') AND updated_at < ?)
@@ -2795,77 +3270,35 @@ class EventStore:
                   )
                 """,
                 (dead_cutoff, accepted_cutoff),
-            )
-            deleted["notification_outbox"] = cursor.rowcount
-            cursor = connection.execute(
-                """
-                DELETE FROM camera_evaluation_events
-                WHERE evaluation_id IN (
-                    SELECT ce.id FROM camera_evaluations ce
-                    WHERE ce.state != 'pending' AND ce.updated_at < ?
-                      AND NOT EXISTS (
-                        SELECT 1 FROM notification_outbox n
-                        WHERE n.camera_evaluation_id = ce.id
-                      )
-                )
-                """,
-                (accepted_cutoff,),
-            )
-            deleted["camera_evaluation_events"] = cursor.rowcount
-            cursor = connection.execute(
+                (),
+            ),
+            (
+                "camera_evaluations",
                 """
-                DELETE FROM camera_evaluations
-                WHERE state != 'pending' AND updated_at < ?
+                SELECT ce.id FROM camera_evaluations ce
+                WHERE ce.state != 'pending' AND ce.updated_at < ?
                   AND NOT EXISTS (
                     SELECT 1 FROM notification_outbox n
-                    WHERE n.camera_evaluation_id = camera_evaluations.id
+                    WHERE n.camera_evaluation_id = ce.id
                   )
                 """,
                 (accepted_cutoff,),
-            )
-            deleted["camera_evaluations"] = cursor.rowcount
-            cursor = connection.execute(
+                (("camera_evaluation_events", "evaluation_id"),),
+            ),
+            (
+                "consumer_deliveries",
                 """
-                DELETE FROM consumer_deliveries
+                SELECT id FROM consumer_deliveries
                 WHERE (status = 'acknowledged' AND updated_at < ?)
                    OR (status = 'dead_letter' AND updated_at < ?)
                 """,
                 (accepted_cutoff, dead_cutoff),
-            )
-            deleted["consumer_deliveries"] = cursor.rowcount
-            cursor = connection.execute(
-                """
-                DELETE FROM incident_events
-                WHERE incident_id IN (
-                    SELECT id FROM incidents
-                    WHERE state != 'open' AND updated_at < ?
-                      AND NOT EXISTS (
-                        SELECT 1 FROM notification_outbox n
-                        WHERE n.incident_id = incidents.id
-                      )
-                )
-                """,
-                (accepted_cutoff,),
-            )
-            deleted["incident_events"] = cursor.rowcount
-            cursor = connection.execute(
-                """
-                DELETE FROM incident_decisions
-                WHERE incident_id IN (
-                    SELECT id FROM incidents
-                    WHERE state != 'open' AND updated_at < ?
-                      AND NOT EXISTS (
-                        SELECT 1 FROM notification_outbox n
-                        WHERE n.incident_id = incidents.id
-                      )
-                )
-                """,
-                (accepted_cutoff,),
-            )
-            deleted["incident_decisions"] = cursor.rowcount
-            cursor = connection.execute(
+                (),
+            ),
+            (
+                "incidents",
                 """
-                DELETE FROM incidents
+                SELECT id FROM incidents
                 WHERE state != 'open' AND updated_at < ?
                   AND NOT EXISTS (
                     SELECT 1 FROM notification_outbox n
@@ -2873,11 +3306,15 @@ class EventStore:
                   )
                 """,
                 (accepted_cutoff,),
-            )
-            deleted["incidents"] = cursor.rowcount
-            cursor = connection.execute(
+                (
+                    ("incident_events", "incident_id"),
+                    ("incident_decisions", "incident_id"),
+                ),
+            ),
+            (
+                "events",
                 """
-                DELETE FROM events
+                SELECT id FROM events
                 WHERE created_at < ?
                   AND NOT EXISTS (
                     SELECT 1 FROM consumer_deliveries d
@@ -2889,11 +3326,12 @@ class EventStore:
                   )
                 """,
                 (accepted_cutoff,),
-            )
-            deleted["events"] = cursor.rowcount
-            cursor = connection.execute(
+                (),
+            ),
+            (
+                "producer_inbox",
                 """
-                DELETE FROM producer_inbox
+                SELECT id FROM producer_inbox
                 WHERE (
                     outcome = 'dead_letter' AND received_at < ?
                 ) OR (
@@ -2905,15 +3343,140 @@ class EventStore:
                 )
                 """,
                 (dead_cutoff, accepted_cutoff),
-            )
-            deleted["producer_inbox"] = cursor.rowcount
-            self._set_counter(
-                connection,
-                MAINTENANCE_LAST_PRUNE_EPOCH,
-                now_epoch,
-            )
-            self._increment(connection, "prune_runs")
-            connection.commit()
+                (),
+            ),
+        )
+
+    def _prune(
+        self,
+        *,
+        now: str,
+        checkpoint: bool,
+        only_if_due: bool,
+        write_status: bool,
+        expected_prune_marker: Any = None,
+        batch_size: int,
+        budget_seconds: Optional[float],
+    ) -> Optional[Mapping[str, int]]:
+        """Delete expired rows in short transactions of ``batch_size`` rows.
+
+        The first transaction claims the run by moving the maintenance marker
+        to ``now``; every later batch re-reads it and stops if another worker
+        has claimed a newer run.  When ``budget_seconds`` elapses the next
+        step is saved in service_counters and the automatic gate stays due, so
+        the next ingest pass resumes where this one stopped.  A manual run
+        (``only_if_due`` false) always starts from the first step, because
+        every table may have rows that expired under the new ``now``.
+        """
+
+        now_epoch = int(_parse_now(now).timestamp())
+        steps = self._prune_steps(
+            _cutoff(now, ACCEPTED_RETENTION_DAYS),
+            _cutoff(now, DEAD_LETTER_RETENTION_DAYS),
+        )
+        deleted: Dict[str, int] = {}
+        for table, _query, _parameters, children in steps:
+            for child, _column in children:
+                deleted[child] = 0
+            deleted[table] = 0
+        started = time.monotonic()
+        max_hold = 0.0
+        complete = False
+        with contextlib.closing(self.connect()) as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            held_since = time.monotonic()
+            if only_if_due:
+                prune_due, current_marker = self._automatic_prune_state(
+                    connection,
+                    now_epoch,
+                )
+                marker_unchanged = (
+                    type(current_marker) is type(expected_prune_marker)
+                    and current_marker == expected_prune_marker
+                )
+                if not marker_unchanged or not prune_due:
+                    connection.rollback()
+                    return None
+            step = 0
+            if only_if_due:
+                resume = connection.execute(
+                    "SELECT value FROM service_counters WHERE name = ?",
+                    (MAINTENANCE_PRUNE_RESUME_STEP,),
+                ).fetchone()
+                step = resume["value"] if resume is not None else 0
+                if type(step) is not int or not 0 <= step < len(steps):
+                    step = 0
+            self._set_counter(connection, MAINTENANCE_LAST_PRUNE_EPOCH, now_epoch)
+            while True:
+                table, query, parameters, children = steps[step]
+                ids = [
+                    row[0]
+                    for row in connection.execute(
+                        query + " LIMIT ?", (*parameters, batch_size)
+                    )
+                ]
+                if ids:
+                    placeholders = ",".join("?" for _ in ids)
+                    for child, column in children:
+                        cursor = connection.execute(
+                            "DELETE FROM {child} WHERE {column} IN ({ids})".format(
+                                child=child, column=column, ids=placeholders
+                            ),
+                            ids,
+                        )
+                        deleted[child] += cursor.rowcount
+                    cursor = connection.execute(
+                        "DELETE FROM {table} WHERE id IN ({ids})".format(
+                            table=table, ids=placeholders
+                        ),
+                        ids,
+                    )
+                    deleted[table] += cursor.rowcount
+                if len(ids) < batch_size:
+                    step += 1
+                complete = step == len(steps)
+                out_of_budget = (
+                    budget_seconds is not None
+                    and time.monotonic() - started >= budget_seconds
+                )
+                if complete or out_of_budget:
+                    break
+                connection.commit()
+                max_hold = max(max_hold, time.monotonic() - held_since)
+                # Let producers and consumers waiting on the writer lock in.
+                time.sleep(PRUNE_BATCH_PAUSE_SECONDS)
+                connection.execute("BEGIN IMMEDIATE")
+                held_since = time.monotonic()
+                marker = connection.execute(
+                    "SELECT value FROM service_counters WHERE name = ?",
+                    (MAINTENANCE_LAST_PRUNE_EPOCH,),
+                ).fetchone()
+                if only_if_due and (marker is None or marker["value"] != now_epoch):
+                    connection.rollback()
+                    break
+            if connection.in_transaction:
+                if complete:
+                    connection.execute(
+                        "DELETE FROM service_counters WHERE name = ?",
+                        (MAINTENANCE_PRUNE_RESUME_STEP,),
+                    )
+                    self._increment(connection, "prune_runs")
+                else:
+                    self._set_counter(connection, MAINTENANCE_PRUNE_RESUME_STEP, step)
+                    self._increment(connection, "prune_incomplete_runs")
+                max_hold = max(max_hold, time.monotonic() - held_since)
+                elapsed = max(time.monotonic() - started, 0.001)
+                self._set_counter(
+                    connection,
+                    "prune_last_rows_per_second",
+                    int(sum(deleted.values()) / elapsed),
+                )
+                self._set_counter(
+                    connection,
+                    "prune_last_max_lock_hold_ms",
+                    int(max_hold * 1000),
+                )
+                connection.commit()
         if checkpoint:
             self._checkpoint_wal()
         if write_status:
@@ -2930,6 +3493,8 @@ class EventStore:
             checkpoint=checkpoint,
             only_if_due=False,
             write_status=True,
+            batch_size=PRUNE_BATCH_SIZE,
+            budget_seconds=None,
         )
         if result is None:
             raise StateError("prune_state_invalid")
@@ -3088,6 +3653,8 @@ class EventStore:
                 only_if_due=True,
                 write_status=False,
                 expected_prune_marker=observed_marker,
+                batch_size=PRUNE_BATCH_SIZE,
+                budget_seconds=PRUNE_BUDGET_SECONDS,
             )
             is not None
         )
@@ -3099,24 +3666,20 @@ class EventStore:
             ).fetchone()
             if runtime is None:
                 raise ConfigError("runtime_status_missing")
-            event_count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-            open_count = connection.execute(
-                "SELECT COUNT(*) FROM incidents WHERE state = 'open'"
-            ).fetchone()[0]
-            pending_count = connection.execute(
-                "SELECT COUNT(*) FROM consumer_deliveries WHERE status = 'pending'"
-            ).fetchone()[0]
-            leased_count = connection.execute(
-                "SELECT COUNT(*) FROM consumer_deliveries WHERE status = 'leased'"
-            ).fetchone()[0]
-            dead_count = connection.execute(
-                """
-                SELECT
-                    (SELECT COUNT(*) FROM producer_inbox WHERE outcome = 'dead_letter') +
-                    (SELECT COUNT(*) FROM consumer_deliveries WHERE status = 'dead_letter') +
-                    (SELECT COUNT(*) FROM notification_outbox WHERE status = 'dead_letter')
-                """
-            ).fetchone()[0]
+            # Materialized by triggers; see STATUS_COUNT_KEYS.
+            counts = {
+                row["name"]: int(row["value"])
+                for row in connection.execute("SELECT name, value FROM status_counts")
+            }
+            event_count = counts.get("events", 0)
+            open_count = counts.get("incidents:open", 0)
+            pending_count = counts.get("deliveries:pending", 0)
+            leased_count = counts.get("deliveries:leased", 0)
+            dead_count = (
+                counts.get("inbox:dead_letter", 0)
+                + counts.get("deliveries:dead_letter", 0)
+                + counts.get("outbox:dead_letter", 0)
+            )
             delivery_runtime = connection.execute(
                 "SELECT * FROM delivery_runtime WHERE singleton = 1"
             ).fetchone()
@@ -3128,18 +3691,19 @@ class EventStore:
             if camera_runtime is None:
                 raise ConfigError("camera_runtime_missing")
             outbox_counts = {
-                status: count
-                for status, count in connection.execute(
-                    "SELECT status, COUNT(*) FROM notification_outbox GROUP BY status"
-                ).fetchall()
+                name[len("outbox:"):]: count
+                for name, count in counts.items()
+                if name.startswith("outbox:")
+            }
+            delivery_attention = {
+                "pending": counts.get("outbox:unknown_unreviewed", 0),
+                "latest_at": connection.execute(
+                    """
+                    SELECT MAX(updated_at) FROM notification_outbox
+                    WHERE status = 'unknown' AND reviewed_at IS NULL
+                    """
+                ).fetchone()[0],
             }
-            delivery_attention = connection.execute(
-                """
-                SELECT COUNT(*) AS pending, MAX(updated_at) AS latest_at
-                FROM notification_outbox
-                WHERE status = 'unknown' AND reviewed_at IS NULL
-                """
-            ).fetchone()
             latest_delivery_review = connection.execute(
                 """
                 SELECT reviewed_at, review_outcome
@@ -3149,26 +3713,36 @@ class EventStore:
                 """
             ).fetchone()
             camera_counts = {
-                state: count
-                for state, count in connection.execute(
-                    "SELECT state, COUNT(*) FROM camera_evaluations GROUP BY state"
-                ).fetchall()
+                name[len("camera:"):]: count
+                for name, count in counts.items()
+                if name.startswith("camera:")
             }
-            consumer_rows = connection.execute(
-                """
-                SELECT c.name,
-                       SUM(CASE WHEN d.status = 'pending' THEN 1 ELSE 0 END) AS pending,
-                       SUM(CASE WHEN d.status = 'leased' THEN 1 ELSE 0 END) AS leased,
-                       SUM(CASE WHEN d.status = 'dead_letter' THEN 1 ELSE 0 END) AS dead_letter,
-                       MIN(CASE WHEN d.status IN ('pending', 'leased') THEN d.created_at END)
-                           AS oldest_unfinished_at
-                FROM consumers c
-                LEFT JOIN consumer_deliveries d ON d.consumer_name = c.name
-                WHERE c.enabled = 1
-                GROUP BY c.name
-                ORDER BY c.name
-                """
-            ).fetchall()
+            consumer_rows = []
+            for row in connection.execute(
+                "SELECT name FROM consumers WHERE enabled = 1 ORDER BY name"
+            ).fetchall():
+                prefix = "deliveries:" + row["name"] + ":"
+                pending = counts.get(prefix + "pending", 0)
+                leased = counts.get(prefix + "leased", 0)
+                oldest = None
+                if pending or leased:
+                    # Only unfinished rows are visited through the status index.
+                    oldest = connection.execute(
+                        """
+                        SELECT MIN(created_at) FROM consumer_deliveries
+                        WHERE status IN ('pending', 'leased') AND consumer_name = ?
+                        """,
+                        (row["name"],),
+                    ).fetchone()[0]
+                consumer_rows.append(
+                    {
+                        "name": row["name"],
+                        "pending": pending,
+                        "leased": leased,
+                        "dead_letter": counts.get(prefix + "dead_letter", 0),
+                        "oldest_unfinished_at": oldest,
+                    }
+                )
             sources: Dict[str, Any] = {}
             for row in connection.execute(
                 """
@@ -3199,14 +3773,21 @@ class EventStore:
                 for row in connection.execute(
                     """
                     SELECT name, value FROM service_counters
-                    WHERE name != ? ORDER BY name
+                    WHERE name NOT IN (?, ?) ORDER BY name
                     """,
-                    (MAINTENANCE_LAST_PRUNE_EPOCH,),
+                    (MAINTENANCE_LAST_PRUNE_EPOCH, MAINTENANCE_PRUNE_RESUME_STEP),
                 )
             }
             reviewed_epoch = counters.pop(
                 ACCESS_ATTENTION_LAST_REVIEWED_EPOCH, None
             )
+            camera_timings = _camera_timing_projection(
+                {
+                    name: counters.pop(name)
+                    for name in list(counters)
+                    if name.startswith(CAMERA_TIMING_PREFIX)
+                }
+            )
             expired_attention = max(0, counters.get(ACCESS_INCIDENTS_EXPIRED, 0))
             reviewed_attention = max(
                 0, counters.get(ACCESS_ATTENTION_REVIEWED, 0)
@@ -3285,6 +3866,7 @@ class EventStore:
                     "last_success_at": camera_runtime["last_success_at"],
                     "last_error_at": camera_runtime["last_error_at"],
                     "last_error_code": camera_runtime["last_error_code"],
+                    "timings": camera_timings,
                 },
                 "attention": {
                     "required": (
@@ -3325,8 +3907,18 @@ class EventStore:
                 "counters": counters,
             }
 
-    def write_status_best_effort(self) -> bool:
+    def write_status_best_effort(
+        self, counters: Optional[Mapping[str, int]] = None
+    ) -> bool:
+        """Publish the status file, first setting any ``counters`` given."""
+
         try:
+            if counters:
+                with contextlib.closing(self.connect()) as connection:
+                    connection.execute("BEGIN IMMEDIATE")
+                    for name, value in counters.items():
+                        self._set_counter(connection, name, value)
+                    connection.commit()
             value = self.status_snapshot()
             encoded = (
                 json.dumps(value, sort_keys=True, separators=(",", ":")).encode(
@@ -3357,32 +3949,45 @@ class EventStore:
             parameters.append(event_type)
         parameters.append(limit)
         query = """
-            SELECT event_uid, source, event_type, site, entity_kind, entity_alias,
-                   occurred_at, observed_at, time_precision, attributes_json
+            SELECT {columns}
             FROM events
             WHERE {where}
             ORDER BY occurred_at DESC, id DESC
             LIMIT ?
-        """.format(where=" AND ".join(clauses))
+        """.format(columns=EVENT_PROJECTION_COLUMNS, where=" AND ".join(clauses))
         with contextlib.closing(self.connect(read_only=True)) as connection:
             rows = connection.execute(query, parameters).fetchall()
-        events = []
-        for row in rows:
-            events.append(
-                {
-                    "event_uid": row["event_uid"],
-                    "source": row["source"],
-                    "event_type": row["event_type"],
-                    "site": row["site"],
-                    "entity_kind": row["entity_kind"],
-                    "entity_alias": row["entity_alias"],
-                    "occurred_at": row["occurred_at"],
-                    "observed_at": row["observed_at"],
-                    "time_precision": row["time_precision"],
-                    "attributes": json.loads(row["attributes_json"]),
-                }
-            )
-        return {"schema_version": 1, "events": events}
+        return {"schema_version": 1, "events": [_event_projection(row) for row in rows]}
+
+    def tail(self, *, after_id: int, limit: int = TAIL_PAGE_SIZE) -> Mapping[str, Any]:
+        """Return up to ``limit`` events with ``events.id`` above the cursor.
+
+        Event ids are AUTOINCREMENT and assigned under the single writer lock,
+        so a reader that resumes from the last id it saw never skips a
+        committed event.  Records use the ``recent`` projection plus ``id``.
+        """
+
+        if isinstance(after_id, bool) or not isinstance(after_id, int) or after_id < 0:
+            raise PayloadError("invalid_cursor")
+        if limit < 1 or limit > TAIL_PAGE_SIZE:
+            raise PayloadError("invalid_limit")
+        with contextlib.closing(self.connect(read_only=True)) as connection:
+            rows = connection.execute(
+                """
+                SELECT id, {columns}
+                FROM events
+                WHERE id > ?
+                ORDER BY id
+                LIMIT ?
+                """.format(columns=EVENT_PROJECTION_COLUMNS),
+                (after_id, limit),
+            ).fetchall()
+        events = [{"id": row["id"], **_event_projection(row)} for row in rows]
+        return {
+            "schema_version": 1,
+            "events": events,
+            "next_after_id": events[-1]["id"] if events else after_id,
+        }
 
     def incidents(
         self,
@@ -3404,11 +4009,12 @@ class EventStore:
                 """
                 SELECT i.incident_uid, i.site, i.state, i.category,
                        i.summary_code, i.opened_at, i.updated_at, i.resolved_at,
-                       COUNT(ie.event_id) AS event_count
+                       (
+                           SELECT COUNT(*) FROM incident_events ie
+                           WHERE ie.incident_id = i.id
+                       ) AS event_count
                 FROM incidents i
-                LEFT JOIN incident_events ie ON ie.incident_id = i.id
                 WHERE {where}
-                GROUP BY i.id
                 ORDER BY i.updated_at DESC, i.id DESC
                 LIMIT {limit}
                 """.format(where=" AND ".join(clauses), limit=MAX_QUERY_LIMIT),
@@ -3470,6 +4076,27 @@ class EventStore:
         }
 
 
+EVENT_PROJECTION_COLUMNS = """
+    event_uid, source, event_type, site, entity_kind, entity_alias,
+    occurred_at, observed_at, time_precision, attributes_json
+"""
+
+
+def _event_projection(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "event_uid": row["event_uid"],
+        "source": row["source"],
+        "event_type": row["event_type"],
+        "site": row["site"],
+        "entity_kind": row["entity_kind"],
+        "entity_alias": row["entity_alias"],
+        "occurred_at": row["occurred_at"],
+        "observed_at": row["observed_at"],
+        "time_precision": row["time_precision"],
+        "attributes": json.loads(row["attributes_json"]),
+    }
+
+
 def _receipt_uid(secret: bytes, source: str, filename: str) -> str:
     return "rcp_" + _opaque_hmac(secret, "spool-receipt", source + "\0" + filename)[:32]
 
@@ -3481,62 +4108,247 @@ def _read_spool(path: Path) -> bytes:
         raise PayloadError("invalid_spool_file") from exc
 
 
-def ingest_once(
-    root: Path,
-    *,
-    limit: int = 100,
-    clock: Callable[[], str] = utc_now,
-) -> IngestResult:
-    if limit < 1 or limit > 1000:
-        raise PayloadError("invalid_ingest_limit")
-    paths = validate_runtime(root)
-    secret = _load_secret(paths)
-    store = EventStore(paths, clock=clock)
-    store.check_schema()
-    lock_descriptor = _open_private_regular(paths.ingest_lock, os.O_RDWR)
+def _load_spool_receipt(secret: bytes, source: str, path: Path) -> SpoolReceipt:
+    receipt = _receipt_uid(secret, source, path.name)
     try:
+        if not READY_NAME_RE.fullmatch(path.name):
+            raise PayloadError("invalid_spool_name")
+        parsed = _decode_json(
+            _read_spool(path),
+            max_bytes=MAX_SPOOL_BYTES,
+            code="spool_too_large",
+        )
+        event = validate_spool_record(parsed, secret)
+    except PayloadError as exc:
+        return SpoolReceipt(receipt, source, error_code=exc.code)
+    return SpoolReceipt(receipt, source, event=event)
+
+
+class _PollingSpoolWatcher:
+    """Fallback that simply sleeps until the next rescan."""
+
+    def __init__(self, _directories: Sequence[Path]) -> None:
+        pass
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifySpoolWatcher:
+    """Linux inotify on each source spool, woken by the final rename."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+
+    def __init__(self, directories: Sequence[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._descriptor = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
         try:
-            fcntl.flock(lock_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
-        except BlockingIOError as exc:
-            raise StateError("ingester_busy") from exc
-        candidates = []
-        for source in SOURCES:
-            for path in paths.source_spool(source).glob("*.ready"):
-                try:
-                    queued_at = path.lstat().st_mtime_ns
-                except OSError:
-                    continue
-                candidates.append((queued_at, source, path))
-        candidates.sort(key=lambda item: (item[0], item[2].name, item[1]))
-        result = IngestResult()
-        for _queued_at, source, path in candidates[:limit]:
-            receipt = _receipt_uid(secret, source, path.name)
-            try:
-                if not READY_NAME_RE.fullmatch(path.name):
-                    raise PayloadError("invalid_spool_name")
-                parsed = _decode_json(
-                    _read_spool(path),
-                    max_bytes=MAX_SPOOL_BYTES,
-                    code="spool_too_large",
-                )
-                event = validate_spool_record(parsed, secret)
-                outcome = store.ingest_event(receipt, source, event)
-            except PayloadError as exc:
-                outcome = store._record_dead_letter(
-                    receipt,
-                    source,
-                    exc.code,
-                    store._now(),
+            for directory in directories:
+                watch = libc.inotify_add_watch(
+                    self._descriptor,
+                    os.fsencode(directory),
+                    self.IN_MOVED_TO | self.IN_CLOSE_WRITE,
                 )
+                if watch < 0:
+                    raise OSError(ctypes.get_errno(), "inotify_add_watch")
+        except Exception:
+            os.close(self._descriptor)
+            raise
+
+    def wait(self, timeout: float) -> None:
+        readable, _, _ = select.select([self._descriptor], [], [], timeout)
+        if readable:
+            with contextlib.suppress(BlockingIOError):
+                while os.read(self._descriptor, 64 * 1024):
+                    pass
+
+    def close(self) -> None:
+        os.close(self._descriptor)
+
+
+class _KqueueSpoolWatcher:
+    """BSD/macOS kqueue vnode-write notifications on each source spool."""
+
+    def __init__(self, directories: Sequence[Path]) -> None:
+        self._queue = select.kqueue()
+        self._descriptors: list[int] = []
+        try:
+            flags = os.O_RDONLY | getattr(os, "O_EVTONLY", 0)
+            for directory in directories:
+                self._descriptors.append(os.open(directory, flags))
+            self._queue.control(
+                [
+                    select.kevent(
+                        descriptor,
+                        filter=select.KQ_FILTER_VNODE,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                        fflags=select.KQ_NOTE_WRITE,
+                    )
+                    for descriptor in self._descriptors
+                ],
+                0,
+            )
+        except Exception:
+            self.close()
+            raise
+
+    def wait(self, timeout: float) -> None:
+        self._queue.control(None, len(self._descriptors), timeout)
+
+    def close(self) -> None:
+        for descriptor in self._descriptors:
+            os.close(descriptor)
+        self._descriptors = []
+        self._queue.close()
+
+
+def _spool_watcher(directories: Sequence[Path]) -> Any:
+    candidates: list[Any] = []
+    if hasattr(select, "kqueue"):
+        candidates.append(_KqueueSpoolWatcher)
+    if sys.platform.startswith("linux"):
+        candidates.append(_InotifySpoolWatcher)
+    for watcher in candidates:
+        try:
+            return watcher(directories)
+        except (OSError, AttributeError, TypeError):
+            continue
+    return _PollingSpoolWatcher(directories)
+
+
+def camera_timing_counters(stage: str, elapsed_ms: int) -> list[Tuple[str, int]]:
+    """Return cumulative histogram increments for one camera stage sample."""
+
+    if stage not in CAMERA_TIMING_STAGES:
+        raise PayloadError("invalid_camera_timing_stage")
+    elapsed_ms = max(0, int(elapsed_ms))
+    prefix = CAMERA_TIMING_PREFIX + stage
+    increments = [
+        (prefix + "_le_" + str(bound) + "_ms", 1)
+        for bound in CAMERA_TIMING_BUCKETS_MS
+        if elapsed_ms <= bound
+    ]
+    increments.extend(
+        [
+            (prefix + "_le_inf", 1),
+            (prefix + "_count", 1),
+            (prefix + "_sum_ms", elapsed_ms),
+        ]
+    )
+    return increments
+
+
+def _camera_timing_projection(counters: Mapping[str, Any]) -> Mapping[str, Any]:
+    projection = {}
+    for stage in CAMERA_TIMING_STAGES:
+        prefix = CAMERA_TIMING_PREFIX + stage
+        buckets = {
+            str(bound): int(counters.get(prefix + "_le_" + str(bound) + "_ms", 0))
+            for bound in CAMERA_TIMING_BUCKETS_MS
+        }
+        buckets["inf"] = int(counters.get(prefix + "_le_inf", 0))
+        projection[stage] = {
+            "count": int(counters.get(prefix + "_count", 0)),
+            "sum_ms": int(counters.get(prefix + "_sum_ms", 0)),
+            "le_ms": buckets,
+        }
+    return projection
+
+
+class _IngestLatency:
+    """Rolling window of enqueue-to-``events``-row latency, as counters.
+
+    Samples are taken once a batch has committed, and only for receipts
+    that were accepted; duplicates and dead letters never add an event.
+    """
+
+    def __init__(self, window: int = INGEST_LATENCY_WINDOW) -> None:
+        self._samples: collections.deque[int] = collections.deque(maxlen=window)
+
+    def observe(self, queued_at_ns: Iterable[int]) -> None:
+        now_ns = time.time_ns()
+        for queued_at in queued_at_ns:
+            self._samples.append(max(0, (now_ns - queued_at) // 1_000_000))
+
+    def counters(self) -> Mapping[str, int]:
+        if not self._samples:
+            return {}
+        ordered = sorted(self._samples)
+        counters = {
+            "ingest_latency_p" + str(percentile) + "_ms": ordered[
+                min(len(ordered) - 1, (len(ordered) * percentile) // 100)
+            ]
+            for percentile in (50, 95, 99)
+        }
+        counters["ingest_latency_max_ms"] = ordered[-1]
+        counters["ingest_latency_samples"] = len(ordered)
+        return counters
+
+
+def _spool_candidates(paths: RuntimePaths) -> list[Tuple[int, str, Path]]:
+    candidates = []
+    for source in SOURCES:
+        for path in paths.source_spool(source).glob("*.ready"):
+            try:
+                queued_at = path.lstat().st_mtime_ns
+            except OSError:
+                continue
+            candidates.append((queued_at, source, path))
+    candidates.sort(key=lambda item: (item[0], item[2].name, item[1]))
+    return candidates
+
+
+def _drain_spool(
+    paths: RuntimePaths,
+    secret: bytes,
+    store: EventStore,
+    *,
+    limit: int,
+    batch_size: int,
+    latency: _IngestLatency,
+) -> IngestResult:
+    selected = _spool_candidates(paths)[:limit]
+    result = IngestResult()
+    for start in range(0, len(selected), batch_size):
+        batch = selected[start : start + batch_size]
+        outcomes = store.ingest_batch(
+            [
+                _load_spool_receipt(secret, source, path)
+                for _queued_at, source, path in batch
+            ]
+        )
+        latency.observe(
+            queued_at
+            for (queued_at, _source, _path), outcome in zip(batch, outcomes)
+            if outcome == "accepted"
+        )
+        # Unlink only after the whole batch is durable.  A crash before
+        # cleanup replays these files as receipt duplicates.
+        for (_queued_at, _source, path), outcome in zip(batch, outcomes):
             cleanup_pending = False
             try:
                 _durable_unlink(path)
             except StateError:
                 cleanup_pending = True
             result = result.incremented(outcome, cleanup_pending)
-        store.prune_if_due(checkpoint=False)
-        store.write_status_best_effort()
-        return result
+    return result
+
+
+@contextlib.contextmanager
+def _ingest_lock(paths: RuntimePaths) -> Iterator[None]:
+    lock_descriptor = _open_private_regular(paths.ingest_lock, os.O_RDWR)
+    try:
+        try:
+            fcntl.flock(lock_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            raise StateError("ingester_busy") from exc
+        yield
     finally:
         try:
             fcntl.flock(lock_descriptor, fcntl.LOCK_UN)
@@ -3544,6 +4356,164 @@ def ingest_once(
             os.close(lock_descriptor)
 
 
+def _validate_ingest_bounds(limit: int, batch_size: int) -> None:
+    if limit < 1 or limit > MAX_INGEST_LIMIT:
+        raise PayloadError("invalid_ingest_limit")
+    if batch_size < 1 or batch_size > MAX_INGEST_LIMIT:
+        raise PayloadError("invalid_ingest_batch_size")
+
+
+def ingest_once(
+    root: Path,
+    *,
+    limit: int = 100,
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    clock: Callable[[], str] = utc_now,
+) -> IngestResult:
+    _validate_ingest_bounds(limit, batch_size)
+    paths = validate_runtime(root)
+    secret = _load_secret(paths)
+    store = EventStore(paths, clock=clock)
+    store.check_schema()
+    latency = _IngestLatency()
+    with _ingest_lock(paths):
+        result = _drain_spool(
+            paths,
+            secret,
+            store,
+            limit=limit,
+            batch_size=batch_size,
+            latency=latency,
+        )
+        store.prune_if_due(checkpoint=False)
+        store.write_status_best_effort(latency.counters())
+        return result
+
+
+def watch_ingest(
+    root: Path,
+    *,
+    limit: int = MAX_INGEST_LIMIT,
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    rescan_seconds: float = WATCH_RESCAN_SECONDS,
+    max_seconds: Optional[float] = None,
+    clock: Callable[[], str] = utc_now,
+) -> IngestResult:
+    """Hold the ingest lock and drain each spool as soon as a file lands.
+
+    The watcher is registered before the first drain so a rename racing the
+    startup scan still wakes the loop.  ``rescan_seconds`` bounds how long a
+    missed notification (or the polling fallback) can delay ingestion.
+    ``limit`` caps each drain pass; a full pass is followed by another.
+    """
+
+    _validate_ingest_bounds(limit, batch_size)
+    if rescan_seconds <= 0 or rescan_seconds > 60:
+        raise PayloadError("invalid_rescan_interval")
+    paths = validate_runtime(root)
+    secret = _load_secret(paths)
+    store = EventStore(paths, clock=clock, persistent=True)
+    store.check_schema()
+    latency = _IngestLatency()
+    total = IngestResult()
+    deadline = None if max_seconds is None else time.monotonic() + max_seconds
+    with _ingest_lock(paths):
+        watcher = _spool_watcher([paths.source_spool(source) for source in SOURCES])
+        try:
+            while True:
+                while True:
+                    result = _drain_spool(
+                        paths,
+                        secret,
+                        store,
+                        limit=limit,
+                        batch_size=batch_size,
+                        latency=latency,
+                    )
+                    total = total.merged(result)
+                    if result.scanned > 0:
+                        store.write_status_best_effort(latency.counters())
+                    if result.scanned < limit:
+                        break
+                store.prune_if_due(checkpoint=False)
+                if deadline is None:
+                    timeout = rescan_seconds
+                else:
+                    timeout = min(rescan_seconds, deadline - time.monotonic())
+                    if timeout <= 0:
+                        break
+                watcher.wait(timeout)
+            store.write_status_best_effort(latency.counters())
+        finally:
+            watcher.close()
+            store.close()
+    return total
+
+
+def follow_events(
+    root: Path,
+    *,
+    after_id: int = 0,
+    follow: bool = False,
+    poll_seconds: float = TAIL_POLL_SECONDS,
+    max_seconds: Optional[float] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[Mapping[str, Any]]:
+    """Yield events in ``events.id`` order after ``after_id``.
+
+    Without ``follow`` the iterator stops at the current end of the log.  With
+    ``follow`` it keeps one pooled read connection and polls for newly
+    committed events until ``max_seconds`` elapses.  Nothing is written, so
+    readers never contend with the ingester for the writer lock.
+    """
+
+    if poll_seconds <= 0 or poll_seconds > 60:
+        raise PayloadError("invalid_poll_interval")
+    paths = validate_runtime(root)
+    store = EventStore(paths, persistent=follow)
+    store.check_schema()
+    deadline = None if max_seconds is None else time.monotonic() + max_seconds
+    cursor = after_id
+    try:
+        while True:
+            page = store.tail(after_id=cursor)
+            yield from page["events"]
+            cursor = page["next_after_id"]
+            if len(page["events"]) == TAIL_PAGE_SIZE:
+                continue
+            if not follow:
+                return
+            if deadline is None:
+                delay = poll_seconds
+            else:
+                delay = min(poll_seconds, deadline - time.monotonic())
+                if delay <= 0:
+                    return
+            sleep(delay)
+    finally:
+        store.close()
+
+
+def _stream_tail(args: argparse.Namespace, *, stream: Any) -> None:
+    root = args.root.expanduser()
+    _assert_absolute_root(root)
+    try:
+        for record in follow_events(
+            root,
+            after_id=args.after_id,
+            follow=args.follow,
+            poll_seconds=args.poll_seconds,
+            max_seconds=args.max_seconds,
+        ):
+            _json_output(record, stream=stream)
+            stream.flush()
+    except BrokenPipeError:
+        # The reader went away; the cursor it last saw is its resume point.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stream.fileno())
+        os.close(devnull)
+
+
 def _parse_duration(value: str, *, clock: Callable[[], str] = utc_now) -> str:
     match = DURATION_RE.fullmatch(value)
     if match is None:
@@ -3576,10 +4546,24 @@ def build_parser() -> argparse.ArgumentParser:
     operator_commands.add_parser("check-config")
     enqueue = operator_commands.add_parser("enqueue")
     enqueue.add_argument("--source", required=True, choices=SOURCES)
+    enqueue.add_argument("--ndjson", action="store_true")
     ingest = operator_commands.add_parser("ingest-once")
     ingest.add_argument("--limit", type=int, default=100)
+    ingest.add_argument(
+        "--batch-size", type=int, default=DEFAULT_INGEST_BATCH_SIZE
+    )
+    ingest.add_argument("--watch", action="store_true")
+    ingest.add_argument("--rescan-seconds", type=float, default=WATCH_RESCAN_SECONDS)
+    ingest.add_argument("--max-seconds", type=float)
     operator_commands.add_parser("status")
     operator_commands.add_parser("prune")
+    verify = operator_commands.add_parser("verify-counters")
+    verify.add_argument("--repair", action="store_true")
+    tail = operator_commands.add_parser("tail")
+    tail.add_argument("--after-id", type=int, default=0)
+    tail.add_argument("--follow", action="store_true")
+    tail.add_argument("--poll-seconds", type=float, default=TAIL_POLL_SECONDS)
+    tail.add_argument("--max-seconds", type=float)
     operator_commands.add_parser("review-access-attention")
     review_delivery = operator_commands.add_parser("review-delivery-attention")
     review_delivery.add_argument(
@@ -3628,6 +4612,14 @@ def run_operator(args: argparse.Namespace) -> Mapping[str, Any]:
             "mode": store.runtime_mode(),
             "delivery_policy": delivery_policy_projection(paths),
         }
+    if args.command == "enqueue" and args.ndjson:
+        data = sys.stdin.buffer.read(MAX_ENQUEUE_BATCH_BYTES + 1)
+        events = enqueue_many(root, args.source, _split_ndjson(data))
+        return {
+            "ok": True,
+            "status": "enqueued",
+            "event_uids": [event.event_uid for event in events],
+        }
     if args.command == "enqueue":
         data = sys.stdin.buffer.read(MAX_STDIN_BYTES + 1)
         event = enqueue_event(root, args.source, data)
@@ -3649,12 +4641,23 @@ def run_operator(args: argparse.Namespace) -> Mapping[str, Any]:
     if args.command == "set-mode":
         return {"ok": True, **store.set_runtime_mode(args.mode)}
     if args.command == "ingest-once":
-        result = ingest_once(root, limit=args.limit)
+        if not args.watch:
+            result = ingest_once(root, limit=args.limit, batch_size=args.batch_size)
+        else:
+            result = watch_ingest(
+                root,
+                limit=args.limit,
+                batch_size=args.batch_size,
+                rescan_seconds=args.rescan_seconds,
+                max_seconds=args.max_seconds,
+            )
         return {"ok": True, **dataclasses.asdict(result)}
     if args.command == "status":
         return store.status_snapshot()
     if args.command == "prune":
         return {"ok": True, "deleted": store.prune()}
+    if args.command == "verify-counters":
+        return {"ok": True, **store.verify_counters(repair=args.repair)}
     if args.command == "review-access-attention":
         return {"ok": True, **store.review_access_attention()}
     if args.command == "review-delivery-attention":
@@ -3701,6 +4704,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = build_parser()
     try:
         args = parser.parse_args(argv)
+        if args.interface == "operator" and args.command == "tail":
+            # NDJSON records go straight to stdout; there is no summary object.
+            _stream_tail(args, stream=sys.stdout)
+            return 0
         value = run_operator(args) if args.interface == "operator" else run_agent(args)
         _json_output(value)
         return 0
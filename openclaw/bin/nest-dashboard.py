@@ -18,6 +18,9 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 from urllib.parse import urlparse, parse_qs
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import history_index  # noqa: E402
+
 HISTORY_DIR = os.path.expanduser("~/.openclaw/nest-history")
 PRESENCE_DIR = os.path.expanduser("~/.openclaw/presence")
 PRESENCE_HISTORY_DIR = os.path.join(PRESENCE_DIR, "history")
@@ -33,74 +36,21 @@ def load_snapshots(hours):
     hours = min(max(1, hours), MAX_HOURS)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=hours)
-    records = []
 
     # Only open files that could contain data in the range
     num_days = hours // 24 + 2
-    for i in range(num_days):
-        day = (now - timedelta(days=i)).strftime("%Y-%m-%d")
-        path = os.path.join(HISTORY_DIR, f"{day}.jsonl")
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if not isinstance(rec, dict):
-                        continue
-                    ts_str = rec.get("timestamp", "")
-                    try:
-                        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        continue
-                    if ts.tzinfo is None:
-                        continue
-                    if ts >= cutoff:
-                        records.append(rec)
-        except OSError:
-            continue
-
-    records.sort(key=lambda r: r.get("timestamp", ""))
+    days = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)]
+    index = history_index.for_directory(HISTORY_DIR)
 
     # Downsample for large ranges: keep closest snapshot to each hour boundary
-    if hours > DOWNSAMPLE_THRESHOLD_HOURS and len(records) > 1:
-        records = _downsample_hourly(records)
+    if hours > DOWNSAMPLE_THRESHOLD_HOURS:
+        return index.hourly_records(days, since=cutoff.timestamp()), hours
 
+    records = index.records(days, since=cutoff.timestamp())
+    records.sort(key=lambda r: r.get("timestamp", ""))
     return records, hours
 
 
-def _downsample_hourly(records):
-    """Keep approximately one snapshot per hour."""
-    buckets = {}
-    for rec in records:
-        ts_str = rec.get("timestamp", "")
-        try:
-            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            continue
-        # Bucket key: date + hour
-        key = ts.strftime("%Y-%m-%d-%H")
-        # Keep the one closest to the hour boundary (minute closest to 0)
-        if key not in buckets or ts.minute < _ts_minute(buckets[key]):
-            buckets[key] = rec
-    # Return in chronological order
-    return [buckets[k] for k in sorted(buckets.keys())]
-
-
-def _ts_minute(rec):
-    ts_str = rec.get("timestamp", "")
-    try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).minute
-    except (ValueError, AttributeError):
-        return 60
-
-
 def _current_room_key(room):
     """Return a stable key that preserves same-room, different-source cards."""
     room_name = room.get("room")
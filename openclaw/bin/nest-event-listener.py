@@ -23,6 +23,7 @@ import sqlite3
 import stat
 import sys
 import threading
+import time
 from typing import Any, Callable, Mapping, Sequence
 
 
@@ -32,6 +33,11 @@ SERVICE_NAME = "nest-event-listener"
 RETENTION_DAYS = 30
 STREAMING_MAX_MESSAGES = 4
 STREAMING_MAX_BYTES = 2 * 1024 * 1024
+# Group commit batches at most one flow-control window of callbacks.
+GROUP_COMMIT_MAX_MESSAGES = STREAMING_MAX_MESSAGES
+MAX_GROUP_COMMIT_MS = 50
+PRUNE_INTERVAL_SECONDS = 5 * 60
+STATUS_WRITE_INTERVAL_SECONDS = 5
 MAX_CONFIG_BYTES = 64 * 1024
 MAX_PAYLOAD_BYTES = 512 * 1024
 DEFAULT_ROOT = Path("~/.openclaw/nest-events").expanduser()
@@ -541,12 +547,29 @@ def load_settings(environ: Mapping[str, str] | None = None) -> Settings:
 class StateStore:
     """SQLite-backed inbox, normalized event ledger, outbox, and status."""
 
-    def __init__(self, settings: Settings, clock: Callable[[], str] = utc_now):
+    def __init__(
+        self,
+        settings: Settings,
+        clock: Callable[[], str] = utc_now,
+        *,
+        prune_interval_seconds: float = 0,
+        status_interval_seconds: float = 0,
+    ):
         self.settings = settings
         self.clock = clock
         self.state_dir = settings.state_dir
         self.db_path = self.state_dir / DB_FILENAME
         self.status_path = self.state_dir / STATUS_FILENAME
+        # Zero intervals keep the historical prune and projection per delivery.
+        self.prune_interval_seconds = prune_interval_seconds
+        self.status_interval_seconds = status_interval_seconds
+        self._maintenance_lock = threading.Lock()
+        # _initialize() has just pruned, so the first interval starts now.
+        self._next_maintenance = {
+            "prune": time.monotonic() + prune_interval_seconds,
+            "status": 0.0,
+        }
+        self._status_timer: threading.Timer | None = None
         _assert_private_directory(self.state_dir, create=True)
         self._prepare_database_file()
         self._initialize()
@@ -852,69 +875,147 @@ class StateStore:
     ) -> ProcessResult:
         """Commit a delivery and deterministic outbox decisions in one transaction."""
 
-        if (
-            not isinstance(message_id, str)
-            or not message_id
-            or len(message_id) > 1024
-            or CONTROL_RE.search(message_id)
-        ):
-            raise PayloadError("invalid_message_id")
-        message_key = opaque_key("pubsub-message", message_id)
-        received_at = self._now()
-        publish_at = normalize_optional_publish_time(publish_time)
+        (result,) = self.record_deliveries([(data, message_id, publish_time)])
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-        try:
-            envelope = parse_sdm_payload(data)
-            payload_error = None
-        except PayloadError as exc:
-            envelope = None
-            payload_error = exc.code
+    def record_deliveries(
+        self,
+        deliveries: Sequence[tuple[bytes, str, Any]],
+    ) -> list[ProcessResult | Exception]:
+        """Commit several deliveries in one transaction (group commit).
 
+        Each delivery runs under its own savepoint, so a failure rolls back
+        only that delivery and is returned in its slot for a nack.  A failed
+        commit raises and must nack every delivery in the group.
+        """
+
+        received_at = self._now()
+        prepared: list[Any] = []
+        for data, message_id, publish_time in deliveries:
+            try:
+                if (
+                    not isinstance(message_id, str)
+                    or not message_id
+                    or len(message_id) > 1024
+                    or CONTROL_RE.search(message_id)
+                ):
+                    raise PayloadError("invalid_message_id")
+                message_key = opaque_key("pubsub-message", message_id)
+                publish_at = normalize_optional_publish_time(publish_time)
+            except PayloadError as exc:
+                prepared.append(exc)
+                continue
+            try:
+                envelope = parse_sdm_payload(data)
+                payload_error = None
+            except PayloadError as exc:
+                envelope = None
+                payload_error = exc.code
+            prepared.append((message_key, publish_at, envelope, payload_error))
+
+        results: list[ProcessResult | Exception] = []
         with contextlib.closing(self._connect()) as connection, connection:
             connection.execute("BEGIN IMMEDIATE")
-            self._prune(connection, received_at)
-            self._increment(connection, "deliveries_total")
-            existing = connection.execute(
-                "SELECT id FROM inbox WHERE message_key = ?", (message_key,)
-            ).fetchone()
-            if existing is not None:
-                self._increment(connection, "duplicate_messages")
-                self._touch_status(connection, received_at, health="ok")
-                connection.commit()
-                result = ProcessResult("duplicate_message", 0, 0)
-            elif payload_error is not None:
-                connection.execute(
-                    """
-                    INSERT INTO inbox(
-                        message_key, received_at, publish_at, outcome, reason_code
-                    ) VALUES (?, ?, ?, 'invalid', ?)
-                    """,
-                    (message_key, received_at, publish_at, payload_error),
-                )
-                self._increment(connection, "invalid_messages")
-                self._touch_status(
-                    connection,
-                    received_at,
-                    health="ok",
-                    error_code=payload_error,
-                )
-                connection.commit()
-                result = ProcessResult("invalid", 0, 0)
-            else:
-                assert envelope is not None
-                result = self._record_valid_envelope(
-                    connection,
-                    envelope,
-                    message_key,
-                    received_at,
-                    publish_at,
-                )
-                connection.commit()
+            if self._maintenance_due("prune", self.prune_interval_seconds):
+                self._prune(connection, received_at)
+            for item in prepared:
+                if isinstance(item, Exception):
+                    results.append(item)
+                    continue
+                connection.execute("SAVEPOINT delivery")
+                try:
+                    result = self._record_one(connection, *item, received_at)
+                except Exception as exc:
+                    connection.execute("ROLLBACK TO SAVEPOINT delivery")
+                    results.append(exc)
+                else:
+                    results.append(result)
+                finally:
+                    connection.execute("RELEASE SAVEPOINT delivery")
+            connection.commit()
 
         # The SQLite transaction above is the ack boundary.  The status JSON is
         # a protected operational projection of the same durable database.
+        self._write_status_when_due()
+        return results
+
+    def _record_one(
+        self,
+        connection: sqlite3.Connection,
+        message_key: str,
+        publish_at: str | None,
+        envelope: NormalizedEnvelope | None,
+        payload_error: str | None,
+        received_at: str,
+    ) -> ProcessResult:
+        self._increment(connection, "deliveries_total")
+        existing = connection.execute(
+            "SELECT id FROM inbox WHERE message_key = ?", (message_key,)
+        ).fetchone()
+        if existing is not None:
+            self._increment(connection, "duplicate_messages")
+            self._touch_status(connection, received_at, health="ok")
+            return ProcessResult("duplicate_message", 0, 0)
+        if payload_error is not None:
+            connection.execute(
+                """
+                INSERT INTO inbox(
+                    message_key, received_at, publish_at, outcome, reason_code
+                ) VALUES (?, ?, ?, 'invalid', ?)
+                """,
+                (message_key, received_at, publish_at, payload_error),
+            )
+            self._increment(connection, "invalid_messages")
+            self._touch_status(
+                connection,
+                received_at,
+                health="ok",
+                error_code=payload_error,
+            )
+            return ProcessResult("invalid", 0, 0)
+        assert envelope is not None
+        return self._record_valid_envelope(
+            connection,
+            envelope,
+            message_key,
+            received_at,
+            publish_at,
+        )
+
+    def _maintenance_due(self, name: str, interval: float) -> bool:
+        if interval <= 0:
+            return True
+        now = time.monotonic()
+        with self._maintenance_lock:
+            if now < self._next_maintenance[name]:
+                return False
+            self._next_maintenance[name] = now + interval
+            return True
+
+    def _write_status_when_due(self) -> None:
+        """Project status now, or once at the end of the current interval."""
+
+        if self._maintenance_due("status", self.status_interval_seconds):
+            self._write_status_best_effort()
+            return
+        with self._maintenance_lock:
+            if self._status_timer is not None:
+                return
+            delay = max(0.0, self._next_maintenance["status"] - time.monotonic())
+            timer = threading.Timer(delay, self._flush_status)
+            timer.daemon = True
+            self._status_timer = timer
+        timer.start()
+
+    def _flush_status(self) -> None:
+        with self._maintenance_lock:
+            self._status_timer = None
+            self._next_maintenance["status"] = (
+                time.monotonic() + self.status_interval_seconds
+            )
         self._write_status_best_effort()
-        return result
 
     def _record_valid_envelope(
         self,
@@ -1302,37 +1403,44 @@ class PubSubMessageProcessor:
             try:
                 message_id = str(message.message_id)
                 data = bytes(message.data)
-                result = self.store.record_delivery(
+                result: ProcessResult | Exception = self.store.record_delivery(
                     data, message_id, getattr(message, "publish_time", None)
                 )
-            except PayloadError:
-                # A missing/invalid Pub/Sub message ID is not a valid SDM
-                # delivery to tombstone; retry rather than acknowledge it.
-                self._safe_runtime_error("invalid_pubsub_message")
-                message.nack()
-                emit_log("error", "delivery_nacked", code="invalid_pubsub_message")
-                return
-            except Exception:
-                self._safe_runtime_error("durable_commit_failed")
-                message.nack()
-                emit_log("error", "delivery_nacked", code="durable_commit_failed")
-                return
-            try:
-                message.ack()
-            except Exception:
-                self._safe_runtime_error("ack_failed")
-                emit_log("error", "ack_failed", code="ack_failed")
-                return
-            emit_log(
-                "info",
-                "delivery_committed",
-                outcome=result.outcome,
-                acceptedEvents=result.accepted_events,
-                alias=result.alias,
-                site=result.site,
-                reasonCode=result.reason_code,
-                eventKinds=result.event_kinds,
-            )
+            except Exception as exc:
+                result = exc
+            self._settle(message, result)
+
+    def _settle(self, message: Any, result: ProcessResult | Exception) -> None:
+        """Ack only a durably committed delivery; nack everything else."""
+
+        if isinstance(result, PayloadError):
+            # A missing/invalid Pub/Sub message ID is not a valid SDM
+            # delivery to tombstone; retry rather than acknowledge it.
+            self._safe_runtime_error("invalid_pubsub_message")
+            message.nack()
+            emit_log("error", "delivery_nacked", code="invalid_pubsub_message")
+            return
+        if isinstance(result, Exception):
+            self._safe_runtime_error("durable_commit_failed")
+            message.nack()
+            emit_log("error", "delivery_nacked", code="durable_commit_failed")
+            return
+        try:
+            message.ack()
+        except Exception:
+            self._safe_runtime_error("ack_failed")
+            emit_log("error", "ack_failed", code="ack_failed")
+            return
+        emit_log(
+            "info",
+            "delivery_committed",
+            outcome=result.outcome,
+            acceptedEvents=result.accepted_events,
+            alias=result.alias,
+            site=result.site,
+            reasonCode=result.reason_code,
+            eventKinds=result.event_kinds,
+        )
 
     def _safe_runtime_error(self, code: str) -> None:
         try:
@@ -1341,6 +1449,71 @@ class PubSubMessageProcessor:
             pass
 
 
+class GroupCommitMessageProcessor(PubSubMessageProcessor):
+    """Commit callbacks that arrive within a short window in one transaction.
+
+    The first callback of a window leads it: it waits up to ``window_seconds``
+    (or until the group is full), then commits the whole group and acks or
+    nacks each message only after that commit returns.  Later callbacks join
+    the open group and return; their messages stay outstanding until settled.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        *,
+        window_seconds: float,
+        max_messages: int = GROUP_COMMIT_MAX_MESSAGES,
+    ):
+        super().__init__(store)
+        self.window_seconds = window_seconds
+        self.max_messages = max_messages
+        self._group_ready = threading.Condition()
+        self._pending: list[Any] = []
+
+    def __call__(self, message: Any) -> None:
+        with self._group_ready:
+            self._pending.append(message)
+            if len(self._pending) > 1:
+                self._group_ready.notify_all()
+                return
+            self._group_ready.wait_for(
+                lambda: len(self._pending) >= self.max_messages,
+                timeout=self.window_seconds,
+            )
+            group, self._pending = self._pending, []
+        with self._lock:
+            self._commit(group)
+
+    def _commit(self, group: Sequence[Any]) -> None:
+        deliveries: list[tuple[bytes, str, Any]] = []
+        settled: list[tuple[Any, Exception]] = []
+        committed: list[Any] = []
+        for message in group:
+            try:
+                deliveries.append(
+                    (
+                        bytes(message.data),
+                        str(message.message_id),
+                        getattr(message, "publish_time", None),
+                    )
+                )
+            except Exception as exc:
+                settled.append((message, exc))
+            else:
+                committed.append(message)
+        if deliveries:
+            try:
+                results: Sequence[ProcessResult | Exception] = (
+                    self.store.record_deliveries(deliveries)
+                )
+            except Exception as exc:
+                results = [exc] * len(deliveries)
+            settled.extend(zip(committed, results))
+        for message, result in settled:
+            self._settle(message, result)
+
+
 def emit_log(level: str, event: str, **fields: Any) -> None:
     safe_fields = {key: value for key, value in fields.items() if value is not None}
     record = {"level": level, "event": event, **safe_fields}
@@ -1388,9 +1561,26 @@ def _create_subscriber(settings: Settings) -> tuple[Any, str, Any]:
     return subscriber, subscription_path, flow_control
 
 
-def run_listener(settings: Settings, *, once: bool) -> int:
-    store = StateStore(settings)
-    processor = PubSubMessageProcessor(store)
+def run_listener(
+    settings: Settings,
+    *,
+    once: bool,
+    group_commit_ms: int = 0,
+) -> int:
+    if group_commit_ms and not once:
+        # Group commit also moves pruning and the status projection off the
+        # per-delivery path; both then run at most once per fixed interval.
+        store = StateStore(
+            settings,
+            prune_interval_seconds=PRUNE_INTERVAL_SECONDS,
+            status_interval_seconds=STATUS_WRITE_INTERVAL_SECONDS,
+        )
+        processor: PubSubMessageProcessor = GroupCommitMessageProcessor(
+            store, window_seconds=group_commit_ms / 1000
+        )
+    else:
+        store = StateStore(settings)
+        processor = PubSubMessageProcessor(store)
     try:
         subscriber, subscription_path, flow_control = _create_subscriber(settings)
     except RuntimeDependencyError as exc:
@@ -1568,6 +1758,12 @@ def build_argument_parser() -> argparse.ArgumentParser:
     run_parser.add_argument(
         "--once", action="store_true", help="pull and process at most one delivery"
     )
+    run_parser.add_argument(
+        "--group-commit-ms",
+        type=int,
+        default=0,
+        help="commit callbacks arriving within this window together (0 disables)",
+    )
     subparsers.add_parser("status", help="print protected operational status JSON")
     subparsers.add_parser(
         "check-config", help="validate config and print a redacted summary"
@@ -1626,7 +1822,14 @@ def main(argv: Sequence[str] | None = None) -> int:
                 )
             )
             return 0
-        return run_listener(settings, once=bool(args.once))
+        if not 0 <= args.group_commit_ms <= MAX_GROUP_COMMIT_MS:
+            emit_log("error", "configuration_failed", code="group_commit_invalid")
+            return 2
+        return run_listener(
+            settings,
+            once=bool(args.once),
+            group_commit_ms=args.group_commit_ms,
+        )
     except (ConfigError, RuntimeDependencyError) as exc:
         emit_log("error", "listener_failed", code=exc.code)
         return 2
@@ -1022,11 +1022,11 @@ def advance_site(
     return changed, bool(local_events)
 
 
-def publish(home_eventctl: str, event: dict[str, Any]) -> None:
+def publish(home_eventctl: str, events: list[dict[str, Any]]) -> None:
     try:
         result = subprocess.run(
-            [home_eventctl, "enqueue", "--source", "presence"],
-            input=stable_json(event),
+            [home_eventctl, "enqueue", "--source", "presence", "--ndjson"],
+            input="".join(stable_json(event) + "\n" for event in events),
             text=True,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
@@ -1075,8 +1075,7 @@ def publish_pending(
     if raw is None:
         return None
     pending = validate_pending(raw)
-    for event in pending["events"]:
-        publish(home_eventctl, event)
+    publish(home_eventctl, pending["events"])
     atomic_json(state_path, pending["state_after"])
     pending_path.unlink()
     fsync_directory(pending_path.parent)
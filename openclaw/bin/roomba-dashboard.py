@@ -29,6 +29,7 @@ SNOOZE_FILE = os.path.expanduser("~/.openclaw/dog-walk/snooze.json")
 SECRETS_FILE = os.path.expanduser("~/.openclaw/.secrets-cache")
 IROBOT_CLOUD_SCRIPT = os.path.expanduser("~/.openclaw/skills/cabin-roomba/irobot-cloud.py")
 PORT = 8553
+ROOMBA_EVENT_TYPES = ("departure", "dock", "dock_timeout")
 
 ROOMBA_CACHE_TTL = 300  # 5 minutes
 ROOMBA_SSH_TIMEOUT = 25
@@ -205,120 +206,177 @@ def save_snooze(data):
 # Calendar heatmap data
 # ---------------------------------------------------------------------------
 
-def load_calendar_data(year, month):
-    """Load Roomba run data for a calendar month from JSONL history.
+def _run_details(rec):
+    """Yield ``(location, run_info)`` for each Roomba command in one event."""
+    event_type = rec.get("event_type")
+    roombas = rec.get("roombas", {})
+    walk = rec.get("dog_walk", {})
+    ts = rec.get("timestamp", "")
+
+    for loc in ("crosstown", "cabin"):
+        loc_data = roombas.get(loc, {})
+        cmd_result = loc_data.get("last_command_result")
+        if not cmd_result:
+            continue
 
-    Returns: {
-        "year": int, "month": int,
-        "crosstown": {day: [run_details...], ...},
-        "cabin": {day: [run_details...], ...},
-        "max_runs": int
-    }
+        # Determine trigger source
+        source = cmd_result.get("source", "automatic")
+        if source == "dog-walk-start":
+            trigger = "manual"
+        else:
+            trigger = "dog_walk"
+
+        run_info = {
+            "time": ts,
+            "event": event_type,
+            "trigger": trigger,
+            "success": cmd_result.get("success", False),
+            "skipped": cmd_result.get("skipped"),
+        }
+
+        # Extract Roomba names from results
+        results = cmd_result.get("results", [])
+        if results:
+            run_info["roombas"] = [r.get("name", "?") for r in results]
+
+        # For dock events, add return signal
+        if event_type in ("dock", "dock_timeout"):
+            run_info["return_signal"] = walk.get("return_signal")
+            run_info["duration_min"] = walk.get("walk_duration_minutes")
+
+        yield loc, run_info
+
+
+def _merge_day_runs(runs):
+    """Pair one day's departures with their docks for one location."""
+    # Deduplicate: keep only departure events for run count, dock for details
+    # Group by walk: departure = start, dock = end
+    departures = [r for r in runs if r["event"] == "departure"]
+    docks = [r for r in runs if r["event"] in ("dock", "dock_timeout")]
+    # Merge dock info into departures where possible
+    merged = []
+    for dep in departures:
+        entry = {
+            "time": dep["time"],
+            "trigger": dep["trigger"],
+            "success": dep["success"],
+            "skipped": dep.get("skipped"),
+            "roombas": dep.get("roombas", []),
+        }
+        # Find matching dock (closest dock after this departure)
+        for dock in docks:
+            if dock["time"] > dep["time"]:
+                entry["return_signal"] = dock.get("return_signal")
+                entry["duration_min"] = dock.get("duration_min")
+                docks.remove(dock)
+                break
+        merged.append(entry)
+    # Include snoozed/skipped departures
+    snoozed = [r for r in runs if r.get("skipped")]
+    for s in snoozed:
+        if s not in departures:
+            merged.append({
+                "time": s["time"],
+                "trigger": s["trigger"],
+                "success": False,
+                "skipped": s["skipped"],
+            })
+    return merged
+
+
+class CalendarCache:
+    """Per-day Roomba runs and per-month calendars, reused across requests.
+
+    Each day file keeps its parsed runs and the byte offset after its last
+    complete line, keyed by inode, size, and mtime.  A file that only grew
+    has just the appended bytes parsed; a replaced or shrunk file is re-read
+    from the start.  A month is rebuilt only when one of its day files
+    changed, so closed months are served from memory after one stat per day.
+    Returned calendars are shared and must not be mutated.
     """
-    num_days = calendar.monthrange(year, month)[1]
-    crosstown = {}
-    cabin = {}
-
-    for day in range(1, num_days + 1):
-        date_str = f"{year}-{month:02d}-{day:02d}"
-        path = os.path.join(HISTORY_DIR, f"{date_str}.jsonl")
-        if not os.path.exists(path):
-            continue
+
+    def __init__(self):
+        self._days = {}
+        self._months = {}
+        self._lock = threading.Lock()
+
+    def month(self, directory, year, month):
+        num_days = calendar.monthrange(year, month)[1]
+        files = []
+        for day in range(1, num_days + 1):
+            path = os.path.join(directory, f"{year}-{month:02d}-{day:02d}.jsonl")
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((day, path, st))
+        signature = tuple(
+            (day, st.st_ino, st.st_size, st.st_mtime_ns) for day, _path, st in files
+        )
+        key = (directory, year, month)
+
+        with self._lock:
+            cached = self._months.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            crosstown = {}
+            cabin = {}
+            for day, path, st in files:
+                entry = self._refresh_day(path, st)
+                if entry is None:
+                    continue
+                for loc, target in (("crosstown", crosstown), ("cabin", cabin)):
+                    if loc in entry["merged"]:
+                        target[day] = entry["merged"][loc]
+            data = _calendar_payload(year, month, crosstown, cabin)
+            self._months[key] = (signature, data)
+            return data
+
+    def _refresh_day(self, path, st):
+        entry = self._days.get(path)
+        if entry is not None and (entry["inode"], entry["size"], entry["mtime_ns"]) == (
+            st.st_ino, st.st_size, st.st_mtime_ns
+        ):
+            return entry
+        if entry is None or entry["inode"] != st.st_ino or st.st_size < entry["offset"]:
+            offset, runs = 0, {}
+        else:
+            offset = entry["offset"]
+            runs = {loc: list(loc_runs) for loc, loc_runs in entry["runs"].items()}
         try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    event_type = rec.get("event_type")
-                    if event_type not in ("departure", "dock", "dock_timeout"):
-                        continue
-
-                    roombas = rec.get("roombas", {})
-                    walk = rec.get("dog_walk", {})
-                    ts = rec.get("timestamp", "")
-
-                    for loc in ("crosstown", "cabin"):
-                        loc_data = roombas.get(loc, {})
-                        cmd_result = loc_data.get("last_command_result")
-                        if not cmd_result:
-                            continue
-
-                        target = crosstown if loc == "crosstown" else cabin
-                        if day not in target:
-                            target[day] = []
-
-                        # Determine trigger source
-                        source = cmd_result.get("source", "automatic")
-                        if source == "dog-walk-start":
-                            trigger = "manual"
-                        else:
-                            trigger = "dog_walk"
-
-                        run_info = {
-                            "time": ts,
-                            "event": event_type,
-                            "trigger": trigger,
-                            "success": cmd_result.get("success", False),
-                            "skipped": cmd_result.get("skipped"),
-                        }
-
-                        # Extract Roomba names from results
-                        results = cmd_result.get("results", [])
-                        if results:
-                            run_info["roombas"] = [r.get("name", "?") for r in results]
-
-                        # For dock events, add return signal
-                        if event_type in ("dock", "dock_timeout"):
-                            run_info["return_signal"] = walk.get("return_signal")
-                            run_info["duration_min"] = walk.get("walk_duration_minutes")
-
-                        target[day].append(run_info)
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(max(0, st.st_size - offset))
         except OSError:
-            continue
+            self._days.pop(path, None)
+            return None
+        # A trailing partial line is left for the next read.
+        complete = data.rfind(b"\n") + 1
+        for raw in data[:complete].splitlines():
+            try:
+                rec = json.loads(raw)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if not isinstance(rec, dict) or rec.get("event_type") not in ROOMBA_EVENT_TYPES:
+                continue
+            for loc, run_info in _run_details(rec):
+                runs.setdefault(loc, []).append(run_info)
+        entry = {
+            "inode": st.st_ino,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "offset": offset + complete,
+            "runs": runs,
+            "merged": {loc: _merge_day_runs(loc_runs) for loc, loc_runs in runs.items()},
+        }
+        self._days[path] = entry
+        return entry
 
-    # Deduplicate: keep only departure events for run count, dock for details
-    for loc_data in (crosstown, cabin):
-        for day in loc_data:
-            runs = loc_data[day]
-            # Group by walk: departure = start, dock = end
-            departures = [r for r in runs if r["event"] == "departure"]
-            docks = [r for r in runs if r["event"] in ("dock", "dock_timeout")]
-            # Merge dock info into departures where possible
-            merged = []
-            for dep in departures:
-                entry = {
-                    "time": dep["time"],
-                    "trigger": dep["trigger"],
-                    "success": dep["success"],
-                    "skipped": dep.get("skipped"),
-                    "roombas": dep.get("roombas", []),
-                }
-                # Find matching dock (closest dock after this departure)
-                for dock in docks:
-                    if dock["time"] > dep["time"]:
-                        entry["return_signal"] = dock.get("return_signal")
-                        entry["duration_min"] = dock.get("duration_min")
-                        docks.remove(dock)
-                        break
-                merged.append(entry)
-            # Include snoozed/skipped departures
-            snoozed = [r for r in runs if r.get("skipped")]
-            for s in snoozed:
-                if s not in departures:
-                    merged.append({
-                        "time": s["time"],
-                        "trigger": s["trigger"],
-                        "success": False,
-                        "skipped": s["skipped"],
-                    })
-            loc_data[day] = merged
 
+CALENDAR_CACHE = CalendarCache()
+
+
+def _calendar_payload(year, month, crosstown, cabin):
     max_runs = 0
     for loc_data in (crosstown, cabin):
         for day_runs in loc_data.values():
@@ -332,10 +390,23 @@ def load_calendar_data(year, month):
         "cabin": {str(k): v for k, v in cabin.items()},
         "max_runs": max_runs,
         "first_weekday": calendar.monthrange(year, month)[0],  # 0=Monday
-        "num_days": num_days,
+        "num_days": calendar.monthrange(year, month)[1],
     }
 
 
+def load_calendar_data(year, month):
+    """Load Roomba run data for a calendar month from JSONL history.
+
+    Returns: {
+        "year": int, "month": int,
+        "crosstown": {day: [run_details...], ...},
+        "cabin": {day: [run_details...], ...},
+        "max_runs": int
+    }
+    """
+    return CALENDAR_CACHE.month(os.path.abspath(HISTORY_DIR), year, month)
+
+
 # ---------------------------------------------------------------------------
 # HTTP Handler
 # ---------------------------------------------------------------------------
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""SQLite catalog of dog-walk route files with pre-binned heatmap cells.
+
+The dog-walk runtime writes one JSON file per walk to
+``~/.openclaw/dog-walk/routes/<location>/<YYYY-MM-DD>/<walk_id>.json``.
+This module keeps ``routes/route-index.sqlite3`` with one row per route file
+(walk id, origin location, start time, dashboard summary) and, per route, the
+number of GPS points in each ``CELL_DEGREES`` grid cell.  Summary, detail,
+and heatmap queries then read only the rows for the requested location and
+window instead of parsing every route ever written.
+
+The route files stay the source of truth.  ``sync`` stats each date
+directory and rescans only those whose mtime changed (the runtime replaces
+files atomically, which touches the directory), re-indexing files whose size
+or mtime changed and dropping rows for deleted files.  ``index_route`` folds
+one file immediately; the runtime calls it when a walk is finalized.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any, Iterator, Optional
+
+
+DATABASE_NAME = "route-index.sqlite3"
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_SECONDS = 5
+# ~11 m of latitude; well below the dashboard heatmap's 24 px radius.
+CELL_DEGREES = 1e-4
+HEATMAP_POINT_WEIGHT = 0.35
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS route_dirs (
+    dir TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS routes (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    walk_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    location TEXT,
+    started_at TEXT,
+    started_epoch REAL,
+    excluded INTEGER NOT NULL,
+    has_points INTEGER NOT NULL,
+    summary TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS routes_window_idx ON routes (location, started_epoch);
+CREATE INDEX IF NOT EXISTS routes_walk_idx ON routes (walk_id);
+CREATE INDEX IF NOT EXISTS routes_dir_idx ON routes (dir);
+CREATE TABLE IF NOT EXISTS route_cells (
+    path TEXT NOT NULL,
+    lat_bin INTEGER NOT NULL,
+    lon_bin INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (path, lat_bin, lon_bin)
+) WITHOUT ROWID;
+"""
+
+
+class RouteIndexError(Exception):
+    """Safe failure with a stable code."""
+
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def default_routes_dir(home: Optional[Path] = None) -> Path:
+    base = Path.home() if home is None else home
+    return base / ".openclaw" / "dog-walk" / "routes"
+
+
+def _start_epoch(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def route_summary(route: dict) -> dict:
+    """The per-walk fields the dashboard lists; no GPS points."""
+    return {
+        "walk_id": route.get("walk_id"),
+        "origin_location": route.get("origin_location"),
+        "started_at": route.get("started_at"),
+        "ended_at": route.get("ended_at"),
+        "end_location": route.get("end_location"),
+        "return_signal": route.get("return_signal"),
+        "distance_m": route.get("distance_m", 0),
+        "fi_distance_m": route.get("fi_distance_m"),
+        "fi_walk_start": route.get("fi_walk_start"),
+        "fi_walk_end": route.get("fi_walk_end"),
+        "fi_walker": route.get("fi_walker"),
+        "fi_walk_count": route.get("fi_walk_count"),
+        "detection_latency_s": route.get("detection_latency_s"),
+        "is_car_trip": route.get("is_car_trip", False),
+        "point_count": route.get("point_count", len(route.get("points") or [])),
+        "active": route.get("ended_at") is None,
+    }
+
+
+def route_excluded(route: dict) -> bool:
+    """Inter-home transits and car trips are not walks."""
+    return bool(route.get("is_interhome_transit") or route.get("is_car_trip"))
+
+
+def _route_cells(points: Any) -> dict[tuple[int, int], int]:
+    cells: dict[tuple[int, int], int] = {}
+    for point in points if isinstance(points, list) else ():
+        if not isinstance(point, dict):
+            continue
+        lat, lon = point.get("lat"), point.get("lon")
+        if isinstance(lat, bool) or isinstance(lon, bool):
+            continue
+        if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+            continue
+        key = (round(lat / CELL_DEGREES), round(lon / CELL_DEGREES))
+        cells[key] = cells.get(key, 0) + 1
+    return cells
+
+
+class RouteIndex:
+    """Route catalog for one routes directory, refreshed incrementally."""
+
+    def __init__(self, routes_dir: str | os.PathLike[str]) -> None:
+        self.routes_dir = Path(routes_dir)
+        self.database = self.routes_dir / DATABASE_NAME
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(
+            self.database, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        try:
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            row = connection.execute(
+                "SELECT value FROM index_meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                connection.execute(
+                    "INSERT OR IGNORE INTO index_meta (key, value) VALUES ('schema_version', ?)",
+                    (SCHEMA_VERSION,),
+                )
+            elif row[0] != SCHEMA_VERSION:
+                raise RouteIndexError("route_index_schema_unsupported")
+            yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self, connection: sqlite3.Connection) -> Iterator[None]:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _date_dirs(self) -> Iterator[tuple[str, int]]:
+        """Yield (relative dir, mtime_ns) for every ``<location>/<date>`` dir."""
+        with os.scandir(self.routes_dir) as locations:
+            location_dirs = [entry for entry in locations if entry.is_dir() and not entry.name.startswith(".")]
+        for location in location_dirs:
+            try:
+                with os.scandir(location.path) as dates:
+                    for entry in dates:
+                        if entry.is_dir() and not entry.name.startswith("."):
+                            yield f"{location.name}/{entry.name}", entry.stat().st_mtime_ns
+            except OSError:
+                continue
+
+    def sync(self) -> int:
+        """Index new or changed route files; return how many were (re)indexed."""
+        if not self.routes_dir.is_dir():
+            return 0
+        indexed = 0
+        with self.connect() as connection:
+            known = {
+                row["dir"]: row["mtime_ns"]
+                for row in connection.execute("SELECT dir, mtime_ns FROM route_dirs")
+            }
+            seen = set()
+            for directory, mtime_ns in self._date_dirs():
+                seen.add(directory)
+                if known.get(directory) == mtime_ns:
+                    continue
+                # The mtime was read before listing, so a write that lands
+                # during the rescan changes it again and is picked up next time.
+                with self._transaction(connection):
+                    indexed += self._sync_dir(connection, directory)
+                    connection.execute(
+                        "INSERT OR REPLACE INTO route_dirs (dir, mtime_ns) VALUES (?, ?)",
+                        (directory, mtime_ns),
+                    )
+            for directory in known.keys() - seen:
+                with self._transaction(connection):
+                    self._forget(connection, "dir = ?", (directory,))
+                    connection.execute("DELETE FROM route_dirs WHERE dir = ?", (directory,))
+        return indexed
+
+    def _sync_dir(self, connection: sqlite3.Connection, directory: str) -> int:
+        indexed_files = {
+            row["path"]: (row["size"], row["mtime_ns"])
+            for row in connection.execute(
+                "SELECT path, size, mtime_ns FROM routes WHERE dir = ?", (directory,)
+            )
+        }
+        present = set()
+        indexed = 0
+        try:
+            with os.scandir(self.routes_dir / directory) as entries:
+                files = [
+                    entry for entry in entries
+                    if entry.name.endswith(".json") and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except OSError:
+            files = []
+        for entry in files:
+            try:
+                status = entry.stat()
+            except OSError:
+                continue
+            path = f"{directory}/{entry.name}"
+            present.add(path)
+            if indexed_files.get(path) == (status.st_size, status.st_mtime_ns):
+                continue
+            self._index_file(connection, path, directory, status)
+            indexed += 1
+        for path in indexed_files.keys() - present:
+            self._forget(connection, "path = ?", (path,))
+        return indexed
+
+    def index_route(self, path: str | os.PathLike[str]) -> bool:
+        """Fold one route file now; False if it is outside the routes tree."""
+        absolute = Path(path).absolute()
+        try:
+            relative = absolute.relative_to(self.routes_dir.absolute())
+        except ValueError:
+            return False
+        if len(relative.parts) != 3:
+            return False
+        with self.connect() as connection, self._transaction(connection):
+            try:
+                status = absolute.stat()
+            except FileNotFoundError:
+                self._forget(connection, "path = ?", (relative.as_posix(),))
+                return True
+            self._index_file(connection, relative.as_posix(), relative.parent.as_posix(), status)
+        return True
+
+    def _index_file(self, connection, path: str, directory: str, status: os.stat_result) -> None:
+        try:
+            with open(self.routes_dir / path, encoding="utf-8") as handle:
+                route = json.load(handle)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            route = None
+        if not isinstance(route, dict):
+            # Unreadable files are remembered so they are not re-parsed until
+            # they change, but never listed.
+            route = {}
+            excluded = True
+        else:
+            excluded = route_excluded(route)
+        self._forget(connection, "path = ?", (path,))
+        points = route.get("points")
+        connection.execute(
+            """
+            INSERT INTO routes (path, dir, walk_id, size, mtime_ns, location, started_at,
+                                started_epoch, excluded, has_points, summary)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                path,
+                directory,
+                Path(path).stem,
+                status.st_size,
+                status.st_mtime_ns,
+                route.get("origin_location"),
+                route.get("started_at") if isinstance(route.get("started_at"), str) else None,
+                _start_epoch(route.get("started_at")),
+                int(excluded),
+                int(bool(points)),
+                json.dumps(route_summary(route), separators=(",", ":"), default=str),
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO route_cells (path, lat_bin, lon_bin, points) VALUES (?, ?, ?, ?)",
+            [(path, lat_bin, lon_bin, count) for (lat_bin, lon_bin), count in _route_cells(points).items()],
+        )
+
+    @staticmethod
+    def _forget(connection, where: str, params: tuple) -> None:
+        connection.execute(
+            f"DELETE FROM route_cells WHERE path IN (SELECT path FROM routes WHERE {where})",
+            params,
+        )
+        connection.execute(f"DELETE FROM routes WHERE {where}", params)
+
+    @staticmethod
+    def _window(since: float, location: Optional[str]) -> tuple[str, tuple]:
+        where = "excluded = 0 AND started_epoch >= ?"
+        params: tuple = (since,)
+        if location is not None:
+            where += " AND location = ?"
+            params += (location,)
+        return where, params
+
+    def summaries(self, *, since: float, location: Optional[str] = None) -> list[dict]:
+        """Walk summaries started at or after ``since``, newest first."""
+        where, params = self._window(since, location)
+        with self.connect() as connection:
+            rows = connection.execute(
+                f"SELECT summary FROM routes WHERE {where} ORDER BY started_at DESC",
+                params,
+            ).fetchall()
+        return [json.loads(row["summary"]) for row in rows]
+
+    def route_path(self, walk_id: str) -> Optional[Path]:
+        """The file for ``walk_id`` if it is indexed as a walk."""
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT path, excluded FROM routes WHERE walk_id = ? ORDER BY path LIMIT 1",
+                (walk_id,),
+            ).fetchone()
+        if row is None or row["excluded"]:
+            return None
+        return self.routes_dir / row["path"]
+
+    def heatmap(self, *, since: float, location: str) -> dict:
+        """Weighted heatmap cells and counts for one location's walks."""
+        where, params = self._window(since, location)
+        with self.connect() as connection:
+            walk_count = connection.execute(
+                f"SELECT COUNT(*) FROM routes WHERE {where} AND has_points = 1", params
+            ).fetchone()[0]
+            rows = connection.execute(
+                f"""
+                SELECT c.lat_bin, c.lon_bin, SUM(c.points) AS points
+                FROM route_cells AS c JOIN routes USING (path)
+                WHERE {where}
+                GROUP BY c.lat_bin, c.lon_bin
+                ORDER BY c.lat_bin, c.lon_bin
+                """,
+                params,
+            ).fetchall()
+        return {
+            "points": [
+                [
+                    round(row["lat_bin"] * CELL_DEGREES, 6),
+                    round(row["lon_bin"] * CELL_DEGREES, 6),
+                    round(row["points"] * HEATMAP_POINT_WEIGHT, 4),
+                ]
+                for row in rows
+            ],
+            "walk_count": walk_count,
+            "point_count": sum(row["points"] for row in rows),
+        }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    sync = subcommands.add_parser("sync", help="index new or changed route files")
+    sync.add_argument("--routes-dir", type=Path, default=default_routes_dir())
+    args = parser.parse_args(argv)
+    try:
+        indexed = RouteIndex(args.routes_dir).sync()
+    except (OSError, sqlite3.Error):
+        print(json.dumps({"ok": False, "error": "route_index_unavailable"}))
+        return 1
+    except RouteIndexError as exc:
+        print(json.dumps({"ok": False, "error": exc.code}))
+        return 1
+    print(json.dumps({"ok": True, "indexed": indexed}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
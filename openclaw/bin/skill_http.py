@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Shared keep-alive HTTP client for the skill API scripts.
+
+The Eight Sleep, Petlibro, and Fi scripts used to open a fresh TLS
+connection with ``urllib.request.urlopen`` for every call.  ``HTTPClient.open``
+keeps the contract those scripts already handle -- it takes a
+``urllib.request.Request``, returns a readable response, and raises
+``urllib.error.HTTPError`` for HTTP errors and ``urllib.error.URLError`` for
+network failures -- while:
+
+* reusing idle connections per scheme/host/port, and discarding connections
+  idle longer than ``IDLE_SECONDS`` so a server-closed socket is rarely used;
+* capping concurrent requests per host;
+* retrying an idempotent request once when a reused connection turns out to
+  have been closed by the server (a POST is never resent);
+* optionally caching GET responses for a short TTL per call, revalidating an
+  expired entry with ``If-None-Match``/``If-Modified-Since``; any other
+  method sent to a host drops that host's cached responses;
+* recording per-call latency, written to stderr as JSON lines when
+  ``OPENCLAW_HTTP_METRICS=1``.
+
+``gather`` runs independent calls concurrently.  Redirects are not followed
+and proxy environment variables are ignored; none of the skill APIs use them.
+"""
+
+from __future__ import annotations
+
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import io
+import json
+import os
+import ssl
+import sys
+import threading
+import time
+from typing import Any, Callable
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+IDLE_SECONDS = 20.0
+MAX_PER_HOST = 4
+MAX_METRICS = 256
+METRICS_ENV = "OPENCLAW_HTTP_METRICS"
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Raised when a pooled connection was closed by the server while idle.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+DEFAULT_USER_AGENT = "Python-urllib/%d.%d" % sys.version_info[:2]
+
+
+class Response:
+    """Fully read response with the parts of ``urlopen``'s result skills use."""
+
+    def __init__(self, url: str, status: int, reason: str, headers, body: bytes) -> None:
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def getcode(self) -> int:
+        return self.status
+
+    def __enter__(self) -> "Response":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        return None
+
+
+class _HostPool:
+    def __init__(self, limit: int) -> None:
+        self.slots = threading.BoundedSemaphore(limit)
+        self.lock = threading.Lock()
+        self.idle: list[tuple[http.client.HTTPConnection, float]] = []
+
+
+class HTTPClient:
+    """Pooled, per-host limited HTTP client with an optional GET cache."""
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int = MAX_PER_HOST,
+        idle_seconds: float = IDLE_SECONDS,
+    ) -> None:
+        self.max_per_host = max_per_host
+        self.idle_seconds = idle_seconds
+        self.metrics: collections.deque[dict[str, Any]] = collections.deque(maxlen=MAX_METRICS)
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+        self._cache: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    # -- public API -------------------------------------------------------
+
+    def open(
+        self,
+        request: urllib.request.Request,
+        timeout: float = 15,
+        *,
+        cache_ttl: float = 0,
+    ) -> Response:
+        """Send ``request`` like ``urllib.request.urlopen`` would."""
+        method = request.get_method()
+        parts = urllib.parse.urlsplit(request.full_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {parts.scheme}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = dict(request.header_items())
+        headers.setdefault("User-agent", DEFAULT_USER_AGENT)
+        if request.data is not None:
+            headers.setdefault("Content-type", "application/x-www-form-urlencoded")
+
+        started = time.monotonic()
+        cache_key = None
+        cached = None
+        if method == "GET" and cache_ttl > 0:
+            cache_key = (key, target, tuple(sorted(headers.items())))
+            with self._lock:
+                cached = self._cache.get(cache_key)
+            if cached is not None and started - cached["stored"] < cache_ttl:
+                self._record(method, parts, 200, started, cached=True, reused=False)
+                return self._cached_response(request.full_url, cached)
+            if cached is not None:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+        elif method not in ("GET", "HEAD"):
+            self._invalidate(key)
+
+        status, reason, message, body, reused = self._send(
+            key, method, target, request.data, headers, timeout
+        )
+        if status == 304 and cached is not None:
+            cached["stored"] = time.monotonic()
+            self._record(method, parts, status, started, cached=True, reused=reused)
+            return self._cached_response(request.full_url, cached)
+        self._record(method, parts, status, started, cached=False, reused=reused)
+        if status >= 300:
+            raise urllib.error.HTTPError(
+                request.full_url, status, reason, message, io.BytesIO(body)
+            )
+        if cache_key is not None:
+            with self._lock:
+                self._cache[cache_key] = {
+                    "stored": time.monotonic(),
+                    "status": status,
+                    "reason": reason,
+                    "headers": message,
+                    "body": body,
+                    "etag": message.get("ETag"),
+                    "last_modified": message.get("Last-Modified"),
+                }
+        return Response(request.full_url, status, reason, message, body)
+
+    def gather(self, *calls: Callable[[], Any]) -> list[Any]:
+        """Run independent zero-argument calls concurrently, in order.
+
+        The first failing call's exception is re-raised after all finish.
+        """
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            with pool.lock:
+                idle, pool.idle = pool.idle, []
+            for connection, _used in idle:
+                connection.close()
+
+    # -- connections ------------------------------------------------------
+
+    def _pool(self, key: tuple[str, str, int]) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(self.max_per_host)
+            return pool
+
+    def _checkout(
+        self, pool: _HostPool, key: tuple[str, str, int], timeout: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with pool.lock:
+            while pool.idle:
+                connection, used = pool.idle.pop()
+                if now - used <= self.idle_seconds and connection.sock is not None:
+                    connection.timeout = timeout
+                    connection.sock.settimeout(timeout)
+                    return connection, True
+                connection.close()
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return (
+                http.client.HTTPSConnection(
+                    host, port, timeout=timeout, context=self._ssl_context
+                ),
+                False,
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _send(self, key, method, target, body, headers, timeout):
+        pool = self._pool(key)
+        with pool.slots:
+            while True:
+                connection, reused = self._checkout(pool, key, timeout)
+                try:
+                    connection.request(method, target, body=body, headers=headers)
+                    response = connection.getresponse()
+                    data = response.read()
+                except STALE_CONNECTION_ERRORS as exc:
+                    connection.close()
+                    if reused and method in IDEMPOTENT_METHODS:
+                        continue
+                    raise urllib.error.URLError(exc) from exc
+                except (OSError, http.client.HTTPException) as exc:
+                    connection.close()
+                    raise urllib.error.URLError(exc) from exc
+                if response.will_close:
+                    connection.close()
+                else:
+                    with pool.lock:
+                        pool.idle.append((connection, time.monotonic()))
+                return response.status, response.reason, response.msg, data, reused
+
+    # -- cache and metrics ------------------------------------------------
+
+    def _cached_response(self, url: str, entry: dict[str, Any]) -> Response:
+        return Response(url, entry["status"], entry["reason"], entry["headers"], entry["body"])
+
+    def _invalidate(self, key: tuple[str, str, int]) -> None:
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._cache if cache_key[0] == key]:
+                del self._cache[cache_key]
+
+    def _record(self, method, parts, status, started, *, cached, reused) -> None:
+        metric = {
+            "method": method,
+            "host": parts.hostname,
+            "path": parts.path,
+            "status": status,
+            "ms": round((time.monotonic() - started) * 1000, 1),
+            "cached": cached,
+            "reused": reused,
+        }
+        self.metrics.append(metric)
+        if os.environ.get(METRICS_ENV) == "1":
+            sys.stderr.write(json.dumps({"http": metric}) + "\n")
@@ -23,10 +23,15 @@ from socketserver import ThreadingMixIn
 from urllib.parse import urlparse, parse_qs
 from urllib.request import urlopen
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import history_index  # noqa: E402
+import usage_rollups  # noqa: E402
+
 HISTORY_DIR = os.path.expanduser("~/.openclaw/usage-history")
 PORT = 8551
 MAX_HOURS = 8760  # 1 year
 DOWNSAMPLE_THRESHOLD_HOURS = 168  # 7 days — beyond this, keep ~1 per hour
+ACTIVITY_FIELDS = usage_rollups.ACTIVITY_FIELDS
 
 
 def load_snapshots(hours):
@@ -34,85 +39,39 @@ def load_snapshots(hours):
     hours = min(max(1, hours), MAX_HOURS)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=hours)
-    records = []
 
     num_days = hours // 24 + 2
-    for i in range(num_days):
-        day = (now - timedelta(days=i)).strftime("%Y-%m-%d")
-        path = os.path.join(HISTORY_DIR, f"{day}.jsonl")
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    ts_str = rec.get("timestamp", "")
-                    try:
-                        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        continue
-                    if ts >= cutoff:
-                        records.append(rec)
-        except OSError:
-            continue
-
-    records.sort(key=lambda r: r.get("timestamp", ""))
+    days = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)]
+    index = history_index.for_directory(
+        HISTORY_DIR,
+        hourly_sums={"activity": ACTIVITY_FIELDS},
+        hourly_lists=("cron_jobs",),
+    )
 
-    if hours > DOWNSAMPLE_THRESHOLD_HOURS and len(records) > 1:
-        records = _downsample_hourly(records)
+    # Long ranges come from the hourly/daily rollup store, one record per
+    # bucket.  If it is unavailable, fall back to one snapshot per hour with
+    # activity/cron deltas of the dropped snapshots merged in.
+    if hours > DOWNSAMPLE_THRESHOLD_HOURS:
+        rollups = load_rollups(hours, cutoff)
+        if rollups is not None:
+            return rollups, hours
+        return index.hourly_records(days, since=cutoff.timestamp()), hours
 
+    records = index.records(days, since=cutoff.timestamp())
+    records.sort(key=lambda r: r.get("timestamp", ""))
     return records, hours
 
 
-def _downsample_hourly(records):
-    """Keep one snapshot per hour, merging activity/cron deltas so counts aren't lost."""
-    buckets = {}
-    extras = {}  # key -> list of activity dicts + cron_jobs from dropped snapshots
-    for rec in records:
-        ts_str = rec.get("timestamp", "")
-        try:
-            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            continue
-        key = ts.strftime("%Y-%m-%d-%H")
-        if key not in buckets:
-            buckets[key] = rec
-            extras[key] = []
-        elif ts.minute < _ts_minute(buckets[key]):
-            # New winner — demote old winner to extras
-            extras[key].append(buckets[key])
-            buckets[key] = rec
-        else:
-            extras[key].append(rec)
-
-    # Merge activity deltas and cron_jobs from dropped snapshots into the kept one
-    for key, kept in buckets.items():
-        for dropped in extras.get(key, []):
-            da = dropped.get("activity", {})
-            if da:
-                ka = kept.setdefault("activity", {})
-                for field in ("agent_runs", "messages_sent", "messages_received",
-                              "cron_runs", "errors", "gateway_restarts"):
-                    ka[field] = ka.get(field, 0) + da.get(field, 0)
-            dc = dropped.get("cron_jobs", [])
-            if dc:
-                kept.setdefault("cron_jobs", []).extend(dc)
-
-    return [buckets[k] for k in sorted(buckets.keys())]
-
-
-def _ts_minute(rec):
-    ts_str = rec.get("timestamp", "")
+def load_rollups(hours, cutoff):
+    """Return rollup buckets covering ``cutoff`` onward, or None if unavailable."""
+    store = usage_rollups.RollupStore(HISTORY_DIR)
     try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).minute
-    except (ValueError, AttributeError):
-        return 60
+        store.sync()
+        return store.query(
+            since=cutoff.timestamp(), grain=usage_rollups.choose_grain(hours)
+        )
+    except (OSError, sqlite3.Error, usage_rollups.RollupError):
+        return None
 
 
 def load_ccusage():
@@ -978,11 +937,14 @@ class DashboardHandler(BaseHTTPRequestHandler):
     def _serve_data(self, hours):
         records, clamped_hours = load_snapshots(hours)
         ccusage = load_ccusage()
+        downsampled = clamped_hours > DOWNSAMPLE_THRESHOLD_HOURS
+        rollup = records[0].get("rollup") if records else None
         self._respond(200, {
             "meta": {
                 "hours": clamped_hours,
                 "count": len(records),
-                "downsampled": clamped_hours > DOWNSAMPLE_THRESHOLD_HOURS,
+                "downsampled": downsampled,
+                "grain": rollup["grain"] if rollup else ("hour" if downsampled else None),
             },
             "snapshots": records,
             "ccusage": ccusage,
@@ -1197,7 +1159,7 @@ body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',system-ui,sans-seri
 
 <!-- Cron job table -->
 <div class="cron-section">
-  <h2>Recent Cron Runs</h2>
+  <h2 id="cronTitle">Recent Cron Runs</h2>
   <table class="cron-table" id="cronTable">
     <thead><tr><th>Job</th><th>Status</th><th>Delivered</th><th>Model</th><th>Duration</th><th>Trend</th><th>Tokens</th><th>Time</th></tr></thead>
     <tbody id="cronBody"><tr><td colspan="8" class="loading">Loading...</td></tr></tbody>
@@ -1569,7 +1531,7 @@ function renderStats(agg, gwData) {
   let h = '';
   if (cost != null && cost > 0) h += `<div class="stat"><div class="stat-label">Total Cost</div><div class="stat-value">$${cost.toFixed(2)}</div><div class="stat-sub">${gw && gw.hasBreakdown ? fmtTokens(gw.cacheRead) + ' cache hits' : 'All OpenClaw sessions'}</div></div>`;
   if (totalTok > 0) h += `<div class="stat"><div class="stat-label">Total Tokens</div><div class="stat-value">${fmtTokens(totalTok)}</div><div class="stat-sub">${gw ? (gw.hasBreakdown ? 'In: ' + fmtTokens(inTok) + ' / Out: ' + fmtTokens(outTok) : 'All OpenClaw sessions') : 'Cron runs'}</div></div>`;
-  if (a.cron_runs > 0) h += `<div class="stat"><div class="stat-label">Cron Runs</div><div class="stat-value">${a.cron_runs}</div><div class="stat-sub">${agg.cronJobs.filter(j=>j.status==='error').length} failed</div></div>`;
+  if (a.cron_runs > 0) h += `<div class="stat"><div class="stat-label">Cron Runs</div><div class="stat-value">${a.cron_runs}</div><div class="stat-sub">${agg.cronJobs.reduce((n,j)=>n+(j.errors != null ? j.errors : (j.status==='error'?1:0)),0)} failed</div></div>`;
   if (a.messages_sent + a.messages_received > 0) h += `<div class="stat"><div class="stat-label">Messages</div><div class="stat-value">${a.messages_sent + a.messages_received}</div><div class="stat-sub">Sent: ${a.messages_sent} / Recv: ${a.messages_received}</div></div>`;
   if (sessions > 0) h += `<div class="stat"><div class="stat-label">Sessions</div><div class="stat-value">${sessions}</div><div class="stat-sub">${totalToolCalls} tool calls</div></div>`;
   if (errCount > 0) h += `<div class="stat"><div class="stat-label">Errors</div><div class="stat-value" style="color:${C.red}">${errCount}</div></div>`;
@@ -1578,23 +1540,39 @@ function renderStats(agg, gwData) {
   el.innerHTML = h;
 }
 
+function runDurations(j) {
+  // A snapshot entry is one run; a rollup entry (with runs) sums its runs.
+  if (j.runs == null) return j.duration_ms > 2000 ? { sum: j.duration_ms, n: 1 } : { sum: 0, n: 0 };
+  const n = j.duration_runs || 0;
+  return n > 0 && j.duration_ms_sum / n > 2000 ? { sum: j.duration_ms_sum, n } : { sum: 0, n: 0 };
+}
+
 function durationTrend(job, allJobs) {
-  // Compare this run's duration to the average of previous runs of the same job
-  const id = job.job_id;
-  const dur = job.duration_ms;
-  if (!dur || dur < 2000) return { text: '-', color: C.muted };
-  const prev = allJobs.filter(j => j.job_id === id && j.duration_ms > 2000 && j !== job);
-  if (prev.length < 1) return { text: '-', color: C.muted };
-  const avg = prev.reduce((s, j) => s + j.duration_ms, 0) / prev.length;
+  // Compare this entry's mean run duration to the mean of the job's other runs
+  const own = runDurations(job);
+  if (own.n < 1) return { text: '-', color: C.muted };
+  let sum = 0, n = 0;
+  for (const j of allJobs) {
+    if (j.job_id !== job.job_id || j === job) continue;
+    const d = runDurations(j);
+    sum += d.sum;
+    n += d.n;
+  }
+  if (n < 1) return { text: '-', color: C.muted };
+  const avg = sum / n;
   if (avg === 0) return { text: '-', color: C.muted };
-  const pct = Math.round(((dur - avg) / avg) * 100);
+  const pct = Math.round(((own.sum / own.n - avg) / avg) * 100);
   if (Math.abs(pct) < 5) return { text: '~', color: C.muted };
   if (pct > 0) return { text: '+' + pct + '%', color: pct > 30 ? C.red : C.amber };
   return { text: pct + '%', color: C.green };
 }
 
-function renderCronTable(jobs) {
+function renderCronTable(jobs, grain) {
   const el = document.getElementById('cronBody');
+  // Rollup ranges carry one summary per job and bucket, not individual runs.
+  const summaries = jobs.some(j => j.runs != null);
+  document.getElementById('cronTitle').textContent =
+    summaries ? 'Cron Jobs by ' + (grain === 'day' ? 'Day' : 'Hour') : 'Recent Cron Runs';
   if (!jobs.length) { el.innerHTML = '<tr><td colspan="8" style="color:' + C.muted + ';text-align:center;padding:1rem">No cron runs in period</td></tr>'; return; }
   // Most recent first
   const sorted = [...jobs].reverse().slice(0, 10);
@@ -1602,15 +1580,26 @@ function renderCronTable(jobs) {
     const delIcon = j.delivered === true ? '✓' : j.delivered === false ? '✗' : '-';
     const delColor = j.delivered === true ? C.green : j.delivered === false ? C.red : C.muted;
     const trend = durationTrend(j, jobs);
+    let status, duration, time;
+    if (j.runs != null) {
+      const errors = j.errors || 0;
+      status = `<span class="badge ${errors ? 'badge-err' : 'badge-ok'}">${j.runs} run${j.runs === 1 ? '' : 's'}${errors ? ', ' + errors + ' failed' : ''}</span>`;
+      duration = j.duration_runs ? fmtDuration(Math.round(j.duration_ms_sum / j.duration_runs)) + ' avg' : '-';
+      time = j.run_at ? 'last ' + fmtTime(j.run_at) : '-';
+    } else {
+      status = `<span class="badge ${j.status === 'ok' ? 'badge-ok' : 'badge-err'}">${j.status}</span>`;
+      duration = fmtDuration(j.duration_ms);
+      time = j.run_at ? fmtTime(j.run_at) : '-';
+    }
     return `<tr>
     <td style="font-weight:500">${shortJobId(j.job_id)}</td>
-    <td><span class="badge ${j.status === 'ok' ? 'badge-ok' : 'badge-err'}">${j.status}</span></td>
+    <td>${status}</td>
     <td style="color:${delColor};text-align:center">${delIcon}</td>
     <td style="color:${C.muted}">${j.model || '-'}</td>
-    <td>${fmtDuration(j.duration_ms)}</td>
+    <td>${duration}</td>
     <td style="color:${trend.color};text-align:center;font-weight:500">${trend.text}</td>
     <td>${fmtTokens(j.total_tokens)}</td>
-    <td style="color:${C.muted}">${j.run_at ? fmtTime(j.run_at) : '-'}</td>
+    <td style="color:${C.muted}">${time}</td>
   </tr>`;
   }).join('');
 }
@@ -2097,7 +2086,7 @@ async function refresh() {
   const agg = aggregate(snaps);
   renderGauges(agg.utilization, agg, ccusage, gwData);
   renderStats(agg, gwData);
-  renderCronTable(agg.cronJobs);
+  renderCronTable(agg.cronJobs, (data.meta || {}).grain);
   renderStaleness(agg.timestamp);
 
   if (typeof Chart !== 'undefined') {
@@ -415,5 +415,19 @@ for p in HISTORY_DIR.glob("*.jsonl"):
     except (ValueError, OSError):
         pass
 
+# Fold the new snapshot into the dashboard's hourly/daily rollups. The JSONL
+# line is already durable, so a rollup failure only delays the dashboard.
+sys.path.insert(0, str(Path.home() / ".openclaw" / "bin"))
+try:
+    import usage_rollups
+except ImportError as exc:
+    usage_rollups = None
+    print(f"Rollup sync skipped: {type(exc).__name__}", file=sys.stderr)
+if usage_rollups is not None:
+    try:
+        usage_rollups.RollupStore(HISTORY_DIR).sync()
+    except (OSError, sqlite3.Error, usage_rollups.RollupError) as exc:
+        print(f"Rollup sync skipped: {type(exc).__name__}", file=sys.stderr)
+
 print(f"Snapshot written: {now_iso}", file=sys.stderr)
 PYTHON_SCRIPT
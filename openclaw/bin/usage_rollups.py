@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""Hourly and daily rollups of OpenClaw usage snapshots.
+
+``usage-snapshot.sh`` appends one snapshot every 15 minutes to
+``~/.openclaw/usage-history/YYYY-MM-DD.jsonl``.  Long dashboard ranges only
+need one point per hour or day, so this module folds those snapshots into a
+small SQLite table (``usage-history/rollups.sqlite3``) with one row per
+grain, UTC bucket, and source day file.  Every metric keeps its sum, min,
+max, and last value; each row also keeps the last ``utilization`` object and
+one summary per cron job instead of every run: run, error, and token sums, a
+per-run duration sum over the runs that reported one, and the last run's
+fields.
+
+The JSONL files stay the source of truth.  ``sync`` records how far into each
+day file it has folded (inode, size, mtime, offset), folds only appended
+complete lines, and re-folds a day whose file shrank or was replaced.  Rows
+outlive the snapshot script's 90-day JSONL pruning so year ranges keep their
+history, and are themselves pruned after ``ROLLUP_RETENTION_DAYS``.
+``usage-snapshot.sh`` syncs after every append; the dashboard syncs before a
+rollup query; ``usage_rollups.py compact`` backfills by hand.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import re
+import sqlite3
+import sys
+import time
+from typing import Any, Iterator, Mapping, Optional
+
+
+DATABASE_NAME = "rollups.sqlite3"
+SCHEMA_VERSION = 1
+GRAINS = {"hour": 3600, "day": 86400}
+ROLLUP_RETENTION_DAYS = 400
+BUSY_TIMEOUT_SECONDS = 5
+DAY_FILE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.jsonl$")
+ACTIVITY_FIELDS = ("agent_runs", "messages_sent", "messages_received",
+                   "cron_runs", "errors", "gateway_restarts")
+# name -> path into the snapshot object.
+METRICS = {
+    **{f"tokens.{field}": ("tokens", field) for field in ("input", "output", "total")},
+    **{f"activity.{field}": ("activity", field) for field in ACTIVITY_FIELDS},
+    "utilization.five_hour": ("utilization", "five_hour", "utilization"),
+    "utilization.seven_day": ("utilization", "seven_day", "utilization"),
+}
+CRON_LAST_FIELDS = ("status", "duration_ms", "model", "run_at", "delivered")
+# Summed per job; rows folded before a field existed count it as zero.
+CRON_SUM_FIELDS = ("runs", "errors", "total_tokens", "duration_ms_sum", "duration_runs")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollup_sources (
+    day TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    folded_offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollups (
+    grain TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    snapshots INTEGER NOT NULL,
+    first_ts REAL NOT NULL,
+    last_ts REAL NOT NULL,
+    metrics TEXT NOT NULL,
+    utilization TEXT,
+    cron_jobs TEXT NOT NULL,
+    PRIMARY KEY (grain, bucket, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rollups_source_idx ON rollups (source);
+"""
+
+
+class RollupError(Exception):
+    """Safe failure with a stable code."""
+
+    def __init__(self, code: str) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def default_history_dir(home: Optional[Path] = None) -> Path:
+    base = Path.home() if home is None else home
+    return base / ".openclaw" / "usage-history"
+
+
+def choose_grain(hours: int) -> str:
+    """Hourly buckets up to 31 days, daily beyond, so a response stays bounded."""
+    return "hour" if hours <= 31 * 24 else "day"
+
+
+def _metric_value(snapshot: Mapping[str, Any], path: tuple[str, ...]) -> Optional[float]:
+    value: Any = snapshot
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _snapshot_epoch(snapshot: Mapping[str, Any]) -> Optional[float]:
+    value = snapshot.get("timestamp")
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return parsed.timestamp()
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class _Bucket:
+    """One (grain, bucket, source) row while folding or merging."""
+
+    def __init__(self) -> None:
+        self.snapshots = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+        self.metrics: dict[str, list[float]] = {}
+        self.metric_ts: dict[str, float] = {}
+        self.utilization: Any = None
+        self.cron_jobs: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "_Bucket":
+        bucket = cls()
+        bucket.snapshots = row["snapshots"]
+        bucket.first_ts = row["first_ts"]
+        bucket.last_ts = row["last_ts"]
+        stored = json.loads(row["metrics"])
+        bucket.metrics = {name: values[:4] for name, values in stored.items()}
+        bucket.metric_ts = {name: values[4] for name, values in stored.items()}
+        bucket.utilization = (
+            None if row["utilization"] is None else json.loads(row["utilization"])
+        )
+        bucket.cron_jobs = {job["job_id"]: job for job in json.loads(row["cron_jobs"])}
+        return bucket
+
+    def row_values(self) -> tuple[Any, ...]:
+        metrics = {
+            name: [*values, self.metric_ts[name]] for name, values in self.metrics.items()
+        }
+        return (
+            self.snapshots,
+            self.first_ts,
+            self.last_ts,
+            json.dumps(metrics, separators=(",", ":"), sort_keys=True),
+            None if self.utilization is None else json.dumps(self.utilization, separators=(",", ":")),
+            json.dumps(list(self.cron_jobs.values()), separators=(",", ":")),
+        )
+
+    def fold(self, snapshot: Mapping[str, Any], epoch: float) -> None:
+        self.snapshots += 1
+        self.first_ts = epoch if self.first_ts is None else min(self.first_ts, epoch)
+        newest = self.last_ts is None or epoch >= self.last_ts
+        self.last_ts = epoch if newest else self.last_ts
+        for name, path in METRICS.items():
+            value = _metric_value(snapshot, path)
+            if value is not None:
+                self._fold_metric(name, [value, value, value, value], epoch)
+        if newest and isinstance(snapshot.get("utilization"), dict):
+            self.utilization = snapshot["utilization"]
+        jobs = snapshot.get("cron_jobs")
+        for job in jobs if isinstance(jobs, list) else ():
+            if isinstance(job, dict) and isinstance(job.get("job_id"), str):
+                self._fold_job(self._job_summary(job))
+
+    def merge(self, other: "_Bucket") -> None:
+        self.snapshots += other.snapshots
+        self.first_ts = other.first_ts if self.first_ts is None else min(self.first_ts, other.first_ts)
+        if self.last_ts is None or other.last_ts >= self.last_ts:
+            self.last_ts = other.last_ts
+            if other.utilization is not None:
+                self.utilization = other.utilization
+        for name, values in other.metrics.items():
+            self._fold_metric(name, values, other.metric_ts[name])
+        for job in other.cron_jobs.values():
+            self._fold_job(dict(job))
+
+    def _fold_metric(self, name: str, values: list[float], epoch: float) -> None:
+        current = self.metrics.get(name)
+        if current is None:
+            self.metrics[name] = list(values)
+            self.metric_ts[name] = epoch
+            return
+        current[0] += values[0]
+        current[1] = min(current[1], values[1])
+        current[2] = max(current[2], values[2])
+        if epoch >= self.metric_ts[name]:
+            current[3] = values[3]
+            self.metric_ts[name] = epoch
+
+    @staticmethod
+    def _job_summary(job: Mapping[str, Any]) -> dict[str, Any]:
+        tokens = job.get("total_tokens", 0)
+        duration = job.get("duration_ms")
+        timed = isinstance(duration, (int, float)) and not isinstance(duration, bool)
+        summary = {
+            "job_id": job["job_id"],
+            "runs": 1,
+            "errors": 1 if job.get("status") == "error" else 0,
+            "total_tokens": tokens if isinstance(tokens, (int, float)) else 0,
+            "duration_ms_sum": duration if timed else 0,
+            "duration_runs": 1 if timed else 0,
+        }
+        for field in CRON_LAST_FIELDS:
+            summary[field] = job.get(field)
+        return summary
+
+    def _fold_job(self, summary: dict[str, Any]) -> None:
+        current = self.cron_jobs.get(summary["job_id"])
+        if current is None:
+            self.cron_jobs[summary["job_id"]] = summary
+            return
+        for field in CRON_SUM_FIELDS:
+            current[field] = current.get(field, 0) + summary.get(field, 0)
+        if (summary.get("run_at") or 0) >= (current.get("run_at") or 0):
+            for field in CRON_LAST_FIELDS:
+                current[field] = summary[field]
+
+    def as_snapshot(self, grain: str, bucket: int) -> dict[str, Any]:
+        """Return a snapshot-shaped record the dashboard UI already renders."""
+        sums = {name: values[0] for name, values in self.metrics.items()}
+        return {
+            "timestamp": _iso(bucket),
+            "tokens": {
+                field: sums.get(f"tokens.{field}", 0) for field in ("input", "output", "total")
+            },
+            "activity": {field: sums.get(f"activity.{field}", 0) for field in ACTIVITY_FIELDS},
+            "utilization": self.utilization,
+            "cron_jobs": sorted(
+                self.cron_jobs.values(), key=lambda job: job.get("run_at") or 0
+            ),
+            "rollup": {
+                "grain": grain,
+                "snapshots": self.snapshots,
+                "first": _iso(self.first_ts),
+                "last": _iso(self.last_ts),
+                "metrics": {
+                    name: dict(zip(("sum", "min", "max", "last"), values))
+                    for name, values in sorted(self.metrics.items())
+                },
+            },
+        }
+
+
+class RollupStore:
+    """SQLite rollups folded incrementally from one usage-history directory."""
+
+    def __init__(self, history_dir: str | os.PathLike[str], *, clock=time.time) -> None:
+        self.history_dir = Path(history_dir)
+        self.database = self.history_dir / DATABASE_NAME
+        self.clock = clock
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(
+            self.database, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        try:
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            row = connection.execute(
+                "SELECT value FROM rollup_meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                connection.execute(
+                    "INSERT OR IGNORE INTO rollup_meta (key, value) VALUES ('schema_version', ?)",
+                    (SCHEMA_VERSION,),
+                )
+            elif row[0] != SCHEMA_VERSION:
+                raise RollupError("rollup_schema_unsupported")
+            yield connection
+        finally:
+            connection.close()
+
+    def sync(self) -> int:
+        """Fold every new complete snapshot line; return how many were folded."""
+        folded = 0
+        try:
+            names = sorted(name for name in os.listdir(self.history_dir) if DAY_FILE_RE.match(name))
+        except OSError:
+            return 0
+        with self.connect() as connection:
+            for name in names:
+                folded += self._sync_day(connection, name[:-len(".jsonl")])
+            cutoff = self.clock() - ROLLUP_RETENTION_DAYS * 86400
+            connection.execute("DELETE FROM rollups WHERE last_ts < ?", (cutoff,))
+        return folded
+
+    def _sync_day(self, connection: sqlite3.Connection, day: str) -> int:
+        try:
+            handle = open(self.history_dir / f"{day}.jsonl", "rb")
+        except OSError:
+            return 0
+        with handle:
+            status = os.fstat(handle.fileno())
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                folded = self._fold_day(connection, day, handle, status)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return folded
+
+    def _fold_day(self, connection, day: str, handle, status: os.stat_result) -> int:
+        source = connection.execute(
+            "SELECT * FROM rollup_sources WHERE day = ?", (day,)
+        ).fetchone()
+        if source is not None and (
+            source["inode"] == status.st_ino
+            and source["size"] == status.st_size
+            and source["mtime_ns"] == status.st_mtime_ns
+        ):
+            return 0
+        start = 0
+        if (
+            source is not None
+            and source["inode"] == status.st_ino
+            and source["size"] < status.st_size
+        ):
+            start = source["folded_offset"]
+        else:
+            connection.execute("DELETE FROM rollups WHERE source = ?", (day,))
+        handle.seek(start)
+        data = handle.read(max(0, status.st_size - start))
+        complete = data.rfind(b"\n") + 1
+        buckets: dict[tuple[str, int], _Bucket] = {}
+        folded = 0
+        for raw in data[:complete].splitlines():
+            try:
+                snapshot = json.loads(raw)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if not isinstance(snapshot, dict):
+                continue
+            epoch = _snapshot_epoch(snapshot)
+            if epoch is None:
+                continue
+            for grain, width in GRAINS.items():
+                key = (grain, int(epoch // width * width))
+                if key not in buckets:
+                    buckets[key] = self._load_bucket(connection, key, day)
+                buckets[key].fold(snapshot, epoch)
+            folded += 1
+        for (grain, bucket), state in buckets.items():
+            connection.execute(
+                """
+                INSERT OR REPLACE INTO rollups
+                    (grain, bucket, source, snapshots, first_ts, last_ts,
+                     metrics, utilization, cron_jobs)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (grain, bucket, day, *state.row_values()),
+            )
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO rollup_sources
+                (day, inode, size, mtime_ns, folded_offset)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (day, status.st_ino, status.st_size, status.st_mtime_ns, start + complete),
+        )
+        return folded
+
+    @staticmethod
+    def _load_bucket(connection, key: tuple[str, int], day: str) -> _Bucket:
+        row = connection.execute(
+            "SELECT * FROM rollups WHERE grain = ? AND bucket = ? AND source = ?",
+            (*key, day),
+        ).fetchone()
+        return _Bucket() if row is None else _Bucket.from_row(row)
+
+    def query(self, *, since: float, grain: str) -> list[dict[str, Any]]:
+        """Return one snapshot-shaped record per bucket overlapping ``since``."""
+        if grain not in GRAINS:
+            raise RollupError("rollup_grain_invalid")
+        width = GRAINS[grain]
+        first_bucket = int(since // width * width)
+        merged: dict[int, _Bucket] = {}
+        with self.connect() as connection:
+            for row in connection.execute(
+                """
+                SELECT * FROM rollups
+                WHERE grain = ? AND bucket >= ?
+                ORDER BY bucket, source
+                """,
+                (grain, first_bucket),
+            ):
+                bucket = merged.setdefault(row["bucket"], _Bucket())
+                bucket.merge(_Bucket.from_row(row))
+        return [merged[bucket].as_snapshot(grain, bucket) for bucket in sorted(merged)]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    compact = subcommands.add_parser("compact", help="fold new usage snapshots")
+    compact.add_argument("--history-dir", type=Path, default=default_history_dir())
+    args = parser.parse_args(argv)
+    try:
+        folded = RollupStore(args.history_dir).sync()
+    except (OSError, sqlite3.Error):
+        print(json.dumps({"ok": False, "error": "rollup_unavailable"}))
+        return 1
+    except RollupError as exc:
+        print(json.dumps({"ok": False, "error": exc.code}))
+        return 1
+    print(json.dumps({"ok": True, "folded": folded}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
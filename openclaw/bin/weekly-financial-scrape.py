@@ -8,6 +8,7 @@ whole-run identifier are emitted.
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from datetime import datetime, timezone
 import fcntl
@@ -20,6 +21,7 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 from dataclasses import dataclass
@@ -52,6 +54,12 @@ PROVIDER_MODE_PATH = (
 )
 PINCHTAB_INSTANCE_HELPER = Path.home() / ".openclaw" / "bin" / "pinchtab-headless-instance"
 COMMAND_TIMEOUT_SECONDS = 420
+SOURCE_PARALLELISM_ENV = "FINANCE_SCRAPE_PARALLELISM"
+DEFAULT_SOURCE_PARALLELISM = 3
+MAX_SOURCE_PARALLELISM = 8
+# PennyMac and BoA both run scrape_mortgage.py, and BoA owns the PinchTab
+# finance profile; keep them in one serialized lane.
+BOA_LANE = "mortgage"
 CONTRACT_PREFLIGHT_TIMEOUT_SECONDS = 30
 PROFILE_PREFLIGHT_TIMEOUT_SECONDS = 45
 BOA_TAB_OPERATION_TIMEOUT_SECONDS = 30
@@ -190,6 +198,9 @@ class TeslaEnvironment(dict):
 _ACTIVE_PROCESS = None
 _SPAWNING_PROCESS = False
 _DEFERRED_TERMINATION_SIGNAL = None
+_SCHEDULER = None
+# Guarded imports write the shared financial-dashboard data; never overlap them.
+_IMPORT_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -219,6 +230,7 @@ class Source:
     credential_profile: str | None = None
     reauth_args: tuple[str, ...] | None = None
     mortgage_source: str | None = None
+    lane: str | None = None
 
 
 FINANCE_CREDENTIAL_KEYS = {
@@ -275,6 +287,7 @@ SOURCES = (
         ("update_data.py", "import-json-electric-cabin"),
         "national_grid",
         ("scrape_national_grid_electric.py", "--re-auth", "--headless"),
+        lane="national_grid",
     ),
     Source(
         "national_grid_gas",
@@ -285,6 +298,7 @@ SOURCES = (
         ("update_data.py", "import-json-gas"),
         "national_grid",
         ("scrape_national_grid.py", "--re-auth", "--headless"),
+        lane="national_grid",
     ),
     Source(
         "bwsc",
@@ -306,6 +320,7 @@ SOURCES = (
         "pennymac",
         ("scrape_mortgage.py", "--lender", "pennymac", "--re-auth", "--headless"),
         "pennymac",
+        lane=BOA_LANE,
     ),
 )
 
@@ -657,10 +672,20 @@ def _run_captured(command, env, timeout, cwd=None):
     """Run a command with bounded private output and contain its lifecycle."""
     global _ACTIVE_PROCESS, _SPAWNING_PROCESS
 
+    # Lane worker threads register children with the scheduler; signals are
+    # only ever handled on the main thread.
+    scheduler = (
+        _SCHEDULER
+        if threading.current_thread() is not threading.main_thread()
+        else None
+    )
     process = None
     try:
         try:
-            _SPAWNING_PROCESS = True
+            if scheduler is not None:
+                scheduler.raise_if_terminating()
+            else:
+                _SPAWNING_PROCESS = True
             try:
                 process = subprocess.Popen(
                     command,
@@ -671,10 +696,16 @@ def _run_captured(command, env, timeout, cwd=None):
                     bufsize=0,
                     start_new_session=True,
                 )
-                _ACTIVE_PROCESS = process
+                if scheduler is not None:
+                    scheduler.register(process)
+                else:
+                    _ACTIVE_PROCESS = process
             finally:
-                _SPAWNING_PROCESS = False
-                _raise_deferred_termination()
+                if scheduler is not None:
+                    scheduler.raise_if_terminating()
+                else:
+                    _SPAWNING_PROCESS = False
+                    _raise_deferred_termination()
         except (OSError, ValueError):
             return CommandResult(127)
 
@@ -693,7 +724,9 @@ def _run_captured(command, env, timeout, cwd=None):
         # descendant remains alive. Always drain the entire private group,
         # including on normal completion and before decoding captured bytes.
         _stop_process_group(process)
-        if _ACTIVE_PROCESS is process:
+        if scheduler is not None:
+            scheduler.unregister(process)
+        elif _ACTIVE_PROCESS is process:
             _ACTIVE_PROCESS = None
     try:
         stdout = stdout_bytes.decode("utf-8", errors="strict")
@@ -710,6 +743,8 @@ def _termination_handler(signum, _frame):
     """Stop a tracked child or defer unwinding until spawn registration finishes."""
     global _DEFERRED_TERMINATION_SIGNAL
 
+    if _SCHEDULER is not None:
+        _SCHEDULER.terminate(signum)
     _signal_process_group(_ACTIVE_PROCESS, signal.SIGTERM)
     if _SPAWNING_PROCESS:
         if _DEFERRED_TERMINATION_SIGNAL is None:
@@ -1492,7 +1527,8 @@ def run_standard_source(
         and not scrape.output_rejected
         and path is not None
     ):
-        imported = run_command(guarded_import_args(source, run_id), runtime_env)
+        with _IMPORT_LOCK:
+            imported = run_command(guarded_import_args(source, run_id), runtime_env)
         result["import"] = command_status(imported)
     return result
 
@@ -1661,13 +1697,14 @@ def run_boa(
         and not scrape.output_rejected
         and path is not None
     ):
-        imported = run_command(
-            (
-                "update_data.py", "import-json-boa-mortgage",
-                "--require-run-id", run_id,
-            ),
-            runtime_env,
-        )
+        with _IMPORT_LOCK:
+            imported = run_command(
+                (
+                    "update_data.py", "import-json-boa-mortgage",
+                    "--require-run-id", run_id,
+                ),
+                runtime_env,
+            )
         result["import"] = command_status(imported)
     return result
 
@@ -2233,6 +2270,105 @@ def finish_run(
     return True
 
 
+def source_parallelism(environ=None):
+    """Return the bounded lane parallelism; invalid overrides use the default."""
+    raw = (os.environ if environ is None else environ).get(SOURCE_PARALLELISM_ENV)
+    if raw is None:
+        return DEFAULT_SOURCE_PARALLELISM
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_SOURCE_PARALLELISM
+    return min(max(value, 1), MAX_SOURCE_PARALLELISM)
+
+
+class SourceScheduler:
+    """Run source lanes concurrently while each lane stays serialized.
+
+    A lane groups sources that share a browser profile, PinchTab instance,
+    or scraper entrypoint. With parallelism 1 every source runs in order on
+    the main thread, exactly as before lanes existed. Otherwise each lane
+    runs on a worker thread; a signal or failure stops every lane's current
+    child and keeps the rest from starting another.
+    """
+
+    def __init__(self, parallelism):
+        self.parallelism = parallelism
+        self.signum = None
+        self._processes = set()
+        self._lock = threading.Lock()
+        self._output_lock = threading.Lock()
+
+    def terminate(self, signum):
+        """Stop every lane child; called from the main-thread signal handler."""
+        if self.signum is None:
+            self.signum = signum
+        for process in tuple(self._processes):
+            _signal_process_group(process, signal.SIGTERM)
+
+    def raise_if_terminating(self):
+        if self.signum is not None:
+            raise WrapperInterrupted(self.signum)
+
+    def register(self, process):
+        with self._lock:
+            self._processes.add(process)
+
+    def unregister(self, process):
+        with self._lock:
+            self._processes.discard(process)
+
+    def run(self, jobs):
+        """Run ``(lane, job)`` pairs; return results in job order."""
+        global _SCHEDULER
+
+        results = [None] * len(jobs)
+        lanes = {}
+        for index, (lane, job) in enumerate(jobs):
+            lanes.setdefault(lane, []).append((index, job))
+        if self.parallelism <= 1 or len(lanes) <= 1:
+            for index, (_lane, job) in enumerate(jobs):
+                results[index] = self._timed(job)
+            return results
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.parallelism, len(lanes)),
+            thread_name_prefix="finance-lane",
+        )
+        _SCHEDULER = self
+        try:
+            futures = [
+                executor.submit(self._run_lane, lane_jobs, results)
+                for lane_jobs in lanes.values()
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.result()
+        except BaseException:
+            self.terminate(signal.SIGTERM)
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            _SCHEDULER = None
+        return results
+
+    def _run_lane(self, lane_jobs, results):
+        for index, job in lane_jobs:
+            self.raise_if_terminating()
+            results[index] = self._timed(job)
+
+    def _timed(self, job):
+        started = time.monotonic()
+        result = dict(job())
+        result["duration_seconds"] = round(time.monotonic() - started, 1)
+        with self._output_lock:
+            print(
+                json.dumps({"event": "source_complete", **result}, sort_keys=True),
+                flush=True,
+            )
+        return result
+
+
 def _execute_run(run_id):
     if not REPO.is_dir() or not PYTHON.is_file():
         finish_run(
@@ -2285,28 +2421,33 @@ def _execute_run(run_id):
         boa_profile_preflight = BoaProfileResult("not_needed")
     else:
         boa_profile_preflight = ensure_boa_profile(env)
-    results = []
-    for source in SOURCES:
-        source_env = tesla_env if source.name == "tesla_solar" else env
-        result = run_standard_source(
-            source,
+    jobs = [
+        (
+            source.lane or source.name,
+            lambda source=source: run_standard_source(
+                source,
+                run_id,
+                tesla_env if source.name == "tesla_solar" else env,
+                credential_store,
+                provider_modes,
+            ),
+        )
+        for source in SOURCES
+    ]
+
+    def boa_job():
+        boa_result = run_boa(
             run_id,
-            source_env,
+            env,
             credential_store,
+            boa_profile_preflight.instance_id,
             provider_modes,
         )
-        results.append(result)
-        print(json.dumps({"event": "source_complete", **result}, sort_keys=True), flush=True)
-    boa_result = run_boa(
-        run_id,
-        env,
-        credential_store,
-        boa_profile_preflight.instance_id,
-        provider_modes,
-    )
-    boa_result["profile_preflight"] = boa_profile_preflight.status
-    results.append(boa_result)
-    print(json.dumps({"event": "source_complete", **boa_result}, sort_keys=True), flush=True)
+        boa_result["profile_preflight"] = boa_profile_preflight.status
+        return boa_result
+
+    jobs.append((BOA_LANE, boa_job))
+    results = SourceScheduler(source_parallelism()).run(jobs)
     if not all(result_ok(result) for result in results):
         status = "failed"
     elif any(path_is_degraded(result["source"], result.get("path")) for result in results):
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Measure home-events spool ingestion throughput per commit batch size.
+
+Every run builds a private temporary runtime, enqueues the same number of
+distinct August lock transitions, and drains them with ``ingest_once`` at one
+batch size.  Nothing touches the production root.
+
+Usage: python3 ingest_batch_bench.py [--events 500] [--batch-sizes 1,10,100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+
+MODULE_PATH = Path(__file__).resolve().parents[2] / "bin" / "home_event_bus.py"
+NOW = "2026-07-12T15:00:00Z"
+
+
+def load_bus():
+    spec = importlib.util.spec_from_file_location("home_event_bus", MODULE_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def august_event(index: int) -> bytes:
+    value = {
+        "source_event_id": "bench-transition-%06d" % index,
+        "event_type": "lock.unlocked",
+        "site": "crosstown",
+        "entity_kind": "lock",
+        "entity_alias": "front_door",
+        "occurred_at": NOW,
+        "observed_at": NOW,
+        "time_precision": "observed_interval",
+        "attributes": {
+            "previous": "locked",
+            "current": "unlocked",
+            "not_before": "2026-07-12T14:55:00Z",
+            "not_after": NOW,
+        },
+    }
+    return json.dumps(value).encode("utf-8")
+
+
+def measure(bus, events: int, batch_size: int) -> dict:
+    with tempfile.TemporaryDirectory() as temporary:
+        root = Path(temporary) / "home-events"
+        bus.initialize_runtime(root, clock=lambda: NOW)
+        for index in range(events):
+            bus.enqueue_event(root, "august", august_event(index), clock=lambda: NOW)
+        accepted = 0
+        started = time.perf_counter()
+        while accepted < events:
+            result = bus.ingest_once(
+                root,
+                limit=bus.MAX_INGEST_LIMIT,
+                batch_size=batch_size,
+                clock=lambda: NOW,
+            )
+            if result.scanned == 0:
+                raise RuntimeError("spool drained before every event was accepted")
+            accepted += result.accepted
+        elapsed = time.perf_counter() - started
+    return {
+        "batch_size": batch_size,
+        "events": events,
+        "seconds": round(elapsed, 4),
+        "events_per_second": round(events / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--batch-sizes", default="1,10,100")
+    args = parser.parse_args()
+    bus = load_bus()
+    sizes = [int(value) for value in args.batch_sizes.split(",") if value]
+    results = [measure(bus, args.events, size) for size in sizes]
+    print(json.dumps({"benchmark": "home_events_ingest", "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
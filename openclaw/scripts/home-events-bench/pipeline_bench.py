@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Drive a synthetic load through the whole home-events pipeline offline.
+
+A seeded generator produces contract-valid ring, presence, August, and Nest
+payloads on a simulated clock.  Each simulated round enqueues its events, then
+runs ``ingest_once``, ``ShadowCorrelator.run_once``, the camera worker, and
+the delivery worker against a private temporary root.  Camera capture/vision
+and the ``openclaw message send`` call are replaced by in-process stubs, so
+nothing leaves the machine and nothing touches the production root.
+
+The workload depends only on ``--events``, ``--per-round``, and ``--seed``, so
+two runs with the same arguments on different commits are directly
+comparable; pass ``--baseline`` with an earlier result file to print ratios.
+
+Usage: python3 pipeline_bench.py [--events 400] [--per-round 8] [--seed 1]
+                                 [--output result.json] [--baseline old.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+
+BIN_DIR = Path(__file__).resolve().parents[2] / "bin"
+START = dt.datetime(2026, 7, 12, 15, 0, tzinfo=dt.timezone.utc)
+ROUND_SECONDS = 20
+TARGET = "chat_id:171"
+POLICY = {
+    "schema_version": 3,
+    "active": True,
+    "sites": ["cabin", "crosstown"],
+    "incident_classes": ["person_activity", "access_activity", "person_and_access"],
+    "recipient_routes": ["dylan"],
+    "arrival_grace_seconds": 900,
+    "cooldown_seconds": 3600,
+    "reservation_ttl_seconds": 300,
+    "unresolved_access_escalation_seconds": 1800,
+    "camera_enabled": True,
+    "camera_bindings": {
+        "nest": {"cabin": "Kitchen", "crosstown": "Living Room Wired"},
+        "ring": {"cabin": ["driveway", "front_door"], "crosstown": ["front_door"]},
+    },
+    "camera_snapshot_offsets_seconds": [30, 60],
+    "camera_result_mode": "structured_text",
+}
+SOURCE_WEIGHTS = (("ring", 40), ("nest", 25), ("august", 25), ("presence", 10))
+STAGES = ("enqueue", "ingest", "correlate", "camera", "delivery")
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def timestamp(value: dt.datetime) -> str:
+    return value.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> str:
+        return timestamp(self.now)
+
+    def advance(self, seconds: int) -> None:
+        self.now += dt.timedelta(seconds=seconds)
+
+
+class PayloadGenerator:
+    """Seeded source mix whose stateful sources emit only valid transitions."""
+
+    def __init__(self, seed: int) -> None:
+        self.random = random.Random(seed)
+        self.sequence = 0
+        self.lock = "locked"
+        self.door = "closed"
+        self.occupancy = {"cabin": "confirmed_vacant", "crosstown": "confirmed_vacant"}
+
+    def next(self, now: dt.datetime) -> tuple[str, bytes]:
+        self.sequence += 1
+        population = [source for source, _weight in SOURCE_WEIGHTS]
+        weights = [weight for _source, weight in SOURCE_WEIGHTS]
+        source = self.random.choices(population, weights)[0]
+        occurred = now - dt.timedelta(seconds=self.random.randint(1, 15))
+        value = getattr(self, source)(occurred, now)
+        value.setdefault("source_event_id", "bench-%s-%06d" % (source, self.sequence))
+        value.setdefault("occurred_at", timestamp(occurred))
+        value["observed_at"] = timestamp(now)
+        return source, json.dumps(value).encode("utf-8")
+
+    def ring(self, _occurred: dt.datetime, _now: dt.datetime) -> dict:
+        site, alias = self.random.choice(
+            (("cabin", "driveway"), ("cabin", "front_door"), ("crosstown", "front_door"))
+        )
+        event_type, attributes = self.random.choice(
+            (
+                ("entry.person_detected", {"classification": "person"}),
+                ("entry.motion_detected", {"classification": "motion"}),
+                ("entry.doorbell_rang", {}),
+            )
+        )
+        return {
+            "event_type": event_type,
+            "site": site,
+            "entity_kind": "doorbell",
+            "entity_alias": alias,
+            "time_precision": "source",
+            "attributes": attributes,
+        }
+
+    def nest(self, _occurred: dt.datetime, _now: dt.datetime) -> dict:
+        site, alias = self.random.choice(
+            (("cabin", "kitchen"), ("crosstown", "living_room_wired"))
+        )
+        classification = self.random.choice(("person", "motion"))
+        return {
+            "event_type": "camera.%s_detected" % classification,
+            "site": site,
+            "entity_kind": "camera",
+            "entity_alias": alias,
+            "time_precision": "source",
+            "attributes": {"classification": classification},
+        }
+
+    def august(self, occurred: dt.datetime, now: dt.datetime) -> dict:
+        if self.random.random() < 0.5:
+            previous, self.lock = self.lock, "unlocked" if self.lock == "locked" else "locked"
+            kind, event_type, current = "lock", "lock." + self.lock, self.lock
+        else:
+            previous, self.door = self.door, "open" if self.door == "closed" else "closed"
+            event_type = "door.opened" if self.door == "open" else "door.closed"
+            kind, current = "door", self.door
+        return {
+            "event_type": event_type,
+            "site": "crosstown",
+            "entity_kind": kind,
+            "entity_alias": "front_door",
+            "occurred_at": timestamp(now),
+            "time_precision": "observed_interval",
+            "attributes": {
+                "previous": previous,
+                "current": current,
+                "not_before": timestamp(occurred),
+                "not_after": timestamp(now),
+            },
+        }
+
+    def presence(self, occurred: dt.datetime, _now: dt.datetime) -> dict:
+        site = self.random.choice(("cabin", "crosstown"))
+        previous = self.occupancy[site]
+        current = self.random.choice(
+            [
+                state
+                for state in ("occupied", "confirmed_vacant", "possibly_vacant")
+                if state != previous
+            ]
+        )
+        self.occupancy[site] = current
+        digest = hashlib.sha256(b"%d" % self.sequence).hexdigest()
+        return {
+            "source_event_id": "presence_" + digest,
+            "event_type": "presence.occupancy_changed",
+            "site": site,
+            "entity_kind": "site",
+            "entity_alias": site,
+            "time_precision": "evaluation",
+            "attributes": {
+                "previous": previous,
+                "current": current,
+                "confidence": "canonical",
+                "evidence_at": timestamp(occurred),
+                "state_hash": digest,
+            },
+        }
+
+
+class StubCameraCommands:
+    def __init__(self, camera) -> None:
+        self.decision = camera.VisionDecision(False, "high")
+
+    def capture(self, _provider: str, _site: str, _alias: str, path: Path) -> None:
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.write(descriptor, b"\xff\xd8\xffbench\xff\xd9")
+        finally:
+            os.close(descriptor)
+
+    def analyze(self, _path: Path):
+        return self.decision
+
+
+def stub_send(command, *_args, **_kwargs) -> subprocess.CompletedProcess:
+    payload = {
+        "action": "send",
+        "channel": "imessage",
+        "dryRun": False,
+        "handledBy": "core",
+        "messageId": "bench-message",
+        "payload": {
+            "channel": "imessage",
+            "to": TARGET,
+            "via": "direct",
+            "result": {"messageId": "bench-message"},
+            "mediaUrl": None,
+            "deliveryStatus": "sent",
+            "payloadOutcomes": [
+                {"index": 0, "status": "sent", "messageId": "bench-message"}
+            ],
+        },
+    }
+    return subprocess.CompletedProcess(command, 0, stdout=json.dumps(payload) + "\n", stderr="")
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def database_bytes(paths) -> int:
+    """Return main-file bytes after folding the WAL back in."""
+
+    with sqlite3.connect(paths.database) as connection:
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return paths.database.stat().st_size
+
+
+def run(events: int, per_round: int, seed: int) -> dict:
+    bus = load_module("home_event_bus", BIN_DIR / "home_event_bus.py")
+    correlator = load_module("home_event_correlator", BIN_DIR / "home-event-correlator.py")
+    camera = load_module("home_event_camera", BIN_DIR / "home-event-camera.py")
+    delivery = load_module("home_event_delivery", BIN_DIR / "home-event-delivery.py")
+    clock = SimulatedClock()
+    generator = PayloadGenerator(seed)
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    items = {stage: 0 for stage in STAGES}
+    outcomes: dict[str, int] = {}
+
+    def timed(stage: str, call):
+        started = time.perf_counter()
+        value = call()
+        timings[stage].append(time.perf_counter() - started)
+        return value
+
+    with tempfile.TemporaryDirectory() as temporary, mock.patch.dict(
+        os.environ, {"OPENCLAW_GATEWAY_TOKEN": "bench-token"}
+    ), mock.patch.object(delivery.subprocess, "run", side_effect=stub_send):
+        root = Path(temporary) / "home-events"
+        presence = Path(temporary) / "presence.json"
+        store = bus.initialize_runtime(root, clock=clock)
+        paths = bus.RuntimePaths(root)
+        bus.install_delivery_policy(paths, json.dumps(POLICY).encode("utf-8"))
+        store.set_runtime_mode("limited_delivery")
+        shadow = correlator.ShadowCorrelator(root, presence, clock=clock)
+        camera_worker = camera.CameraWorker(
+            root,
+            presence_state=presence,
+            clock=clock,
+            commands=StubCameraCommands(camera),
+        )
+        delivery_worker = delivery.DeliveryWorker(root, presence, TARGET, clock=clock)
+        initial_bytes = database_bytes(paths)
+        wall_started = time.perf_counter()
+        produced = 0
+        while produced < events:
+            clock.advance(ROUND_SECONDS)
+            presence.write_text(
+                json.dumps(
+                    {
+                        "timestamp": clock(),
+                        "cabin": {"occupancy": "confirmed_vacant", "fresh": True},
+                        "crosstown": {"occupancy": "confirmed_vacant", "fresh": True},
+                    }
+                ),
+                encoding="utf-8",
+            )
+            presence.chmod(0o600)
+            for _ in range(min(per_round, events - produced)):
+                source, data = generator.next(clock.now)
+                timed("enqueue", lambda: bus.enqueue_event(root, source, data, clock=clock))
+                produced += 1
+            items["enqueue"] = produced
+            result = timed("ingest", lambda: bus.ingest_once(root, clock=clock))
+            items["ingest"] += result.accepted + result.duplicate
+            result = timed("correlate", shadow.run_once)
+            items["correlate"] += int(result.get("acknowledged", 0))
+            for stage, worker in (("camera", camera_worker), ("delivery", delivery_worker)):
+                while True:
+                    outcome = timed(stage, worker.run_once)["outcome"]
+                    key = stage + ":" + outcome
+                    outcomes[key] = outcomes.get(key, 0) + 1
+                    if outcome in ("idle", "busy"):
+                        break
+                    items[stage] += 1
+        wall_seconds = time.perf_counter() - wall_started
+        final_bytes = database_bytes(paths)
+        status = store.status_snapshot()
+        for worker in (shadow, camera_worker, delivery_worker):
+            worker.store.close()
+
+    stages = {}
+    for stage in STAGES:
+        samples = timings[stage]
+        seconds = sum(samples)
+        stages[stage] = {
+            "calls": len(samples),
+            "items": items[stage],
+            "seconds": round(seconds, 4),
+            "items_per_second": round(items[stage] / seconds, 1) if seconds else 0.0,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        }
+    return {
+        "benchmark": "home_events_pipeline",
+        "schema_version": 1,
+        "parameters": {"events": events, "per_round": per_round, "seed": seed},
+        "environment": {
+            "python": sys.version.split()[0],
+            "sqlite": sqlite3.sqlite_version,
+            "bus_schema_version": bus.SCHEMA_VERSION,
+        },
+        "wall_seconds": round(wall_seconds, 4),
+        "end_to_end_events_per_second": round(events / wall_seconds, 1),
+        "stages": stages,
+        "outcomes": dict(sorted(outcomes.items())),
+        "database": {
+            "initial_bytes": initial_bytes,
+            "final_bytes": final_bytes,
+            "bytes_per_event": round((final_bytes - initial_bytes) / events, 1),
+            "events": status["counts"]["events"],
+            "open_incidents": status["counts"]["open_incidents"],
+        },
+    }
+
+
+def compare(result: dict, baseline: dict) -> dict:
+    """Return current/baseline ratios for the headline metrics."""
+
+    if baseline.get("parameters") != result["parameters"]:
+        raise SystemExit("baseline was produced with different parameters")
+    ratios = {
+        "end_to_end_events_per_second": result["end_to_end_events_per_second"]
+        / max(baseline["end_to_end_events_per_second"], 1e-9),
+        "bytes_per_event": result["database"]["bytes_per_event"]
+        / max(baseline["database"]["bytes_per_event"], 1e-9),
+    }
+    for stage in STAGES:
+        for metric in ("p50_ms", "p99_ms"):
+            ratios[stage + "_" + metric] = result["stages"][stage][metric] / max(
+                baseline["stages"][stage][metric], 1e-9
+            )
+    return {name: round(value, 3) for name, value in ratios.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=400)
+    parser.add_argument("--per-round", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    args = parser.parse_args()
+    if args.events < 1 or args.per_round < 1:
+        parser.error("--events and --per-round must be positive")
+    result = run(args.events, args.per_round, args.seed)
+    if args.baseline is not None:
+        result["ratios_vs_baseline"] = compare(
+            result, json.loads(args.baseline.read_text(encoding="utf-8"))
+        )
+    encoded = json.dumps(result, indent=2, sort_keys=True) + "\n"
+    if args.output is not None:
+        args.output.write_text(encoded, encoding="utf-8")
+    sys.stdout.write(encoded)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
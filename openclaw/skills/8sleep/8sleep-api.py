@@ -27,6 +27,9 @@ import urllib.request
 import urllib.error
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "bin"))
+import skill_http  # noqa: E402
+
 CONFIG_DIR = Path.home() / ".config" / "eightctl"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 TOKEN_FILE = CONFIG_DIR / "token-cache.json"
@@ -40,6 +43,11 @@ CLIENT_SECRET = os.environ["EIGHTSLEEP_CLIENT_SECRET"]
 USER_AGENT = "okhttp/4.9.3"
 
 TOKEN_EXPIRY_BUFFER = 300  # refresh 5 min before expiry
+# Read-only lookups repeated within one command (current device, device
+# record) are served from the client's response cache for this long.
+READ_CACHE_TTL = 5
+
+HTTP = skill_http.HTTPClient()
 
 # User IDs (from device data — Dylan=left, Julia=right)
 USERS = {
@@ -78,7 +86,9 @@ def resolve_device_id(token_data, location):
     if configured:
         return configured
     uid = token_data["userId"]
-    current = api_get(f"users/{uid}/current-device", token_data)
+    current = api_get(
+        f"users/{uid}/current-device", token_data, cache_ttl=READ_CACHE_TTL
+    )
     return current.get("id", "")
 
 
@@ -134,7 +144,7 @@ def _auth_request(payload):
         AUTH_URL, data=data,
         headers={"Content-Type": "application/json", "user-agent": USER_AGENT}
     )
-    resp = urllib.request.urlopen(req, timeout=15)
+    resp = HTTP.open(req, timeout=15)
     result = json.loads(resp.read().decode())
     result["cached_at"] = time.time()
     TOKEN_FILE.write_text(json.dumps(result))
@@ -215,19 +225,19 @@ def get_token():
     return authenticate(config["email"], config["password"])
 
 
-def api_get(path, token_data=None):
-    """GET from the Eight Sleep API."""
-    if token_data is None:
-        token_data = get_token()
-    req = urllib.request.Request(
-        f"{API_URL}/{path}",
-        headers={
-            "Authorization": f"Bearer {token_data['access_token']}",
-            "user-agent": USER_AGENT,
-        }
-    )
+def _api_request(url, token_data, method="GET", body=None, cache_ttl=0):
+    """Send one authenticated request and decode its JSON response."""
+    headers = {
+        "Authorization": f"Bearer {token_data['access_token']}",
+        "user-agent": USER_AGENT,
+    }
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(url, data=data, method=method, headers=headers)
     try:
-        resp = urllib.request.urlopen(req, timeout=15)
+        resp = HTTP.open(req, timeout=15, cache_ttl=cache_ttl)
         payload = resp.read().decode()
         return json.loads(payload) if payload else {}
     except urllib.error.HTTPError as e:
@@ -236,25 +246,18 @@ def api_get(path, token_data=None):
         return {"error": "network", "message": str(e)}
 
 
-def api_get_app(path, token_data=None):
+def api_get(path, token_data=None, cache_ttl=0):
+    """GET from the Eight Sleep API."""
+    if token_data is None:
+        token_data = get_token()
+    return _api_request(f"{API_URL}/{path}", token_data, cache_ttl=cache_ttl)
+
+
+def api_get_app(path, token_data=None, cache_ttl=0):
     """GET from the Eight Sleep app API."""
     if token_data is None:
         token_data = get_token()
-    req = urllib.request.Request(
-        f"{APP_API_URL}/{path}",
-        headers={
-            "Authorization": f"Bearer {token_data['access_token']}",
-            "user-agent": USER_AGENT,
-        }
-    )
-    try:
-        resp = urllib.request.urlopen(req, timeout=15)
-        payload = resp.read().decode()
-        return json.loads(payload) if payload else {}
-    except urllib.error.HTTPError as e:
-        return {"error": e.code, "message": e.read().decode()[:300]}
-    except (urllib.error.URLError, OSError, json.JSONDecodeError) as e:
-        return {"error": "network", "message": str(e)}
+    return _api_request(f"{APP_API_URL}/{path}", token_data, cache_ttl=cache_ttl)
 
 
 def api_put(path, body, token_data=None, use_app_api=False):
@@ -262,24 +265,7 @@ def api_put(path, body, token_data=None, use_app_api=False):
     if token_data is None:
         token_data = get_token()
     base = APP_API_URL if use_app_api else API_URL
-    data = json.dumps(body).encode()
-    req = urllib.request.Request(
-        f"{base}/{path}",
-        data=data, method="PUT",
-        headers={
-            "Authorization": f"Bearer {token_data['access_token']}",
-            "Content-Type": "application/json",
-            "user-agent": USER_AGENT,
-        }
-    )
-    try:
-        resp = urllib.request.urlopen(req, timeout=15)
-        payload = resp.read().decode()
-        return json.loads(payload) if payload else {}
-    except urllib.error.HTTPError as e:
-        return {"error": e.code, "message": e.read().decode()[:300]}
-    except (urllib.error.URLError, OSError, json.JSONDecodeError) as e:
-        return {"error": "network", "message": str(e)}
+    return _api_request(f"{base}/{path}", token_data, method="PUT", body=body)
 
 
 class APICommandError(Exception):
@@ -539,21 +525,24 @@ def cmd_status(location=DEFAULT_LOCATION):
     # Get device info — location selects which Pod on multi-Pod accounts
     dev_id = resolve_device_id(token_data, location)
 
+    # The schedule endpoint is user/current-set scoped. Avoid changing the
+    # global current set for a read-only status call (the dashboard polls this),
+    # and include schedule details only when the selected Pod is already current.
+    # The device record and the current-device lookup are independent.
+    device, current = HTTP.gather(
+        lambda: api_get(f"devices/{dev_id}", token_data),
+        lambda: api_get(
+            f"users/{uid}/current-device", token_data, cache_ttl=READ_CACHE_TTL
+        ),
+    )
     try:
-        device = require_api_success(
-            api_get(f"devices/{dev_id}", token_data),
-            f"loading {location} Pod status",
-        )
+        device = require_api_success(device, f"loading {location} Pod status")
     except APICommandError as exc:
         command_error(exc)
     d = device.get("result", device)
 
     sensor = d.get("sensorInfo", {})
 
-    # The schedule endpoint is user/current-set scoped. Avoid changing the
-    # global current set for a read-only status call (the dashboard polls this),
-    # and include schedule details only when the selected Pod is already current.
-    current = api_get(f"users/{uid}/current-device", token_data)
     temp = {}
     if not current.get("error") and current.get("id") == dev_id:
         temp = api_get(f"users/{uid}/temperature", token_data)
@@ -23,6 +23,7 @@ SCHEMA_VERSION = 1
 DEFAULT_ALIAS = "cabin-living-room-airthings"
 DEFAULT_CACHE_TTL_SECONDS = 300
 DEFAULT_SCAN_SECONDS = 15.0
+MAX_CONCURRENT_READS = 3
 AIRTHINGS_MANUFACTURER_ID = 820
 SUPPORTED_MODEL = "Wave Enhance"
 SITES = {"cabin", "crosstown"}
@@ -229,6 +230,8 @@ class AirthingsMonitor:
         self.cache_file = self.state_dir / "status-cache.json"
         self.lock_file = self.state_dir / "ble.lock"
         self.cache_ttl_seconds = cache_ttl_seconds
+        self._scan_addresses: tuple[str, ...] = ()
+        self._scan: asyncio.Future | None = None
 
     def load_config(self) -> list[dict[str, Any]]:
         _private_file(self.config_file)
@@ -284,6 +287,7 @@ class AirthingsMonitor:
             if reading.get("online") is True:
                 stored = copy.deepcopy(reading)
                 stored.pop("cache_age_seconds", None)
+                stored.pop("timing", None)
                 stored["cached"] = False
                 existing[reading["alias"]] = stored
         _atomic_json(
@@ -316,34 +320,98 @@ class AirthingsMonitor:
             return "device_not_found"
         return "read_failed"
 
-    async def _read_address(self, binding: dict[str, Any]) -> dict[str, Any]:
+    async def _scan_for(self, addresses: tuple[str, ...]) -> tuple[dict, dict]:
+        """One discovery pass for every address; stops once all are seen.
+
+        Returns the discovered devices and the milliseconds until each was
+        first seen, both keyed by upper-cased address.
+        """
+        from bleak import BleakScanner
+
+        wanted = {address.upper() for address in addresses}
+        found: dict[str, Any] = {}
+        seen_ms: dict[str, int] = {}
+        complete = asyncio.Event()
+        started = time.monotonic()
+
+        def detected(device: Any, _advertisement: Any) -> None:
+            key = device.address.upper()
+            if key in wanted and key not in found:
+                found[key] = device
+                seen_ms[key] = int((time.monotonic() - started) * 1000)
+                if len(found) == len(wanted):
+                    complete.set()
+
+        async with BleakScanner(detection_callback=detected):
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(complete.wait(), timeout=DEFAULT_SCAN_SECONDS)
+        return found, seen_ms
+
+    async def _discovered(self) -> tuple[dict, dict]:
+        # The first read starts the shared scan; the rest await the same one.
+        # Shielded so one device's timeout does not cancel it for the others.
+        if self._scan is None:
+            self._scan = asyncio.ensure_future(self._scan_for(self._scan_addresses))
+        return await asyncio.shield(self._scan)
+
+    async def _read_address(
+        self, binding: dict[str, Any], timing: dict[str, int | None]
+    ) -> dict[str, Any]:
         try:
             from airthings_ble import AirthingsBluetoothDeviceData
-            from bleak import BleakScanner
+            import bleak  # noqa: F401
         except ImportError as exc:
             raise AirthingsError("runtime_unavailable", 12) from exc
 
+        key = binding["address"].upper()
         try:
-            device = await BleakScanner.find_device_by_address(
-                binding["address"], timeout=DEFAULT_SCAN_SECONDS
-            )
+            devices, seen_ms = await self._discovered()
+            device = devices.get(key)
             if device is None:
-                return offline_reading(binding, "device_not_found")
+                timing["scan_ms"] = int(DEFAULT_SCAN_SECONDS * 1000)
+                return {**offline_reading(binding, "device_not_found"), "timing": timing}
+            timing["scan_ms"] = seen_ms[key]
+            started = time.monotonic()
             reader = AirthingsBluetoothDeviceData(logging.getLogger("airthings"))
             result = await reader.update_device(device)
+            timing["read_ms"] = int((time.monotonic() - started) * 1000)
             if result.model.product_name != SUPPORTED_MODEL:
-                return offline_reading(binding, "model_mismatch")
-            return normalize_reading(binding, result)
+                return {**offline_reading(binding, "model_mismatch"), "timing": timing}
+            return {**normalize_reading(binding, result), "timing": timing}
         except Exception as exc:  # BLE libraries expose backend-specific errors.
-            return offline_reading(binding, self._ble_error_category(exc))
+            return {
+                **offline_reading(binding, self._ble_error_category(exc)),
+                "timing": timing,
+            }
+
+    async def _read_all(self, pending: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Resolve every pending device in one scan, then read a few at a time."""
+        self._scan_addresses = tuple(binding["address"] for binding in pending)
+        self._scan = None
+        limit = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def read(binding: dict[str, Any]) -> dict[str, Any]:
+            async with limit:
+                return await self._read_with_timeout(binding)
+
+        try:
+            return list(await asyncio.gather(*(read(binding) for binding in pending)))
+        finally:
+            if self._scan is not None and not self._scan.done():
+                self._scan.cancel()
+            self._scan = None
 
     async def _read_with_timeout(self, binding: dict[str, Any]) -> dict[str, Any]:
+        # Shared with the read so a timeout still reports how far it got.
+        timing: dict[str, int | None] = {"scan_ms": None, "read_ms": None}
+        started = time.monotonic()
         try:
             return await asyncio.wait_for(
-                self._read_address(binding), timeout=DEFAULT_SCAN_SECONDS + 10
+                self._read_address(binding, timing), timeout=DEFAULT_SCAN_SECONDS + 10
             )
         except TimeoutError:
-            return offline_reading(binding, "bluetooth_timeout")
+            timing["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+            return {**offline_reading(binding, "bluetooth_timeout"), "timing": timing}
 
     async def status(
         self, alias: str | None, refresh: bool, cache_only: bool = False
@@ -375,7 +443,7 @@ class AirthingsMonitor:
         if pending:
             try:
                 with self.ble_lock():
-                    fresh = [await self._read_with_timeout(binding) for binding in pending]
+                    fresh = await self._read_all(pending)
                     self._save_cache(fresh)
                     readings.extend(fresh)
             except AirthingsError as exc:
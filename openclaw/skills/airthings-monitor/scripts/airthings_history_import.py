@@ -11,7 +11,9 @@ import json
 import math
 import os
 import shutil
+import sqlite3
 import stat
+import sys
 import tempfile
 from collections import defaultdict
 from contextlib import contextmanager
@@ -19,6 +21,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin"))
+import climate_history_store  # noqa: E402
+
 
 IMPORT_CONTRACT = "airthings_csv_v1"
 SITE_STRUCTURE = "Philly"
@@ -325,26 +330,73 @@ def _existing_keys(records: Iterable[dict[str, Any]]) -> set[str]:
     return result
 
 
+def _indexed_day(
+    store: climate_history_store.ClimateHistoryStore,
+    day: str,
+    day_samples: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+    """Dedupe ``day_samples`` through the history index; export the merged day."""
+    store.sync_day(day)
+    existing_keys = store.existing_timestamps(
+        day,
+        SOURCE,
+        [item["timestamp"] for item in day_samples],
+        structure=SITE_STRUCTURE,
+        room=ROOM,
+    )
+    additions = [item for item in day_samples if item["timestamp"] not in existing_keys]
+    return additions, store.export_day(day, additions) if additions else None
+
+
+def _scanned_day(
+    path: Path, day_samples: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+    existing = _load_history_file(path)
+    existing_keys = _existing_keys(existing)
+    additions = [item for item in day_samples if item["timestamp"] not in existing_keys]
+    if not additions:
+        return additions, None
+    return additions, sorted(existing + additions, key=lambda item: item["timestamp"])
+
+
 def prepare_import(
-    samples: list[dict[str, Any]], history_dir: Path
+    samples: list[dict[str, Any]], history_dir: Path, *, indexed: bool = False
 ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, int]]:
+    """Plan the merge; ``indexed`` uses (and updates) the history index.
+
+    Only the ``--apply`` path, holding ``history_lock``, passes ``indexed``;
+    a dry run reads the day files and leaves the history directory untouched.
+    """
     _safe_directory(history_dir)
     by_day: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for sample in samples:
         by_day[sample["timestamp"][:10]].append(sample)
 
+    # A missing history directory has nothing to dedupe against; otherwise
+    # the index answers dedupe and export without re-reading each day file.
+    store = (
+        climate_history_store.ClimateHistoryStore(history_dir)
+        if indexed and history_dir.is_dir()
+        else None
+    )
     merged: dict[str, list[dict[str, Any]]] = {}
     duplicates = 0
     added = 0
     for day, day_samples in sorted(by_day.items()):
-        path = history_dir / f"{day}.jsonl"
-        existing = _load_history_file(path)
-        existing_keys = _existing_keys(existing)
-        additions = [item for item in day_samples if item["timestamp"] not in existing_keys]
+        day_merged = None
+        if store is not None:
+            try:
+                additions, day_merged = _indexed_day(store, day, day_samples)
+            except climate_history_store.HistoryStoreError as exc:
+                raise ImportErrorSafe(exc.code) from exc
+            except (OSError, sqlite3.Error):
+                store = None
+        if store is None:
+            additions, day_merged = _scanned_day(history_dir / f"{day}.jsonl", day_samples)
         duplicates += len(day_samples) - len(additions)
         added += len(additions)
-        if additions:
-            merged[day] = sorted(existing + additions, key=lambda item: item["timestamp"])
+        if day_merged is not None:
+            merged[day] = day_merged
     return merged, {
         "samples": len(samples),
         "added": added,
@@ -382,6 +434,14 @@ def _sha256(path: Path) -> str:
     return digest.hexdigest()
 
 
+def _reindex(history_dir: Path, days: Iterable[str]) -> None:
+    # The index is a cache; a day it misses here is re-indexed on next sync.
+    try:
+        climate_history_store.ClimateHistoryStore(history_dir).sync(days)
+    except (OSError, sqlite3.Error, climate_history_store.HistoryStoreError):
+        pass
+
+
 def apply_import(
     merged: dict[str, list[dict[str, Any]]],
     history_dir: Path,
@@ -440,6 +500,7 @@ def apply_import(
                 elif target.exists():
                     target.unlink()
             raise
+        _reindex(history_dir, merged)
     except ImportErrorSafe:
         raise
     except OSError as exc:
@@ -476,7 +537,7 @@ def main() -> int:
             if os.environ.get("AIRTHINGS_ALLOW_HISTORY_IMPORT") != "1":
                 raise ImportErrorSafe("import_not_authorized", 13)
             with history_lock(history_dir):
-                merged, counts = prepare_import(samples, history_dir)
+                merged, counts = prepare_import(samples, history_dir, indexed=True)
                 summary: dict[str, Any] = {
                     "ok": True,
                     "mode": "apply",
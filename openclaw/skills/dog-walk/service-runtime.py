@@ -1084,6 +1084,22 @@ def _write_json_file(path: Path, data: dict) -> None:
                 pass
 
 
+def _index_route(path: Path) -> None:
+    """Fold a finished route into the dashboard route index (best effort).
+
+    The dashboard would re-index the file on its next request anyway; doing
+    it here keeps the parse off the dashboard's request path.
+    """
+    try:
+        if OPENCLAW_BIN not in sys.path:
+            sys.path.append(OPENCLAW_BIN)
+        import route_index
+
+        route_index.RouteIndex(ROUTES_DIR).index_route(path)
+    except Exception as exc:
+        log(f"ROUTE INDEX: skipped {path.name}: {exc}")
+
+
 def _read_json_file(path: Path) -> dict | None:
     try:
         return json.loads(path.read_text())
@@ -1267,6 +1283,7 @@ def _finalize_walk_route(
         route["return_signal"] = return_signal
         route.update(_summarize_route(route, fi_result=fi_result))
         _write_json_file(path, route)
+    _index_route(path)
     return {"distance_m": route["distance_m"], "point_count": route["point_count"]}
 
 
@@ -9,12 +9,18 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import math
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "bin"))
+import skill_http  # noqa: E402
 
 API_BASE = "https://api.tryfi.com"
 CONFIG_DIR = os.path.expanduser("~/.config/fi-collar")
 TOKEN_FILE = os.path.join(CONFIG_DIR, "session.json")
 TOKEN_TTL = 3600 * 12  # 12 hours
 
+HTTP = skill_http.HTTPClient()
+
 # Home locations for proximity detection — from env vars to avoid committing coordinates
 LOCATIONS = {}
 if os.environ.get("CROSSTOWN_LAT") and os.environ.get("CROSSTOWN_LON"):
@@ -71,7 +77,7 @@ def login():
     data = urllib.parse.urlencode({"email": email, "password": password}).encode()
     req = urllib.request.Request(f"{API_BASE}/auth/login", data=data)
     try:
-        resp = urllib.request.urlopen(req, timeout=15)
+        resp = HTTP.open(req, timeout=15)
         result = json.loads(resp.read().decode())
     except urllib.error.HTTPError as e:
         print(json.dumps({"error": e.code, "message": e.read().decode()[:300]}))
@@ -125,14 +131,14 @@ def graphql(session, query, variables=None):
         }
     )
     try:
-        resp = urllib.request.urlopen(req, timeout=15)
+        resp = HTTP.open(req, timeout=15)
         result = json.loads(resp.read().decode())
     except urllib.error.HTTPError as e:
         if e.code in (401, 403):
             # Session expired, re-login and retry once
             session = login()
             req.add_header("Cookie", session.get("cookie", ""))
-            resp = urllib.request.urlopen(req, timeout=15)
+            resp = HTTP.open(req, timeout=15)
             result = json.loads(resp.read().decode())
         else:
             return {"error": e.code, "message": e.read().decode()[:300]}
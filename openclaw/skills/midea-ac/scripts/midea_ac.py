@@ -12,6 +12,7 @@ import re
 import stat
 import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -20,6 +21,13 @@ from typing import Any, Mapping, Sequence
 SCHEMA_VERSION = 1
 CONFIG_LIMIT_BYTES = 65_536
 DEFAULT_CONFIG = Path("~/.openclaw/midea-ac/bindings.json").expanduser()
+DISCOVERY_CACHE_NAME = "discovery.json"
+# DHCP leases outlive this; a stale address is also dropped on connect failure.
+DISCOVERY_TTL_SECONDS = 6 * 3600
+DISCOVERY_KEYS = ("type", "ip_address", "port", "protocol", "model", "mac", "sn")
+# Covers the dashboard's five-minute Midea poll plus its 10% jitter, so each
+# background poll reuses the session its previous poll released.
+SESSION_IDLE_SECONDS = 360
 VALID_SITES = frozenset({"cabin", "crosstown"})
 CLOUD_NAMES = ("SmartHome", "NetHome Plus", "Midea Air", "Ariston Clima", "美的美居")
 ALIAS_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
@@ -184,14 +192,9 @@ def load_config() -> dict[str, Any]:
         raise MideaACError("config_invalid") from exc
 
 
-def write_config(value: Mapping[str, Any]) -> None:
-    validated = validate_config(value)
-    path = config_path()
+def write_private(path: Path, encoded: bytes) -> None:
     validate_private_parent(path, create=True)
-    encoded = (json.dumps(validated, indent=2, sort_keys=True) + "\n").encode()
-    if len(encoded) > CONFIG_LIMIT_BYTES:
-        raise MideaACError("config_too_large")
-    descriptor, temporary_name = tempfile.mkstemp(prefix=".bindings.", dir=path.parent)
+    descriptor, temporary_name = tempfile.mkstemp(prefix=f".{path.stem}.", dir=path.parent)
     temporary = Path(temporary_name)
     try:
         os.fchmod(descriptor, 0o600)
@@ -214,6 +217,14 @@ def write_config(value: Mapping[str, Any]) -> None:
         raise
 
 
+def write_config(value: Mapping[str, Any]) -> None:
+    validated = validate_config(value)
+    encoded = (json.dumps(validated, indent=2, sort_keys=True) + "\n").encode()
+    if len(encoded) > CONFIG_LIMIT_BYTES:
+        raise MideaACError("config_too_large")
+    write_private(config_path(), encoded)
+
+
 def resolve_binding(config: Mapping[str, Any], alias: str) -> dict[str, Any]:
     matches = [device for device in config["devices"] if device["alias"] == alias]
     if not matches:
@@ -242,6 +253,171 @@ def discover_local(*, attempts: int = 1) -> list[dict[str, Any]]:
     return sorted(devices.values(), key=lambda item: int(item["device_id"]))
 
 
+def discovery_cache_path() -> Path:
+    return config_path().with_name(DISCOVERY_CACHE_NAME)
+
+
+def valid_cache_entry(value: Any) -> bool:
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("ip_address"), str)
+        and isinstance(value.get("port"), int)
+        and value.get("protocol") in {1, 2, 3}
+        and isinstance(value.get("discovered_at"), (int, float))
+    )
+
+
+def load_discovery_cache() -> dict[str, dict[str, Any]]:
+    """Cached device_id → LAN address table; empty when missing or unsafe."""
+    path = discovery_cache_path()
+    try:
+        info = path.stat(follow_symlinks=False)
+        if (
+            not stat.S_ISREG(info.st_mode)
+            or info.st_uid != os.getuid()
+            or stat.S_IMODE(info.st_mode) != 0o600
+            or info.st_size > CONFIG_LIMIT_BYTES
+        ):
+            return {}
+        value = json.loads(path.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeError, json.JSONDecodeError):
+        return {}
+    if not isinstance(value, dict) or value.get("schema_version") != SCHEMA_VERSION:
+        return {}
+    devices = value.get("devices")
+    if not isinstance(devices, dict):
+        return {}
+    return {
+        device_id: entry
+        for device_id, entry in devices.items()
+        if isinstance(device_id, str) and valid_cache_entry(entry)
+    }
+
+
+def write_discovery_cache(devices: Mapping[str, Mapping[str, Any]]) -> None:
+    encoded = (
+        json.dumps(
+            {"schema_version": SCHEMA_VERSION, "devices": devices}, sort_keys=True
+        )
+        + "\n"
+    ).encode()
+    try:
+        write_private(discovery_cache_path(), encoded)
+    except (OSError, MideaACError):
+        # The cache only saves a broadcast; status and control work without it.
+        pass
+
+
+def invalidate_discovery(device_id: str) -> None:
+    devices = load_discovery_cache()
+    if devices.pop(device_id, None) is not None:
+        write_discovery_cache(devices)
+
+
+def locate_devices(device_ids: Sequence[str]) -> tuple[dict[str, dict[str, Any]], bool]:
+    """Return LAN addresses for ``device_ids`` and whether discovery ran.
+
+    Fresh cached entries answer without a UDP broadcast; a missing or
+    expired entry triggers one discovery, whose results refresh the cache.
+    """
+    now = time.time()
+    cached = {
+        device_id: entry
+        for device_id, entry in load_discovery_cache().items()
+        if 0 <= now - entry["discovered_at"] < DISCOVERY_TTL_SECONDS
+    }
+    if all(device_id in cached for device_id in device_ids):
+        return cached, False
+    for item in discover_local(attempts=2):
+        cached[str(item["device_id"])] = {
+            **{key: item.get(key) for key in DISCOVERY_KEYS},
+            "discovered_at": now,
+        }
+    write_discovery_cache(cached)
+    return cached, True
+
+
+class DeviceLocator:
+    """Resolve bindings to LAN addresses for one command, discovering at most once."""
+
+    def __init__(self, bindings: Sequence[Mapping[str, Any]]) -> None:
+        self.device_ids = [binding["device_id"] for binding in bindings]
+        self.discovered = False
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def get(self, device_id: str) -> dict[str, Any] | None:
+        if self._entries is None:
+            self._entries, self.discovered = locate_devices(self.device_ids)
+        return self._entries.get(device_id)
+
+    def rediscover(self, device_id: str) -> dict[str, Any] | None:
+        """Drop a cached address that failed to connect and discover again."""
+        if self.discovered:
+            return None
+        invalidate_discovery(device_id)
+        self._entries = None
+        return self.get(device_id)
+
+
+class SessionPool:
+    """Authenticated device connections kept open between calls.
+
+    Disabled for one-shot CLI runs, where every device is closed after the
+    command. A long-lived host (the home dashboard) enables it so a status
+    or control call on a recently used unit reuses its V3 session instead
+    of reconnecting. A taken session is owned by one caller until released.
+    Every take and release closes pooled sessions idle past ``idle_seconds``.
+    """
+
+    def __init__(self, idle_seconds: float = SESSION_IDLE_SECONDS) -> None:
+        self.enabled = False
+        self.idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._sessions: dict[str, tuple[Any, float]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def take(self, alias: str) -> Any:
+        with self._lock:
+            expired = self._expired_locked()
+            session = self._sessions.pop(alias, None)
+        for device in expired:
+            device.close_socket()
+        return None if session is None else session[0]
+
+    def release(self, alias: str, device: Any) -> None:
+        if not self.enabled:
+            device.close_socket()
+            return
+        with self._lock:
+            expired = self._expired_locked()
+            previous = self._sessions.pop(alias, None)
+            self._sessions[alias] = (device, time.monotonic())
+        if previous is not None:
+            expired.append(previous[0])
+        for stale in expired:
+            stale.close_socket()
+
+    def _expired_locked(self) -> list[Any]:
+        now = time.monotonic()
+        expired = [
+            alias
+            for alias, (_device, released) in self._sessions.items()
+            if now - released > self.idle_seconds
+        ]
+        return [self._sessions.pop(alias)[0] for alias in expired]
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for device, _released in sessions.values():
+            device.close_socket()
+
+
+SESSIONS = SessionPool()
+
+
 def build_device(binding: Mapping[str, Any], discovered: Mapping[str, Any]) -> Any:
     _, selector = import_midea()
     try:
@@ -281,6 +457,34 @@ def refresh_device(binding: Mapping[str, Any], discovered: Mapping[str, Any]) ->
         raise MideaACError("device_unavailable") from exc
 
 
+def acquire_device(binding: Mapping[str, Any], locator: DeviceLocator) -> Any:
+    """Return a connected, freshly refreshed device for ``binding``.
+
+    Reuses a pooled session when one is live, then the located address; an
+    address that fails to connect is dropped from the discovery cache and
+    rediscovered once.
+    """
+    device = SESSIONS.take(binding["alias"])
+    if device is not None:
+        try:
+            device.refresh_status(True)
+            return device
+        except Exception:
+            device.close_socket()
+    local = locator.get(binding["device_id"])
+    if local is None:
+        raise MideaACError("not_discovered")
+    try:
+        return refresh_device(binding, local)
+    except MideaACError as exc:
+        if exc.code not in {"device_auth_failed", "device_unavailable"}:
+            raise
+        local = locator.rediscover(binding["device_id"])
+        if local is None:
+            raise
+    return refresh_device(binding, local)
+
+
 def c_to_f(value: Any) -> float | None:
     if value is None or isinstance(value, bool) or not isinstance(value, (int, float)):
         return None
@@ -343,24 +547,20 @@ def collect_status(alias: str | None = None) -> list[dict[str, Any]]:
     bindings = (
         [resolve_binding(config, alias)] if alias else list(config["devices"])
     )
-    discovered = {
-        str(item["device_id"]): item for item in discover_local(attempts=2)
-    }
+    locator = DeviceLocator(bindings)
     results: list[dict[str, Any]] = []
     for binding in bindings:
-        local = discovered.get(binding["device_id"])
-        if local is None:
-            results.append(offline_status(binding, "not_discovered"))
-            continue
-        device = None
         try:
-            device = refresh_device(binding, local)
-            results.append(status_from_attributes(binding, device.attributes))
+            device = acquire_device(binding, locator)
         except MideaACError as exc:
+            if exc.code in {"discovery_failed", "runtime_unavailable"}:
+                raise
             results.append(offline_status(binding, exc.code))
+            continue
+        try:
+            results.append(status_from_attributes(binding, device.attributes))
         finally:
-            if device is not None:
-                device.close_socket()
+            SESSIONS.release(binding["alias"], device)
     return results
 
 
@@ -401,16 +601,18 @@ def value_matches(attributes: Mapping[Any, Any], attribute: str, intended: Any)
 def send_control(command: str, alias: str, value: Any = None) -> tuple[dict[str, Any], int]:
     config = load_config()
     binding = resolve_binding(config, alias)
-    local = {
-        str(item["device_id"]): item for item in discover_local(attempts=2)
-    }.get(binding["device_id"])
-    if local is None:
-        raise MideaACError("device_unavailable")
-    device = refresh_device(binding, local)
     attribute, intended = intended_value(command, value)
+    try:
+        device = acquire_device(binding, DeviceLocator([binding]))
+    except MideaACError as exc:
+        if exc.code == "not_discovered":
+            raise MideaACError("device_unavailable") from exc
+        raise
+    reusable = False
     try:
         before = device.attributes
         if value_matches(before, attribute, intended):
+            reusable = True
             return {
                 "ok": True,
                 "alias": alias,
@@ -442,13 +644,18 @@ def send_control(command: str, alias: str, value: Any = None) -> tuple[dict[str,
         }
         if not verified:
             result["error"] = "outcome_unknown"
+        reusable = True
         return result, 0 if verified else 2
     except MideaACError:
         raise
     except Exception as exc:
         raise MideaACError("outcome_unknown", exit_code=2) from exc
     finally:
-        device.close_socket()
+        # A session that failed mid-command is never handed to the next caller.
+        if reusable:
+            SESSIONS.release(alias, device)
+        else:
+            device.close_socket()
 
 
 def safe_candidate(index: int, item: Mapping[str, Any], name: str | None = None) -> dict[str, Any]:
@@ -17,6 +17,9 @@ import time
 import urllib.error
 import urllib.request
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "bin"))
+import skill_http  # noqa: E402
+
 
 CONFIG_DIR = Path(os.environ.get("PETLIBRO_CONFIG_DIR", Path.home() / ".config" / "petlibro"))
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
@@ -43,6 +46,8 @@ DEFAULT_FEED_COOLDOWN_SECONDS = 300
 SCHEDULE_VERIFY_ATTEMPTS = 3
 SCHEDULE_VERIFY_INTERVAL_SECONDS = 1
 
+HTTP = skill_http.HTTPClient()
+
 DEVICE_SELECTORS = {
     "crosstown-feeder": ("device_crosstown_feeder", "feeder", "crosstown"),
     "crosstown-fountain": ("device_crosstown_fountain", "fountain", "crosstown"),
@@ -177,7 +182,7 @@ def api_post(endpoint: str, body: dict | None = None, token: str | None = None)
         headers=headers,
     )
     try:
-        with urllib.request.urlopen(request, timeout=15) as response:
+        with HTTP.open(request, timeout=15) as response:
             raw = response.read()
     except urllib.error.HTTPError as error:
         raise PetlibroError(
@@ -559,9 +564,17 @@ def read_feeding_schedule_state(token: str, device: dict) -> bool:
     return data["enableFeedingPlan"]
 
 
+def optional_schedule_state(token: str, device: dict) -> bool | None:
+    try:
+        return read_feeding_schedule_state(token, device)
+    except PetlibroError:
+        return None
+
+
 def cmd_status() -> list[dict]:
     config, token, devices = get_token_and_devices()
     output = []
+    schedule_reads = []
     for device in devices:
         kind = device_type(device)
         selector = alias_for_device(config, device) or "unmapped"
@@ -585,13 +598,7 @@ def cmd_status() -> list[dict]:
                 }
             )
             if item["online"] and selector != "unmapped":
-                try:
-                    schedule_enabled = read_feeding_schedule_state(token, device)
-                except PetlibroError:
-                    pass
-                else:
-                    item["scheduleEnabled"] = schedule_enabled
-                    item["scheduleState"] = "enabled" if schedule_enabled else "disabled"
+                schedule_reads.append((item, device))
         elif kind == "fountain":
             item.update(
                 {
@@ -604,6 +611,17 @@ def cmd_status() -> list[dict]:
                 }
             )
         output.append(item)
+    # Feeders' schedule states are independent reads; fetch them concurrently.
+    states = HTTP.gather(
+        *(
+            lambda device=device: optional_schedule_state(token, device)
+            for _, device in schedule_reads
+        )
+    )
+    for (item, _), schedule_enabled in zip(schedule_reads, states):
+        if schedule_enabled is not None:
+            item["scheduleEnabled"] = schedule_enabled
+            item["scheduleState"] = "enabled" if schedule_enabled else "disabled"
     return output
 
 
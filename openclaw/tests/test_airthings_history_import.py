@@ -72,6 +72,7 @@ class AirthingsHistoryImportTests(unittest.TestCase):
         history_path = self.history_dir / "2026-08-01.jsonl"
         original = json.dumps(existing) + "\n"
         history_path.write_text(original, encoding="utf-8")
+        before = sorted(path.name for path in self.history_dir.iterdir())
 
         merged, counts = history_import.prepare_import(
             history_import.load_export(self.csv_file), self.history_dir
@@ -82,6 +83,8 @@ class AirthingsHistoryImportTests(unittest.TestCase):
         self.assertEqual(len(merged["2026-08-01"]), 3)
         self.assertEqual(history_path.read_text(encoding="utf-8"), original)
         self.assertFalse(self.backup_root.exists())
+        # A dry run neither creates nor syncs the history index.
+        self.assertEqual(sorted(path.name for path in self.history_dir.iterdir()), before)
 
     def test_apply_requires_explicit_environment_gate(self) -> None:
         samples = history_import.load_export(self.csv_file)
@@ -145,9 +148,12 @@ class AirthingsHistoryImportTests(unittest.TestCase):
         self.assertEqual(len(records), 3)
         self.assertEqual(records, sorted(records, key=lambda item: item["timestamp"]))
 
-        second_merged, second_counts = history_import.prepare_import(
-            samples, self.history_dir
-        )
+        with mock.patch.object(
+            history_import, "_load_history_file", side_effect=AssertionError("rescanned")
+        ):
+            second_merged, second_counts = history_import.prepare_import(
+                samples, self.history_dir, indexed=True
+            )
         self.assertEqual(second_merged, {})
         self.assertEqual(second_counts["added"], 0)
         self.assertEqual(second_counts["duplicates"], 2)
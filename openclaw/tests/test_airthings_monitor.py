@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import os
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -134,7 +136,7 @@ class AirthingsConfigTests(unittest.TestCase):
     def test_refresh_returns_safe_offline_category(self) -> None:
         self.write_config()
 
-        async def unavailable(binding):
+        async def unavailable(binding, _timing):
             return airthings.offline_reading(binding, "bluetooth_unauthorized")
 
         with mock.patch.object(self.monitor, "_read_address", side_effect=unavailable):
@@ -145,6 +147,81 @@ class AirthingsConfigTests(unittest.TestCase):
         self.assertEqual(device["error"], "bluetooth_unauthorized")
         self.assertNotIn("address", device)
 
+    def test_refresh_scans_once_and_bounds_concurrent_reads(self) -> None:
+        devices = [
+            {"alias": f"sensor-{name}", "site": "cabin", "room": name.title(),
+             "model": "Wave Enhance", "address": f"addr-{name}"}
+            for name in ("den", "loft", "porch")
+        ]
+        self.config.write_text(json.dumps({"schema_version": 1, "devices": devices}))
+        self.config.chmod(0o600)
+        scanners = []
+        reads = {"active": 0, "peak": 0}
+
+        class FakeScanner:
+            def __init__(self, detection_callback) -> None:
+                self.detected = detection_callback
+                scanners.append(self)
+
+            async def __aenter__(self):
+                for address in ("ADDR-LOFT", "unrelated", "ADDR-DEN"):
+                    self.detected(SimpleNamespace(address=address), None)
+                return self
+
+            async def __aexit__(self, *_args) -> None:
+                return None
+
+        class FakeReader:
+            def __init__(self, _logger) -> None:
+                pass
+
+            async def update_device(self, device):
+                reads["active"] += 1
+                reads["peak"] = max(reads["peak"], reads["active"])
+                await asyncio.sleep(0.01)
+                reads["active"] -= 1
+                return SimpleNamespace(
+                    model=SimpleNamespace(product_name="Wave Enhance"),
+                    sensors={"temperature": 20, "co2": 600},
+                )
+
+        with mock.patch.dict(sys.modules, {
+            "bleak": SimpleNamespace(BleakScanner=FakeScanner),
+            "airthings_ble": SimpleNamespace(AirthingsBluetoothDeviceData=FakeReader),
+        }), mock.patch.object(airthings, "DEFAULT_SCAN_SECONDS", 0.05), mock.patch.object(
+            airthings, "MAX_CONCURRENT_READS", 1
+        ):
+            result = asyncio.run(self.monitor.status(None, True))
+
+        self.assertEqual(len(scanners), 1)
+        self.assertEqual(reads["peak"], 1)
+        den, loft, porch = result["devices"]
+        self.assertEqual((den["online"], loft["online"]), (True, True))
+        self.assertEqual(porch["error"], "device_not_found")
+        for device in (den, loft):
+            self.assertGreaterEqual(device["timing"]["read_ms"], 0)
+            self.assertLess(device["timing"]["scan_ms"], 50)
+        self.assertEqual(porch["timing"], {"scan_ms": 50, "read_ms": None})
+        self.assertNotIn("timing", self.monitor._load_cache()["sensor-den"])
+
+    def test_bluetooth_timeout_reports_how_far_the_read_got(self) -> None:
+        self.write_config()
+
+        async def stalled(binding, timing):
+            timing["scan_ms"] = 7
+            await asyncio.sleep(1)
+
+        with mock.patch.object(
+            self.monitor, "_read_address", side_effect=stalled
+        ), mock.patch.object(airthings, "DEFAULT_SCAN_SECONDS", -9.95):
+            result = asyncio.run(self.monitor.status(None, True))
+
+        device = result["devices"][0]
+        self.assertEqual(device["error"], "bluetooth_timeout")
+        self.assertEqual(device["timing"]["scan_ms"], 7)
+        self.assertIsNone(device["timing"]["read_ms"])
+        self.assertGreaterEqual(device["timing"]["elapsed_ms"], 0)
+
     def test_cache_only_never_touches_ble_when_cache_is_missing(self) -> None:
         self.write_config()
 
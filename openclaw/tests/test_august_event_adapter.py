@@ -72,9 +72,10 @@ if os.environ.get('FAKE_AUGUST_NO_STDOUT') != '1':
             self.home_eventctl,
             """#!/usr/bin/env python3
 import json, os, sys
-payload = json.load(sys.stdin)
+payloads = [json.loads(line) for line in sys.stdin if line.strip()]
 with open(os.environ['EVENTS_LOG'], 'a', encoding='utf-8') as handle:
-    handle.write(json.dumps({'args': sys.argv[1:], 'payload': payload}) + '\\n')
+    for payload in payloads:
+        handle.write(json.dumps({'args': sys.argv[1:], 'payload': payload}) + '\\n')
 raise SystemExit(0 if os.environ.get('FAKE_PUBLISH_FAIL') != '1' else 8)
 """,
         )
@@ -215,7 +216,7 @@ raise SystemExit(0 if os.environ.get('FAKE_PUBLISH_FAIL') != '1' else 8)
             {"lock.unlocked", "door.opened", "device.battery_low"},
         )
         for entry in published:
-            self.assertEqual(entry["args"], ["enqueue", "--source", "august"])
+            self.assertEqual(entry["args"], ["enqueue", "--source", "august", "--ndjson"])
             self.assertEqual(entry["payload"]["site"], "crosstown")
             self.assertNotIn("lockID", json.dumps(entry))
             BUS.normalize_input(
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Contract tests for the indexed climate-history store."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+climate_history_store = load_module(
+    "climate_history_store", BIN_DIR / "climate_history_store.py"
+)
+
+
+def record(timestamp: str, source: str = "airthings", room: str = "Living Room") -> dict:
+    return {
+        "timestamp": timestamp,
+        "rooms": [{"structure": "Philly", "room": room, "source": source}],
+    }
+
+
+class ClimateHistoryStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.history = Path(self.temporary.name)
+        self.store = climate_history_store.ClimateHistoryStore(self.history)
+
+    def append(self, day: str, *records: dict) -> Path:
+        path = self.history / f"{day}.jsonl"
+        with path.open("a", encoding="utf-8") as handle:
+            for item in records:
+                handle.write(json.dumps(item, sort_keys=True) + "\n")
+        return path
+
+    def test_sync_tails_appends_and_reindexes_replaced_days(self) -> None:
+        path = self.append("2026-08-01", record("2026-08-01T00:05:00Z"))
+        self.assertEqual(self.store.sync(), 1)
+        self.assertEqual(self.store.sync(), 0)
+        self.assertEqual(stat.S_IMODE(self.store.database.stat().st_mode), 0o600)
+
+        self.append("2026-08-01", record("2026-08-01T00:10:00Z", source="nest", room="Bedroom"))
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write('{"timestamp": "2026-08-01T00:15')
+        self.assertEqual(self.store.sync_day("2026-08-01"), 1)
+        self.assertTrue(
+            self.store.contains("2026-08-01", "nest", "2026-08-01T00:10:00Z", room="Bedroom")
+        )
+        self.assertFalse(
+            self.store.contains("2026-08-01", "nest", "2026-08-01T00:10:00Z", room="Living Room")
+        )
+        self.assertTrue(self.store.contains("2026-08-01", "airthings", "2026-08-01T00:05:00Z"))
+        self.assertFalse(self.store.contains("2026-08-02", "airthings", "2026-08-01T00:05:00Z"))
+
+        replacement = path.with_name(".replacement")
+        replacement.write_text(json.dumps(record("2026-08-01T01:00:00Z")) + "\n")
+        os.replace(replacement, path)
+        self.assertEqual(self.store.sync_day("2026-08-01"), 1)
+        self.assertFalse(self.store.contains("2026-08-01", "airthings", "2026-08-01T00:05:00Z"))
+        self.assertEqual(self.store.day_records("2026-08-01"), [record("2026-08-01T01:00:00Z")])
+
+        path.unlink()
+        self.store.sync_day("2026-08-01")
+        self.assertEqual(self.store.day_records("2026-08-01"), [])
+
+    def test_range_scans_and_export_merge_in_timestamp_order(self) -> None:
+        self.append(
+            "2026-08-01",
+            record("2026-08-01T23:00:00Z", source="nest"),
+            record("2026-08-01T12:00:00Z"),
+        )
+        self.append("2026-08-02", record("2026-08-01T20:00:00-04:00"))
+        self.store.sync()
+
+        start = climate_history_store._epoch("2026-08-01T12:00:00Z")
+        self.assertEqual(
+            [item["timestamp"] for item in self.store.records_between(start, start + 86400)],
+            ["2026-08-01T12:00:00Z", "2026-08-01T23:00:00Z", "2026-08-01T20:00:00-04:00"],
+        )
+
+        addition = record("2026-08-01T18:00:00Z")
+        self.assertEqual(
+            [item["timestamp"] for item in self.store.export_day("2026-08-01", [addition])],
+            ["2026-08-01T12:00:00Z", "2026-08-01T18:00:00Z", "2026-08-01T23:00:00Z"],
+        )
+        self.assertEqual(
+            self.store.existing_timestamps(
+                "2026-08-01",
+                "airthings",
+                ["2026-08-01T12:00:00Z", "2026-08-01T18:00:00Z"],
+                structure="Philly",
+                room="Living Room",
+            ),
+            {"2026-08-01T12:00:00Z"},
+        )
+
+    def test_invalid_history_line_is_reported_safely(self) -> None:
+        (self.history / "2026-08-01.jsonl").write_text("[1]\n", encoding="utf-8")
+        with self.assertRaises(climate_history_store.HistoryStoreError) as caught:
+            self.store.sync_day("2026-08-01")
+        self.assertEqual(caught.exception.code, "invalid_history_file")
+        self.assertEqual(self.store.day_records("2026-08-01"), [])
+
+    def test_linked_or_oversized_day_file_is_unsafe(self) -> None:
+        path = self.append("2026-08-01", record("2026-08-01T00:05:00Z"))
+        link = self.history / "linked"
+        os.link(path, link)
+        with self.assertRaises(climate_history_store.HistoryStoreError) as caught:
+            self.store.sync_day("2026-08-01")
+        self.assertEqual(caught.exception.code, "unsafe_history_file")
+
+        link.unlink()
+        with mock.patch.object(climate_history_store, "MAX_HISTORY_BYTES", 1):
+            with self.assertRaises(climate_history_store.HistoryStoreError) as caught:
+                self.store.sync_day("2026-08-01")
+        self.assertEqual(caught.exception.code, "unsafe_history_file")
+        self.assertEqual(self.store.day_records("2026-08-01"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
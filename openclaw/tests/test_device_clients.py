@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Contract tests for the home dashboard's in-process device clients."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+device_clients = load_module("device_clients", BIN_DIR / "device_clients.py")
+
+FAKE_PETLIBRO = textwrap.dedent(
+    """
+    import threading
+
+    LOADS = globals().setdefault("LOADS", [])
+    LOADS.append(1)
+    CALLS = []
+    # Cleared by tests to simulate a hung LAN or cloud call.
+    RESPONSIVE = threading.Event()
+    RESPONSIVE.set()
+
+
+    class PetlibroError(Exception):
+        def __init__(self, code, message):
+            super().__init__(message)
+            self.code = code
+            self.message = message
+
+        def payload(self):
+            return {"success": False, "error": self.code, "message": self.message}
+
+
+    def dispatch(argv):
+        CALLS.append(argv)
+        RESPONSIVE.wait(5)
+        if argv == ["status"]:
+            return [{"selector": "crosstown-feeder", "type": "feeder", "online": True}]
+        if argv[0] == "feed":
+            return {"device": argv[1], "portions": int(argv[2])}
+        if argv[0] == "boom":
+            raise RuntimeError("secret detail")
+        raise PetlibroError("unknown_command", "Unknown Petlibro command")
+    """
+)
+
+
+class DeviceClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.skills = Path(self.temporary.name)
+        (self.skills / "petlibro").mkdir()
+        (self.skills / "petlibro" / "petlibro-api.py").write_text(FAKE_PETLIBRO)
+        self.registry = device_clients.DeviceClientRegistry(self.skills)
+
+    def test_module_loads_once_and_mirrors_cli_json_contract(self) -> None:
+        self.assertEqual(
+            self.registry.call(["petlibro", "--json", "status"]),
+            (0, [{"selector": "crosstown-feeder", "type": "feeder", "online": True}]),
+        )
+        self.assertEqual(
+            self.registry.call(["petlibro", "feed", "crosstown-feeder", "2"]),
+            (0, {"device": "crosstown-feeder", "portions": 2}),
+        )
+        self.assertEqual(
+            self.registry.call(["petlibro", "nope"]),
+            (1, {"success": False, "error": "unknown_command",
+                 "message": "Unknown Petlibro command"}),
+        )
+        code, payload = self.registry.call(["petlibro", "boom"])
+        self.assertEqual((code, payload["error"]), (1, "internal_error"))
+        self.assertNotIn("secret", str(payload))
+
+        module = self.registry.get("petlibro").module()
+        self.assertEqual(len(module.LOADS), 1)
+        self.assertEqual(module.CALLS[0], ["status"])
+
+    def test_missing_modules_and_runtimes_are_unavailable(self) -> None:
+        (self.skills / "midea-ac" / "scripts").mkdir(parents=True)
+        (self.skills / "midea-ac" / "scripts" / "midea_ac.py").write_text("raise SystemExit")
+
+        for argv in (["litter-robot", "status"], ["midea-ac", "status"], ["hue", "status"], []):
+            with self.assertRaises(device_clients.ClientUnavailable):
+                self.registry.call(argv)
+        self.assertEqual(
+            self.registry.availability(),
+            {"petlibro": True, "litter-robot": False, "midea-ac": False},
+        )
+
+    def test_client_without_dispatch_cannot_be_constructed(self) -> None:
+        class Incomplete(device_clients.DeviceClient):
+            cli = "incomplete"
+
+        with self.assertRaises(TypeError):
+            Incomplete(self.skills)
+
+
+class DashboardDeviceClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        home = Path(self.temporary.name)
+        with mock.patch.dict(os.environ, {"HOME": str(home)}):
+            self.dashboard = load_module(
+                "home_dashboard_device_clients_test", BIN_DIR / "home-dashboard.py"
+            )
+        skills = home / ".openclaw" / "skills"
+        (skills / "petlibro").mkdir(parents=True)
+        (skills / "petlibro" / "petlibro-api.py").write_text(FAKE_PETLIBRO)
+        self.dashboard.DEVICE_CLIENTS = device_clients.DeviceClientRegistry(skills)
+
+    def test_collectors_and_commands_run_in_process_with_cli_fallback(self) -> None:
+        completed = subprocess.CompletedProcess(
+            [], 0, stdout='{"ok": true, "robots": []}', stderr=""
+        )
+        with mock.patch.object(
+            self.dashboard.subprocess, "run", return_value=completed
+        ) as run:
+            petlibro = self.dashboard.collect_petlibro()
+            code, response = self.dashboard.execute_command(
+                {"device": "petlibro", "action": "feed", "args": {"portions": 2}}
+            )
+            self.assertEqual(run.call_count, 0)
+            litter = self.dashboard.collect_litter_robot()
+
+        self.assertEqual(petlibro["data"][0]["selector"], "crosstown-feeder")
+        self.assertEqual(code, 200)
+        self.assertEqual(response["result"], {"device": "crosstown-feeder", "portions": 2})
+        self.assertEqual(litter, {"ok": True, "robots": []})
+        self.assertEqual(run.call_args.args[0], ["litter-robot", "--json", "status"])
+
+    def test_hung_client_call_times_out_like_the_cli(self) -> None:
+        module = self.dashboard.DEVICE_CLIENTS.get("petlibro").module()
+        module.RESPONSIVE.clear()
+        self.addCleanup(module.RESPONSIVE.set)
+        self.dashboard.COMMAND_TIMEOUT_SECONDS = 0.1
+
+        with mock.patch.object(self.dashboard.subprocess, "run") as run:
+            petlibro = self.dashboard.collect_petlibro()
+            code, response = self.dashboard.execute_command(
+                {"device": "petlibro", "action": "feed", "args": {"portions": 2}}
+            )
+
+        self.assertEqual(petlibro, {"error": "command timed out after 0.1s"})
+        self.assertEqual(code, 504)
+        self.assertEqual(
+            response, {"success": False, "error": "command timed out after 0.1s"}
+        )
+        run.assert_not_called()
+        with self.assertRaises(device_clients.ClientTimeout):
+            self.dashboard.DEVICE_CLIENTS.call(["petlibro", "status"], timeout=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
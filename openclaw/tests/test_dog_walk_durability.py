@@ -21,6 +21,7 @@ from unittest import mock
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 LISTENER_PATH = REPO_ROOT / "openclaw/skills/dog-walk/service-runtime.py"
+ROUTE_INDEX_PATH = REPO_ROOT / "openclaw/bin/route_index.py"
 
 
 def load_listener(fake_home: Path):
@@ -117,6 +118,28 @@ class DogWalkDurabilityTests(unittest.TestCase):
         self.assertEqual(json.loads(self.path.read_text()), original)
         self.assertEqual(list(self.path.parent.glob(f".{self.path.name}.*.tmp")), [])
 
+    def test_finalized_route_is_folded_into_the_dashboard_index(self) -> None:
+        self.write_route(points=[{"ts": self.started_at, "lat": 42.0, "lon": -71.0}])
+        spec = importlib.util.spec_from_file_location("route_index", ROUTE_INDEX_PATH)
+        assert spec and spec.loader
+        route_index = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(route_index)
+
+        with mock.patch.dict(sys.modules, {"route_index": route_index}):
+            self.module._finalize_walk_route(
+                self.walk_id, self.origin, self.started_at, "2026-07-05T12:40:00Z", "ring"
+            )
+
+        index = route_index.RouteIndex(self.module.ROUTES_DIR)
+        with mock.patch.object(
+            route_index.RouteIndex, "_index_file", side_effect=AssertionError("re-parsed")
+        ):
+            self.assertEqual(index.sync(), 0)
+        (summary,) = index.summaries(since=0, location=self.origin)
+        self.assertEqual(summary["walk_id"], self.walk_id)
+        self.assertEqual(summary["ended_at"], "2026-07-05T12:40:00Z")
+        self.assertEqual(index.route_path(self.walk_id), self.path)
+
     def test_all_route_mutators_use_the_locked_atomic_writer(self) -> None:
         mutators = [
             self.module._init_walk_route,
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Contract tests for the shared dashboard history index."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+history_index = load_module("history_index", BIN_DIR / "history_index.py")
+usage_dashboard = load_module("usage_dashboard", BIN_DIR / "usage-dashboard.py")
+roomba_dashboard = load_module("roomba_dashboard", BIN_DIR / "roomba-dashboard.py")
+
+DAY = "2026-07-12"
+
+
+def epoch(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class HistoryIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.root = Path(self.temporary.name)
+        self.path = self.root / f"{DAY}.jsonl"
+
+    def append(self, *lines) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            for line in lines:
+                handle.write(line if isinstance(line, str) else json.dumps(line) + "\n")
+
+    def test_records_filter_by_time_and_event_type_and_skip_invalid_lines(self) -> None:
+        self.append(
+            {"timestamp": "2026-07-12T10:00:00Z", "event_type": "departure"},
+            "not json\n",
+            "[1, 2]\n",
+            {"timestamp": "2026-07-12T10:30:00", "event_type": "dock"},
+            {"event_type": "dock"},
+            {"timestamp": "2026-07-12T11:00:00+00:00", "event_type": "dock"},
+        )
+        index = history_index.HistoryIndex(self.root)
+
+        since = epoch("2026-07-12T10:15:00Z")
+        self.assertEqual(
+            index.records([DAY], since=since),
+            [{"timestamp": "2026-07-12T11:00:00+00:00", "event_type": "dock"}],
+        )
+        self.assertEqual(
+            [record.get("timestamp") for record in index.records([DAY], event_types=["dock"])],
+            ["2026-07-12T10:30:00", None, "2026-07-12T11:00:00+00:00"],
+        )
+        self.assertEqual(index.records([DAY], since=epoch("2026-07-12T12:00:00Z")), [])
+        self.assertEqual(index.records(["2026-07-11"]), [])
+
+    def test_appends_are_indexed_incrementally_and_rewrites_rebuild(self) -> None:
+        self.append({"timestamp": "2026-07-12T10:00:00Z", "n": 1})
+        index = history_index.HistoryIndex(self.root)
+        self.assertEqual(len(index.records([DAY])), 1)
+
+        self.append({"timestamp": "2026-07-12T10:05:00Z", "n": 2}, '{"timestamp": "2026')
+        decode = history_index._decode
+        with mock.patch.object(history_index, "_decode", wraps=decode) as decoded:
+            self.assertEqual([r["n"] for r in index.records([DAY])], [1, 2])
+        # Only the appended complete line is parsed while indexing, then the
+        # two selected lines are decoded for the response.
+        self.assertEqual(decoded.call_count, 3)
+
+        self.append('-07-12T10:10:00Z", "n": 3}\n')
+        self.assertEqual([r["n"] for r in index.records([DAY])], [1, 2, 3])
+
+        replacement = self.root / "replacement.jsonl"
+        replacement.write_text(
+            json.dumps({"timestamp": "2026-07-12T09:00:00Z", "n": 9}) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(replacement, self.path)
+        self.assertEqual([r["n"] for r in index.records([DAY])], [9])
+
+        sidecar = json.loads((self.root / ".index" / f"{DAY}.json").read_text())
+        self.assertEqual(sidecar["size"], self.path.stat().st_size)
+        self.assertEqual(sidecar["min_ts"], epoch("2026-07-12T09:00:00Z"))
+
+    def test_persisted_sidecar_is_reused_without_reparsing(self) -> None:
+        self.append(
+            {"timestamp": "2026-07-12T10:00:00Z", "n": 1},
+            {"timestamp": "2026-07-12T11:00:00Z", "n": 2},
+        )
+        history_index.HistoryIndex(self.root).records([DAY])
+
+        fresh = history_index.HistoryIndex(self.root)
+        with mock.patch.object(fresh, "_build", side_effect=AssertionError("rebuilt")):
+            records = fresh.records([DAY], since=epoch("2026-07-12T10:30:00Z"))
+        self.assertEqual([r["n"] for r in records], [2])
+
+    def test_hourly_records_merge_dropped_activity_and_cron_jobs(self) -> None:
+        stamp = lambda minute: f"2026-07-12T10:{minute:02d}:00+00:00"
+        self.append(
+            {"timestamp": stamp(20), "activity": {"cron_runs": 2, "errors": 1},
+             "cron_jobs": [{"id": "b"}]},
+            {"timestamp": stamp(5), "activity": {"cron_runs": 1}},
+            {"timestamp": stamp(40), "activity": {}, "cron_jobs": [{"id": "c"}]},
+            {"timestamp": stamp(50), "activity": {"messages_sent": 4}},
+        )
+        index = history_index.HistoryIndex(
+            self.root,
+            hourly_sums={"activity": usage_dashboard.ACTIVITY_FIELDS},
+            hourly_lists=("cron_jobs",),
+        )
+
+        for _ in range(2):
+            records = index.hourly_records([DAY], since=epoch("2026-07-12T00:00:00Z"))
+
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]["timestamp"], stamp(5))
+            self.assertEqual(
+                records[0]["activity"],
+                {"agent_runs": 0, "messages_sent": 4, "messages_received": 0,
+                 "cron_runs": 3, "errors": 1, "gateway_restarts": 0},
+            )
+            self.assertEqual(records[0]["cron_jobs"], [{"id": "b"}, {"id": "c"}])
+
+        records = index.hourly_records([DAY], since=epoch(stamp(10)))
+        # The hour straddling the cutoff is rebuilt from its remaining lines.
+        self.assertEqual(records[0]["timestamp"], stamp(20))
+        self.assertEqual(records[0]["activity"]["messages_sent"], 4)
+        self.assertEqual(records[0]["activity"]["cron_runs"], 2)
+
+    def test_roomba_calendar_reads_only_run_events(self) -> None:
+        self.append(
+            {"timestamp": "2026-07-12T10:00:00Z", "event_type": "fi_gps"},
+            {"timestamp": "2026-07-12T10:01:00Z", "event_type": "departure",
+             "roombas": {"crosstown": {"last_command_result": {"success": True}}}},
+        )
+        original = roomba_dashboard.HISTORY_DIR
+        roomba_dashboard.HISTORY_DIR = str(self.root)
+        self.addCleanup(setattr, roomba_dashboard, "HISTORY_DIR", original)
+
+        data = roomba_dashboard.load_calendar_data(2026, 7)
+
+        self.assertEqual(
+            data["crosstown"]["12"],
+            [{"time": "2026-07-12T10:01:00Z", "trigger": "dog_walk",
+              "success": True, "skipped": None, "roombas": []}],
+        )
+        self.assertEqual(data["cabin"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
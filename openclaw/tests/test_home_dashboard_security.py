@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Fake-only security contract tests for the home control dashboard."""
+"""Fake-only security and refresh contract tests for the home control dashboard."""
 
 from __future__ import annotations
 
@@ -9,6 +9,7 @@ import json
 import os
 from pathlib import Path
 import tempfile
+import threading
 from types import SimpleNamespace
 import unittest
 from unittest.mock import patch
@@ -333,5 +334,235 @@ class HomeDashboardSecurityTests(unittest.TestCase):
         )
 
 
+class BlockingCollector:
+    def __init__(self, value) -> None:
+        self.value = value
+        self.calls = 0
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return {"value": self.value, "call": self.calls}
+
+
+class HomeDashboardRefreshTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.dashboard = load_dashboard(Path(self.tempdir.name))
+        self.collector = BlockingCollector("fresh")
+        self.collectors = {"lock": self.collector}
+        self.dashboard.COLLECTORS.clear()
+        self.dashboard.COLLECTORS.update(self.collectors)
+        self.scheduler = self.dashboard.CollectorScheduler(
+            self.collectors, jitter=lambda low, high: 0.0
+        )
+        self.addCleanup(self.scheduler._executor.shutdown, wait=True)
+        self.addCleanup(self.collector.release.set)
+        self.dashboard.SCHEDULER = self.scheduler
+
+    def test_stale_entry_is_served_with_age_while_one_revalidation_runs(self) -> None:
+        stale_at = self.dashboard.time.time() - 600
+        self.dashboard.STATUS_CACHE["lock"] = {"data": {"value": "old"}, "timestamp": stale_at}
+
+        first = self.dashboard.collect_status_bundle()
+        second = self.dashboard.collect_status_cached_fast()
+
+        self.assertTrue(self.collector.started.wait(5))
+        for payload in (first, second):
+            self.assertEqual(payload["lock"], {"value": "old"})
+            self.assertTrue(payload["cache"]["lock"]["stale"])
+            self.assertGreaterEqual(payload["meta"]["age_seconds"], 600)
+        self.assertEqual(second["meta"]["pending"], [])
+
+        harness = HandlerHarness(self.dashboard, path="/api/status")
+        harness.handler.do_GET()
+        self.assertEqual(harness.status, 200)
+        self.assertGreaterEqual(int(dict(harness.response_headers)["Age"]), 600)
+
+        self.collector.release.set()
+        data, _timestamp = self.scheduler.refresh("lock").result(5)
+        self.assertEqual(data, {"value": "fresh", "call": 1})
+        self.assertEqual(self.collector.calls, 1)
+        refreshed = self.dashboard.collect_status_cached_fast()
+        self.assertFalse(refreshed["cache"]["lock"]["stale"])
+
+    def test_collector_ttls_match_their_background_cadence(self) -> None:
+        dashboard = load_dashboard(Path(self.tempdir.name))
+        self.assertEqual(set(dashboard.COLLECTOR_TTL_SECONDS), set(dashboard.COLLECTORS))
+        for name, ttl in dashboard.COLLECTOR_TTL_SECONDS.items():
+            with self.subTest(name=name):
+                cadence = dashboard.COLLECTOR_REFRESH_SECONDS.get(
+                    name, dashboard.DEFAULT_REFRESH_SECONDS
+                )
+                self.assertLessEqual(ttl, cadence)
+
+        # A CLI entry younger than its cadence is fresh, so polls leave it.
+        recent = self.dashboard.time.time() - 120
+        self.dashboard.STATUS_CACHE["lock"] = {"data": {"value": "old"}, "timestamp": recent}
+        payload = self.dashboard.collect_status_cached_fast()
+        self.assertFalse(payload["cache"]["lock"]["stale"])
+        self.assertEqual(payload["cache"]["lock"]["ttl_seconds"], 300)
+        self.assertNotIn("lock", self.scheduler._inflight)
+        self.assertEqual(self.collector.calls, 0)
+
+    def test_concurrent_device_refreshes_share_one_in_flight_run(self) -> None:
+        harnesses = [HandlerHarness(self.dashboard, path="/api/status/lock") for _ in range(3)]
+        threads = [threading.Thread(target=h.handler.do_GET) for h in harnesses]
+        joined = threading.Semaphore(0)
+        refresh = self.scheduler.refresh
+
+        def counted_refresh(name):
+            future = refresh(name)
+            joined.release()
+            return future
+
+        with patch.object(self.scheduler, "refresh", side_effect=counted_refresh):
+            for thread in threads:
+                thread.start()
+            # Release the run only once every request has joined it.
+            for _ in threads:
+                self.assertTrue(joined.acquire(timeout=5))
+        self.collector.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.collector.calls, 1)
+        for harness in harnesses:
+            self.assertEqual(harness.status, 200)
+            self.assertEqual(json.loads(harness.body), {"value": "fresh", "call": 1})
+            self.assertIn("age", harness.header_names)
+
+    def test_background_cadence_skips_speakers_and_commands_discard_older_runs(self) -> None:
+        speaker = BlockingCollector("speaker")
+        speaker.release.set()
+        self.collector.release.set()
+        self.collectors["speakers"] = speaker
+        scheduler = self.dashboard.CollectorScheduler(
+            self.collectors, jitter=lambda low, high: high
+        )
+        self.addCleanup(scheduler._executor.shutdown, wait=True)
+
+        scheduler.refresh("speakers").result(5)
+        scheduler.refresh("lock").result(5)
+
+        self.assertEqual(set(scheduler._next_due), {"lock"})
+        delay = scheduler._next_due["lock"] - self.dashboard.STATUS_CACHE["lock"]["timestamp"]
+        cadence = self.dashboard.DEFAULT_REFRESH_SECONDS
+        self.assertAlmostEqual(
+            delay, cadence * (1 + self.dashboard.REFRESH_JITTER_FRACTION), delta=1
+        )
+
+        self.dashboard.STATUS_CACHE.clear()
+        with patch.object(scheduler, "_clock", side_effect=[100.0, 200.0, 300.0]):
+            future = scheduler.refresh("lock")
+            future.result(5)
+        self.assertEqual(self.dashboard.STATUS_CACHE["lock"]["timestamp"], 200.0)
+        # A run that started before a device command must not overwrite it.
+        with patch.object(scheduler, "_clock", side_effect=[400.0, 500.0, 600.0]):
+            scheduler._invalidated_at = 450.0
+            scheduler.refresh("lock").result(5)
+        self.assertEqual(self.dashboard.STATUS_CACHE["lock"]["timestamp"], 200.0)
+
+    def test_stale_speaker_entry_is_not_revalidated_by_status_polls(self) -> None:
+        speaker = BlockingCollector("speaker")
+        speaker.release.set()
+        self.collectors["speakers"] = speaker
+        self.dashboard.COLLECTORS["speakers"] = speaker
+        stale_at = self.dashboard.time.time() - 600
+        self.dashboard.STATUS_CACHE["speakers"] = {"data": {"value": "old"}, "timestamp": stale_at}
+        self.dashboard.STATUS_CACHE["lock"] = {
+            "data": {"value": "locked"}, "timestamp": self.dashboard.time.time()
+        }
+
+        fast = self.dashboard.collect_status_cached_fast()
+        bundle = self.dashboard.collect_status_bundle()
+
+        for payload in (fast, bundle):
+            self.assertEqual(payload["speakers"], {"value": "old"})
+            self.assertTrue(payload["cache"]["speakers"]["stale"])
+        self.assertEqual(speaker.calls, 0)
+        self.assertNotIn("speakers", self.scheduler._inflight)
+
+        explicit = HandlerHarness(self.dashboard, path="/api/status/speakers")
+        explicit.handler.do_GET()
+        self.assertEqual(json.loads(explicit.body), {"value": "speaker", "call": 1})
+
+    def store(self, value) -> None:
+        with self.dashboard.STATUS_CACHE_LOCK:
+            self.dashboard._store_status_locked(
+                "lock", {"value": value}, self.dashboard.time.time()
+            )
+
+    def test_bundle_etag_answers_not_modified_until_collector_data_changes(self) -> None:
+        self.store("locked")
+        first = HandlerHarness(self.dashboard, path="/api/status")
+        first.handler.do_GET()
+        etag = dict(first.response_headers)["ETag"]
+        self.assertEqual(json.loads(first.body)["meta"]["version"], etag[3:-1])
+
+        self.store("locked")
+        repeat = HandlerHarness(
+            self.dashboard, path="/api/status", headers={"If-None-Match": etag}
+        )
+        repeat.handler.do_GET()
+        self.assertEqual(repeat.status, 304)
+        self.assertEqual(repeat.body, b"")
+        self.assertEqual(dict(repeat.response_headers)["Cache-Control"], "no-store")
+
+        self.store("unlocked")
+        changed = HandlerHarness(
+            self.dashboard, path="/api/status", headers={"If-None-Match": etag}
+        )
+        changed.handler.do_GET()
+        self.assertEqual(changed.status, 200)
+        self.assertNotEqual(dict(changed.response_headers)["ETag"], etag)
+        self.assertEqual(json.loads(changed.body)["lock"], {"value": "unlocked"})
+
+    def test_event_stream_pushes_only_changed_collectors(self) -> None:
+        self.store("locked")
+        version = self.dashboard.STATUS_VERSION["value"]
+        token = self.dashboard._status_token(version)
+        self.dashboard.EVENT_STREAM_MAX_SECONDS = 0.5
+        self.dashboard.EVENT_HEARTBEAT_SECONDS = 0.1
+        stream = HandlerHarness(self.dashboard, path=f"/api/events?since={token}")
+        thread = threading.Thread(target=stream.handler.do_GET)
+        thread.start()
+        self.store("locked")
+        self.store("unlocked")
+        thread.join(5)
+
+        self.assertEqual(stream.status, 200)
+        self.assertEqual(dict(stream.response_headers)["Content-Type"], "text/event-stream")
+        events = [
+            block for block in stream.body.decode().split("\n\n")
+            if block.startswith("event: status")
+        ]
+        self.assertEqual(len(events), 1)
+        event_id, data = events[0].split("\n")[1:]
+        self.assertEqual(event_id, f"id: {self.dashboard._status_token(version + 1)}")
+        update = json.loads(data.removeprefix("data: "))
+        self.assertEqual(update["name"], "lock")
+        self.assertEqual(update["data"], {"value": "unlocked"})
+        self.assertIn(": keepalive", stream.body.decode())
+        self.assertEqual(self.dashboard.EVENT_STREAMS["open"], 0)
+
+        # A Last-Event-ID from another server boot resyncs every collector.
+        self.dashboard.EVENT_STREAM_MAX_SECONDS = 0.05
+        resync = HandlerHarness(
+            self.dashboard, path="/api/events", headers={"Last-Event-ID": "stale-99"}
+        )
+        resync.handler.do_GET()
+        self.assertIn('"value": "unlocked"', resync.body.decode())
+
+        self.dashboard.EVENT_STREAMS["open"] = self.dashboard.MAX_EVENT_STREAMS
+        refused = HandlerHarness(self.dashboard, path="/api/events")
+        refused.handler.do_GET()
+        self.assertEqual(refused.status, 503)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,7 @@ import stat
 import sys
 import tempfile
 import threading
+import time
 import unittest
 from unittest import mock
 
@@ -234,6 +235,7 @@ class RuntimeSecurityTests(HomeEventTestCase):
             self.paths.database,
             self.paths.ingest_lock,
             self.paths.delivery_lock,
+            self.paths.correlator_lock,
             self.paths.status,
         ):
             with self.subTest(path=path):
@@ -255,6 +257,69 @@ class RuntimeSecurityTests(HomeEventTestCase):
             }
         self.assertTrue(home_events.EXPECTED_TABLES.issubset(tables))
 
+    def test_persistent_store_reuses_one_writer_and_bounded_readers(self) -> None:
+        store = home_events.EventStore(
+            self.paths, clock=lambda: NOW, persistent=True
+        )
+        self.addCleanup(store.close)
+        with contextlib.closing(store.connect()) as writer:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute(
+                "INSERT INTO service_counters(name, value) VALUES ('uncommitted', 1)"
+            )
+        with contextlib.closing(store.connect()) as reused:
+            self.assertIs(reused, writer)
+            self.assertFalse(reused.in_transaction)
+            self.assertIsNone(
+                reused.execute(
+                    "SELECT value FROM service_counters WHERE name = 'uncommitted'"
+                ).fetchone()
+            )
+            self.assertEqual(reused.execute("PRAGMA synchronous").fetchone()[0], 2)
+
+        readers = [
+            store.connect(read_only=True)
+            for _ in range(home_events.READ_POOL_SIZE + 1)
+        ]
+        for reader in readers:
+            reader.close()
+        with contextlib.closing(store.connect(read_only=True)) as reader:
+            self.assertIn(reader, readers)
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM service_counters")
+        self.assertEqual(len(store._idle[True]), home_events.READ_POOL_SIZE)
+        store.status_snapshot()
+        store.recent(since="2026-07-12T00:00:00Z", limit=10)
+
+    def test_persistent_store_revalidates_database_identity_on_reuse(self) -> None:
+        store = home_events.EventStore(
+            self.paths, clock=lambda: NOW, persistent=True
+        )
+        self.addCleanup(store.close)
+        first = store.connect(read_only=True)
+        first.close()
+        os.chmod(self.paths.database, 0o644)
+        with self.assertRaisesRegex(home_events.ConfigError, "private_file_permissions"):
+            store.connect(read_only=True)
+        os.chmod(self.paths.database, 0o600)
+        second = store.connect(read_only=True)
+        self.addCleanup(second.close)
+        self.assertIsNot(second, first)
+
+        replacement = self.paths.state / "replacement.sqlite3"
+        with contextlib.closing(sqlite3.connect(self.paths.database)) as source:
+            with contextlib.closing(sqlite3.connect(replacement)) as target:
+                source.backup(target)
+        os.chmod(replacement, 0o600)
+        second.close()
+        os.replace(replacement, self.paths.database)
+        with contextlib.closing(store.connect(read_only=True)) as third:
+            self.assertIsNot(third, second)
+            self.assertEqual(
+                third.execute("SELECT COUNT(*) FROM runtime_status").fetchone()[0],
+                1,
+            )
+
     def test_insecure_directory_secret_and_database_symlink_fail_closed(self) -> None:
         os.chmod(self.paths.spool, 0o755)
         with self.assertRaisesRegex(home_events.ConfigError, "directory_permissions"):
@@ -649,7 +714,7 @@ class RuntimeSecurityTests(HomeEventTestCase):
         with self.connection() as connection:
             self.assertEqual(
                 connection.execute("SELECT version FROM schema_migrations").fetchone()[0],
-                5,
+                home_events.SCHEMA_VERSION,
             )
             self.assertEqual(
                 connection.execute(
@@ -760,6 +825,67 @@ class EnqueueValidationTests(HomeEventTestCase):
             if path.is_file() and not path.is_symlink():
                 self.assertNotIn(raw_id.encode(), path.read_bytes(), path)
 
+    def test_enqueue_many_validates_whole_batch_before_spooling(self) -> None:
+        first = ring_payload(source_event_id="batch-first")
+        invalid = ring_payload(source_event_id="batch-invalid")
+        invalid["raw_payload"] = {"account": "secret"}
+        with self.assertRaisesRegex(home_events.PayloadError, "invalid_event_fields"):
+            home_events.enqueue_many(
+                self.root, "ring", [encode(first), encode(invalid)], clock=lambda: NOW
+            )
+        self.assertEqual(list(self.paths.source_spool("ring").glob("*.ready")), [])
+        with self.assertRaisesRegex(home_events.PayloadError, "empty_batch"):
+            home_events.enqueue_many(self.root, "ring", [], clock=lambda: NOW)
+        with self.assertRaisesRegex(home_events.PayloadError, "batch_too_large"):
+            home_events.enqueue_many(
+                self.root,
+                "ring",
+                [encode(first)] * (home_events.MAX_ENQUEUE_BATCH + 1),
+                clock=lambda: NOW,
+            )
+
+        events = home_events.enqueue_many(
+            self.root,
+            "ring",
+            [encode(first), encode(ring_payload(source_event_id="batch-second"))],
+            clock=lambda: NOW,
+        )
+        self.assertEqual(len({event.event_uid for event in events}), 2)
+        self.assertEqual(len(list(self.paths.source_spool("ring").glob("*.ready"))), 2)
+        self.assertEqual(self.ingest().accepted, 2)
+
+    def test_operator_enqueue_accepts_ndjson_batch_in_one_invocation(self) -> None:
+        # The CLI stamps receipt with the wall clock, so the batch is current.
+        current = home_events.utc_now()
+        lines = []
+        for index in range(3):
+            value = august_payload(source_event_id=f"ndjson-{index}")
+            value["occurred_at"] = value["observed_at"] = current
+            value["attributes"]["not_before"] = value["attributes"]["not_after"] = current
+            lines.append(encode(value) + b"\n")
+        args = home_events.build_parser().parse_args(
+            [
+                "operator",
+                "--root",
+                str(self.root),
+                "enqueue",
+                "--source",
+                "august",
+                "--ndjson",
+            ]
+        )
+        with mock.patch.object(
+            home_events.sys,
+            "stdin",
+            io.TextIOWrapper(io.BytesIO(b"".join(lines))),
+        ):
+            result = home_events.run_operator(args)
+        self.assertEqual(result["status"], "enqueued")
+        self.assertEqual(len(result["event_uids"]), 3)
+        self.assertEqual(home_events.ingest_once(self.root).accepted, 3)
+        with self.assertRaisesRegex(home_events.PayloadError, "batch_too_large"):
+            home_events._split_ndjson(b"\n" * (home_events.MAX_ENQUEUE_BATCH_BYTES + 1))
+
     def test_schema_version_is_optional_but_unknown_fields_are_rejected(self) -> None:
         first = self.enqueue(ring_payload(schema=False))
         self.assertRegex(first.event_uid, r"^evt_")
@@ -1303,6 +1429,84 @@ class IngestDurabilityTests(HomeEventTestCase):
                 1,
             )
 
+    def test_batched_ingest_commits_each_batch_once_with_per_receipt_outcomes(
+        self,
+    ) -> None:
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="second"))
+        self.enqueue(august_payload(), source="august")
+        tampered = sorted(self.paths.source_spool("august").glob("*.ready"))[0]
+        tampered.write_text("{}", encoding="utf-8")
+        os.chmod(tampered, 0o600)
+        with mock.patch.object(
+            home_events.EventStore,
+            "ingest_batch",
+            autospec=True,
+            side_effect=home_events.EventStore.ingest_batch,
+        ) as ingest_batch:
+            result = home_events.ingest_once(
+                self.root,
+                batch_size=3,
+                clock=lambda: NOW,
+            )
+        self.assertEqual(
+            [len(call.args[1]) for call in ingest_batch.call_args_list],
+            [3, 1],
+        )
+        self.assertEqual(
+            result,
+            home_events.IngestResult(
+                scanned=4, accepted=2, duplicate=1, dead_letter=1
+            ),
+        )
+        with self.connection() as connection:
+            outcomes = sorted(
+                row[0] for row in connection.execute("SELECT outcome FROM producer_inbox")
+            )
+        self.assertEqual(outcomes, ["accepted", "accepted", "dead_letter", "duplicate"])
+        for source in ("ring", "august"):
+            self.assertEqual(list(self.paths.source_spool(source).glob("*.ready")), [])
+
+    def test_failed_batch_commit_rolls_back_and_keeps_every_spool_file(self) -> None:
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="second"))
+        original = home_events.EventStore._ingest_event_locked
+        calls = []
+
+        def fail_second(store, *args):
+            calls.append(args[1])
+            if len(calls) == 2:
+                raise sqlite3.OperationalError("disk I/O error")
+            return original(store, *args)
+
+        with mock.patch.object(
+            home_events.EventStore,
+            "_ingest_event_locked",
+            autospec=True,
+            side_effect=fail_second,
+        ):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.ingest()
+        with self.connection() as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM events").fetchone()[0], 0)
+            self.assertEqual(
+                connection.execute("SELECT COUNT(*) FROM producer_inbox").fetchone()[0],
+                0,
+            )
+        self.assertEqual(len(list(self.paths.source_spool("ring").glob("*.ready"))), 2)
+        self.assertEqual(self.ingest().accepted, 2)
+
+    def test_ingest_batch_size_is_bounded(self) -> None:
+        for batch_size in (0, 1001):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaisesRegex(
+                    home_events.PayloadError, "invalid_ingest_batch_size"
+                ):
+                    home_events.ingest_once(
+                        self.root, batch_size=batch_size, clock=lambda: NOW
+                    )
+
     def test_tampered_spool_becomes_metadata_only_dead_letter(self) -> None:
         event = self.enqueue(ring_payload())
         path = next(self.paths.source_spool("ring").glob("*.ready"))
@@ -1346,6 +1550,139 @@ class IngestDurabilityTests(HomeEventTestCase):
         self.assertEqual(len(list(self.paths.source_spool("ring").glob("*.ready"))), 1)
         self.assertEqual(self.store.status_snapshot()["counts"]["spool_ready"], 1)
 
+    def test_ingest_publishes_enqueue_to_event_row_latency_counters(self) -> None:
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="second"))
+        self.enqueue(august_payload(), source="august")
+        tampered = next(self.paths.source_spool("august").glob("*.ready"))
+        tampered.write_text("{}", encoding="utf-8")
+        os.chmod(tampered, 0o600)
+        committed_events = []
+        observe = home_events._IngestLatency.observe
+
+        def observe_after_commit(latency, queued_at_ns):
+            with self.connection() as connection:
+                committed_events.append(
+                    connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+                )
+            return observe(latency, queued_at_ns)
+
+        with mock.patch.object(
+            home_events._IngestLatency, "observe", observe_after_commit
+        ):
+            self.ingest()
+        # Sampled once the batch committed; the duplicate and dead letter
+        # produced no events row and are not counted.
+        self.assertEqual(committed_events, [2])
+        counters = self.store.status_snapshot()["counters"]
+        self.assertEqual(counters["ingest_latency_samples"], 2)
+        for name in (
+            "ingest_latency_p50_ms",
+            "ingest_latency_p95_ms",
+            "ingest_latency_p99_ms",
+        ):
+            with self.subTest(name=name):
+                self.assertGreaterEqual(counters[name], 0)
+                self.assertLessEqual(counters[name], counters["ingest_latency_max_ms"])
+
+    def test_watch_ingest_wakes_on_rename_and_holds_ingest_lock(self) -> None:
+        self.enqueue(ring_payload(source_event_id="already-queued"))
+        started = threading.Event()
+        real_watcher = home_events._spool_watcher
+        watchers = []
+
+        def watcher_factory(directories):
+            watcher = real_watcher(directories)
+            watchers.append(watcher)
+            return watcher
+
+        def enqueue_later() -> None:
+            started.wait(5)
+            self.enqueue(ring_payload(source_event_id="arrives-while-watching"))
+
+        producer = threading.Thread(target=enqueue_later)
+        producer.start()
+        self.addCleanup(producer.join)
+        original_drain = home_events._drain_spool
+
+        def drain(*args, **kwargs):
+            result = original_drain(*args, **kwargs)
+            started.set()
+            return result
+
+        with mock.patch.object(home_events, "_drain_spool", side_effect=drain):
+            with mock.patch.object(
+                home_events, "_spool_watcher", side_effect=watcher_factory
+            ):
+                result = home_events.watch_ingest(
+                    self.root,
+                    rescan_seconds=30,
+                    max_seconds=1.5,
+                    clock=lambda: NOW,
+                )
+        # The rescan interval exceeds the run, so only a notification can
+        # have delivered the second file.
+        self.assertNotIsInstance(watchers[0], home_events._PollingSpoolWatcher)
+        self.assertEqual(result.accepted, 2)
+        self.assertEqual(list(self.paths.source_spool("ring").glob("*.ready")), [])
+        self.assertEqual(
+            self.store.status_snapshot()["counters"]["ingest_latency_samples"], 2
+        )
+
+    def test_watch_ingest_refuses_to_run_beside_another_ingester(self) -> None:
+        descriptor = os.open(self.paths.ingest_lock, os.O_RDWR)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            with self.assertRaisesRegex(home_events.StateError, "ingester_busy"):
+                home_events.watch_ingest(self.root, max_seconds=0.1, clock=lambda: NOW)
+        finally:
+            fcntl.flock(descriptor, fcntl.LOCK_UN)
+            os.close(descriptor)
+
+    def test_polling_fallback_rescans_spool(self) -> None:
+        with mock.patch.object(
+            home_events,
+            "_spool_watcher",
+            side_effect=home_events._PollingSpoolWatcher,
+        ):
+            self.enqueue(ring_payload())
+            result = home_events.watch_ingest(
+                self.root,
+                rescan_seconds=0.05,
+                max_seconds=0.2,
+                clock=lambda: NOW,
+            )
+        self.assertEqual(result.accepted, 1)
+
+    def test_ingest_once_watch_flag_runs_the_watcher_with_its_limit(self) -> None:
+        for index in range(3):
+            self.enqueue(ring_payload(source_event_id=f"watched-{index}"))
+        args = home_events.build_parser().parse_args(
+            [
+                "operator",
+                "--root",
+                str(self.root),
+                "ingest-once",
+                "--watch",
+                "--limit",
+                "2",
+                "--max-seconds",
+                "0.1",
+            ]
+        )
+        original_drain = home_events._drain_spool
+        limits = []
+
+        def drain(*args, **kwargs):
+            limits.append(kwargs["limit"])
+            return original_drain(*args, **kwargs)
+
+        with mock.patch.object(home_events, "_drain_spool", side_effect=drain):
+            result = home_events.run_operator(args)
+        self.assertEqual(result["accepted"], 3)
+        self.assertEqual(limits[:2], [2, 2])
+
     def test_status_projection_failure_does_not_undo_database_commit(self) -> None:
         self.enqueue(ring_payload())
         with mock.patch.object(home_events, "_atomic_write", side_effect=OSError("full")):
@@ -1458,6 +1795,70 @@ class ConsumerAndQueryTests(HomeEventTestCase):
         )
         self.assertEqual(empty["events"], [])
 
+    def test_tail_streams_id_ordered_recent_projection_from_cursor(self) -> None:
+        self.enqueue(august_payload(), source="august")
+        self.ingest()
+        recent = self.store.recent(since="2026-07-12T00:00:00Z", limit=20)
+
+        first = self.store.tail(after_id=0, limit=1)
+        self.assertEqual(len(first["events"]), 1)
+        rest = self.store.tail(after_id=first["next_after_id"])
+        records = first["events"] + rest["events"]
+        self.assertEqual([record["id"] for record in records], sorted(
+            record["id"] for record in records
+        ))
+        self.assertEqual(
+            {record["event_uid"]: {k: v for k, v in record.items() if k != "id"}
+             for record in records},
+            {event["event_uid"]: event for event in recent["events"]},
+        )
+        self.assertNotIn("dedupe_key", json.dumps(records))
+        self.assertEqual(
+            self.store.tail(after_id=rest["next_after_id"]),
+            {"schema_version": 1, "events": [], "next_after_id": rest["next_after_id"]},
+        )
+        for cursor in (-1, True, "1"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaisesRegex(home_events.PayloadError, "invalid_cursor"):
+                    self.store.tail(after_id=cursor)
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            code = home_events.main(
+                ["operator", "--root", str(self.root), "tail", "--after-id", "0"]
+            )
+        self.assertEqual(code, 0)
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(lines, records)
+
+    def test_tail_follow_yields_events_committed_after_it_started(self) -> None:
+        start = self.store.tail(after_id=0)["next_after_id"]
+        sleeps = []
+
+        def ingest_between_polls(delay: float) -> None:
+            sleeps.append(delay)
+            if len(sleeps) == 1:
+                self.enqueue(august_payload(), source="august")
+                self.ingest()
+            time.sleep(0.01)
+
+        records = list(
+            home_events.follow_events(
+                self.root,
+                after_id=start,
+                follow=True,
+                poll_seconds=0.05,
+                max_seconds=0.3,
+                sleep=ingest_between_polls,
+            )
+        )
+        self.assertEqual(len(records), 1)
+        self.assertGreater(records[0]["id"], start)
+        self.assertEqual(records[0]["source"], "august")
+        self.assertTrue(all(0 < delay <= 0.05 for delay in sleeps))
+        with self.assertRaisesRegex(home_events.PayloadError, "invalid_poll_interval"):
+            list(home_events.follow_events(self.root, poll_seconds=0))
+
     def test_incident_list_and_explain_return_structured_evidence(self) -> None:
         with self.connection() as connection:
             event_id = connection.execute("SELECT id FROM events").fetchone()[0]
@@ -1507,6 +1908,114 @@ class ConsumerAndQueryTests(HomeEventTestCase):
             self.store.explain("inc_" + ("b" * 32))
 
 
+class MaterializedCountTests(HomeEventTestCase):
+    def assert_counts_consistent(self) -> None:
+        report = self.store.verify_counters()
+        self.assertEqual(report["drift"], {})
+        self.assertTrue(report["consistent"])
+
+    def test_counts_follow_every_transition_without_table_scans(self) -> None:
+        self.enqueue(ring_payload(source_event_id="first"))
+        self.enqueue(ring_payload(source_event_id="second"))
+        self.ingest()
+        self.assert_counts_consistent()
+        claimed = self.store.claim_deliveries("correlator", limit=2)
+        first, second = claimed["deliveries"]
+        self.store.acknowledge_delivery(
+            "correlator", first["delivery_id"], claimed["lease_token"]
+        )
+        self.store.dead_letter_delivery(
+            "correlator",
+            second["delivery_id"],
+            claimed["lease_token"],
+            "correlation_failed",
+        )
+        self.assert_counts_consistent()
+
+        statements = []
+        real_connect = home_events.EventStore.connect
+
+        def traced(store, *, read_only=False):
+            connection = real_connect(store, read_only=read_only)
+            connection.set_trace_callback(statements.append)
+            return connection
+
+        with mock.patch.object(home_events.EventStore, "connect", traced):
+            status = self.store.status_snapshot()
+        self.assertEqual(status["counts"]["events"], 2)
+        self.assertEqual(status["counts"]["pending_deliveries"], 0)
+        self.assertEqual(status["counts"]["dead_letters"], 1)
+        self.assertEqual(status["consumers"]["correlator"]["dead_letter"], 1)
+        self.assertFalse(
+            [
+                statement
+                for statement in statements
+                if "COUNT(*) FROM events" in statement
+                or "COUNT(*) FROM consumer_deliveries" in statement
+            ]
+        )
+
+        with self.connection() as connection:
+            connection.execute(
+                "UPDATE consumer_deliveries SET updated_at = '2026-01-01T00:00:00Z'"
+            )
+            connection.execute("UPDATE events SET created_at = '2026-01-01T00:00:00Z'")
+        self.store.prune(checkpoint=False)
+        self.assert_counts_consistent()
+        self.assertEqual(self.store.status_snapshot()["counts"]["events"], 0)
+
+    def test_verify_counters_reports_and_repairs_drift(self) -> None:
+        self.enqueue(ring_payload())
+        self.ingest()
+        with self.connection() as connection:
+            connection.execute("UPDATE status_counts SET value = 7 WHERE name = 'events'")
+            connection.execute("DELETE FROM status_counts WHERE name = 'deliveries:pending'")
+
+        report = self.store.verify_counters()
+        self.assertFalse(report["consistent"])
+        self.assertFalse(report["repaired"])
+        self.assertEqual(
+            report["drift"],
+            {
+                "deliveries:pending": {"stored": 0, "actual": 1},
+                "events": {"stored": 7, "actual": 1},
+            },
+        )
+        self.assertEqual(self.store.verify_counters()["drift"], report["drift"])
+
+        repaired = self.store.verify_counters(repair=True)
+        self.assertTrue(repaired["repaired"])
+        self.assert_counts_consistent()
+        status = self.store.status_snapshot()
+        self.assertEqual(status["counts"]["events"], 1)
+        self.assertEqual(status["counters"]["status_count_repairs"], 1)
+
+    def test_v5_database_backfills_counts_and_installs_triggers(self) -> None:
+        self.enqueue(ring_payload())
+        self.ingest()
+        with self.connection() as connection:
+            for name in home_events.STATUS_COUNT_TRIGGERS:
+                connection.execute("DROP TRIGGER " + name)
+            connection.execute("DROP TABLE status_counts")
+            connection.execute("UPDATE schema_migrations SET version = 5")
+        with self.assertRaisesRegex(home_events.ConfigError, "database_schema"):
+            self.store.check_schema()
+
+        self.store.initialize()
+
+        self.assert_counts_consistent()
+        self.assertEqual(self.store.status_snapshot()["counts"]["events"], 1)
+        self.enqueue(ring_payload(source_event_id="after-migration"))
+        self.ingest()
+        self.assertEqual(self.store.status_snapshot()["counts"]["events"], 2)
+
+    def test_missing_trigger_fails_schema_check_closed(self) -> None:
+        with self.connection() as connection:
+            connection.execute("DROP TRIGGER status_counts_events_0_insert")
+        with self.assertRaisesRegex(home_events.ConfigError, "database_schema"):
+            self.store.check_schema()
+
+
 class RetentionAndCliTests(HomeEventTestCase):
     def test_automatic_prune_is_daily_restart_durable_and_internal(self) -> None:
         self.ingest()
@@ -1651,6 +2160,113 @@ class RetentionAndCliTests(HomeEventTestCase):
         self.assertEqual(deleted["events"], 1)
         self.assertEqual(deleted["producer_inbox"], 1)
 
+    def age_acknowledged_events(self, count: int) -> None:
+        for index in range(count):
+            self.enqueue(ring_payload(source_event_id="ring-prune-%d" % index))
+        self.ingest()
+        old = "2026-05-01T00:00:00Z"
+        with self.connection() as connection:
+            connection.execute("UPDATE events SET created_at = ?", (old,))
+            connection.execute("UPDATE producer_inbox SET received_at = ?", (old,))
+            connection.execute(
+                """
+                UPDATE consumer_deliveries SET status='acknowledged', updated_at=?,
+                    lease_token=NULL, lease_until=NULL
+                """,
+                (old,),
+            )
+
+    def test_budgeted_automatic_prune_resumes_in_bounded_batches(self) -> None:
+        self.age_acknowledged_events(5)
+        due = home_events.EventStore(
+            self.paths,
+            clock=lambda: "2026-07-13T15:00:00Z",
+        )
+        with mock.patch.multiple(
+            home_events,
+            PRUNE_BATCH_SIZE=2,
+            PRUNE_BUDGET_SECONDS=0,
+            PRUNE_BATCH_PAUSE_SECONDS=0,
+        ):
+            runs = 0
+            remaining = [5]
+            while due.prune_if_due(checkpoint=False):
+                runs += 1
+                self.assertLess(runs, 50)
+                with self.connection() as connection:
+                    remaining.append(
+                        connection.execute(
+                            "SELECT COUNT(*) FROM consumer_deliveries"
+                        ).fetchone()[0]
+                    )
+                self.assertLessEqual(remaining[-2] - remaining[-1], 2)
+
+        # One step or one two-row batch per run: 6 steps, 3+3+3 batches.
+        self.assertGreaterEqual(runs, 9)
+        status = due.status_snapshot()
+        counters = status["counters"]
+        self.assertEqual(counters["prune_runs"], 2)
+        self.assertEqual(counters["prune_incomplete_runs"], runs - 1)
+        self.assertIn("prune_last_rows_per_second", counters)
+        self.assertIn("prune_last_max_lock_hold_ms", counters)
+        self.assertNotIn(home_events.MAINTENANCE_PRUNE_RESUME_STEP, counters)
+        self.assertEqual(status["counts"]["events"], 0)
+        self.assertTrue(due.verify_counters()["consistent"])
+        with self.connection() as connection:
+            self.assertEqual(
+                connection.execute("SELECT COUNT(*) FROM producer_inbox").fetchone()[0],
+                0,
+            )
+            self.assertIsNone(
+                connection.execute(
+                    "SELECT value FROM service_counters WHERE name = ?",
+                    (home_events.MAINTENANCE_PRUNE_RESUME_STEP,),
+                ).fetchone()
+            )
+
+    def test_forced_prune_commits_each_batch_and_finishes(self) -> None:
+        self.age_acknowledged_events(5)
+        commits = []
+        real_connect = home_events.EventStore.connect
+
+        def traced(store, *, read_only=False):
+            connection = real_connect(store, read_only=read_only)
+            connection.set_trace_callback(
+                lambda statement: commits.append(statement)
+                if statement.startswith("BEGIN IMMEDIATE")
+                else None
+            )
+            return connection
+
+        with mock.patch.multiple(
+            home_events, PRUNE_BATCH_SIZE=2, PRUNE_BATCH_PAUSE_SECONDS=0
+        ), mock.patch.object(home_events.EventStore, "connect", traced):
+            deleted = self.store.prune(checkpoint=False)
+        self.assertEqual(deleted["consumer_deliveries"], 5)
+        self.assertEqual(deleted["events"], 5)
+        self.assertEqual(deleted["producer_inbox"], 5)
+        self.assertGreaterEqual(len(commits), 9)
+        counters = self.store.status_snapshot()["counters"]
+        self.assertEqual(counters["prune_runs"], 2)
+        self.assertNotIn("prune_incomplete_runs", counters)
+
+    def test_forced_prune_ignores_interrupted_automatic_resume_step(self) -> None:
+        self.age_acknowledged_events(3)
+        with self.connection() as connection:
+            # An automatic run stopped before its last (producer_inbox) step.
+            connection.execute(
+                "INSERT INTO service_counters(name, value) VALUES (?, 5)",
+                (home_events.MAINTENANCE_PRUNE_RESUME_STEP,),
+            )
+        deleted = self.store.prune(checkpoint=False)
+        self.assertEqual(deleted["consumer_deliveries"], 3)
+        self.assertEqual(deleted["events"], 3)
+        self.assertEqual(deleted["producer_inbox"], 3)
+        self.assertNotIn(
+            home_events.MAINTENANCE_PRUNE_RESUME_STEP,
+            self.store.status_snapshot()["counters"],
+        )
+
     def test_reserved_notification_retains_resolved_incident(self) -> None:
         old = "2026-01-01T00:00:00Z"
         with self.connection() as connection:
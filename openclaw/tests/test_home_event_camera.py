@@ -11,6 +11,7 @@ from pathlib import Path
 import sqlite3
 import sys
 import tempfile
+import threading
 import unittest
 from unittest import mock
 
@@ -41,6 +42,7 @@ class FakeCommands:
         self.decisions = list(decisions or [])
         self.failures = set(failures or set())
         self.captures: list[tuple[str, str, str]] = []
+        self.analyses = 0
 
     def capture(
         self,
@@ -59,6 +61,7 @@ class FakeCommands:
             os.close(descriptor)
 
     def analyze(self, _path: Path) -> camera.VisionDecision:
+        self.analyses += 1
         return self.decisions.pop(0)
 
 
@@ -223,7 +226,7 @@ class HomeEventCameraTests(unittest.TestCase):
         row = self.row(row_id)
         self.assertEqual(row["state"], "complete")
         self.assertEqual(row["result"], "person_visible")
-        self.assertEqual(
+        self.assertCountEqual(
             commands.captures,
             [
                 ("ring", "cabin", "front_door"),
@@ -248,7 +251,7 @@ class HomeEventCameraTests(unittest.TestCase):
         result = self.worker(commands).run_once()
 
         self.assertEqual(result["outcome"], "clear")
-        self.assertEqual(
+        self.assertCountEqual(
             commands.captures,
             [
                 ("ring", "cabin", "driveway"),
@@ -361,7 +364,7 @@ class HomeEventCameraTests(unittest.TestCase):
 
         self.assertEqual(first["outcome"], "clear")
         self.assertEqual(second["outcome"], "cancelled")
-        self.assertEqual(
+        self.assertCountEqual(
             commands.captures,
             [
                 ("ring", "cabin", "front_door"),
@@ -396,7 +399,7 @@ class HomeEventCameraTests(unittest.TestCase):
         self.assertEqual(status["camera"]["health"], "ok")
         self.assertEqual(status["counters"]["camera_evaluations_cancelled"], 1)
 
-    def test_presence_is_rechecked_between_provider_captures(self) -> None:
+    def test_presence_is_rechecked_before_any_frame_is_analyzed(self) -> None:
         row_id = self.insert_evaluation()
         test_case = self
 
@@ -418,16 +421,58 @@ class HomeEventCameraTests(unittest.TestCase):
         result = self.worker(commands).run_once()
 
         self.assertEqual(result["outcome"], "cancelled")
-        self.assertEqual(
-            commands.captures,
-            [("ring", "cabin", "front_door")],
-        )
+        self.assertEqual(commands.analyses, 0)
         row = self.row(row_id)
         self.assertEqual(row["state"], "complete")
         self.assertEqual(row["result"], "unavailable")
         self.assertEqual(row["error_code"], "presence_not_vacant")
         self.assertEqual(list(self.paths.camera_images.iterdir()), [])
 
+    def test_slot_targets_run_concurrently_and_publish_stage_timings(self) -> None:
+        row_id = self.insert_evaluation()
+        # Each capture waits for the other; a sequential slot would break it.
+        barrier = threading.Barrier(2, timeout=5)
+
+        class RendezvousCommands(FakeCommands):
+            def capture(
+                self,
+                provider: str,
+                site: str,
+                alias: str,
+                path: Path,
+            ) -> None:
+                barrier.wait()
+                super().capture(provider, site, alias, path)
+
+        commands = RendezvousCommands(
+            [
+                camera.VisionDecision(True, "high"),
+                camera.VisionDecision(False, "high"),
+            ]
+        )
+
+        result = self.worker(commands).run_once()
+
+        self.assertEqual(result["outcome"], "person")
+        self.assertEqual(self.row(row_id)["snapshot_30_result"], "person")
+        self.assertEqual(commands.analyses, 2)
+        status = self.store.status_snapshot()
+        timings = status["camera"]["timings"]
+        self.assertEqual(
+            {stage: timings[stage]["count"] for stage in timings},
+            {"capture": 2, "analysis": 2, "slot": 1},
+        )
+        for stage, histogram in timings.items():
+            with self.subTest(stage=stage):
+                self.assertEqual(histogram["le_ms"]["inf"], histogram["count"])
+                self.assertEqual(
+                    list(histogram["le_ms"]),
+                    [str(bound) for bound in bus.CAMERA_TIMING_BUCKETS_MS] + ["inf"],
+                )
+        self.assertFalse(
+            any(name.startswith("camera_timing_") for name in status["counters"])
+        )
+
     def test_invalid_active_policy_degrades_camera_health(self) -> None:
         self.paths.delivery_policy.write_text("{}\n", encoding="utf-8")
         self.paths.delivery_policy.chmod(0o600)
@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+import fcntl
 import importlib.util
 import json
+import os
 import sqlite3
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -1182,5 +1185,74 @@ class HomeEventCorrelatorTests(unittest.TestCase):
         self.assertEqual(len(self.rows("SELECT * FROM incidents")), 1)
 
 
+class IndexedCorrelatorTests(HomeEventCorrelatorTests):
+    """Replay every scenario through one long-lived, daemon-indexed correlator."""
+
+    def run_correlator(self):
+        if not hasattr(self, "daemon"):
+            self.daemon = correlator.ShadowCorrelator(
+                self.root, self.presence, clock=self.clock
+            )
+            self.daemon.index = correlator.IncidentIndex()
+            self.daemon._presence_cache = {}
+        return self.daemon._run_cycle(limit=correlator.CLAIM_LIMIT)
+
+    def test_daemon_grows_claims_through_a_burst_and_stops_at_deadline(self) -> None:
+        for sequence in range(45):
+            self.enqueue(
+                "ring",
+                "entry.person_detected",
+                site=("cabin", "crosstown")[sequence % 2],
+                sequence=str(sequence),
+            )
+        self.ingest()
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            time.sleep(0.01)
+
+        result = correlator.ShadowCorrelator(
+            self.root, self.presence, clock=self.clock
+        ).run_daemon(poll_seconds=0.5, max_seconds=0.2, sleep=sleep)
+
+        self.assertEqual(result["outcome"], "stopped")
+        self.assertEqual(result["claimed"], 45)
+        self.assertEqual(result["acknowledged"], 45)
+        self.assertEqual(result["max_claim_limit"], 40)
+        self.assertTrue(sleeps)
+        self.assertTrue(all(seconds == 0.5 for seconds in sleeps))
+        self.assertEqual(
+            [
+                (row["site"], row["state"])
+                for row in self.rows("SELECT site, state FROM incidents ORDER BY id")
+            ],
+            [("cabin", "open"), ("crosstown", "open")],
+        )
+        with self.assertRaisesRegex(correlator.CorrelatorError, "invalid_poll_interval"):
+            correlator.ShadowCorrelator(
+                self.root, self.presence, clock=self.clock
+            ).run_daemon(poll_seconds=0)
+
+    def test_held_correlator_lock_makes_other_runs_report_busy(self) -> None:
+        self.enqueue("ring", "entry.person_detected")
+        self.ingest()
+        descriptor = os.open(self.root / "state" / "correlator.lock", os.O_RDWR)
+        self.addCleanup(os.close, descriptor)
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        instance = correlator.ShadowCorrelator(
+            self.root, self.presence, clock=self.clock
+        )
+
+        self.assertEqual(instance.run_once(), {"ok": True, "outcome": "busy"})
+        self.assertEqual(
+            instance.run_daemon(max_seconds=0.1), {"ok": True, "outcome": "busy"}
+        )
+        self.assertEqual(self.rows("SELECT * FROM incidents"), [])
+
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
+        self.assertEqual(instance.run_once()["acknowledged"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Query-plan regression tests for the home-event SQLite schema.
+
+Every statement the bus, correlator, delivery worker, and camera worker issue
+during a representative run is captured through the connection trace hook and
+re-run under ``EXPLAIN QUERY PLAN``.  A full scan of a table that grows with
+history fails the suite; only singleton/configuration tables and partial
+indexes may be scanned.  ``verify-counters`` is a deliberate full recount and
+is not part of the workload.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import json
+from pathlib import Path
+import re
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+bus = load_module("home_event_bus", BIN_DIR / "home_event_bus.py")
+correlator = load_module(
+    "home_event_correlator", BIN_DIR / "home-event-correlator.py"
+)
+delivery = load_module(
+    "home_event_delivery", BIN_DIR / "home-event-delivery.py"
+)
+camera = load_module("home_event_camera", BIN_DIR / "home-event-camera.py")
+
+# Singleton and configuration tables whose size does not grow with history.
+BOUNDED_TABLES = frozenset(
+    {
+        "schema_migrations",
+        "sqlite_master",
+        "status_counts",
+        "service_counters",
+        "consumers",
+        "producer_state",
+        "runtime_status",
+        "delivery_runtime",
+        "camera_runtime",
+    }
+)
+DATA_STATEMENT_RE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.I)
+SCAN_RE = re.compile(
+    r"^SCAN (?!CONSTANT ROW)(\w+)(?: USING (?:COVERING )?INDEX (\w+))?"
+)
+POLICY = {
+    "schema_version": 1,
+    "active": True,
+    "sites": ["cabin", "crosstown"],
+    "incident_classes": [
+        "person_activity",
+        "access_activity",
+        "person_and_access",
+    ],
+    "recipient_routes": ["dylan"],
+    "arrival_grace_seconds": 900,
+    "cooldown_seconds": 3600,
+    "reservation_ttl_seconds": 300,
+    "unresolved_access_escalation_seconds": 1800,
+    "camera_enabled": False,
+}
+
+
+def payload(
+    source: str,
+    event_type: str,
+    *,
+    site: str,
+    sequence: str,
+    attributes: dict,
+    entity_kind: str,
+    precision: str,
+) -> bytes:
+    return json.dumps(
+        {
+            "source_event_id": f"plan-{source}-{event_type}-{site}-{sequence}",
+            "event_type": event_type,
+            "site": site,
+            "entity_kind": entity_kind,
+            "entity_alias": "kitchen" if source == "nest" else "front_door",
+            "occurred_at": "2026-07-12T14:58:00Z",
+            "observed_at": "2026-07-12T14:58:00Z",
+            "time_precision": precision,
+            "attributes": attributes,
+        }
+    ).encode("utf-8")
+
+
+class FakeCommands:
+    def capture(self, *_args, **_kwargs):
+        raise AssertionError("no camera evaluation is pending")
+
+
+class QueryPlanTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.root = Path(self.temporary.name) / "home-events"
+        self.presence = Path(self.temporary.name) / "presence.json"
+        self.now = "2026-07-12T15:00:00Z"
+        self.clock = lambda: self.now
+        self.store = bus.initialize_runtime(self.root, clock=self.clock)
+        self.paths = bus.RuntimePaths(self.root)
+        self.write_presence()
+        environment = mock.patch.dict(
+            delivery.os.environ,
+            {"OPENCLAW_GATEWAY_TOKEN": "test-gateway-token"},
+            clear=False,
+        )
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def write_presence(self) -> None:
+        self.presence.write_text(
+            json.dumps(
+                {
+                    "timestamp": self.now,
+                    "cabin": {"occupancy": "confirmed_vacant", "fresh": True},
+                    "crosstown": {"occupancy": "confirmed_vacant", "fresh": True},
+                }
+            ),
+            encoding="utf-8",
+        )
+        self.presence.chmod(0o600)
+
+    def enqueue_fixture_events(self, sequence: str) -> None:
+        for site in ("cabin", "crosstown"):
+            bus.enqueue_event(
+                self.root,
+                "ring",
+                payload(
+                    "ring",
+                    "entry.person_detected",
+                    site=site,
+                    sequence=sequence,
+                    attributes={"classification": "person"},
+                    entity_kind="doorbell",
+                    precision="source",
+                ),
+                clock=self.clock,
+            )
+        bus.enqueue_event(
+            self.root,
+            "august",
+            payload(
+                "august",
+                "lock.unlocked",
+                site="crosstown",
+                sequence=sequence,
+                attributes={
+                    "previous": "locked",
+                    "current": "unlocked",
+                    "not_before": "2026-07-12T14:55:00Z",
+                    "not_after": "2026-07-12T14:58:00Z",
+                },
+                entity_kind="lock",
+                precision="observed_interval",
+            ),
+            clock=self.clock,
+        )
+        bus.enqueue_event(
+            self.root,
+            "nest",
+            payload(
+                "nest",
+                "camera.person_detected",
+                site="cabin",
+                sequence=sequence,
+                attributes={"classification": "person"},
+                entity_kind="camera",
+                precision="source",
+            ),
+            clock=self.clock,
+        )
+
+    def run_workload(self) -> list[str]:
+        statements: list[str] = []
+        real_connect = bus.EventStore.connect
+
+        def traced(store, *, read_only=False):
+            connection = real_connect(store, read_only=read_only)
+            connection.set_trace_callback(statements.append)
+            return connection
+
+        with mock.patch.object(bus.EventStore, "connect", traced):
+            bus.install_delivery_policy(
+                self.paths, json.dumps(POLICY).encode("utf-8")
+            )
+            self.store.set_runtime_mode("limited_delivery")
+            delivery.DeliveryWorker(
+                self.root, self.presence, "chat_id:171", clock=self.clock
+            ).run_once()
+            camera.CameraWorker(
+                self.root,
+                presence_state=self.presence,
+                clock=self.clock,
+                commands=FakeCommands(),
+            ).run_once()
+
+            self.enqueue_fixture_events("1")
+            bus.ingest_once(self.root, clock=self.clock)
+            shadow = correlator.ShadowCorrelator(
+                self.root, self.presence, clock=self.clock
+            )
+            shadow.run_once()
+            self.now = "2026-07-12T15:16:00Z"
+            self.write_presence()
+            shadow.run_once()
+            self.enqueue_fixture_events("2")
+            bus.ingest_once(self.root, clock=self.clock)
+            correlator.ShadowCorrelator(
+                self.root, self.presence, clock=self.clock
+            ).run_daemon(max_seconds=0.05, sleep=lambda _seconds: None)
+            self.now = "2026-07-12T16:00:00Z"
+            self.write_presence()
+            shadow.run_once()
+
+            status = self.store.status_snapshot()
+            self.store.recent(since="2026-07-12T00:00:00Z", limit=20)
+            self.store.recent(
+                since="2026-07-12T00:00:00Z",
+                limit=20,
+                site="cabin",
+                event_type="entry.person_detected",
+            )
+            self.store.tail(after_id=0)
+            listed = self.store.incidents(since="2026-07-12T00:00:00Z", state="all")
+            for incident in listed["incidents"]:
+                self.store.explain(incident["incident_uid"])
+            self.store.review_access_attention()
+            self.store.review_delivery_attention("received")
+            self.now = "2026-09-30T00:00:00Z"
+            self.store.prune_if_due()
+            self.store.prune(checkpoint=False)
+        self.assertGreater(status["counts"]["events"], 0)
+        self.assertTrue(listed["incidents"])
+        return statements
+
+    def plan_scans(self, connection: sqlite3.Connection, statement: str) -> list[str]:
+        partial = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql LIKE '% WHERE %'"
+            )
+        }
+        scans = []
+        for row in connection.execute("EXPLAIN QUERY PLAN " + statement):
+            match = SCAN_RE.match(row[3])
+            if match is None or match.group(1) in BOUNDED_TABLES:
+                continue
+            if match.group(2) in partial:
+                continue
+            scans.append(row[3])
+        return scans
+
+    def test_every_production_query_avoids_full_scans_of_growing_tables(self) -> None:
+        statements = self.run_workload()
+        explained = 0
+        failures = {}
+        with contextlib.closing(sqlite3.connect(self.paths.database)) as connection:
+            for statement in dict.fromkeys(statements):
+                if not DATA_STATEMENT_RE.match(statement):
+                    continue
+                explained += 1
+                scans = self.plan_scans(connection, statement)
+                if scans:
+                    failures[" ".join(statement.split())] = scans
+        self.assertGreater(explained, 50)
+        self.assertEqual(failures, {})
+
+    def test_named_hot_paths_use_access_path_indexes(self) -> None:
+        cases = {
+            """
+            SELECT * FROM incidents
+            WHERE site = 'cabin' AND category = 'activity' AND state = 'open'
+            ORDER BY id DESC LIMIT 1
+            """: "incidents_open_category_site_idx",
+            """
+            SELECT d.id FROM consumer_deliveries d
+            JOIN events e ON e.id = d.event_id
+            WHERE d.consumer_name = 'correlator'
+              AND d.status IN ('pending', 'leased')
+              AND (
+                d.status = 'pending'
+                OR (d.status = 'leased' AND d.lease_until < '2026-07-12T15:00:00Z')
+              )
+            ORDER BY e.observed_at, e.id, d.id
+            LIMIT 20
+            """: "deliveries_consumer_status_idx",
+            "SELECT 1 FROM notification_outbox WHERE incident_id = 1 LIMIT 1": (
+                "notification_incident_idx"
+            ),
+        }
+        with contextlib.closing(sqlite3.connect(self.paths.database)) as connection:
+            for statement, index in cases.items():
+                with self.subTest(index=index):
+                    details = " ".join(
+                        row[3]
+                        for row in connection.execute("EXPLAIN QUERY PLAN " + statement)
+                    )
+                    self.assertIn("INDEX " + index, details)
+
+    def test_v6_database_gains_indexes_and_missing_index_fails_closed(self) -> None:
+        with contextlib.closing(sqlite3.connect(self.paths.database)) as connection:
+            for name in bus.ACCESS_PATH_INDEXES:
+                connection.execute("DROP INDEX " + name)
+            connection.execute("UPDATE schema_migrations SET version = 6")
+            connection.commit()
+        with self.assertRaisesRegex(bus.ConfigError, "database_schema"):
+            self.store.check_schema()
+
+        self.store.initialize()
+
+        with contextlib.closing(sqlite3.connect(self.paths.database)) as connection:
+            self.assertEqual(
+                connection.execute("SELECT version FROM schema_migrations").fetchall(),
+                [(bus.SCHEMA_VERSION,)],
+            )
+            indexes = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            self.assertTrue(set(bus.ACCESS_PATH_INDEXES).issubset(indexes))
+            connection.execute("DROP INDEX notification_incident_idx")
+            connection.commit()
+        with self.assertRaisesRegex(bus.ConfigError, "database_schema"):
+            self.store.check_schema()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import importlib.util
 import json
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -143,6 +144,110 @@ class MideaACTest(unittest.TestCase):
         self.assertEqual([device["device_id"] for device in devices], [1, 2])
         self.assertEqual(discover.call_count, 3)
 
+    def discovered(self, ip_address="192.0.2.10"):
+        return {
+            "device_id": 123456789,
+            "type": 0xAC,
+            "ip_address": ip_address,
+            "port": 6444,
+            "protocol": 3,
+            "model": "00000Q13",
+            "sn": "serial",
+        }
+
+    def fake_device(self):
+        device = unittest.mock.Mock()
+        device.attributes = {"power": True, "mode": 2, "target_temperature": 22.0}
+        return device
+
+    def test_status_reuses_cached_discovery_until_connect_fails(self):
+        self.write_config()
+        device = self.fake_device()
+        discover = unittest.mock.Mock(
+            side_effect=[[self.discovered()], [self.discovered("192.0.2.20")]]
+        )
+        refresh = unittest.mock.Mock(
+            side_effect=[device, device, midea_ac.MideaACError("device_unavailable"), device]
+        )
+        with patch.object(midea_ac, "discover_local", discover), patch.object(
+            midea_ac, "refresh_device", refresh
+        ), patch.object(midea_ac, "SESSIONS", midea_ac.SessionPool()):
+            self.assertTrue(midea_ac.collect_status()[0]["online"])
+            self.assertTrue(midea_ac.collect_status("cabin-bedroom")[0]["online"])
+            self.assertEqual(discover.call_count, 1)
+            cache = self.private / "discovery.json"
+            self.assertEqual(cache.stat().st_mode & 0o777, 0o600)
+            self.assertNotIn("token", cache.read_text())
+
+            # The cached address stopped answering: drop it and rediscover once.
+            self.assertTrue(midea_ac.collect_status()[0]["online"])
+        self.assertEqual(discover.call_count, 2)
+        self.assertEqual(
+            [call.args[1]["ip_address"] for call in refresh.call_args_list],
+            ["192.0.2.10", "192.0.2.10", "192.0.2.10", "192.0.2.20"],
+        )
+        self.assertEqual(
+            midea_ac.load_discovery_cache()["123456789"]["ip_address"], "192.0.2.20"
+        )
+        self.assertEqual(device.close_socket.call_count, 3)
+
+    def test_expired_discovery_entry_triggers_a_new_broadcast(self):
+        self.write_config()
+        discover = unittest.mock.Mock(return_value=[self.discovered()])
+        with patch.object(midea_ac, "discover_local", discover), patch.object(
+            midea_ac, "refresh_device", return_value=self.fake_device()
+        ):
+            midea_ac.collect_status()
+            with patch.object(
+                midea_ac.time, "time",
+                return_value=time.time() + midea_ac.DISCOVERY_TTL_SECONDS + 1,
+            ):
+                midea_ac.collect_status()
+        self.assertEqual(discover.call_count, 2)
+
+    def test_enabled_session_pool_keeps_one_connection_between_calls(self):
+        self.write_config()
+        device = self.fake_device()
+        sessions = midea_ac.SessionPool()
+        sessions.enable()
+        refresh = unittest.mock.Mock(return_value=device)
+        with patch.object(
+            midea_ac, "discover_local", return_value=[self.discovered()]
+        ), patch.object(midea_ac, "refresh_device", refresh), patch.object(
+            midea_ac, "SESSIONS", sessions
+        ):
+            midea_ac.collect_status()
+            result, code = midea_ac.send_control("on", "cabin-bedroom")
+            self.assertEqual((code, result["changed"]), (0, False))
+
+            device.refresh_status.side_effect = OSError("socket closed")
+            replacement = self.fake_device()
+            refresh.return_value = replacement
+            self.assertTrue(midea_ac.collect_status()[0]["online"])
+
+        self.assertEqual(refresh.call_count, 2)
+        device.close_socket.assert_called_once_with()
+        replacement.close_socket.assert_not_called()
+        sessions.close()
+        replacement.close_socket.assert_called_once_with()
+
+    def test_session_pool_sweeps_idle_sessions_on_each_access(self):
+        sessions = midea_ac.SessionPool(idle_seconds=360)
+        sessions.enable()
+        bedroom, kitchen = self.fake_device(), self.fake_device()
+        with patch.object(midea_ac.time, "monotonic", return_value=1000.0):
+            sessions.release("cabin-bedroom", bedroom)
+        # A poll on the dashboard's jittered five-minute cadence reuses it.
+        with patch.object(midea_ac.time, "monotonic", return_value=1330.0):
+            self.assertIs(sessions.take("cabin-bedroom"), bedroom)
+            sessions.release("cabin-bedroom", bedroom)
+        with patch.object(midea_ac.time, "monotonic", return_value=1700.0):
+            sessions.release("cabin-kitchen", kitchen)
+        bedroom.close_socket.assert_called_once_with()
+        with patch.object(midea_ac.time, "monotonic", return_value=1701.0):
+            self.assertIsNone(sessions.take("cabin-bedroom"))
+        kitchen.close_socket.assert_not_called()
+
     def test_cli_rejects_temperature_outside_safe_range_before_network(self):
         with patch.object(midea_ac, "send_control") as send:
             code = midea_ac.main(["temperature", "cabin-bedroom", "55", "--json"])
@@ -12,6 +12,7 @@ from pathlib import Path
 import sqlite3
 import sys
 import tempfile
+import threading
 import types
 import unittest
 from unittest import mock
@@ -964,6 +965,174 @@ class AckBoundaryTests(NestEventTestCase):
         )
 
 
+class GroupCommitTests(NestEventTestCase):
+    def test_group_commits_once_and_isolates_each_delivery(self) -> None:
+        store = self.store()
+        commits = []
+        real_connect = store._connect
+
+        def traced():
+            connection = real_connect()
+            connection.set_trace_callback(
+                lambda statement: commits.append(statement)
+                if statement.strip().upper() == "COMMIT"
+                else None
+            )
+            return connection
+
+        store._connect = traced
+        results = store.record_deliveries(
+            [
+                (event_payload(top_event_id="group-top-1"), "group-1", None),
+                (b"not-json", "group-2", None),
+                (event_payload(top_event_id="group-top-3"), "", None),
+                (event_payload(top_event_id="group-top-1"), "group-1", None),
+            ]
+        )
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(
+            [getattr(result, "outcome", None) for result in results],
+            ["accepted", "invalid", None, "duplicate_message"],
+        )
+        self.assertIsInstance(results[2], nest_events.PayloadError)
+        with sqlite3.connect(store.db_path) as connection:
+            self.assertEqual(
+                connection.execute("SELECT COUNT(*) FROM inbox").fetchone()[0], 2
+            )
+            self.assertEqual(
+                connection.execute(
+                    "SELECT value FROM service_counters WHERE name = 'deliveries_total'"
+                ).fetchone()[0],
+                3,
+            )
+
+    def test_failed_delivery_rolls_back_only_its_savepoint(self) -> None:
+        store = self.store()
+        real_record = store._record_valid_envelope
+
+        def flaky(connection, envelope, *args):
+            if envelope.event_id == "group-top-bad":
+                connection.execute(
+                    "UPDATE service_counters SET value = 999 "
+                    "WHERE name = 'deliveries_total'"
+                )
+                raise sqlite3.IntegrityError("simulated")
+            return real_record(connection, envelope, *args)
+
+        store._record_valid_envelope = flaky
+        results = store.record_deliveries(
+            [
+                (event_payload(top_event_id="group-top-bad"), "bad", None),
+                (event_payload(top_event_id="group-top-good"), "good", None),
+            ]
+        )
+
+        self.assertIsInstance(results[0], sqlite3.IntegrityError)
+        self.assertEqual(results[1].outcome, "accepted")
+        with sqlite3.connect(store.db_path) as connection:
+            self.assertEqual(
+                connection.execute(
+                    "SELECT value FROM service_counters WHERE name = 'deliveries_total'"
+                ).fetchone()[0],
+                1,
+            )
+
+    def test_processor_acks_group_only_after_one_durable_commit(self) -> None:
+        calls: list[str] = []
+        lock = threading.Lock()
+
+        class Store:
+            fail = False
+
+            def record_deliveries(self, deliveries):
+                with lock:
+                    calls.append(
+                        "commit:" + ",".join(sorted(item[1] for item in deliveries))
+                    )
+                if self.fail:
+                    raise sqlite3.OperationalError("disk I/O error")
+                return [
+                    nest_events.ProcessResult("accepted", 1, 0, "Kitchen", "Cabin")
+                    for _item in deliveries
+                ]
+
+            def mark_runtime_error(self, code):
+                with lock:
+                    calls.append(f"error:{code}")
+
+        class Message:
+            data = b"{}"
+            publish_time = None
+
+            def __init__(self, message_id):
+                self.message_id = message_id
+
+            def ack(self):
+                with lock:
+                    assert calls and calls[0].startswith("commit:")
+                    calls.append("ack:" + self.message_id)
+
+            def nack(self):
+                with lock:
+                    calls.append("nack:" + self.message_id)
+
+        for fail in (False, True):
+            with self.subTest(fail=fail):
+                calls.clear()
+                store = Store()
+                store.fail = fail
+                processor = nest_events.GroupCommitMessageProcessor(
+                    store, window_seconds=5, max_messages=3
+                )
+                threads = [
+                    threading.Thread(target=processor, args=(Message(f"m{index}"),))
+                    for index in range(3)
+                ]
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join(timeout=10)
+                self.assertEqual(calls[0], "commit:m0,m1,m2")
+                settled = "nack:" if fail else "ack:"
+                self.assertEqual(
+                    sorted(call for call in calls if call.startswith(settled)),
+                    ["%sm0" % settled, "%sm1" % settled, "%sm2" % settled],
+                )
+                self.assertEqual(
+                    calls.count("error:durable_commit_failed"), 3 if fail else 0
+                )
+
+    def test_prune_and_status_projection_are_rate_limited(self) -> None:
+        store = nest_events.StateStore(
+            self.settings,
+            clock=lambda: "2026-07-11T19:00:00Z",
+            prune_interval_seconds=300,
+            status_interval_seconds=300,
+        )
+        prunes = []
+        real_prune = store._prune
+        store._prune = lambda connection, now: (
+            prunes.append(now),
+            real_prune(connection, now),
+        )
+        writes = []
+        store.write_status = lambda: writes.append("status")
+
+        for index in range(3):
+            store.record_delivery(
+                event_payload(top_event_id=f"rate-top-{index}"), f"rate-{index}"
+            )
+
+        self.assertEqual(prunes, [])
+        self.assertEqual(writes, ["status"])
+        self.assertIsNotNone(store._status_timer)
+        store._status_timer.cancel()
+        store._flush_status()
+        self.assertEqual(writes, ["status", "status"])
+
+
 class StreamingRuntimeTests(NestEventTestCase):
     def test_household_flow_control_is_explicit_and_passed_to_subscribe(self) -> None:
         class FlowControl:
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import tempfile
 import unittest
@@ -71,6 +72,17 @@ class NestHistoryAppendTests(unittest.TestCase):
         self.assertEqual(json.loads(second.stdout)["outcome"], "duplicate")
         daily = self.history / "2026-08-10.jsonl"
         self.assertEqual(len(daily.read_text().splitlines()), 1)
+        # Answered by the history index, kept private beside the day files.
+        index = self.history / ".climate-history.sqlite3"
+        self.assertEqual(index.stat().st_mode & 0o777, 0o600)
+        other_room = self.run_append(record, *args[:-1], "Bedroom")
+        self.assertEqual(json.loads(other_room.stdout)["outcome"], "appended")
+
+        # The index applies the appender's file checks before answering.
+        os.link(daily, self.history / "linked.jsonl")
+        linked = self.run_append(record, *args)
+        self.assertNotEqual(linked.returncode, 0)
+        self.assertEqual(json.loads(linked.stderr)["error"], "unsafe_history_file")
 
     def test_concurrent_writers_preserve_every_complete_record(self) -> None:
         records = [
@@ -117,8 +117,8 @@ class PetlibroTests(unittest.TestCase):
             active_patch.start()
             self.addCleanup(active_patch.stop)
         network_guard = patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=AssertionError("unexpected live Petlibro request"),
         )
         network_guard.start()
@@ -227,8 +227,8 @@ class PetlibroTests(unittest.TestCase):
         for response, expected_error in failures:
             with self.subTest(expected_error=expected_error):
                 with patch.object(
-                    petlibro_api.urllib.request,
-                    "urlopen",
+                    petlibro_api.HTTP,
+                    "open",
                     side_effect=response if isinstance(response, Exception) else None,
                     return_value=None if isinstance(response, Exception) else response,
                 ):
@@ -242,8 +242,8 @@ class PetlibroTests(unittest.TestCase):
         self.token_file.write_bytes(original)
         self.token_file.chmod(0o600)
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             return_value=FakeResponse({"code": 7, "message": "bad credentials"}),
         ):
             code, payload = self.run_main(["devices"])
@@ -259,8 +259,8 @@ class PetlibroTests(unittest.TestCase):
             self.device_list_response(),
         ]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ):
             code, payload = self.run_main(["devices"])
@@ -278,8 +278,8 @@ class PetlibroTests(unittest.TestCase):
             FakeResponse({"code": 0}),
         ]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ) as urlopen:
             code, payload = self.run_main(["feed", "crosstown-feeder", "2"])
@@ -322,7 +322,7 @@ class PetlibroTests(unittest.TestCase):
     def test_portions_are_bounded_before_any_network_call(self) -> None:
         for value in ("0", "4", "1.5", "lots"):
             with self.subTest(value=value):
-                with patch.object(petlibro_api.urllib.request, "urlopen") as urlopen:
+                with patch.object(petlibro_api.HTTP, "open") as urlopen:
                     code, payload = self.run_main(["feed", "crosstown-feeder", value])
                 self.assertEqual(code, 1)
                 self.assertEqual(payload["error"], "invalid_portions")
@@ -330,8 +330,8 @@ class PetlibroTests(unittest.TestCase):
 
     def test_status_includes_verified_schedule_state_for_online_mapped_feeders(self) -> None:
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=[self.device_list_response(), self.schedule_state_response(False)],
         ) as urlopen:
             code, payload = self.run_main(["status"])
@@ -357,8 +357,8 @@ class PetlibroTests(unittest.TestCase):
             self.schedule_state_response(False),
         ]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ) as urlopen:
             code, payload = self.run_main(["schedule-set", "crosstown-feeder", "off"])
@@ -387,8 +387,8 @@ class PetlibroTests(unittest.TestCase):
 
     def test_schedule_set_same_state_is_verified_without_mutation(self) -> None:
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=[self.device_list_response(), self.schedule_state_response(False)],
         ) as urlopen:
             code, payload = self.run_main(["schedule-set", "crosstown-feeder", "off"])
@@ -402,7 +402,7 @@ class PetlibroTests(unittest.TestCase):
     def test_schedule_state_is_validated_before_network(self) -> None:
         for state_value in ("pause", "OFF", "1"):
             with self.subTest(state=state_value), patch.object(
-                petlibro_api.urllib.request, "urlopen"
+                petlibro_api.HTTP, "open"
             ) as urlopen:
                 code, payload = self.run_main(
                     ["schedule-set", "crosstown-feeder", state_value]
@@ -418,8 +418,8 @@ class PetlibroTests(unittest.TestCase):
             urllib.error.URLError("lost"),
         ]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ) as urlopen:
             code, payload = self.run_main(["schedule-set", "crosstown-feeder", "off"])
@@ -442,8 +442,8 @@ class PetlibroTests(unittest.TestCase):
             self.schedule_state_response(True),
         ]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ) as urlopen, patch.object(petlibro_api.time, "sleep"):
             code, payload = self.run_main(["schedule-set", "crosstown-feeder", "off"])
@@ -463,8 +463,8 @@ class PetlibroTests(unittest.TestCase):
     def test_manual_feed_cooldown_blocks_duplicate_before_second_feed_call(self) -> None:
         first_responses = [self.device_list_response(), FakeResponse({"code": 0})]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=first_responses,
         ):
             first_code, first_payload = self.run_main(
@@ -474,8 +474,8 @@ class PetlibroTests(unittest.TestCase):
         self.assertTrue(first_payload["request_id"])
 
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             return_value=self.device_list_response(),
         ) as second_urlopen:
             second_code, second_payload = self.run_main(
@@ -491,8 +491,8 @@ class PetlibroTests(unittest.TestCase):
 
     def test_cooldown_follows_physical_feeder_not_alias(self) -> None:
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=[self.device_list_response(), FakeResponse({"code": 0})],
         ):
             first_code, _ = self.run_main(["feed", "crosstown-feeder", "1"])
@@ -505,8 +505,8 @@ class PetlibroTests(unittest.TestCase):
         self.config_file.write_text(config_text, encoding="utf-8")
         self.config_file.chmod(0o600)
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             return_value=self.device_list_response(),
         ) as urlopen:
             code, payload = self.run_main(["feed", "cabin-feeder", "1"])
@@ -518,8 +518,8 @@ class PetlibroTests(unittest.TestCase):
     def test_ambiguous_feed_failure_is_recorded_and_not_retryable(self) -> None:
         responses = [self.device_list_response(), urllib.error.URLError("lost")]
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             side_effect=responses,
         ):
             code, payload = self.run_main(["feed", "crosstown-feeder", "1"])
@@ -534,8 +534,8 @@ class PetlibroTests(unittest.TestCase):
         self.assertEqual(feed_record["status"], "unknown")
 
         with patch.object(
-            petlibro_api.urllib.request,
-            "urlopen",
+            petlibro_api.HTTP,
+            "open",
             return_value=self.device_list_response(),
         ) as retry_urlopen:
             retry_code, retry_payload = self.run_main(
@@ -546,7 +546,7 @@ class PetlibroTests(unittest.TestCase):
         self.assertEqual(retry_urlopen.call_count, 1)
 
     def test_raw_api_command_is_not_agent_facing(self) -> None:
-        with patch.object(petlibro_api.urllib.request, "urlopen") as urlopen:
+        with patch.object(petlibro_api.HTTP, "open") as urlopen:
             code, payload = self.run_main(["raw", "/device/device/manualFeeding"])
         self.assertEqual(code, 1)
         self.assertEqual(payload["error"], "unknown_command")
@@ -47,10 +47,11 @@ class PresenceLocalEventAdapterTests(TestCase):
 import json
 import os
 import sys
-assert sys.argv[1:] == ["enqueue", "--source", "presence"]
-event = json.load(sys.stdin)
+assert sys.argv[1:] == ["enqueue", "--source", "presence", "--ndjson"]
+events = [json.loads(line) for line in sys.stdin if line.strip()]
 with open(os.environ["PRESENCE_LOCAL_CAPTURE"], "a", encoding="utf-8") as stream:
-    stream.write(json.dumps(event, separators=(",", ":"), sort_keys=True) + "\\n")
+    for event in events:
+        stream.write(json.dumps(event, separators=(",", ":"), sort_keys=True) + "\\n")
 """,
             encoding="utf-8",
         )
@@ -544,10 +545,10 @@ with open(os.environ["PRESENCE_LOCAL_CAPTURE"], "a", encoding="utf-8") as stream
         self.write_scan("2026-07-23T12:45:00Z", False, False)
         self.write_canonical("2026-07-23T12:45:00Z", "cabin", "crosstown")
 
-        attempts: list[dict] = []
+        attempts: list[list[dict]] = []
 
-        def crash_after_first(_home_eventctl: str, event: dict) -> None:
-            attempts.append(json.loads(json.dumps(event)))
+        def crash_after_first(_home_eventctl: str, events: list[dict]) -> None:
+            attempts.append(json.loads(json.dumps(events)))
             raise adapter.AdapterError("simulated_crash")
 
         with (
@@ -558,15 +559,17 @@ with open(os.environ["PRESENCE_LOCAL_CAPTURE"], "a", encoding="utf-8") as stream
                 adapter.run_once()
         self.assertTrue(self.pending_path.exists())
         self.assertEqual(len(attempts), 1)
+        self.assertEqual(len(attempts[0]), 2)
         pending = json.loads(self.pending_path.read_text(encoding="utf-8"))
         self.assertEqual(len(pending["events"]), 2)
 
         replayed: list[dict] = []
-        accepted_ids = {attempts[0]["source_event_id"]}
+        # The bus may have spooled a prefix of the batch before the crash.
+        accepted_ids = {attempts[0][0]["source_event_id"]}
 
-        def idempotent_replay(_binary: str, event: dict) -> None:
-            replayed.append(json.loads(json.dumps(event)))
-            accepted_ids.add(event["source_event_id"])
+        def idempotent_replay(_binary: str, events: list[dict]) -> None:
+            replayed.extend(json.loads(json.dumps(events)))
+            accepted_ids.update(event["source_event_id"] for event in events)
 
         with (
             mock.patch.object(adapter, "utc_now", return_value=moment("2026-07-23T12:46:00Z")),
@@ -580,7 +583,7 @@ with open(os.environ["PRESENCE_LOCAL_CAPTURE"], "a", encoding="utf-8") as stream
         self.assertTrue(result["ok"])
         self.assertFalse(self.pending_path.exists())
         self.assertEqual(len(replayed), 2)
-        self.assertEqual(attempts[0]["source_event_id"], replayed[0]["source_event_id"])
+        self.assertEqual(attempts[0], replayed)
         self.assertNotEqual(replayed[0]["source_event_id"], replayed[1]["source_event_id"])
         self.assertEqual(len(accepted_ids), 2)
         self.assertEqual(
@@ -641,8 +644,8 @@ with open(os.environ["PRESENCE_LOCAL_CAPTURE"], "a", encoding="utf-8") as stream
             mock.patch.object(
                 adapter,
                 "publish",
-                side_effect=lambda _binary, event: replayed.append(
-                    json.loads(json.dumps(event))
+                side_effect=lambda _binary, events: replayed.extend(
+                    json.loads(json.dumps(events))
                 ),
             ),
         ):
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Contract tests for the Roomba dashboard's month calendar cache."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+roomba_dashboard = load_module("roomba_dashboard", BIN_DIR / "roomba-dashboard.py")
+
+
+def run_event(timestamp: str, event_type: str, **walk) -> dict:
+    return {
+        "timestamp": timestamp,
+        "event_type": event_type,
+        "roombas": {"crosstown": {"last_command_result": {
+            "success": True, "results": [{"name": "Combo"}],
+        }}},
+        "dog_walk": walk,
+    }
+
+
+class CalendarCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.root = Path(self.temporary.name)
+        original = roomba_dashboard.HISTORY_DIR
+        roomba_dashboard.HISTORY_DIR = str(self.root)
+        self.addCleanup(setattr, roomba_dashboard, "HISTORY_DIR", original)
+        self.cache = roomba_dashboard.CalendarCache()
+        patcher = mock.patch.object(roomba_dashboard, "CALENDAR_CACHE", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def append(self, day: str, *lines) -> Path:
+        path = self.root / f"{day}.jsonl"
+        with path.open("a", encoding="utf-8") as handle:
+            for line in lines:
+                handle.write(line if isinstance(line, str) else json.dumps(line) + "\n")
+        return path
+
+    def test_appended_lines_are_tailed_and_unchanged_months_are_reused(self) -> None:
+        self.append("2026-06-30", run_event("2026-06-30T09:00:00Z", "departure"))
+        path = self.append(
+            "2026-07-12",
+            run_event("2026-07-12T10:00:00Z", "departure"),
+            '{"timestamp": "2026-07-12T10:20:00Z", "event_type": "do',
+        )
+
+        june = roomba_dashboard.load_calendar_data(2026, 6)
+        july = roomba_dashboard.load_calendar_data(2026, 7)
+        self.assertEqual(june["max_runs"], 1)
+        self.assertNotIn("return_signal", july["crosstown"]["12"][0])
+
+        # Finish the partial line; only the appended bytes are parsed.
+        self.append("2026-07-12", 'ck_timeout"}\n', run_event(
+            "2026-07-12T10:40:00Z", "dock", return_signal="door", walk_duration_minutes=40,
+        ))
+        with mock.patch.object(
+            roomba_dashboard.json, "loads", wraps=json.loads
+        ) as loads:
+            july = roomba_dashboard.load_calendar_data(2026, 7)
+            self.assertIs(roomba_dashboard.load_calendar_data(2026, 6), june)
+        self.assertEqual(loads.call_count, 2)
+        self.assertEqual(
+            july["crosstown"]["12"],
+            [{"time": "2026-07-12T10:00:00Z", "trigger": "dog_walk", "success": True,
+              "skipped": None, "roombas": ["Combo"], "return_signal": "door",
+              "duration_min": 40}],
+        )
+        self.assertIs(roomba_dashboard.load_calendar_data(2026, 7), july)
+
+        # A rewritten file is re-read from the start.
+        replacement = path.with_name(".rewrite.tmp")
+        replacement.write_text("", encoding="utf-8")
+        os.replace(replacement, path)
+        self.assertEqual(roomba_dashboard.load_calendar_data(2026, 7)["crosstown"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
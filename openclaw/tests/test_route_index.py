@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Contract tests for the dog-walk route index and its dashboard queries."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+route_index = load_module("route_index", BIN_DIR / "route_index.py")
+dog_walk_dashboard = load_module("dog_walk_dashboard", BIN_DIR / "dog-walk-dashboard.py")
+
+
+def iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class RouteIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.routes = Path(self.temporary.name) / "routes"
+        self.routes.mkdir()
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        original = dog_walk_dashboard.ROUTES_DIR
+        dog_walk_dashboard.ROUTES_DIR = str(self.routes)
+        self.addCleanup(setattr, dog_walk_dashboard, "ROUTES_DIR", original)
+
+    def write(self, walk_id: str, location: str, started: datetime, points=(), **extra) -> Path:
+        path = self.routes / location / started.strftime("%Y-%m-%d") / f"{walk_id}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        route = {
+            "walk_id": walk_id,
+            "origin_location": location,
+            "started_at": iso(started),
+            "ended_at": iso(started + timedelta(minutes=30)),
+            "distance_m": 100,
+            "points": [{"lat": lat, "lon": lon} for lat, lon in points],
+            **extra,
+        }
+        path.write_text(json.dumps(route), encoding="utf-8")
+        return path
+
+    def test_dashboard_queries_read_only_the_requested_window(self) -> None:
+        recent = self.now - timedelta(days=2)
+        self.write("recent", "cabin", recent, points=[(42.00001, -71.0), (42.00002, -71.0), (42.001, -71.0)])
+        self.write("old", "cabin", self.now - timedelta(days=40), points=[(43.0, -72.0)])
+        self.write("crosstown", "crosstown", recent - timedelta(hours=1), points=[(40.0, -70.0)])
+        self.write("car", "cabin", recent, points=[(44.0, -73.0)], is_car_trip=True)
+        (self.routes / "cabin" / recent.strftime("%Y-%m-%d") / "broken.json").write_text("{")
+
+        summaries, _, location = dog_walk_dashboard.load_route_summaries(30, "all")
+        self.assertEqual(location, "all")
+        self.assertEqual([summary["walk_id"] for summary in summaries], ["recent", "crosstown"])
+        self.assertEqual(summaries[0]["point_count"], 3)
+        self.assertNotIn("points", summaries[0])
+
+        points, _, meta = dog_walk_dashboard.load_heatmap_points(30, "cabin")
+        self.assertEqual(meta, {"location": "cabin", "walk_count": 1, "point_count": 3})
+        self.assertEqual(points, [[42.0, -71.0, 0.7], [42.001, -71.0, 0.35]])
+
+        self.assertEqual(dog_walk_dashboard.load_route_detail("recent")["walk_id"], "recent")
+        self.assertIsNone(dog_walk_dashboard.load_route_detail("car"))
+        self.assertIsNone(dog_walk_dashboard.load_route_detail("missing"))
+
+        with mock.patch.object(
+            dog_walk_dashboard, "_iter_route_files", side_effect=AssertionError("scanned files")
+        ), mock.patch.object(
+            route_index.RouteIndex, "_index_file", side_effect=AssertionError("re-parsed")
+        ):
+            dog_walk_dashboard.load_route_summaries(30, "cabin")
+            dog_walk_dashboard.load_heatmap_points(30, "cabin")
+            dog_walk_dashboard.load_route_detail("recent")
+
+    def test_sync_reindexes_only_changed_files_and_drops_deleted_ones(self) -> None:
+        started = self.now - timedelta(days=1)
+        first = self.write("first", "cabin", started, points=[(42.0, -71.0)])
+        self.write("second", "cabin", started + timedelta(hours=1))
+        index = route_index.RouteIndex(self.routes)
+        self.assertEqual(index.sync(), 2)
+        self.assertEqual(index.sync(), 0)
+
+        updated = json.loads(first.read_text())
+        updated["points"].append({"lat": 42.5, "lon": -71.5})
+        replacement = first.with_name(".first.tmp")
+        replacement.write_text(json.dumps(updated), encoding="utf-8")
+        os.replace(replacement, first)
+        self.assertEqual(index.sync(), 1)
+        self.assertEqual(index.heatmap(since=0, location="cabin")["point_count"], 2)
+
+        first.unlink()
+        index.sync()
+        self.assertEqual(
+            [summary["walk_id"] for summary in index.summaries(since=0)], ["second"]
+        )
+        self.assertEqual(index.heatmap(since=0, location="cabin")["points"], [])
+        self.assertIsNone(index.route_path("first"))
+
+
+if __name__ == "__main__":
+    unittest.main()
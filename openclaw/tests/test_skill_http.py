@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Contract tests for the shared skill HTTP client."""
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import importlib.util
+import json
+from pathlib import Path
+import sys
+import threading
+import unittest
+from unittest import mock
+import urllib.error
+import urllib.request
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+skill_http = load_module("skill_http", BIN_DIR / "skill_http.py")
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args) -> None:
+        return None
+
+    def _reply(self, status: int, payload: object = None, headers=()) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.server.requests.append(("GET", self.path, self.client_address[1],
+                                     self.headers.get("If-None-Match")))
+        if self.path == "/missing":
+            self._reply(404, {"error": "not_found"})
+        elif self.headers.get("If-None-Match") == '"v1"' and self.server.version == 1:
+            self._reply(304, headers=[("ETag", '"v1"')])
+        else:
+            version = self.server.version
+            self._reply(200, {"version": version}, headers=[("ETag", f'"v{version}"')])
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.requests.append(("POST", self.path, self.client_address[1], None))
+        self.server.version = body["version"]
+        self._reply(200, {"ok": True})
+
+
+class SkillHTTPClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.version = 1
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = skill_http.HTTPClient()
+        self.addCleanup(self.client.close)
+
+    def get(self, path: str, **kwargs) -> dict:
+        request = urllib.request.Request(f"{self.base}{path}")
+        with self.client.open(request, timeout=5, **kwargs) as response:
+            return json.loads(response.read())
+
+    def test_connections_are_reused_and_errors_match_urlopen(self) -> None:
+        self.assertEqual(self.get("/state"), {"version": 1})
+        self.assertEqual(self.get("/state"), {"version": 1})
+        with self.assertRaises(urllib.error.HTTPError) as raised:
+            self.get("/missing")
+        self.assertEqual(raised.exception.code, 404)
+        self.assertEqual(json.loads(raised.exception.read()), {"error": "not_found"})
+
+        ports = {port for _method, _path, port, _etag in self.server.requests}
+        self.assertEqual(len(ports), 1)
+        self.assertEqual(
+            [(metric["reused"], metric["status"]) for metric in self.client.metrics],
+            [(False, 200), (True, 200), (True, 404)],
+        )
+
+        with self.assertRaises(urllib.error.URLError):
+            self.client.open(urllib.request.Request("http://127.0.0.1:9/"), timeout=1)
+
+    def test_get_cache_revalidates_and_writes_invalidate(self) -> None:
+        with mock.patch.object(skill_http.time, "monotonic", return_value=100.0):
+            self.assertEqual(self.get("/state", cache_ttl=5), {"version": 1})
+            self.assertEqual(self.get("/state", cache_ttl=5), {"version": 1})
+        self.assertEqual(len(self.server.requests), 1)
+
+        # Expired: revalidated with the stored ETag and answered by a 304.
+        with mock.patch.object(skill_http.time, "monotonic", return_value=110.0):
+            self.assertEqual(self.get("/state", cache_ttl=5), {"version": 1})
+        self.assertEqual(self.server.requests[-1][3], '"v1"')
+        self.assertEqual(self.client.metrics[-1]["status"], 304)
+
+        post = urllib.request.Request(
+            f"{self.base}/state", data=json.dumps({"version": 2}).encode(), method="POST"
+        )
+        self.client.open(post, timeout=5).read()
+        with mock.patch.object(skill_http.time, "monotonic", return_value=111.0):
+            self.assertEqual(self.get("/state", cache_ttl=5), {"version": 2})
+        self.assertIsNone(self.server.requests[-1][3])
+
+    def test_gather_runs_calls_concurrently_in_order(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            barrier.wait()
+            return value
+
+        self.assertEqual(
+            self.client.gather(*(lambda value=value: call(value) for value in "abc")),
+            ["a", "b", "c"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -187,6 +187,12 @@ class LaunchAgentStatusTests(unittest.TestCase):
         self.assertIn("prior exit (", usage_dashboard.DASHBOARD_HTML)
         self.assertIn("badge-prior", usage_dashboard.DASHBOARD_HTML)
 
+    def test_dashboard_renders_rollup_cron_summaries_with_per_run_trend(self):
+        html = usage_dashboard.DASHBOARD_HTML
+        self.assertIn("'Cron Jobs by ' + (grain === 'day' ? 'Day' : 'Hour')", html)
+        self.assertIn("j.duration_ms_sum / j.duration_runs", html)
+        self.assertIn("function runDurations(j)", html)
+
 
 class IMessageResponseLatencyTests(unittest.TestCase):
     def setUp(self):
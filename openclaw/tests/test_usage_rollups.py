@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Contract tests for the usage-dashboard hourly/daily rollup store."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BIN_DIR = REPO_ROOT / "openclaw" / "bin"
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+usage_rollups = load_module("usage_rollups", BIN_DIR / "usage_rollups.py")
+usage_dashboard = load_module("usage_dashboard", BIN_DIR / "usage-dashboard.py")
+
+
+def snapshot(timestamp: str, *, five_hour: float, cron_runs: int, jobs=()) -> dict:
+    return {
+        "timestamp": timestamp,
+        "utilization": {"five_hour": {"utilization": five_hour}},
+        "tokens": {"input": 10, "output": 5, "total": 15},
+        "activity": {"cron_runs": cron_runs, "errors": 0},
+        "cron_jobs": [
+            {"job_id": job_id, "status": status, "total_tokens": 7, "run_at": run_at,
+             "duration_ms": 1000 * run_at}
+            for job_id, status, run_at in jobs
+        ],
+    }
+
+
+class UsageRollupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary.cleanup)
+        self.root = Path(self.temporary.name)
+        self.clock = lambda: datetime(2026, 7, 13, tzinfo=timezone.utc).timestamp()
+        self.store = usage_rollups.RollupStore(self.root, clock=self.clock)
+
+    def append(self, day: str, *records) -> None:
+        with (self.root / f"{day}.jsonl").open("a", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(record if isinstance(record, str) else json.dumps(record) + "\n")
+
+    def test_sync_folds_only_appended_lines_and_refolds_replaced_days(self) -> None:
+        self.append(
+            "2026-07-12",
+            snapshot("2026-07-12T10:00:00Z", five_hour=20.0, cron_runs=1,
+                     jobs=[("daily", "ok", 1)]),
+            snapshot("2026-07-12T10:15:00Z", five_hour=35.0, cron_runs=2,
+                     jobs=[("daily", "error", 2)]),
+        )
+        self.assertEqual(self.store.sync(), 2)
+        self.assertEqual(self.store.sync(), 0)
+
+        self.append(
+            "2026-07-12",
+            snapshot("2026-07-12T10:30:00Z", five_hour=25.0, cron_runs=0),
+            '{"timestamp": "2026-07-12T10:45',
+        )
+        self.assertEqual(self.store.sync(), 1)
+
+        (hour,) = self.store.query(since=0, grain="hour")
+        self.assertEqual(hour["timestamp"], "2026-07-12T10:00:00Z")
+        self.assertEqual(hour["tokens"], {"input": 30, "output": 15, "total": 45})
+        self.assertEqual(hour["activity"]["cron_runs"], 3)
+        self.assertEqual(hour["utilization"], {"five_hour": {"utilization": 25.0}})
+        self.assertEqual(
+            hour["rollup"]["metrics"]["utilization.five_hour"],
+            {"sum": 80.0, "min": 20.0, "max": 35.0, "last": 25.0},
+        )
+        self.assertEqual(hour["rollup"]["snapshots"], 3)
+        self.assertEqual(
+            [(job["job_id"], job["runs"], job["errors"], job["status"], job["total_tokens"],
+              job["duration_ms_sum"], job["duration_runs"])
+             for job in hour["cron_jobs"]],
+            [("daily", 2, 1, "error", 14, 3000, 2)],
+        )
+
+        replacement = self.root / "replacement.jsonl"
+        replacement.write_text(
+            json.dumps(snapshot("2026-07-12T11:00:00Z", five_hour=1.0, cron_runs=4)) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(replacement, self.root / "2026-07-12.jsonl")
+        self.assertEqual(self.store.sync(), 1)
+        self.assertEqual(
+            [bucket["timestamp"] for bucket in self.store.query(since=0, grain="hour")],
+            ["2026-07-12T11:00:00Z"],
+        )
+
+    def test_buckets_spanning_day_files_merge_and_survive_jsonl_pruning(self) -> None:
+        self.append(
+            "2026-07-11",
+            snapshot("2026-07-12T00:05:00+00:00", five_hour=10.0, cron_runs=1),
+        )
+        self.append(
+            "2026-07-12",
+            snapshot("2026-07-12T00:20:00Z", five_hour=12.0, cron_runs=2),
+            snapshot("2026-07-12T18:00:00Z", five_hour=50.0, cron_runs=5),
+        )
+        self.store.sync()
+        (self.root / "2026-07-11.jsonl").unlink()
+        self.store.sync()
+
+        hours = self.store.query(since=0, grain="hour")
+        self.assertEqual([bucket["activity"]["cron_runs"] for bucket in hours], [3, 5])
+        (day,) = self.store.query(
+            since=datetime(2026, 7, 12, 9, tzinfo=timezone.utc).timestamp(), grain="day"
+        )
+        self.assertEqual(day["timestamp"], "2026-07-12T00:00:00Z")
+        self.assertEqual(day["activity"]["cron_runs"], 8)
+        self.assertEqual(day["rollup"]["metrics"]["utilization.five_hour"]["max"], 50.0)
+        self.assertEqual(day["utilization"]["five_hour"]["utilization"], 50.0)
+        with self.assertRaisesRegex(usage_rollups.RollupError, "rollup_grain_invalid"):
+            self.store.query(since=0, grain="week")
+
+    def test_long_dashboard_ranges_are_answered_from_bounded_rollups(self) -> None:
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        for offset in range(0, 40 * 24, 6):
+            moment = now - timedelta(hours=offset)
+            self.append(
+                moment.strftime("%Y-%m-%d"),
+                snapshot(moment.strftime("%Y-%m-%dT%H:%M:%SZ"), five_hour=1.0, cron_runs=1),
+            )
+        original = usage_dashboard.HISTORY_DIR
+        usage_dashboard.HISTORY_DIR = str(self.root)
+        self.addCleanup(setattr, usage_dashboard, "HISTORY_DIR", original)
+
+        with mock.patch.object(
+            usage_dashboard.history_index.HistoryIndex,
+            "hourly_records",
+            side_effect=AssertionError("long range re-read raw history"),
+        ):
+            monthly, _ = usage_dashboard.load_snapshots(24 * 30)
+            yearly, hours = usage_dashboard.load_snapshots(24 * 365)
+
+        self.assertEqual(hours, 8760)
+        self.assertEqual({record["rollup"]["grain"] for record in monthly}, {"hour"})
+        self.assertLessEqual(len(monthly), 24 * 30 + 1)
+        self.assertEqual({record["rollup"]["grain"] for record in yearly}, {"day"})
+        self.assertLessEqual(len(yearly), 41)
+        self.assertEqual(sum(record["activity"]["cron_runs"] for record in yearly), 160)
+        self.assertTrue((self.root / usage_rollups.DATABASE_NAME).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ import json
 import os
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
@@ -3553,6 +3555,122 @@ class WeeklyFinancialScrapeTests(unittest.TestCase):
                 weekly_financial_scrape.write_final_status(payload, link)
             self.assertFalse(link.exists())
 
+    def test_source_lanes_share_browser_state_and_parallelism_is_bounded(self):
+        lanes = {
+            source.name: source.lane or source.name
+            for source in weekly_financial_scrape.SOURCES
+        }
+        self.assertEqual(lanes["national_grid_electric"], lanes["national_grid_gas"])
+        self.assertEqual(lanes["pennymac"], weekly_financial_scrape.BOA_LANE)
+        self.assertEqual(
+            len(set(lanes.values()) | {weekly_financial_scrape.BOA_LANE}), 5
+        )
+        key = weekly_financial_scrape.SOURCE_PARALLELISM_ENV
+        parallelism = weekly_financial_scrape.source_parallelism
+        self.assertEqual(parallelism({}), weekly_financial_scrape.DEFAULT_SOURCE_PARALLELISM)
+        self.assertEqual(parallelism({key: "1"}), 1)
+        self.assertEqual(parallelism({key: "0"}), 1)
+        self.assertEqual(
+            parallelism({key: "99"}), weekly_financial_scrape.MAX_SOURCE_PARALLELISM
+        )
+        self.assertEqual(
+            parallelism({key: "many"}), weekly_financial_scrape.DEFAULT_SOURCE_PARALLELISM
+        )
+
+    def test_scheduler_runs_lanes_concurrently_and_serializes_each_lane(self):
+        barrier = threading.Barrier(3, timeout=5)
+        events = []
+        lock = threading.Lock()
+
+        def job(name, concurrent=True):
+            def run():
+                with lock:
+                    events.append(("start", name))
+                if concurrent:
+                    barrier.wait()
+                with lock:
+                    events.append(("end", name))
+                return {"source": name}
+            return run
+
+        scheduler = weekly_financial_scrape.SourceScheduler(3)
+        results, output = self.capture_stdout(
+            scheduler.run,
+            [
+                ("tesla_solar", job("tesla_solar")),
+                ("mortgage", job("pennymac")),
+                ("bwsc", job("bwsc")),
+                ("mortgage", job("boa", concurrent=False)),
+            ],
+        )
+
+        self.assertEqual(
+            [result["source"] for result in results],
+            ["tesla_solar", "pennymac", "bwsc", "boa"],
+        )
+        self.assertTrue(all(
+            isinstance(result["duration_seconds"], float) for result in results
+        ))
+        self.assertLess(events.index(("end", "pennymac")), events.index(("start", "boa")))
+        self.assertEqual(
+            sorted(json.loads(line)["source"] for line in output.splitlines()),
+            ["boa", "bwsc", "pennymac", "tesla_solar"],
+        )
+        self.assertIsNone(weekly_financial_scrape._SCHEDULER)
+
+    def test_scheduler_failure_stops_other_lanes_before_their_next_source(self):
+        scheduler = weekly_financial_scrape.SourceScheduler(2)
+
+        def failing():
+            raise RuntimeError("private failure detail")
+
+        def waits_for_termination():
+            deadline = time.monotonic() + 5
+            while scheduler.signum is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return {"source": "pennymac"}
+
+        never_started = Mock(return_value={"source": "boa"})
+        with self.assertRaises(RuntimeError):
+            self.capture_stdout(
+                scheduler.run,
+                [
+                    ("bwsc", failing),
+                    ("mortgage", waits_for_termination),
+                    ("mortgage", never_started),
+                ],
+            )
+
+        never_started.assert_not_called()
+        self.assertEqual(scheduler.signum, weekly_financial_scrape.signal.SIGTERM)
+        self.assertIsNone(weekly_financial_scrape._SCHEDULER)
+
+    def test_lane_children_are_signalled_and_none_spawn_after_termination(self):
+        scheduler = weekly_financial_scrape.SourceScheduler(2)
+        process = Mock(pid=4321)
+        scheduler.register(process)
+        with patch.object(weekly_financial_scrape.os, "killpg") as killpg:
+            scheduler.terminate(weekly_financial_scrape.signal.SIGINT)
+        killpg.assert_called_once_with(4321, weekly_financial_scrape.signal.SIGTERM)
+
+        spawned = []
+
+        def worker():
+            try:
+                weekly_financial_scrape.run_command(("scraper.py",), self.BASE_ENV, 1)
+            except weekly_financial_scrape.WrapperInterrupted as error:
+                spawned.append(error.signum)
+
+        with (
+            patch.object(weekly_financial_scrape, "_SCHEDULER", scheduler),
+            patch.object(weekly_financial_scrape.subprocess, "Popen") as popen,
+        ):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join(5)
+        popen.assert_not_called()
+        self.assertEqual(spawned, [weekly_financial_scrape.signal.SIGINT])
+
     def test_degraded_run_persists_status_and_returns_nonzero(self):
         degraded_result = {
             "source": "bwsc",
@@ -3639,6 +3757,7 @@ class WeeklyFinancialScrapeTests(unittest.TestCase):
             self.assertEqual(final["status"], "degraded")
             self.assertEqual(final["run_id"], self.RUN_ID)
             self.assertEqual(final["results"][0]["path"], "browser_only")
+            self.assertIn("duration_seconds", final["results"][0])
             self.assertEqual(
                 final,
                 json.loads(status_path.read_text(encoding="utf-8")),